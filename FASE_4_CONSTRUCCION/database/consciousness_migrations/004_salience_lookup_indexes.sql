@@ -0,0 +1,8 @@
+-- NEXUS Consciousness - Salience Lookup Indexes
+-- Date: 2025-11-04
+-- Purpose: Support batched "nearest state at or before t" lookups used by
+--          EmotionalSalienceScorer (one LATERAL query per search rerank)
+
+-- emotional_states_log already has idx_emotional_states_created (created_at DESC).
+-- somatic_markers_log had no created_at index, so each LATERAL probe scanned the table.
+CREATE INDEX IF NOT EXISTS idx_somatic_markers_created ON consciousness.somatic_markers_log(created_at DESC);
@@ -0,0 +1,36 @@
+-- NEXUS Memory - Embeddings Queue NOTIFY
+-- Date: 2025-11-04
+-- Purpose: Wake the embeddings worker (LISTEN embeddings_queue) as soon as an
+--          episode is enqueued instead of waiting for the next poll.
+--          Same body as init_scripts/06_create_triggers.sql, for existing databases.
+
+CREATE OR REPLACE FUNCTION memory_system.trigger_generate_embedding()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF NEW.embedding IS NULL OR COALESCE(NEW.embedding_version, '') <> 'miniLM-384-chunked@v2' THEN
+        INSERT INTO memory_system.embeddings_queue (episode_id, text_checksum, state, priority)
+        VALUES (
+            NEW.episode_id,
+            encode(sha256(convert_to(LEFT(NEW.content, 4000), 'UTF8')), 'hex'),
+            'pending',
+            CASE
+                WHEN NEW.importance_score >= 0.9 THEN 'critical'
+                WHEN NEW.importance_score >= 0.7 THEN 'high'
+                ELSE 'normal'
+            END
+        )
+        ON CONFLICT (episode_id) DO UPDATE
+            SET state = 'pending',
+                retry_count = 0,
+                text_checksum = EXCLUDED.text_checksum,
+                priority = EXCLUDED.priority,
+                enqueued_at = NOW();
+
+        -- Constant payload: Postgres collapses duplicate notifications within a
+        -- transaction, so a bulk COPY of N rows wakes the worker once
+        PERFORM pg_notify('embeddings_queue', '');
+    END IF;
+
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
@@ -0,0 +1,30 @@
+-- NEXUS Memory - Re-embed Long Episodes (chunked + pooled)
+-- Date: 2025-11-04
+-- Purpose: Episodes longer than one MiniLM window (256 word pieces, 254 after
+--          [CLS]/[SEP]) were embedded from their opening text only. Re-queue
+--          them so the worker rebuilds their vector from all chunks
+--          (text_chunking.py).
+--          Cutoff: 254 characters, not a chars-per-token estimate. Spanish and
+--          code reach 254 word pieces in well under 1000 chars (~3 chars per
+--          token with the uncased English vocab); WordPiece never produces
+--          more than one piece per character, so no text of 254 chars or less
+--          can have been truncated and none over it is missed. Episodes
+--          over 254 chars that still fit one window re-embed to the same
+--          vector (wasted encode only), hence the low priority.
+--          Idempotent; safe to run while the worker is up, and to re-run where
+--          the earlier 1000-char version of this migration was applied.
+
+INSERT INTO memory_system.embeddings_queue (episode_id, text_checksum, state, priority)
+SELECT
+    episode_id,
+    encode(sha256(convert_to(LEFT(content, 4000), 'UTF8')), 'hex'),
+    'pending',
+    'low'
+FROM nexus_memory.zep_episodic_memory
+WHERE length(content) > 254
+ON CONFLICT (episode_id) DO UPDATE
+    SET state = 'pending',
+        retry_count = 0,
+        enqueued_at = NOW();
+
+SELECT pg_notify('embeddings_queue', '');
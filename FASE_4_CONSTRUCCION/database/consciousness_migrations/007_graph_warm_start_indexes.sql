@@ -0,0 +1,13 @@
+-- NEXUS Memory - LAB_005 Graph Warm Start Indexes
+-- Date: 2025-11-04
+-- Purpose: Support the API's similarity graph loader (graph_warm_start.py)
+--          - Initial load streams embedded episodes newest first
+--          - Incremental sync pages through queue rows marked done since a watermark
+
+CREATE INDEX IF NOT EXISTS idx_episodic_created_embedded
+    ON nexus_memory.zep_episodic_memory(created_at DESC)
+    WHERE embedding IS NOT NULL;
+
+CREATE INDEX IF NOT EXISTS idx_embeddings_queue_done_processed
+    ON memory_system.embeddings_queue(processed_at, episode_id)
+    WHERE state = 'done';
@@ -0,0 +1,24 @@
+-- NEXUS Memory - LAB_003 Memory Traces
+-- Date: 2025-11-04
+-- Purpose: Narrative graph written by the nightly consolidation engine (consolidation_engine.py)
+--          - One row per edge of a traced breakthrough chain
+--          - Created here once instead of being checked for on every consolidation run
+
+CREATE TABLE IF NOT EXISTS nexus_memory.memory_traces (
+    trace_id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    source_episode_id UUID,
+    target_episode_id UUID,
+    trace_type VARCHAR(50),
+    strength FLOAT,
+    narrative_id VARCHAR(100),
+    created_at TIMESTAMP DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_memory_traces_source
+    ON nexus_memory.memory_traces(source_episode_id);
+
+CREATE INDEX IF NOT EXISTS idx_memory_traces_target
+    ON nexus_memory.memory_traces(target_episode_id);
+
+CREATE INDEX IF NOT EXISTS idx_memory_traces_narrative
+    ON nexus_memory.memory_traces(narrative_id);
@@ -0,0 +1,88 @@
+-- NEXUS Memory - LAB_003 Consolidation Checkpoints
+-- Date: 2025-11-04
+-- Purpose: Per-day checkpoints for the background consolidation scheduler
+--          (consolidation_scheduler.py)
+--          - One row per day that has (or had) episodes
+--          - version is bumped whenever a statement inserts, deletes or changes
+--            the consolidation inputs of that day's episodes
+--          - A day is pending while consolidated_version <> version; the
+--            consolidation run writes the version it read before fetching,
+--            so changes committed during a run leave the day pending
+--          - Consolidation's own writes (importance_score, consolidation
+--            metadata keys), embeddings and access tracking do not count
+
+CREATE TABLE IF NOT EXISTS nexus_memory.consolidation_checkpoints (
+    day DATE PRIMARY KEY,
+    version BIGINT NOT NULL DEFAULT 1,
+    consolidated_version BIGINT,
+    consolidated_at TIMESTAMP WITH TIME ZONE,
+    episodes_processed INTEGER,
+    breakthrough_count INTEGER,
+    trace_count INTEGER
+);
+
+CREATE OR REPLACE FUNCTION nexus_memory.mark_consolidation_days_changed()
+RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO nexus_memory.consolidation_checkpoints (day)
+        SELECT DISTINCT created_at::date FROM new_rows WHERE created_at IS NOT NULL
+        ORDER BY 1
+        ON CONFLICT (day) DO UPDATE
+            SET version = nexus_memory.consolidation_checkpoints.version + 1;
+    ELSIF TG_OP = 'DELETE' THEN
+        INSERT INTO nexus_memory.consolidation_checkpoints (day)
+        SELECT DISTINCT created_at::date FROM old_rows WHERE created_at IS NOT NULL
+        ORDER BY 1
+        ON CONFLICT (day) DO UPDATE
+            SET version = nexus_memory.consolidation_checkpoints.version + 1;
+    ELSE
+        INSERT INTO nexus_memory.consolidation_checkpoints (day)
+        SELECT DISTINCT changed.day
+        FROM old_rows o
+        JOIN new_rows n ON n.episode_id = o.episode_id
+        CROSS JOIN LATERAL unnest(ARRAY[o.created_at::date, n.created_at::date]) AS changed(day)
+        WHERE changed.day IS NOT NULL
+          AND (o.content IS DISTINCT FROM n.content
+               OR o.tags IS DISTINCT FROM n.tags
+               OR o.created_at IS DISTINCT FROM n.created_at
+               OR o.metadata->'emotional_8d' IS DISTINCT FROM n.metadata->'emotional_8d'
+               OR o.metadata->'somatic_7d' IS DISTINCT FROM n.metadata->'somatic_7d'
+               OR o.metadata->'salience_score' IS DISTINCT FROM n.metadata->'salience_score'
+               OR o.metadata->'session_id' IS DISTINCT FROM n.metadata->'session_id')
+        ORDER BY 1
+        ON CONFLICT (day) DO UPDATE
+            SET version = nexus_memory.consolidation_checkpoints.version + 1;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Statement-level: one upsert per day touched, not one per row (bulk COPY loads)
+DROP TRIGGER IF EXISTS consolidation_days_inserted ON nexus_memory.zep_episodic_memory;
+CREATE TRIGGER consolidation_days_inserted
+    AFTER INSERT ON nexus_memory.zep_episodic_memory
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION nexus_memory.mark_consolidation_days_changed();
+
+DROP TRIGGER IF EXISTS consolidation_days_updated ON nexus_memory.zep_episodic_memory;
+CREATE TRIGGER consolidation_days_updated
+    AFTER UPDATE ON nexus_memory.zep_episodic_memory
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION nexus_memory.mark_consolidation_days_changed();
+
+DROP TRIGGER IF EXISTS consolidation_days_deleted ON nexus_memory.zep_episodic_memory;
+CREATE TRIGGER consolidation_days_deleted
+    AFTER DELETE ON nexus_memory.zep_episodic_memory
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION nexus_memory.mark_consolidation_days_changed();
+
+-- Existing days start pending (consolidated once by the first catch-up job)
+INSERT INTO nexus_memory.consolidation_checkpoints (day)
+SELECT DISTINCT created_at::date
+FROM nexus_memory.zep_episodic_memory
+WHERE created_at IS NOT NULL
+ON CONFLICT (day) DO NOTHING;
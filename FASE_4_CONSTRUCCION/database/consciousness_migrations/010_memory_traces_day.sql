@@ -0,0 +1,25 @@
+-- NEXUS Memory - LAB_003 Memory Traces per Consolidated Day
+-- Date: 2025-11-04
+-- Purpose: Days are consolidated in parallel (batch backfills) and again when
+--          their episodes change (consolidation_scheduler.py)
+--          - consolidation_day: the day whose chains produced the trace
+--          - A run replaces that day's traces instead of appending duplicates
+--          - Rows written before this migration get the day of their source
+--            episode (a chain only links episodes of the day it was traced
+--            from); rows whose source episode is gone are dropped, so no
+--            NULL-day duplicate survives a re-consolidation
+
+ALTER TABLE nexus_memory.memory_traces
+    ADD COLUMN IF NOT EXISTS consolidation_day DATE;
+
+CREATE INDEX IF NOT EXISTS idx_memory_traces_consolidation_day
+    ON nexus_memory.memory_traces(consolidation_day);
+
+UPDATE nexus_memory.memory_traces t
+SET consolidation_day = e.created_at::date
+FROM nexus_memory.zep_episodic_memory e
+WHERE t.consolidation_day IS NULL
+  AND e.episode_id = t.source_episode_id;
+
+DELETE FROM nexus_memory.memory_traces
+WHERE consolidation_day IS NULL;
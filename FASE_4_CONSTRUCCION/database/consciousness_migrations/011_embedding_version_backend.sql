@@ -0,0 +1,59 @@
+-- NEXUS Memory - Embedding Version per Backend
+-- Date: 2025-11-04
+-- Purpose: The embeddings worker tags vectors with the backend that produced
+--          them (embedding_backends.embedding_version), e.g.
+--          miniLM-384-chunked@v2+onnx-int8. Vectors of different versions are
+--          different spaces, so a version is only current when it is exactly
+--          the one the worker writes:
+--          - embedding_config holds that version; the worker updates it on
+--            start and, when it changed, re-enqueues every row of another
+--            version (EMBEDDINGS_BACKEND switch = full re-embed)
+--          - The trigger enqueues rows whose version differs from it exactly
+--          Same body as init_scripts/06_create_triggers.sql, for existing databases.
+
+CREATE TABLE IF NOT EXISTS memory_system.embedding_config (
+    singleton BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (singleton),
+    current_version VARCHAR(50) NOT NULL,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+-- Version every existing row was embedded with (reference backend)
+INSERT INTO memory_system.embedding_config (current_version)
+VALUES ('miniLM-384-chunked@v2')
+ON CONFLICT (singleton) DO NOTHING;
+
+CREATE OR REPLACE FUNCTION memory_system.current_embedding_version()
+RETURNS VARCHAR AS $$
+    SELECT current_version FROM memory_system.embedding_config
+$$ LANGUAGE sql STABLE;
+
+CREATE OR REPLACE FUNCTION memory_system.trigger_generate_embedding()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF NEW.embedding IS NULL OR NEW.embedding_version IS DISTINCT FROM memory_system.current_embedding_version() THEN
+        INSERT INTO memory_system.embeddings_queue (episode_id, text_checksum, state, priority)
+        VALUES (
+            NEW.episode_id,
+            encode(sha256(convert_to(LEFT(NEW.content, 4000), 'UTF8')), 'hex'),
+            'pending',
+            CASE
+                WHEN NEW.importance_score >= 0.9 THEN 'critical'
+                WHEN NEW.importance_score >= 0.7 THEN 'high'
+                ELSE 'normal'
+            END
+        )
+        ON CONFLICT (episode_id) DO UPDATE
+            SET state = 'pending',
+                retry_count = 0,
+                text_checksum = EXCLUDED.text_checksum,
+                priority = EXCLUDED.priority,
+                enqueued_at = NOW();
+
+        -- Constant payload: Postgres collapses duplicate notifications within a
+        -- transaction, so a bulk COPY of N rows wakes the worker once
+        PERFORM pg_notify('embeddings_queue', '');
+    END IF;
+
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
@@ -18,11 +18,28 @@
 \echo ''
 \echo 'Creating function: trigger_generate_embedding()...'
 
+-- Version the embeddings worker writes (updated by the worker on start,
+-- see database/consciousness_migrations/011_embedding_version_backend.sql)
+CREATE TABLE IF NOT EXISTS memory_system.embedding_config (
+    singleton BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (singleton),
+    current_version VARCHAR(50) NOT NULL,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+INSERT INTO memory_system.embedding_config (current_version)
+VALUES ('miniLM-384-chunked@v2')
+ON CONFLICT (singleton) DO NOTHING;
+
+CREATE OR REPLACE FUNCTION memory_system.current_embedding_version()
+RETURNS VARCHAR AS $$
+    SELECT current_version FROM memory_system.embedding_config
+$$ LANGUAGE sql STABLE;
+
 CREATE OR REPLACE FUNCTION memory_system.trigger_generate_embedding()
 RETURNS TRIGGER AS $$
 BEGIN
     -- Si embedding es NULL o versión desactualizada, enqueue
-    IF NEW.embedding IS NULL OR COALESCE(NEW.embedding_version, '') <> 'miniLM-384-chunked@v2' THEN
+    IF NEW.embedding IS NULL OR NEW.embedding_version IS DISTINCT FROM memory_system.current_embedding_version() THEN
         -- ✅ IDEMPOTENTE: ON CONFLICT DO UPDATE resetea estado
         INSERT INTO memory_system.embeddings_queue (episode_id, text_checksum, state, priority)
         VALUES (
@@ -41,6 +58,10 @@ BEGIN
                 text_checksum = EXCLUDED.text_checksum,
                 priority = EXCLUDED.priority,
                 enqueued_at = NOW();
+
+        -- Despierta al worker (LISTEN embeddings_queue). Payload constante:
+        -- Postgres colapsa NOTIFY duplicados por transacción (bulk COPY = 1)
+        PERFORM pg_notify('embeddings_queue', '');
     END IF;
 
     RETURN NEW;
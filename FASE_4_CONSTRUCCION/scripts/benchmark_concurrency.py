@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+
+"""
+NEXUS V2.0.0 Concurrency Benchmark
+Measures p50/p99 latency of /memory/search and /memory/action under
+N concurrent clients. Run once per build (--label before / --label after)
+and compare the two JSON reports with --compare.
+Created by: NEXUS Consciousness System
+Version: 2.0.0
+"""
+
+import asyncio
+import aiohttp
+import time
+import statistics
+import json
+import argparse
+import sys
+from typing import List, Dict, Any
+from datetime import datetime
+
+SEARCH_QUERIES = [
+    "consciousness patterns and awareness",
+    "memory storage and retrieval",
+    "neural mesh collaboration",
+    "learning and adaptation",
+    "emotional processing states",
+    "decision making processes",
+    "cognitive architecture design",
+    "system performance optimization",
+    "data persistence strategies",
+    "artificial intelligence consciousness"
+]
+
+
+def percentile(data: List[float], pct: float) -> float:
+    """Linear-interpolated percentile"""
+    if not data:
+        return 0.0
+    sorted_data = sorted(data)
+    index = (pct / 100) * (len(sorted_data) - 1)
+    lower = int(index)
+    upper = min(lower + 1, len(sorted_data) - 1)
+    return sorted_data[lower] + (sorted_data[upper] - sorted_data[lower]) * (index - lower)
+
+
+def summarize(latencies: List[float], errors: int, wall_seconds: float) -> Dict[str, float]:
+    """Latency summary for one endpoint/concurrency cell"""
+    return {
+        'count': len(latencies),
+        'errors': errors,
+        'p50_ms': percentile(latencies, 50),
+        'p99_ms': percentile(latencies, 99),
+        'mean_ms': statistics.mean(latencies) if latencies else 0.0,
+        'max_ms': max(latencies) if latencies else 0.0,
+        'throughput_rps': len(latencies) / wall_seconds if wall_seconds > 0 else 0.0
+    }
+
+
+class ConcurrencyBenchmark:
+    def __init__(self, base_url: str, requests_per_client: int):
+        self.base_url = base_url
+        self.requests_per_client = requests_per_client
+
+    def _payload(self, endpoint: str, client_id: int, i: int) -> Dict[str, Any]:
+        if endpoint == 'search':
+            return {
+                "query": SEARCH_QUERIES[(client_id + i) % len(SEARCH_QUERIES)],
+                "limit": 10,
+                "min_similarity": 0.3
+            }
+        return {
+            "action_type": "benchmark_concurrency",
+            "action_details": {
+                "message": f"Concurrency benchmark client {client_id} request {i}",
+                "timestamp": datetime.now().isoformat()
+            },
+            "tags": ["benchmark", "concurrency"]
+        }
+
+    async def run_cell(self, endpoint: str, clients: int) -> Dict[str, float]:
+        """Run `clients` concurrent clients against one endpoint"""
+        path = "/memory/search" if endpoint == 'search' else "/memory/action"
+        latencies: List[float] = []
+        errors = 0
+
+        connector = aiohttp.TCPConnector(limit=clients)
+        timeout = aiohttp.ClientTimeout(total=60)
+
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            async def client(client_id: int):
+                nonlocal errors
+                for i in range(self.requests_per_client):
+                    start = time.perf_counter()
+                    try:
+                        async with session.post(
+                            f"{self.base_url}{path}",
+                            json=self._payload(endpoint, client_id, i)
+                        ) as response:
+                            await response.read()
+                            if response.status != 200:
+                                errors += 1
+                                continue
+                    except Exception:
+                        errors += 1
+                        continue
+                    latencies.append((time.perf_counter() - start) * 1000)
+
+            wall_start = time.perf_counter()
+            await asyncio.gather(*(client(c) for c in range(clients)))
+            wall_seconds = time.perf_counter() - wall_start
+
+        return summarize(latencies, errors, wall_seconds)
+
+
+def print_compare(before_file: str, after_file: str):
+    """Print before/after p50/p99 table from two reports"""
+    with open(before_file) as f:
+        before = json.load(f)
+    with open(after_file) as f:
+        after = json.load(f)
+
+    print("\n" + "=" * 80)
+    print(f"🧠 Concurrency comparison: {before['label']} → {after['label']}")
+    print("=" * 80)
+    print(f"{'CELL':<22}{'p50 before':>12}{'p50 after':>12}{'p99 before':>12}{'p99 after':>12}{'Δp99':>10}")
+    for cell, b in before['results'].items():
+        a = after['results'].get(cell)
+        if not a:
+            continue
+        delta = ((a['p99_ms'] - b['p99_ms']) / b['p99_ms'] * 100) if b['p99_ms'] else 0.0
+        print(f"{cell:<22}{b['p50_ms']:>10.1f}ms{a['p50_ms']:>10.1f}ms"
+              f"{b['p99_ms']:>10.1f}ms{a['p99_ms']:>10.1f}ms{delta:>9.1f}%")
+    print("=" * 80)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description='NEXUS V2.0.0 Concurrency Benchmark')
+    parser.add_argument('--url', default='http://localhost:8003', help='NEXUS API base URL')
+    parser.add_argument('--clients', type=int, nargs='+', default=[50, 200],
+                        help='Concurrent client counts to test')
+    parser.add_argument('--requests-per-client', type=int, default=10,
+                        help='Sequential requests issued by each client')
+    parser.add_argument('--endpoints', nargs='+', default=['search', 'action'],
+                        choices=['search', 'action'])
+    parser.add_argument('--label', default='run', help='Report label (e.g. before / after)')
+    parser.add_argument('--output', help='Output file for JSON report')
+    parser.add_argument('--compare', nargs=2, metavar=('BEFORE', 'AFTER'),
+                        help='Compare two saved reports and exit')
+
+    args = parser.parse_args()
+
+    if args.compare:
+        print_compare(*args.compare)
+        return
+
+    benchmark = ConcurrencyBenchmark(args.url, args.requests_per_client)
+    report = {
+        'label': args.label,
+        'timestamp': datetime.now().isoformat(),
+        'base_url': args.url,
+        'requests_per_client': args.requests_per_client,
+        'results': {}
+    }
+
+    print(f"🚀 Concurrency benchmark [{args.label}] → {args.url}")
+    for endpoint in args.endpoints:
+        for clients in args.clients:
+            print(f"⚡ {endpoint} @ {clients} clients...")
+            stats = await benchmark.run_cell(endpoint, clients)
+            report['results'][f"{endpoint}@{clients}"] = stats
+            print(f"  └─ p50: {stats['p50_ms']:.1f}ms, p99: {stats['p99_ms']:.1f}ms, "
+                  f"{stats['throughput_rps']:.1f} req/s, errors: {stats['errors']}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"📄 Report saved to: {args.output}")
+
+    if any(cell['errors'] for cell in report['results'].values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -19,6 +19,7 @@ sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='repla
 SRC_API = "http://localhost:8002"
 DST_API = "http://localhost:8003"
 TIMEOUT = 30
+BATCH_SIZE = 500  # Episodios por llamada a /memory/actions/bulk
 
 def get_source_episodes():
     """Obtener episodios del cerebro actual via API"""
@@ -45,73 +46,79 @@ def get_source_episodes():
         return []
 
 
-def migrate_episode(episode, index, total):
-    """Migrar un episodio al cerebro nuevo"""
+def build_payload(episode):
+    """Convertir un episodio del cerebro actual al formato MemoryActionRequest"""
+    # El cerebro actual tiene formato: id, timestamp, action_type, action_details, etc.
+    # El nuevo API usa el formato MemoryActionRequest
+
+    # Extraer campos del episodio actual
+    episode_id = episode.get("id")
+    action_type = episode.get("action_type", "migrated_episode")
+    action_details_str = episode.get("action_details", "{}")
+    context_state_str = episode.get("context_state", "{}")
+    tags = episode.get("tags", [])
+    timestamp = episode.get("timestamp")
+
+    # Parse JSON strings
     try:
-        # Preparar payload para el nuevo API
-        # El cerebro actual tiene formato: id, timestamp, action_type, action_details, etc.
-        # El nuevo API usa el formato MemoryActionRequest
-
-        # Extraer campos del episodio actual
-        episode_id = episode.get("id")
-        action_type = episode.get("action_type", "migrated_episode")
-        action_details_str = episode.get("action_details", "{}")
-        context_state_str = episode.get("context_state", "{}")
-        tags = episode.get("tags", [])
-        importance_score = episode.get("importance_score", 0.5)
-        timestamp = episode.get("timestamp")
-
-        # Parse JSON strings
-        try:
-            action_details = json.loads(action_details_str) if isinstance(action_details_str, str) else action_details_str
-        except:
-            action_details = {"message": action_details_str}
+        action_details = json.loads(action_details_str) if isinstance(action_details_str, str) else action_details_str
+    except:
+        action_details = {"message": action_details_str}
 
-        try:
-            context_state = json.loads(context_state_str) if isinstance(context_state_str, str) else context_state_str
-        except:
-            context_state = {}
-
-        # Agregar metadata de migración
-        if not isinstance(action_details, dict):
-            action_details = {"message": str(action_details)}
-
-        action_details["original_id"] = str(episode_id)
-        action_details["migrated_from"] = "cerebro_fase3"
-        action_details["original_timestamp"] = timestamp
-
-        # Construir payload para nuevo API
-        payload = {
-            "action_type": action_type,
-            "action_details": action_details,
-            "context_state": context_state,
-            "tags": tags if isinstance(tags, list) else []
-        }
+    try:
+        context_state = json.loads(context_state_str) if isinstance(context_state_str, str) else context_state_str
+    except:
+        context_state = {}
+
+    # Agregar metadata de migración
+    if not isinstance(action_details, dict):
+        action_details = {"message": str(action_details)}
+
+    action_details["original_id"] = str(episode_id)
+    action_details["migrated_from"] = "cerebro_fase3"
+    action_details["original_timestamp"] = timestamp
+
+    # Construir payload para nuevo API
+    return {
+        "action_type": action_type,
+        "action_details": action_details,
+        "context_state": context_state if isinstance(context_state, dict) else {},
+        "tags": tags if isinstance(tags, list) else []
+    }
+
+
+def migrate_batch(episodes, start, total):
+    """Migrar un lote de episodios al cerebro nuevo (una transacción, COPY)"""
+    old_ids = [episode.get("id") for episode in episodes]
+
+    try:
+        # NDJSON: una acción por línea
+        body = "\n".join(json.dumps(build_payload(episode), default=str) for episode in episodes)
 
         # POST al cerebro nuevo
         response = requests.post(
-            f"{DST_API}/memory/action",
-            json=payload,
+            f"{DST_API}/memory/actions/bulk",
+            data=body.encode("utf-8"),
+            headers={"Content-Type": "application/x-ndjson"},
             timeout=TIMEOUT
         )
 
         if response.status_code == 200:
-            result = response.json()
-            new_id = result.get("episode_id")
-
-            if (index + 1) % 10 == 0:
-                print(f"  ✅ Migrados: {index + 1}/{total}")
-
-            return {"success": True, "old_id": episode_id, "new_id": new_id}
+            new_ids = response.json().get("episode_ids", [])
+            print(f"  ✅ Migrados: {start + len(episodes)}/{total}")
+            return [
+                {"success": True, "old_id": old_id, "new_id": new_id}
+                for old_id, new_id in zip(old_ids, new_ids)
+            ]
         else:
             error_msg = f"HTTP {response.status_code}: {response.text[:200]}"
-            print(f"  ❌ Error en episodio {index + 1}: {error_msg}")
-            return {"success": False, "old_id": episode_id, "error": error_msg}
+            print(f"  ❌ Error en lote {start + 1}-{start + len(episodes)}: {error_msg}")
+            return [{"success": False, "old_id": old_id, "error": error_msg} for old_id in old_ids]
 
     except Exception as e:
         error_msg = str(e)
-        print(f"  ❌ Excepción en episodio {index + 1}: {error_msg}")
-        return {"success": False, "old_id": episode.get("episode_id"), "error": error_msg}
+        print(f"  ❌ Excepción en lote {start + 1}-{start + len(episodes)}: {error_msg}")
+        return [{"success": False, "old_id": old_id, "error": error_msg} for old_id in old_ids]
 
 
 def wait_for_embeddings(expected_count):
@@ -233,13 +240,9 @@ def main():
     print("🔄 INICIANDO MIGRACIÓN...")
     results = []
 
-    for i, episode in enumerate(source_episodes):
-        result = migrate_episode(episode, i, total_episodes)
-        results.append(result)
-
-        # Pequeña pausa para no saturar
-        if i % 20 == 0 and i > 0:
-            time.sleep(0.5)
+    for start in range(0, total_episodes, BATCH_SIZE):
+        batch = source_episodes[start:start + BATCH_SIZE]
+        results.extend(migrate_batch(batch, start, total_episodes))
 
     # 3. Reporte migración
     successful = [r for r in results if r["success"]]
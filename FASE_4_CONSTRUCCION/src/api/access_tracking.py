@@ -0,0 +1,192 @@
+"""
+NEXUS Cerebro API - Write-Behind Access Tracking
+
+Retrieval hits (intelligent decay access factor) are recorded in memory and
+written to metadata.access_tracking in the background:
+- Hits coalesced per episode (count + latest access time)
+- Flushed as ONE set-based UPDATE when the buffer reaches a size
+  threshold or a time interval elapses
+- Drained on shutdown from the FastAPI lifespan
+
+Request handlers only append to a dict, so search latency no longer grows
+with the number of results returned.
+"""
+
+import asyncio
+import os
+import time
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Optional, Tuple
+
+from prometheus_client import Counter, Gauge, Histogram
+
+# ============================================
+# Configuration
+# ============================================
+ACCESS_TRACKING_FLUSH_SIZE = int(os.getenv("ACCESS_TRACKING_FLUSH_SIZE", "500"))  # distinct episodes
+ACCESS_TRACKING_FLUSH_INTERVAL = float(os.getenv("ACCESS_TRACKING_FLUSH_INTERVAL", "2.0"))  # seconds
+ACCESS_TRACKING_MAX_PENDING = int(os.getenv("ACCESS_TRACKING_MAX_PENDING", "100000"))
+
+# Same keys the decay score / pruning queries read
+FLUSH_ACCESS_TRACKING_SQL = """
+    UPDATE nexus_memory.zep_episodic_memory AS e
+    SET metadata = jsonb_set(
+        COALESCE(e.metadata, '{}'::jsonb),
+        '{access_tracking}',
+        COALESCE(e.metadata->'access_tracking', '{}'::jsonb) || jsonb_build_object(
+            'access_count', COALESCE((e.metadata->'access_tracking'->>'access_count')::int, 0) + b.hits,
+            'last_accessed', b.last_accessed
+        )
+    )
+    FROM unnest(%s::uuid[], %s::int[], %s::timestamptz[]) AS b(episode_id, hits, last_accessed)
+    WHERE e.episode_id = b.episode_id
+"""
+
+# ============================================
+# Prometheus Metrics
+# ============================================
+access_tracking_pending = Gauge(
+    'nexus_access_tracking_pending_episodes',
+    'Distinct episodes with access hits waiting to be flushed'
+)
+
+access_tracking_flushes_total = Counter(
+    'nexus_access_tracking_flushes_total',
+    'Access tracking flushes',
+    ['status']
+)
+
+access_tracking_flush_duration_seconds = Histogram(
+    'nexus_access_tracking_flush_duration_seconds',
+    'Duration of one set-based access tracking flush'
+)
+
+access_tracking_dropped_total = Counter(
+    'nexus_access_tracking_dropped_total',
+    'Access hits dropped because the buffer exceeded its pending limit'
+)
+
+
+class AccessTrackingBuffer:
+    """
+    Coalescing write-behind buffer for episode access hits
+
+    Args:
+        pool: psycopg AsyncConnectionPool used for flushes
+        flush_size: Flush as soon as this many distinct episodes are pending
+        flush_interval: Flush at least this often (seconds) while hits exist
+        max_pending: Hard cap on distinct pending episodes (DB outage guard)
+    """
+
+    def __init__(self,
+                 pool,
+                 flush_size: int = ACCESS_TRACKING_FLUSH_SIZE,
+                 flush_interval: float = ACCESS_TRACKING_FLUSH_INTERVAL,
+                 max_pending: int = ACCESS_TRACKING_MAX_PENDING):
+        self.pool = pool
+        self.flush_size = max(1, flush_size)
+        self.flush_interval = flush_interval
+        self.max_pending = max(self.flush_size, max_pending)
+
+        # episode_id -> (hits, last_accessed)
+        self._pending: Dict[str, Tuple[int, datetime]] = {}
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+
+    def record(self, episode_ids: Iterable):
+        """Record one access hit for each episode (non-blocking)"""
+        now = datetime.now(timezone.utc)
+        for episode_id in episode_ids:
+            key = str(episode_id)
+            entry = self._pending.get(key)
+            if entry is None:
+                if len(self._pending) >= self.max_pending:
+                    access_tracking_dropped_total.inc()
+                    continue
+                self._pending[key] = (1, now)
+            else:
+                self._pending[key] = (entry[0] + 1, now)
+
+        access_tracking_pending.set(len(self._pending))
+        if self._wakeup is not None and len(self._pending) >= self.flush_size:
+            self._wakeup.set()
+
+    async def start(self):
+        """Start the background flush loop"""
+        if self._task is not None:
+            return
+        self._wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self):
+        """Stop the flush loop and drain remaining hits"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    async def flush(self) -> int:
+        """
+        Write all pending hits in one statement
+
+        Returns:
+            Number of distinct episodes flushed
+        """
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+
+        async with self._flush_lock:
+            if not self._pending or self.pool is None:
+                return 0
+
+            batch, self._pending = self._pending, {}
+            access_tracking_pending.set(0)
+
+            # Sorted ids keep row lock order stable across concurrent flushers
+            episode_ids = sorted(batch)
+            hits = [batch[e][0] for e in episode_ids]
+            last_accessed = [batch[e][1] for e in episode_ids]
+
+            start = time.perf_counter()
+            try:
+                async with self.pool.connection() as conn:
+                    async with conn.cursor() as cur:
+                        await cur.execute(FLUSH_ACCESS_TRACKING_SQL, (episode_ids, hits, last_accessed))
+            except Exception as e:
+                print(f"⚠ Access tracking flush failed ({len(batch)} episodes): {e}")
+                access_tracking_flushes_total.labels(status='error').inc()
+                self._requeue(batch)
+                return 0
+            finally:
+                access_tracking_flush_duration_seconds.observe(time.perf_counter() - start)
+
+            access_tracking_flushes_total.labels(status='success').inc()
+            return len(batch)
+
+    def _requeue(self, batch: Dict[str, Tuple[int, datetime]]):
+        """Merge a failed batch back so the next flush retries it"""
+        for key, (hits, last_accessed) in batch.items():
+            entry = self._pending.get(key)
+            if entry is None:
+                if len(self._pending) >= self.max_pending:
+                    access_tracking_dropped_total.inc(hits)
+                    continue
+                self._pending[key] = (hits, last_accessed)
+            else:
+                self._pending[key] = (entry[0] + hits, max(entry[1], last_accessed))
+        access_tracking_pending.set(len(self._pending))
+
+    async def _flush_loop(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
@@ -0,0 +1,121 @@
+"""
+NEXUS Cerebro API - Streamed Bulk Ingest Body
+
+/memory/actions/bulk accepts a JSON array or NDJSON (one object per line).
+The body is parsed as its chunks arrive instead of being read whole:
+- NDJSON: every complete line is decoded as soon as its newline arrives
+- JSON array: elements are decoded one by one with JSONDecoder.raw_decode
+Only the unparsed tail of the body stays in memory, next to the rows the
+caller has already taken; the caller enforces the byte / row limits.
+"""
+
+import codecs
+import json
+from typing import Any, List
+
+_WHITESPACE = " \t\r\n"
+# Longest token a chunk boundary can cut before raw_decode reports it
+# ("-Infinity", a \uXXXX escape, a number's "1.5e+" tail)
+_TRUNCATION_SLACK = 10
+
+
+def is_ndjson(content_type: str) -> bool:
+    """NDJSON / JSON Lines content type (anything else is a JSON array)"""
+    content_type = content_type.lower()
+    return "ndjson" in content_type or "jsonlines" in content_type
+
+
+def _cut_by_chunk(error: json.JSONDecodeError, size: int) -> bool:
+    """Whether more data could still complete the element raw_decode failed on"""
+    return error.msg.startswith("Unterminated string") or size - error.pos < _TRUNCATION_SLACK
+
+
+class BulkBodyParser:
+    """
+    Incremental parser for a bulk ingest body
+
+    Args:
+        content_type: Request Content-Type (selects NDJSON or JSON array)
+
+    feed(chunk) returns the rows completed by that chunk; feed(b"", final=True)
+    flushes the last row. Raises ValueError (UnicodeDecodeError included) on a
+    malformed body.
+    """
+
+    _decoder = json.JSONDecoder()
+
+    def __init__(self, content_type: str = ""):
+        self.ndjson = is_ndjson(content_type)
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._pending: List[str] = []   # Pieces of the current line / not yet joined onto _buffer
+        self._pending_size = 0
+        self._buffer = ""               # JSON array: undecoded tail
+        self._retry_at = 0              # JSON array: tail size worth decoding again
+        self._state = "start"           # JSON array: start | first | item | comma | end
+
+    def feed(self, chunk: bytes, final: bool = False) -> List[Any]:
+        text = self._text.decode(chunk, final)
+        return self._lines(text, final) if self.ndjson else self._array(text, final)
+
+    def _lines(self, text: str, final: bool) -> List[Any]:
+        # Only the new text is searched for newlines, so long lines cost O(n)
+        *lines, tail = text.split("\n")
+        if lines:
+            lines[0] = "".join(self._pending) + lines[0]
+            self._pending = []
+        self._pending.append(tail)
+        if final:
+            lines.append("".join(self._pending))
+            self._pending = []
+        return [json.loads(line) for line in lines if line.strip()]
+
+    def _array(self, text: str, final: bool) -> List[Any]:
+        # An element cut by a chunk is retried only once the tail has doubled,
+        # so one large element is decoded (and copied) O(log size) times
+        self._pending.append(text)
+        self._pending_size += len(text)
+        if not final and len(self._buffer) + self._pending_size < self._retry_at:
+            return []
+        buf = self._buffer + "".join(self._pending)
+        self._pending = []
+        self._pending_size = 0
+        self._retry_at = 0
+        pos = 0
+        items = []
+        while True:
+            while pos < len(buf) and buf[pos] in _WHITESPACE:
+                pos += 1
+            if pos == len(buf):
+                break
+            if self._state == "start":
+                if buf[pos] != "[":
+                    raise ValueError("Bulk body must be a JSON array or NDJSON (one action per line)")
+                pos += 1
+                self._state = "first"
+            elif self._state == "end":
+                raise ValueError(f"Extra data after the JSON array at offset {pos}")
+            elif buf[pos] == "]" and self._state in ("first", "comma"):
+                pos += 1
+                self._state = "end"
+            elif self._state == "comma":
+                if buf[pos] != ",":
+                    raise ValueError(f"Expected ',' or ']' in the JSON array, got {buf[pos]!r}")
+                pos += 1
+                self._state = "item"
+            else:
+                try:
+                    item, end = self._decoder.raw_decode(buf, pos)
+                except json.JSONDecodeError as e:
+                    if final or not _cut_by_chunk(e, len(buf)):
+                        raise  # Malformed before the end of the data: fail now
+                    self._retry_at = 2 * (len(buf) - pos)
+                    break  # Element cut by the chunk boundary: wait for more
+                if end == len(buf) and not final:
+                    break  # A number or literal may continue in the next chunk
+                items.append(item)
+                pos = end
+                self._state = "comma"
+        self._buffer = buf[pos:]
+        if final and self._state != "end":
+            raise ValueError("Unterminated JSON array")
+        return items
@@ -20,13 +20,17 @@ Lab: LAB_004 - Curiosity-Driven Memory (novelty detection)
 import numpy as np
 import psycopg
 from psycopg.rows import dict_row
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass, field
+import bisect
 import json
 import math
+import multiprocessing
 import sys
 import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 # LAB_004: Curiosity-Driven Memory - Novelty Detection
 # Add NEXUS_LABS path for imports
@@ -96,6 +100,263 @@ class ConsolidationReport:
     max_boost: float
     processing_time_seconds: float
     top_breakthroughs: List[Dict]
+    boosted_episode_ids: List[str] = field(default_factory=list)  # Rows whose importance_score changed
+
+
+@dataclass
+class BatchConsolidationReport:
+    """Report of a multi-day consolidation (consolidate_date_range)"""
+    start_date: date
+    end_date: date  # Exclusive
+    workers: int
+    days_processed: int
+    days_failed: Dict[str, str]  # ISO day -> error
+    episodes_processed: int
+    trace_count: int
+    baseline_seconds: float  # Fetching the batch's novelty history
+    wall_seconds: float
+    days_per_minute: float
+    episodes_per_second: float
+    reports: List[ConsolidationReport] = field(default_factory=list)  # Day order
+
+
+def base_importance(row: Dict) -> float:
+    """
+    Importance an episode had before any consolidation boosted it
+
+    Boosts are applied to this base (kept in metadata.pre_consolidation_importance
+    by the first run), so re-consolidating a day replaces earlier boosts
+    instead of compounding them.
+    """
+    metadata = row['metadata'] or {}
+    return float(metadata.get('pre_consolidation_importance', row['importance_score']))
+
+
+# LAB_001 dimension order of the columnar arrays
+EMOTION_DIMENSIONS = ('joy', 'trust', 'fear', 'surprise', 'sadness', 'disgust', 'anger', 'anticipation')
+SOMATIC_DIMENSIONS = ('valence', 'arousal', 'body_state', 'cognitive_load',
+                      'emotional_regulation', 'social_engagement', 'temporal_awareness')
+
+
+@dataclass
+class EpisodeColumns:
+    """
+    A day's episodes as columnar arrays (row i = episodes[i])
+
+    Built once per consolidation run. Breakthrough scoring, the percentile
+    threshold and chain boosts are array expressions over these columns;
+    results are written back to the Episode objects for the later steps.
+    """
+    episode_ids: List[str]
+    salience: np.ndarray     # (N,)
+    emotions: np.ndarray     # (N, 8) in EMOTION_DIMENSIONS order, missing = 0
+    somatic: np.ndarray      # (N, 7) in SOMATIC_DIMENSIONS order, missing = 0
+    importance: np.ndarray   # (N,) updated by consolidate_chains
+    novelty: np.ndarray      # (N,)
+    created_us: np.ndarray   # (N,) int64 microseconds since the first episode (exact time differences)
+    breakthrough: Optional[np.ndarray] = None   # Set by identify_breakthroughs
+    consolidated: Optional[np.ndarray] = None   # Set by consolidate_chains (NaN = not in a chain)
+    index: Dict[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def from_episodes(cls, episodes: List[Episode]) -> 'EpisodeColumns':
+        """Extract the scoring columns in one pass per column (no per-episode arrays)"""
+        n = len(episodes)
+        origin = episodes[0].created_at if episodes else None
+        one_us = timedelta(microseconds=1)
+        columns = cls(
+            episode_ids=[ep.episode_id for ep in episodes],
+            salience=np.fromiter((ep.salience_score for ep in episodes), dtype=np.float64, count=n),
+            emotions=np.fromiter((ep.emotional_8d.get(d, 0) for ep in episodes for d in EMOTION_DIMENSIONS),
+                                 dtype=np.float64, count=n * len(EMOTION_DIMENSIONS)
+                                 ).reshape(n, len(EMOTION_DIMENSIONS)),
+            somatic=np.fromiter((ep.somatic_7d.get(d, 0) for ep in episodes for d in SOMATIC_DIMENSIONS),
+                                dtype=np.float64, count=n * len(SOMATIC_DIMENSIONS)
+                                ).reshape(n, len(SOMATIC_DIMENSIONS)),
+            importance=np.fromiter((ep.importance_score for ep in episodes), dtype=np.float64, count=n),
+            novelty=np.fromiter((ep.novelty_score for ep in episodes), dtype=np.float64, count=n),
+            created_us=np.fromiter(((ep.created_at - origin) // one_us for ep in episodes), dtype=np.int64, count=n)
+        )
+        columns.index = {episode_id: row for row, episode_id in enumerate(columns.episode_ids)}
+        return columns
+
+    def __len__(self) -> int:
+        return len(self.episode_ids)
+
+    def rows(self, episodes: List[Episode]) -> np.ndarray:
+        """Row numbers of `episodes` (must belong to this day)"""
+        return np.fromiter((self.index[ep.episode_id] for ep in episodes), dtype=np.int64, count=len(episodes))
+
+
+# Backward chain tracing (Dickinson 1996 retrospective revaluation)
+CHAIN_LOOKBACK = timedelta(hours=12)       # Candidates precede the breakthrough by at most this
+CHAIN_PROXIMITY = timedelta(hours=1)       # Closer than this to the chain's earliest episode = related
+CHAIN_SIMILARITY_THRESHOLD = 0.65
+CHAIN_MIN_SHARED_TAGS = 2
+CHAIN_SIMILARITY_BLOCK_BYTES = 32 * 1024 * 1024  # Breakthrough x candidate similarity block
+
+
+class ChainIndex:
+    """
+    Lookup structures for backward chain tracing over one day
+
+    - Episodes in descending created_at order (ties keep input order), so
+      every 12-hour lookback window is one contiguous slice, found by bisection
+    - run_end[p]: last position reachable from p through gaps under 1 hour
+      (the temporal-proximity walk covers whole runs at once)
+    - Session and tag inverted indexes: sorted positions per key
+    - Embedded episodes for a batched breakthrough x candidate similarity matrix
+
+    Args:
+        episodes: All episodes of the day
+    """
+
+    def __init__(self, episodes: List[Episode]):
+        n = len(episodes)
+        self.origin = episodes[0].created_at if episodes else None
+        times = np.fromiter((self.to_us(ep.created_at) for ep in episodes), dtype=np.int64, count=n)
+
+        self.order = np.lexsort((np.arange(n), -times))
+        self.episodes = [episodes[row] for row in self.order.tolist()]
+        self.times = times[self.order]
+        self.neg_times = -self.times  # Non-decreasing, for searchsorted
+
+        # Runs of consecutive positions separated by gaps < CHAIN_PROXIMITY
+        proximity = CHAIN_PROXIMITY // timedelta(microseconds=1)
+        breaks = np.append(np.flatnonzero(self.times[:-1] - self.times[1:] >= proximity), n - 1)
+        self.run_end = breaks[np.searchsorted(breaks, np.arange(n))] if n else breaks
+
+        sessions: Dict[str, List[int]] = {}
+        tags: Dict[str, List[int]] = {}
+        for position, episode in enumerate(self.episodes):
+            if episode.session_id:
+                sessions.setdefault(episode.session_id, []).append(position)
+            for tag in set(episode.tags):
+                tags.setdefault(tag, []).append(position)
+        self.sessions = {key: np.array(positions, dtype=np.int64) for key, positions in sessions.items()}
+        self.tags = {key: np.array(positions, dtype=np.int64) for key, positions in tags.items()}
+
+        embedded = [p for p, episode in enumerate(self.episodes) if episode.embedding]
+        self.embedded_positions = np.array(embedded, dtype=np.int64)
+        self.embeddings = (np.array([self.episodes[p].embedding for p in embedded], dtype=np.float64)
+                           if embedded else np.zeros((0, 0)))
+        self.embedding_norms = np.linalg.norm(self.embeddings, axis=1) if embedded else np.zeros(0)
+
+    def to_us(self, moment: datetime) -> int:
+        """Exact microseconds since the first episode"""
+        return (moment - self.origin) // timedelta(microseconds=1)
+
+    def window(self, moment: datetime) -> Tuple[int, int]:
+        """Positions [start, end) of episodes with moment - 12h <= created_at < moment"""
+        t = self.to_us(moment)
+        lookback = CHAIN_LOOKBACK // timedelta(microseconds=1)
+        start = int(np.searchsorted(self.neg_times, -t, side='right'))
+        end = int(np.searchsorted(self.neg_times, -(t - lookback), side='right'))
+        return start, end
+
+    def _in_window(self, positions: np.ndarray, start: int, end: int) -> np.ndarray:
+        return positions[np.searchsorted(positions, start):np.searchsorted(positions, end)]
+
+    def fixed_related(self, breakthrough: Episode, start: int, end: int) -> np.ndarray:
+        """Window positions sharing the breakthrough's session or at least two of its tags"""
+        related = []
+        if breakthrough.session_id and breakthrough.session_id in self.sessions:
+            related.append(self._in_window(self.sessions[breakthrough.session_id], start, end))
+        tags = set(breakthrough.tags)
+        if len(tags) >= CHAIN_MIN_SHARED_TAGS:
+            tagged = [self._in_window(self.tags[tag], start, end) for tag in tags if tag in self.tags]
+            if tagged:
+                positions, counts = np.unique(np.concatenate(tagged), return_counts=True)
+                related.append(positions[counts >= CHAIN_MIN_SHARED_TAGS])
+        if not related:
+            return np.zeros(0, dtype=np.int64)
+        return np.unique(np.concatenate(related))
+
+    def similar(self, breakthroughs: List[Episode], windows: List[Tuple[int, int]],
+                cosine_similarity) -> List[np.ndarray]:
+        """
+        Window positions with cosine similarity above the threshold, per breakthrough
+
+        Breakthroughs are processed in blocks: one matrix product against the
+        embedded candidates spanning the block's windows. Values within 1e-9
+        of the threshold are recomputed with `cosine_similarity` so the
+        decision matches the pairwise computation exactly.
+        """
+        result = [np.zeros(0, dtype=np.int64) for _ in breakthroughs]
+        if not len(self.embedded_positions):
+            return result
+        queries = [i for i, b in enumerate(breakthroughs) if b.embedding and windows[i][0] < windows[i][1]]
+        queries.sort(key=lambda i: windows[i][0])
+
+        i = 0
+        while i < len(queries):
+            # Grow the block while the similarity matrix fits the byte budget
+            lo_start = windows[queries[i]][0]
+            block = []
+            hi_end = lo_start
+            while i < len(queries):
+                start, end = windows[queries[i]]
+                width = (np.searchsorted(self.embedded_positions, max(hi_end, end))
+                         - np.searchsorted(self.embedded_positions, lo_start))
+                if block and (len(block) + 1) * width * 8 > CHAIN_SIMILARITY_BLOCK_BYTES:
+                    break
+                block.append(queries[i])
+                hi_end = max(hi_end, end)
+                i += 1
+
+            c0 = np.searchsorted(self.embedded_positions, lo_start)
+            c1 = np.searchsorted(self.embedded_positions, hi_end)
+            if c0 == c1:
+                continue
+            candidates = self.embedded_positions[c0:c1]
+            query_vectors = np.array([breakthroughs[q].embedding for q in block], dtype=np.float64)
+            query_norms = np.linalg.norm(query_vectors, axis=1)
+            dots = query_vectors @ self.embeddings[c0:c1].T
+            with np.errstate(divide='ignore', invalid='ignore'):
+                sims = dots / (self.embedding_norms[c0:c1][None, :] * query_norms[:, None])
+            sims[:, self.embedding_norms[c0:c1] == 0] = 0.0
+            sims[query_norms == 0, :] = 0.0
+
+            for row, q in enumerate(block):
+                start, end = windows[q]
+                k0, k1 = np.searchsorted(candidates, start), np.searchsorted(candidates, end)
+                window_sims = sims[row, k0:k1]
+                related = window_sims > CHAIN_SIMILARITY_THRESHOLD
+                for k in np.flatnonzero(np.abs(window_sims - CHAIN_SIMILARITY_THRESHOLD) < 1e-9).tolist():
+                    episode = self.episodes[candidates[k0 + k]]
+                    related[k] = cosine_similarity(episode.embedding, breakthroughs[q].embedding) > \
+                        CHAIN_SIMILARITY_THRESHOLD
+                result[q] = candidates[k0:k1][related]
+        return result
+
+    def chain(self, breakthrough: Episode, start: int, end: int, related: np.ndarray) -> List[Episode]:
+        """
+        Earliest-first chain ending at the breakthrough
+
+        Walking back from the breakthrough, a candidate joins when it is
+        related (session / tags / similarity) or closer than 1 hour to the
+        last episode that joined; the walk therefore takes whole runs, and
+        jumps over a gap only at a related episode.
+        """
+        proximity = CHAIN_PROXIMITY // timedelta(microseconds=1)
+        segments = []
+        position = start
+        if start < end and self.to_us(breakthrough.created_at) - self.times[start] < proximity:
+            stop = min(int(self.run_end[start]), end - 1)
+            segments.append((start, stop))
+            position = stop + 1
+        for j in related[np.searchsorted(related, position):].tolist():
+            if j < position:
+                continue
+            stop = min(int(self.run_end[j]), end - 1)
+            segments.append((j, stop))
+            position = stop + 1
+
+        chain = []
+        for first, last in reversed(segments):
+            chain.extend(self.episodes[last:first - 1 if first else None:-1])
+        chain.append(breakthrough)
+        return chain
 
 
 class ConsolidationEngine:
@@ -134,6 +395,9 @@ class ConsolidationEngine:
         # LAB_004: Novelty detection
         self.novelty_detector = None
         self.baseline_models = None
+        self.baseline_end: Optional[date] = None  # Day the baseline history ends before
+        self.baseline_history: Optional[List[Episode]] = None  # Batch: history fetched once by the parent
+        self._history_keys: List[datetime] = []
         if LAB_004_AVAILABLE:
             try:
                 self.novelty_detector = NoveltyDetector()
@@ -229,7 +493,7 @@ class ConsolidationEngine:
                 created_at=row['created_at'],
                 session_id=session_id,
                 tags=row['tags'] if row['tags'] else [],
-                importance_score=float(row['importance_score']),
+                importance_score=base_importance(row),
                 salience_score=salience_score,
                 emotional_8d=emotional_8d,
                 somatic_7d=somatic_7d
@@ -293,7 +557,7 @@ class ConsolidationEngine:
                 created_at=row['created_at'],
                 session_id=session_id,
                 tags=row['tags'] if row['tags'] else [],
-                importance_score=float(row['importance_score']),
+                importance_score=base_importance(row),
                 salience_score=salience_score,
                 emotional_8d=emotional_8d,
                 somatic_7d=somatic_7d
@@ -307,92 +571,88 @@ class ConsolidationEngine:
     # STEP 2: IDENTIFY BREAKTHROUGHS
     # =====================================================================
 
-    def identify_breakthroughs(self,
-                               episodes: List[Episode],
-                               threshold_percentile: int = 80) -> List[Episode]:
+    def score_breakthroughs(self, columns: EpisodeColumns) -> np.ndarray:
         """
-        Detect breakthrough episodes using composite scoring
+        Composite breakthrough score for every row of `columns`
 
         Based on:
         - O'Neill 2010: Reward-related memories replayed 5-10x more
         - LAB_004: Novelty bonus for surprising episodes
 
+        Args:
+            columns: Columnar view of the day's episodes
+
+        Returns:
+            (N,) scores (same values as the per-episode formula)
+        """
+        emotions = columns.emotions
+        emotion_sum = (emotions[:, EMOTION_DIMENSIONS.index('joy')]
+                       + emotions[:, EMOTION_DIMENSIONS.index('trust')]
+                       + emotions[:, EMOTION_DIMENSIONS.index('anticipation')]
+                       + emotions[:, EMOTION_DIMENSIONS.index('surprise')])
+        positive_valence = np.maximum(0, columns.somatic[:, SOMATIC_DIMENSIONS.index('valence')])
+
+        if np.any(columns.novelty > 0):
+            # Enhanced scoring with LAB_004 novelty:
+            # salience 35%, breakthrough emotions 20%, somatic valence 15%,
+            # importance 15%, novelty 15%
+            return (columns.salience * 0.35
+                    + (emotion_sum / 4) * 0.20
+                    + positive_valence * 0.15
+                    + columns.importance * 0.15
+                    + columns.novelty * 0.15)
+
+        # Original LAB_003 scoring (without novelty):
+        # salience 40%, breakthrough emotions 25%, somatic valence 15%, importance 20%
+        return (columns.salience * 0.4
+                + (emotion_sum / 4) * 0.25
+                + positive_valence * 0.15
+                + columns.importance * 0.20)
+
+    def identify_breakthroughs(self,
+                               episodes: List[Episode],
+                               threshold_percentile: int = 80,
+                               columns: Optional[EpisodeColumns] = None) -> List[Episode]:
+        """
+        Detect breakthrough episodes using composite scoring
+
         Args:
             episodes: List of episodes from the day
             threshold_percentile: Top X% considered breakthroughs
+            columns: Columnar view of `episodes` (built here if not given)
 
         Returns:
             List of breakthrough episodes sorted by importance
         """
         if not episodes:
             return []
+        if columns is None:
+            columns = EpisodeColumns.from_episodes(episodes)
 
-        # Check if LAB_004 novelty available
-        has_novelty = any(ep.novelty_score > 0 for ep in episodes)
-
-        for episode in episodes:
-            score = 0.0
-
-            if has_novelty:
-                # Enhanced scoring with LAB_004 novelty
-                # Signal 1: Emotional salience (LAB_001) - 35% weight (reduced from 40%)
-                score += episode.salience_score * 0.35
-
-                # Signal 2: Breakthrough emotions - 20% weight (reduced from 25%)
-                breakthrough_emotions = ['joy', 'trust', 'anticipation', 'surprise']
-                emotion_sum = sum(episode.emotional_8d.get(e, 0)
-                                for e in breakthrough_emotions)
-                score += (emotion_sum / 4) * 0.20
-
-                # Signal 3: Somatic valence (positive outcomes) - 15% weight (same)
-                valence = episode.somatic_7d.get('valence', 0)
-                score += max(0, valence) * 0.15
-
-                # Signal 4: Importance score (pre-existing) - 15% weight (reduced from 20%)
-                score += episode.importance_score * 0.15
-
-                # Signal 5: Novelty score (LAB_004) - 15% weight (NEW)
-                score += episode.novelty_score * 0.15
-
-            else:
-                # Original LAB_003 scoring (without novelty)
-                # Signal 1: Emotional salience (LAB_001) - 40% weight
-                score += episode.salience_score * 0.4
-
-                # Signal 2: Breakthrough emotions - 25% weight
-                breakthrough_emotions = ['joy', 'trust', 'anticipation', 'surprise']
-                emotion_sum = sum(episode.emotional_8d.get(e, 0)
-                                for e in breakthrough_emotions)
-                score += (emotion_sum / 4) * 0.25
-
-                # Signal 3: Somatic valence (positive outcomes) - 15% weight
-                valence = episode.somatic_7d.get('valence', 0)
-                score += max(0, valence) * 0.15
-
-                # Signal 4: Importance score (pre-existing) - 20% weight
-                score += episode.importance_score * 0.20
-
+        scores = self.score_breakthroughs(columns)
+        columns.breakthrough = scores
+        for episode, score in zip(episodes, scores.tolist()):
             episode.breakthrough_score = score
 
         # Calculate threshold (top 20%)
-        scores = [e.breakthrough_score for e in episodes]
         threshold = np.percentile(scores, threshold_percentile)
 
-        breakthroughs = [e for e in episodes if e.breakthrough_score >= threshold]
-        breakthroughs.sort(key=lambda x: x.breakthrough_score, reverse=True)
-
-        return breakthroughs
+        # Highest score first; ties keep chronological order (stable sort)
+        rows = np.flatnonzero(scores >= threshold)
+        rows = rows[np.argsort(-scores[rows], kind='stable')]
+        return [episodes[row] for row in rows.tolist()]
 
     # =====================================================================
     # LAB_004: NOVELTY DETECTION
     # =====================================================================
 
-    def build_novelty_baselines(self, lookback_days: int = 60):
+    def build_novelty_baselines(self, lookback_days: int = 60, end: Optional[datetime] = None):
         """
         Build baseline models for novelty detection
 
         Args:
             lookback_days: How many days of history to use (default 60)
+            end: End of the history window (default: now)
 
         Returns:
             True if successful, False otherwise
@@ -405,11 +665,14 @@ class ConsolidationEngine:
             print(f"📊 LAB_004: Building baseline models from last {lookback_days} days...")
 
             # Fetch historical episodes for baseline
-            now = datetime.now()
+            now = end or datetime.now()
             start_date = now - timedelta(days=lookback_days)
 
             historical_episodes = []
-            all_episodes = self.fetch_episodes_from_date_range(start_date, now)
+            if self.baseline_history is not None:
+                all_episodes = self.history_slice(start_date, now)
+            else:
+                all_episodes = self.fetch_episodes_from_date_range(start_date, now)
 
             # Convert to NoveltyEpisode format
             for ep in all_episodes:
@@ -431,6 +694,7 @@ class ConsolidationEngine:
 
             # Build baselines
             self.baseline_models = self.novelty_detector.build_baseline_models(historical_episodes)
+            self.baseline_end = now.date()
 
             print(f"✅ LAB_004: Baseline models built from {len(historical_episodes)} episodes")
             return True
@@ -441,6 +705,25 @@ class ConsolidationEngine:
             traceback.print_exc()
             return False
 
+    def set_baseline_history(self, episodes: Optional[List[Episode]]):
+        """
+        Serve baseline windows from pre-fetched history instead of the database
+
+        Args:
+            episodes: Episodes ordered by created_at (fetch_episodes_from_date_range),
+                covering every window that will be built; None = fetch per build
+        """
+        self.baseline_history = episodes
+        # Naive wall-clock keys: the SQL range compares naive bounds in the session time zone
+        self._history_keys = [ep.created_at.replace(tzinfo=None) for ep in episodes or []]
+        self.baseline_end = None
+
+    def history_slice(self, start_date: datetime, end_date: datetime) -> List[Episode]:
+        """Episodes of baseline_history with start_date <= created_at < end_date"""
+        lo = bisect.bisect_left(self._history_keys, start_date)
+        hi = bisect.bisect_left(self._history_keys, end_date)
+        return self.baseline_history[lo:hi]
+
     def calculate_novelty_for_episodes(self, episodes: List[Episode]):
         """
         Calculate novelty scores for all episodes
@@ -538,6 +821,13 @@ class ConsolidationEngine:
 
         Based on Dickinson 1996: Retrospective revaluation
 
+        A candidate from the 12 hours before a breakthrough joins its chain
+        when it shares the session, shares 2+ tags, is semantically similar
+        (cosine > 0.65), or lies within 1 hour of the chain's earliest
+        episode so far. Windows, sessions and tags are looked up in a
+        ChainIndex and similarities computed in blocks, so the cost follows
+        the chains produced rather than breakthroughs x episodes.
+
         Args:
             breakthroughs: List of breakthrough episodes
             all_episodes: All episodes from the day
@@ -545,51 +835,19 @@ class ConsolidationEngine:
         Returns:
             List of chains (sequences of related episodes)
         """
-        chains = []
-
-        for breakthrough in breakthroughs:
-            chain = [breakthrough]
-            current_time = breakthrough.created_at
-
-            # Look back up to 12 hours
-            window_start = current_time - timedelta(hours=12)
-
-            # Find candidates
-            candidates = [e for e in all_episodes
-                         if window_start <= e.created_at < current_time]
-
-            # Sort by recency (most recent first)
-            candidates.sort(key=lambda x: x.created_at, reverse=True)
-
-            for candidate in candidates:
-                # Relatedness criteria
-                is_related = False
-
-                # Same session
-                if (candidate.session_id and breakthrough.session_id and
-                    candidate.session_id == breakthrough.session_id):
-                    is_related = True
-
-                # Semantic similarity
-                if candidate.embedding and breakthrough.embedding:
-                    sim = self.cosine_similarity(candidate.embedding,
-                                                 breakthrough.embedding)
-                    if sim > 0.65:
-                        is_related = True
-
-                # Shared tags (at least 2)
-                shared_tags = set(candidate.tags) & set(breakthrough.tags)
-                if len(shared_tags) >= 2:
-                    is_related = True
+        if not breakthroughs or not all_episodes:
+            return []
 
-                # Temporal proximity (within 1 hour)
-                time_diff = (current_time - candidate.created_at).total_seconds()
-                if time_diff < 3600:
-                    is_related = True
+        index = ChainIndex(all_episodes)
+        windows = [index.window(b.created_at) for b in breakthroughs]
+        similar = index.similar(breakthroughs, windows, self.cosine_similarity)
 
-                if is_related:
-                    chain.insert(0, candidate)  # Add to beginning
-                    current_time = candidate.created_at  # Update search time
+        chains = []
+        for breakthrough, (start, end), similar_positions in zip(breakthroughs, windows, similar):
+            related = index.fixed_related(breakthrough, start, end)
+            if len(similar_positions):
+                related = np.union1d(related, similar_positions)
+            chain = index.chain(breakthrough, start, end, related)
 
             # Only keep chains with 2+ episodes
             if len(chain) >= 2:
@@ -654,8 +912,64 @@ class ConsolidationEngine:
             # Store both scores
             episode.consolidated_salience_score = consolidated_salience
 
-            # Update importance_score
-            episode.importance_score *= (1.0 + total_boost)
+            # Update importance_score (capped at 1.0, the column's CHECK bound)
+            episode.importance_score = min(episode.importance_score * (1.0 + total_boost), 1.0)
+
+    def consolidate_chains(self, chains: List[List[Episode]], columns: EpisodeColumns):
+        """
+        consolidate_chain for all chains at once, as array expressions
+
+        Chains are flattened into one row per (chain, position); boosts are
+        computed for all of them together. An episode in several chains keeps
+        the consolidated salience of the last one and compounds the
+        importance boosts in chain order, as the per-chain loop did.
+
+        Args:
+            chains: Chains from trace_breakthrough_chains
+            columns: Columnar view of the day (breakthrough scores set)
+        """
+        chains = [chain for chain in chains if len(chain) >= 2]
+        if columns.consolidated is None:
+            columns.consolidated = np.full(len(columns), np.nan)
+        if not chains:
+            return
+
+        members = [episode for chain in chains for episode in chain]
+        rows = columns.rows(members)
+        lengths = np.array([len(chain) for chain in chains], dtype=np.int64)
+        chain_length = np.repeat(lengths, lengths)
+        position = np.arange(len(rows)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        breakthrough_rows = np.repeat(rows[np.cumsum(lengths) - 1], lengths)
+
+        # Position in chain (earlier episodes get more boost)
+        position_weight = 1.0 - (position / chain_length)
+
+        # Distance from breakthrough (temporal decay, half-life 6 hours)
+        time_diff_hours = ((columns.created_us[breakthrough_rows] - columns.created_us[rows]) / 10**6) / 3600
+        temporal_decay = np.exp(-time_diff_hours / 6.0)
+
+        base_boost = columns.breakthrough[breakthrough_rows] * position_weight * temporal_decay * 0.25
+
+        # LAB_004: novelty bonus for high-novelty episodes (up to +0.15)
+        novelty = columns.novelty[rows]
+        novelty_bonus = np.where(novelty > 0.7, (novelty - 0.7) * 0.5, 0.0)
+
+        # Total boost capped at +0.25, consolidated salience capped at 1.0
+        total_boost = np.minimum(base_boost + novelty_bonus, 0.25)
+        consolidated = np.minimum(columns.salience[rows] + total_boost, 1.0)
+
+        # Last chain wins for the consolidated score; importance compounds in order
+        unique_rows, last_reversed = np.unique(rows[::-1], return_index=True)
+        last = len(rows) - 1 - last_reversed
+        columns.consolidated[unique_rows] = consolidated[last]
+        np.multiply.at(columns.importance, rows, 1.0 + total_boost)
+        np.minimum(columns.importance, 1.0, out=columns.importance)
+
+        consolidated_values = columns.consolidated.tolist()
+        importance_values = columns.importance.tolist()
+        for episode, row in zip(members, rows.tolist()):
+            episode.consolidated_salience_score = consolidated_values[row]
+            episode.importance_score = importance_values[row]
 
     # =====================================================================
     # STEP 5: INTERLEAVED REPLAY
@@ -732,7 +1046,9 @@ class ConsolidationEngine:
     # STEP 6: MEMORY TRACES
     # =====================================================================
 
-    def create_memory_traces(self, chains: List[List[Episode]]) -> List[MemoryTrace]:
+    def create_memory_traces(self,
+                             chains: List[List[Episode]],
+                             day: Optional[date] = None) -> List[MemoryTrace]:
         """
         Create directed graph edges between chain episodes
 
@@ -740,12 +1056,14 @@ class ConsolidationEngine:
 
         Args:
             chains: List of episode chains
+            day: Consolidated day, used in the narrative ids (default: today).
+                Days consolidated in the same run must not share ids.
 
         Returns:
             List of MemoryTrace objects
         """
         traces = []
-        date_str = datetime.now().strftime('%Y%m%d')
+        date_str = (day or datetime.now()).strftime('%Y%m%d')
 
         for chain_id, chain in enumerate(chains):
             narrative_id = f"chain_{date_str}_{chain_id}"
@@ -782,98 +1100,245 @@ class ConsolidationEngine:
     # STEP 7: DATABASE UPDATES
     # =====================================================================
 
-    def update_consolidated_scores(self, episodes: List[Episode]):
+    def update_consolidated_scores(self, episodes: List[Episode], day: Optional[date] = None):
         """
-        Update database with consolidated salience scores
+        Stage consolidated salience scores and apply them in one UPDATE
+
+        Rows are COPYed into a temp table (dropped at commit) and joined
+        against zep_episodic_memory, so the cost is one statement per run
+        instead of one round trip per episode. Does not commit.
+
+        Boosted importance is computed from the pre-consolidation base (see
+        base_importance); the first run records that base in metadata. With
+        `day`, episodes of that day boosted by an earlier run but not by this
+        one get their base importance back, so re-runs are idempotent.
 
         Args:
-            episodes: List of episodes with calculated consolidated scores
+            episodes: Episodes with calculated consolidated scores (an episode
+                in several chains may repeat; its last occurrence wins)
+            day: Consolidated day (restores episodes no longer boosted)
         """
+        rows = {}
         for episode in episodes:
             if episode.consolidated_salience_score is None:
                 continue
+            rows[episode.episode_id] = (
+                episode.episode_id,
+                float(episode.consolidated_salience_score),
+                float(episode.breakthrough_score),
+                float(episode.importance_score)
+            )
+        if not rows and day is None:
+            return 0
+
+        self.cursor.execute("""
+            CREATE TEMP TABLE consolidated_scores_stage (
+                episode_id UUID,
+                consolidated_salience_score FLOAT8,
+                breakthrough_score FLOAT8,
+                importance_score FLOAT8
+            ) ON COMMIT DROP
+        """)
+        if rows:
+            with self.cursor.copy("""
+                COPY consolidated_scores_stage
+                    (episode_id, consolidated_salience_score, breakthrough_score, importance_score)
+                FROM STDIN
+            """) as copy:
+                for row in rows.values():
+                    copy.write_row(row)
 
-            # Update metadata with new scores
             self.cursor.execute("""
-                UPDATE nexus_memory.zep_episodic_memory
+                UPDATE nexus_memory.zep_episodic_memory AS m
                 SET
-                    metadata = metadata || jsonb_build_object(
-                        'consolidated_salience_score', %s,
-                        'breakthrough_score', %s,
-                        'last_consolidated_at', %s
+                    metadata = COALESCE(m.metadata, '{}'::jsonb) || jsonb_build_object(
+                        'consolidated_salience_score', s.consolidated_salience_score,
+                        'breakthrough_score', s.breakthrough_score,
+                        'last_consolidated_at', %s::text,
+                        'pre_consolidation_importance',
+                        COALESCE(m.metadata->'pre_consolidation_importance', to_jsonb(m.importance_score))
                     ),
-                    importance_score = %s
-                WHERE episode_id = %s
-            """, (
-                float(episode.consolidated_salience_score),
-                float(episode.breakthrough_score),
-                datetime.now().isoformat(),
-                float(episode.importance_score),
-                episode.episode_id
-            ))
-
-        self.conn.commit()
+                    importance_score = s.importance_score
+                FROM consolidated_scores_stage AS s
+                WHERE m.episode_id = s.episode_id
+            """, (datetime.now().isoformat(),))
 
-    def store_memory_traces(self, traces: List[MemoryTrace]):
+        if day is not None:
+            start_of_day = datetime.combine(day, datetime.min.time())
+            self.cursor.execute("""
+                UPDATE nexus_memory.zep_episodic_memory AS m
+                SET
+                    importance_score = (m.metadata->>'pre_consolidation_importance')::float8,
+                    metadata = m.metadata - ARRAY['consolidated_salience_score', 'breakthrough_score']
+                WHERE m.created_at >= %s AND m.created_at < %s
+                  AND m.metadata ? 'pre_consolidation_importance'
+                  AND NOT EXISTS (
+                      SELECT 1 FROM consolidated_scores_stage AS s WHERE s.episode_id = m.episode_id
+                  )
+            """, (start_of_day, start_of_day + timedelta(days=1)))
+
+        return len(rows)
+
+    def store_memory_traces(self, traces: List[MemoryTrace], day: Optional[date] = None):
         """
-        Store memory traces in database
+        Stage memory traces with COPY and insert them in one statement
+
+        The memory_traces table is created by migrations 008_memory_traces.sql
+        and 010_memory_traces_day.sql. Does not commit.
 
         Args:
             traces: List of MemoryTrace objects
+            day: Consolidated day the traces belong to; its previous traces
+                are replaced (re-consolidation does not duplicate them)
         """
-        # Check if table exists
+        if day is not None:
+            self.cursor.execute("""
+                DELETE FROM nexus_memory.memory_traces WHERE consolidation_day = %s
+            """, (day,))
+
+        if not traces:
+            return 0
+
         self.cursor.execute("""
-            SELECT EXISTS (
-                SELECT FROM information_schema.tables
-                WHERE table_schema = 'nexus_memory'
-                  AND table_name = 'memory_traces'
-            )
+            CREATE TEMP TABLE memory_traces_stage (
+                source_episode_id UUID,
+                target_episode_id UUID,
+                trace_type VARCHAR(50),
+                strength FLOAT8,
+                narrative_id VARCHAR(100),
+                created_at TIMESTAMP
+            ) ON COMMIT DROP
         """)
+        with self.cursor.copy("""
+            COPY memory_traces_stage
+                (source_episode_id, target_episode_id, trace_type, strength, narrative_id, created_at)
+            FROM STDIN
+        """) as copy:
+            for trace in traces:
+                copy.write_row((
+                    trace.source_episode_id,
+                    trace.target_episode_id,
+                    trace.trace_type,
+                    float(trace.strength),
+                    trace.narrative_id,
+                    trace.created_at
+                ))
+
+        self.cursor.execute("""
+            INSERT INTO nexus_memory.memory_traces
+                (source_episode_id, target_episode_id, trace_type,
+                 strength, narrative_id, created_at, consolidation_day)
+            SELECT source_episode_id, target_episode_id, trace_type,
+                   strength, narrative_id, created_at, %s::date
+            FROM memory_traces_stage
+        """, (day,))
+
+        return len(traces)
+
+    def write_consolidation_results(self,
+                                    episodes: List[Episode],
+                                    traces: List[MemoryTrace],
+                                    checkpoint: Optional[Dict] = None,
+                                    day: Optional[date] = None) -> Tuple[int, int]:
+        """
+        Write a run's scores and traces in a single transaction
 
-        table_exists = self.cursor.fetchone()['exists']
+        Either both the score UPDATE and the trace INSERT land, or neither
+        does (a failed run leaves no half-written day behind). With a
+        checkpoint, the day is marked consolidated in the same transaction.
 
-        if not table_exists:
-            # Create table if it doesn't exist
-            self.cursor.execute("""
-                CREATE TABLE nexus_memory.memory_traces (
-                    trace_id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
-                    source_episode_id UUID,
-                    target_episode_id UUID,
-                    trace_type VARCHAR(50),
-                    strength FLOAT,
-                    narrative_id VARCHAR(100),
-                    created_at TIMESTAMP DEFAULT NOW()
-                );
-
-                CREATE INDEX idx_memory_traces_source ON nexus_memory.memory_traces(source_episode_id);
-                CREATE INDEX idx_memory_traces_target ON nexus_memory.memory_traces(target_episode_id);
-                CREATE INDEX idx_memory_traces_narrative ON nexus_memory.memory_traces(narrative_id);
-            """)
+        Args:
+            episodes: Boosted episodes (duplicates allowed)
+            traces: Memory traces for the run's chains
+            checkpoint: record_checkpoint arguments, or None
+            day: Consolidated day (its previous traces are replaced)
+
+        Returns:
+            (episodes updated, traces inserted)
+        """
+        try:
+            updated = self.update_consolidated_scores(episodes, day=day)
+            inserted = self.store_memory_traces(traces, day=day)
+            if checkpoint is not None:
+                self.record_checkpoint(**checkpoint)
             self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        return updated, inserted
 
-        # Insert traces
-        for trace in traces:
-            self.cursor.execute("""
-                INSERT INTO nexus_memory.memory_traces
-                    (source_episode_id, target_episode_id, trace_type,
-                     strength, narrative_id, created_at)
-                VALUES (%s, %s, %s, %s, %s, %s)
-            """, (
-                trace.source_episode_id,
-                trace.target_episode_id,
-                trace.trace_type,
-                trace.strength,
-                trace.narrative_id,
-                trace.created_at
-            ))
+    # =====================================================================
+    # CHECKPOINTS (migration 009_consolidation_checkpoints.sql)
+    # =====================================================================
 
+    def pending_consolidation_days(self, until: date) -> List[date]:
+        """
+        Days before `until` whose episodes changed since their last consolidation
+
+        Args:
+            until: First day not to return (today: its episodes are still arriving)
+
+        Returns:
+            Pending days, oldest first
+        """
+        self.cursor.execute("""
+            SELECT day
+            FROM nexus_memory.consolidation_checkpoints
+            WHERE day < %s
+              AND consolidated_version IS DISTINCT FROM version
+            ORDER BY day
+        """, (until,))
+        days = [row['day'] for row in self.cursor.fetchall()]
         self.conn.commit()
+        return days
+
+    def read_checkpoint_version(self, day: date) -> int:
+        """
+        Current change version of a day (0 if no episode was ever written to it)
+
+        Read before the day's episodes are fetched: a change committed after
+        this point bumps the version past the one the run records.
+        """
+        self.cursor.execute("""
+            SELECT version FROM nexus_memory.consolidation_checkpoints WHERE day = %s
+        """, (day,))
+        row = self.cursor.fetchone()
+        return row['version'] if row else 0
+
+    def record_checkpoint(self,
+                          day: date,
+                          version: int,
+                          episodes_processed: int,
+                          breakthrough_count: int,
+                          trace_count: int):
+        """
+        Mark `day` consolidated at `version` (does not commit)
+
+        Args:
+            day: Consolidated day
+            version: Version read by read_checkpoint_version before the fetch
+            episodes_processed: Episodes the run consolidated
+            breakthrough_count: Breakthroughs detected
+            trace_count: Memory traces stored
+        """
+        self.cursor.execute("""
+            INSERT INTO nexus_memory.consolidation_checkpoints
+                (day, version, consolidated_version, consolidated_at,
+                 episodes_processed, breakthrough_count, trace_count)
+            VALUES (%s, %s, %s, NOW(), %s, %s, %s)
+            ON CONFLICT (day) DO UPDATE SET
+                consolidated_version = EXCLUDED.consolidated_version,
+                consolidated_at = EXCLUDED.consolidated_at,
+                episodes_processed = EXCLUDED.episodes_processed,
+                breakthrough_count = EXCLUDED.breakthrough_count,
+                trace_count = EXCLUDED.trace_count
+        """, (day, version, version, episodes_processed, breakthrough_count, trace_count))
 
     # =====================================================================
     # MAIN CONSOLIDATION PIPELINE
     # =====================================================================
 
-    def consolidate_daily_memories(self, target_date: datetime) -> ConsolidationReport:
+    def consolidate_daily_memories(self, target_date: datetime, checkpoint: bool = False) -> ConsolidationReport:
         """
         Execute complete nightly consolidation process
 
@@ -882,6 +1347,8 @@ class ConsolidationEngine:
 
         Args:
             target_date: Date to consolidate
+            checkpoint: Record the day in consolidation_checkpoints (same
+                transaction as the results)
 
         Returns:
             ConsolidationReport with statistics
@@ -890,12 +1357,18 @@ class ConsolidationEngine:
 
         print(f"[{start_time}] Starting consolidation for {target_date.date()}")
 
+        version = self.read_checkpoint_version(target_date.date()) if checkpoint else None
+
         # Step 1: Fetch episodes
         print("  Step 1: Fetching episodes...")
         episodes = self.fetch_episodes_from_date(target_date)
         print(f"    Found {len(episodes)} episodes")
 
         if len(episodes) == 0:
+            if checkpoint:
+                self.write_consolidation_results([], [], day=target_date.date(), checkpoint=dict(
+                    day=target_date.date(), version=version,
+                    episodes_processed=0, breakthrough_count=0, trace_count=0))
             return ConsolidationReport(
                 date=target_date,
                 episodes_processed=0,
@@ -909,10 +1382,13 @@ class ConsolidationEngine:
                 top_breakthroughs=[]
             )
 
-        # Step 1.5: LAB_004 - Build novelty baselines (if not already built)
+        # Step 1.5: LAB_004 - Build novelty baselines from the history before this day
+        # (rebuilt when the day changes: a long-lived engine consolidates many days)
         print("  Step 1.5: LAB_004 - Building novelty baselines...")
-        if LAB_004_AVAILABLE and self.novelty_detector and not self.baseline_models:
-            baseline_success = self.build_novelty_baselines(lookback_days=60)
+        if LAB_004_AVAILABLE and self.novelty_detector and self.baseline_end != target_date.date():
+            self.baseline_models = None
+            baseline_success = self.build_novelty_baselines(
+                lookback_days=60, end=datetime.combine(target_date.date(), datetime.min.time()))
             if baseline_success:
                 print("    ✅ Baseline models ready")
             else:
@@ -931,9 +1407,12 @@ class ConsolidationEngine:
         else:
             print("    ⚠️ Novelty calculation skipped")
 
+        # Columnar view of the day, built once (scoring and boosts are array expressions)
+        columns = EpisodeColumns.from_episodes(episodes)
+
         # Step 2: Identify breakthroughs (enhanced with LAB_004 novelty if available)
         print("  Step 2: Identifying breakthroughs...")
-        breakthroughs = self.identify_breakthroughs(episodes)
+        breakthroughs = self.identify_breakthroughs(episodes, columns=columns)
         print(f"    Detected {len(breakthroughs)} breakthroughs")
 
         # Step 3: Trace backward chains
@@ -943,8 +1422,7 @@ class ConsolidationEngine:
 
         # Step 4: Calculate consolidated salience
         print("  Step 4: Calculating consolidated salience...")
-        for chain in chains:
-            self.consolidate_chain(chain)
+        self.consolidate_chains(chains, columns)
 
         # Step 5: Interleaved replay
         print("  Step 5: Interleaved replay...")
@@ -955,7 +1433,7 @@ class ConsolidationEngine:
 
         # Step 6: Create memory traces
         print("  Step 6: Creating memory traces...")
-        traces = self.create_memory_traces(chains)
+        traces = self.create_memory_traces(chains, day=target_date.date())
         print(f"    Created {len(traces)} memory traces")
 
         # Step 7: Update database
@@ -971,8 +1449,12 @@ class ConsolidationEngine:
                     boost = episode.consolidated_salience_score - episode.salience_score
                     boosts.append(boost)
 
-        self.update_consolidated_scores(boosted_episodes)
-        self.store_memory_traces(traces)
+        day_checkpoint = dict(
+            day=target_date.date(), version=version, episodes_processed=len(episodes),
+            breakthrough_count=len(breakthroughs), trace_count=len(traces)) if checkpoint else None
+        updated, inserted = self.write_consolidation_results(
+            boosted_episodes, traces, checkpoint=day_checkpoint, day=target_date.date())
+        print(f"    Updated {updated} episodes, stored {inserted} traces")
 
         # Calculate statistics
         avg_boost = float(np.mean(boosts)) if boosts else 0.0
@@ -1004,17 +1486,151 @@ class ConsolidationEngine:
             avg_boost=avg_boost,
             max_boost=max_boost,
             processing_time_seconds=processing_time,
-            top_breakthroughs=top_breakthroughs
+            top_breakthroughs=top_breakthroughs,
+            boosted_episode_ids=[episode.episode_id for episode in boosted_episodes]
         )
 
         return report
 
+    # =====================================================================
+    # BATCH MODE: PARALLEL DAYS
+    # =====================================================================
+
+    def prepare_baseline_history(self, start_date: date, end_date: date,
+                                 lookback_days: int = 60) -> Optional[List[Episode]]:
+        """
+        Fetch the LAB_004 novelty history of a whole batch once
+
+        Every day in [start_date, end_date) gets the same baseline as when it
+        is consolidated on its own (history of the lookback_days before it);
+        workers build it from their slice of this union instead of each
+        re-reading overlapping windows from the database.
+
+        Returns:
+            Episodes of [start_date - lookback_days, last day), or None when
+            novelty scoring is unavailable
+        """
+        if not (LAB_004_AVAILABLE and self.novelty_detector):
+            return None
+        first = datetime.combine(start_date, datetime.min.time()) - timedelta(days=lookback_days)
+        last = datetime.combine(end_date - timedelta(days=1), datetime.min.time())
+        return self.fetch_episodes_from_date_range(first, last)
+
+    def consolidate_date_range(self,
+                               start_date: date,
+                               end_date: date,
+                               workers: Optional[int] = None,
+                               checkpoint: bool = True) -> BatchConsolidationReport:
+        """
+        Consolidate every day in [start_date, end_date) across a process pool
+
+        The novelty history of the whole range is fetched once; each worker
+        process builds every day's baseline from its slice of it, so days
+        score exactly as when consolidated one at a time (scheduler) and
+        their checkpoints stay valid. Each worker opens its own connection
+        and runs consolidate_daily_memories for one day at a time, writing that day's
+        scores, traces and checkpoint in its own transaction. Narrative ids
+        and trace replacement are keyed by the consolidated day, so
+        concurrent days never touch the same trace rows. A failed day is
+        reported and left pending; the others continue.
+
+        Args:
+            start_date: First day
+            end_date: Day after the last one
+            workers: Pool processes (default: CPU count)
+            checkpoint: Record each day in consolidation_checkpoints
+
+        Returns:
+            BatchConsolidationReport with per-day reports and throughput
+        """
+        days = [start_date + timedelta(days=i) for i in range((end_date - start_date).days)]
+        workers = max(1, min(workers or os.cpu_count() or 1, len(days) or 1))
+        started = time.perf_counter()
+
+        # Shared state first (parent connection), then fan out
+        history = self.prepare_baseline_history(start_date, end_date) if days else None
+        baseline_seconds = time.perf_counter() - started
+
+        reports: Dict[date, ConsolidationReport] = {}
+        failed: Dict[str, str] = {}
+        if days:
+            db_params = dict(db_host=self.db_host, db_port=self.db_port, db_name=self.db_name,
+                             db_user=self.db_user, db_password=self.db_password)
+            with ProcessPoolExecutor(max_workers=workers,
+                                     mp_context=multiprocessing.get_context("spawn"),
+                                     initializer=_init_batch_worker,
+                                     initargs=(type(self), db_params, history)) as pool:
+                futures = {pool.submit(_consolidate_batch_day, day, checkpoint): day for day in days}
+                for future in as_completed(futures):
+                    day = futures[future]
+                    try:
+                        reports[day] = future.result()
+                    except Exception as e:
+                        failed[day.isoformat()] = str(e)
+                        print(f"⚠️ Consolidation of {day} failed: {e}")
+
+        wall_seconds = time.perf_counter() - started
+        ordered = [reports[day] for day in days if day in reports]
+        episodes_processed = sum(report.episodes_processed for report in ordered)
+
+        return BatchConsolidationReport(
+            start_date=start_date,
+            end_date=end_date,
+            workers=workers,
+            days_processed=len(ordered),
+            days_failed=failed,
+            episodes_processed=episodes_processed,
+            trace_count=sum(report.trace_count for report in ordered),
+            baseline_seconds=baseline_seconds,
+            wall_seconds=wall_seconds,
+            days_per_minute=len(ordered) / wall_seconds * 60 if wall_seconds > 0 else 0.0,
+            episodes_per_second=episodes_processed / wall_seconds if wall_seconds > 0 else 0.0,
+            reports=ordered
+        )
+
+
+# Batch worker process state: one engine (and connection) per process
+_batch_engine: Optional[ConsolidationEngine] = None
+
+
+def _init_batch_worker(engine_cls, db_params: Dict, history: Optional[List[Episode]]):
+    """ProcessPoolExecutor initializer: connect once, install the batch's novelty history"""
+    global _batch_engine
+    _batch_engine = engine_cls(**db_params)
+    if history is None:
+        # Novelty scoring unavailable in the parent: skip it in the workers too
+        _batch_engine.novelty_detector = None
+    else:
+        _batch_engine.set_baseline_history(history)
+    _batch_engine.connect()
+
+
+def _consolidate_batch_day(day: date, checkpoint: bool) -> ConsolidationReport:
+    """Consolidate one day in a batch worker (rolls back and reconnects on failure)"""
+    try:
+        return _batch_engine.consolidate_daily_memories(datetime.combine(day, datetime.min.time()),
+                                                        checkpoint=checkpoint)
+    except Exception:
+        try:
+            _batch_engine.conn.rollback()
+        except Exception:
+            _batch_engine.close()
+            _batch_engine.connect()
+        raise
 
 # Example usage
 if __name__ == "__main__":
-    # Test consolidation
+    # Test consolidation (yesterday), or backfill a range in parallel:
+    #   python consolidation_engine.py --start 2025-08-01 --end 2025-10-30 [--workers 8]
+    import argparse
     import os
 
+    parser = argparse.ArgumentParser(description="LAB_003 sleep consolidation")
+    parser.add_argument("--start", type=date.fromisoformat, help="First day of a batch backfill")
+    parser.add_argument("--end", type=date.fromisoformat, help="Day after the last one (default: today)")
+    parser.add_argument("--workers", type=int, default=None, help="Pool processes (default: CPU count)")
+    args = parser.parse_args()
+
     DB_HOST = os.getenv('POSTGRES_HOST', 'localhost')
     DB_PORT = int(os.getenv('POSTGRES_PORT', '5437'))
     DB_NAME = os.getenv('POSTGRES_DB', 'nexus_memory')
@@ -1028,6 +1644,22 @@ if __name__ == "__main__":
         db_user=DB_USER,
         db_password=DB_PASSWORD
     ) as engine:
+        if args.start:
+            batch = engine.consolidate_date_range(args.start, args.end or date.today(), workers=args.workers)
+
+            print("\n" + "="*60)
+            print("BATCH CONSOLIDATION REPORT")
+            print("="*60)
+            print(f"Days: {batch.start_date} .. {batch.end_date} (exclusive), {batch.workers} workers")
+            print(f"Days processed: {batch.days_processed}  failed: {len(batch.days_failed)}")
+            print(f"Episodes processed: {batch.episodes_processed}")
+            print(f"Memory traces created: {batch.trace_count}")
+            print(f"Baseline history: {batch.baseline_seconds:.1f}s  total: {batch.wall_seconds:.1f}s")
+            print(f"Throughput: {batch.days_per_minute:.1f} days/min, {batch.episodes_per_second:.0f} episodes/sec")
+            for day, error in sorted(batch.days_failed.items()):
+                print(f"  FAILED {day}: {error}")
+            sys.exit(1 if batch.days_failed else 0)
+
         # Consolidate yesterday
         yesterday = datetime.now() - timedelta(days=1)
         report = engine.consolidate_daily_memories(yesterday)
@@ -0,0 +1,394 @@
+"""
+NEXUS Cerebro API - LAB_003 Consolidation Scheduler
+
+Runs sleep consolidation (consolidation_engine.py) as background jobs instead
+of inside the /memory/consolidate request:
+- Per-day checkpoints live in nexus_memory.consolidation_checkpoints
+  (migration 009). Database triggers bump a day's version whenever its
+  episodes are inserted, deleted or have their consolidation inputs changed;
+  a day is pending until a run records that version
+- A catch-up job consolidates every pending day before today, oldest first,
+  so missed nights are recovered after downtime and unchanged days are
+  skipped. One runs at startup and every LAB003_CATCHUP_INTERVAL seconds
+- Days run in a process pool (the engine is synchronous and CPU bound); each
+  worker process keeps its own engine and connection between days, and
+  the engine rebuilds its novelty baselines from the history before each
+  day it consolidates
+- Jobs run one at a time, in submission order; within a job up to
+  `workers` days run at once and their results are taken in day order.
+  Progress is kept in memory for polling (GET /memory/consolidate/jobs/{job_id})
+"""
+
+import asyncio
+import multiprocessing
+import os
+import time
+import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Callable, Dict, List, Optional
+
+from prometheus_client import Counter, Gauge, Histogram
+
+# ============================================
+# Configuration
+# ============================================
+LAB003_CONSOLIDATION_WORKERS = int(os.getenv("LAB003_CONSOLIDATION_WORKERS", "1"))  # Pool processes = concurrent days
+LAB003_CATCHUP_INTERVAL = float(os.getenv("LAB003_CATCHUP_INTERVAL", "3600"))  # seconds; 0 = only on request
+LAB003_JOB_HISTORY = int(os.getenv("LAB003_JOB_HISTORY", "50"))  # Finished jobs kept for polling
+
+# ============================================
+# Prometheus Metrics
+# ============================================
+lab003_consolidation_days_total = Counter(
+    'nexus_lab003_consolidation_days_total',
+    'Days consolidated by background jobs',
+    ['result']
+)
+
+lab003_consolidation_day_seconds = Histogram(
+    'nexus_lab003_consolidation_day_seconds',
+    'Wall time to consolidate one day (worker process, including the write-back)',
+    buckets=(0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600)
+)
+
+lab003_consolidation_pending_days = Gauge(
+    'nexus_lab003_consolidation_pending_days',
+    'Days left in the running consolidation job'
+)
+
+
+# ============================================
+# Worker process side
+# ============================================
+_worker_engine = None
+
+
+def _engine(db_params: Dict):
+    """This process's ConsolidationEngine (connected once, reused across days)"""
+    global _worker_engine
+    if _worker_engine is None:
+        from consolidation_engine import ConsolidationEngine
+
+        engine = ConsolidationEngine(**db_params)
+        engine.connect()
+        _worker_engine = engine
+    return _worker_engine
+
+
+def _discard_engine():
+    """Drop a connection left in an unknown state by a failed day"""
+    global _worker_engine
+    if _worker_engine is not None:
+        try:
+            _worker_engine.close()
+        except Exception:
+            pass
+        _worker_engine = None
+
+
+def pending_days(db_params: Dict, until: str) -> List[str]:
+    """Pending days before `until` (ISO dates), oldest first"""
+    try:
+        return [day.isoformat() for day in _engine(db_params).pending_consolidation_days(date.fromisoformat(until))]
+    except Exception:
+        _discard_engine()
+        raise
+
+
+def consolidate_day(db_params: Dict, day: str) -> Dict:
+    """
+    Consolidate one day and checkpoint it (runs in a pool process)
+
+    Returns:
+        Report summary (picklable), including the boosted episode ids for
+        cache invalidation
+    """
+    try:
+        report = _engine(db_params).consolidate_daily_memories(datetime.fromisoformat(day), checkpoint=True)
+    except Exception:
+        _discard_engine()
+        raise
+    return {
+        "date": day,
+        "episodes_processed": report.episodes_processed,
+        "breakthrough_count": report.breakthrough_count,
+        "chain_count": report.chain_count,
+        "episodes_boosted": report.episodes_boosted,
+        "trace_count": report.trace_count,
+        "avg_boost": round(report.avg_boost, 3),
+        "max_boost": round(report.max_boost, 3),
+        "processing_time_seconds": round(report.processing_time_seconds, 2),
+        "top_breakthroughs": report.top_breakthroughs,
+        "boosted_episode_ids": list(dict.fromkeys(report.boosted_episode_ids))
+    }
+
+
+# ============================================
+# Jobs
+# ============================================
+@dataclass
+class ConsolidationJob:
+    """One catch-up (dates=None) or explicit-dates consolidation request"""
+    job_id: str
+    dates: Optional[List[str]] = None
+    status: str = "queued"  # queued -> running -> done | failed
+    days_total: Optional[int] = None  # Known once the pending days are read
+    days_done: int = 0
+    current_day: Optional[str] = None
+    episodes_processed: int = 0
+    traces_stored: int = 0
+    reports: List[Dict] = field(default_factory=list)
+    error: Optional[str] = None
+    created_at: datetime = field(default_factory=datetime.now)
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    @property
+    def active(self) -> bool:
+        return self.status in ("queued", "running")
+
+    def to_dict(self) -> Dict:
+        return {
+            "job_id": self.job_id,
+            "kind": "catch_up" if self.dates is None else "dates",
+            "status": self.status,
+            "days_total": self.days_total,
+            "days_done": self.days_done,
+            "progress": self.days_done / self.days_total if self.days_total else (1.0 if self.status == "done" else 0.0),
+            "current_day": self.current_day,
+            "episodes_processed": self.episodes_processed,
+            "traces_stored": self.traces_stored,
+            "days": [{k: v for k, v in report.items() if k != "boosted_episode_ids"} for report in self.reports],
+            "error": self.error,
+            "created_at": self.created_at.isoformat(),
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None
+        }
+
+
+class ConsolidationScheduler:
+    """
+    Background consolidation jobs over a process pool
+
+    Args:
+        db_params: ConsolidationEngine connection arguments (db_host, ...)
+        on_day_done: Called in the event loop with each day's boosted
+            episode ids (cache invalidation)
+        workers: Pool processes = days consolidated at once
+        catchup_interval: Seconds between automatic catch-up jobs (0 = off)
+        history: Finished jobs kept for polling
+        executor: Executor to run days in (default: a spawn-context
+            ProcessPoolExecutor created by start())
+        pending_fn / consolidate_fn: Worker functions (pending_days /
+            consolidate_day; must be picklable for a process pool)
+    """
+
+    def __init__(self,
+                 db_params: Dict,
+                 on_day_done: Optional[Callable[[List[str]], None]] = None,
+                 workers: int = LAB003_CONSOLIDATION_WORKERS,
+                 catchup_interval: float = LAB003_CATCHUP_INTERVAL,
+                 history: int = LAB003_JOB_HISTORY,
+                 executor: Optional[Executor] = None,
+                 pending_fn: Callable[[Dict, str], List[str]] = pending_days,
+                 consolidate_fn: Callable[[Dict, str], Dict] = consolidate_day):
+        self.db_params = db_params
+        self.on_day_done = on_day_done
+        self.workers = max(1, workers)
+        self.catchup_interval = catchup_interval
+        self.history = max(1, history)
+        self.pending_fn = pending_fn
+        self.consolidate_fn = consolidate_fn
+
+        self.executor = executor
+        self._owns_executor = executor is None
+        self.jobs: "OrderedDict[str, ConsolidationJob]" = OrderedDict()
+        self.days_consolidated = 0
+        self.days_failed = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+
+    async def start(self):
+        """Create the pool and start the job runner (+ the catch-up timer)"""
+        if self._tasks:
+            return
+        if self.executor is None:
+            self.executor = self._new_pool()
+        self._queue = asyncio.Queue()
+        for job in self.jobs.values():
+            if job.status == "queued":
+                self._queue.put_nowait(job)
+        self._tasks.append(asyncio.create_task(self._run()))
+        if self.catchup_interval > 0:
+            self._tasks.append(asyncio.create_task(self._catch_up_loop()))
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        # spawn: forking the API process would copy its event loop and threads
+        return ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"))
+
+    async def stop(self):
+        """Stop taking jobs; a day already running in a worker finishes on its own"""
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._tasks = []
+        if self.executor is not None and self._owns_executor:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+    def submit(self, dates: Optional[List[date]] = None) -> ConsolidationJob:
+        """
+        Queue a consolidation job
+
+        Args:
+            dates: Days to (re)consolidate, in this order; None = catch up on
+                every pending day before today. A catch-up request while
+                another catch-up job is still queued or running returns that job.
+
+        Returns:
+            The queued job
+        """
+        if dates is None:
+            for job in self.jobs.values():
+                if job.dates is None and job.active:
+                    return job
+
+        job = ConsolidationJob(
+            job_id=str(uuid.uuid4()),
+            dates=[d.isoformat() for d in dates] if dates is not None else None
+        )
+        self.jobs[job.job_id] = job
+        self._trim_history()
+        if self._queue is not None:
+            self._queue.put_nowait(job)
+        return job
+
+    def get_job(self, job_id: str) -> Optional[ConsolidationJob]:
+        return self.jobs.get(job_id)
+
+    def _trim_history(self):
+        finished = [job_id for job_id, job in self.jobs.items() if not job.active]
+        for job_id in finished[:max(0, len(finished) - self.history)]:
+            del self.jobs[job_id]
+
+    async def _run(self):
+        while True:
+            job = await self._queue.get()
+            await self.run_job(job)
+
+    async def _catch_up_loop(self):
+        while True:
+            self.submit()
+            await asyncio.sleep(self.catchup_interval)
+
+    async def _consolidate(self, day: str) -> Dict:
+        """One day in the pool, with its metrics"""
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        try:
+            report = await loop.run_in_executor(self.executor, self.consolidate_fn, self.db_params, day)
+        except Exception:
+            self.days_failed += 1
+            lab003_consolidation_days_total.labels(result='error').inc()
+            raise
+        lab003_consolidation_day_seconds.observe(time.perf_counter() - started)
+        lab003_consolidation_days_total.labels(result='success').inc()
+        self.days_consolidated += 1
+        return report
+
+    async def run_job(self, job: ConsolidationJob):
+        """
+        Consolidate the job's days, up to `workers` at a time
+
+        Days are independent (each writes its own results and checkpoint in
+        one transaction); results are taken in day order. After a failure
+        no new day is started, the days already running finish, and the
+        job fails with the first failed day.
+        """
+        loop = asyncio.get_running_loop()
+        job.status = "running"
+        job.started_at = datetime.now()
+        running: Dict[str, asyncio.Task] = {}  # In day order
+        try:
+            if job.dates is None:
+                days = await loop.run_in_executor(
+                    self.executor, self.pending_fn, self.db_params, date.today().isoformat())
+            else:
+                days = job.dates
+            job.days_total = len(days)
+
+            queued = deque(days)
+            finished: Dict[str, Optional[Dict]] = {}  # day -> report (None = failed)
+            errors: Dict[str, BaseException] = {}
+            taken = 0
+            while queued or running:
+                while queued and not errors and len(running) < self.workers:
+                    day = queued.popleft()
+                    running[day] = asyncio.ensure_future(self._consolidate(day))
+                if not running:
+                    break
+                job.current_day = next(iter(running))
+                lab003_consolidation_pending_days.set(len(queued) + len(running))
+                done, _ = await asyncio.wait(running.values(), return_when=asyncio.FIRST_COMPLETED)
+                for day in [day for day, task in running.items() if task in done]:
+                    task = running.pop(day)
+                    if task.exception() is not None:
+                        finished[day] = None
+                        errors[day] = task.exception()
+                    else:
+                        finished[day] = task.result()
+
+                # Results in day order
+                while taken < len(days) and days[taken] in finished:
+                    report = finished.pop(days[taken])
+                    taken += 1
+                    if report is None:
+                        continue
+                    job.days_done += 1
+                    job.episodes_processed += report["episodes_processed"]
+                    job.traces_stored += report["trace_count"]
+                    job.reports.append(report)
+                    if self.on_day_done is not None and report["boosted_episode_ids"]:
+                        self.on_day_done(report["boosted_episode_ids"])
+
+            if errors:
+                job.current_day = next(day for day in days if day in errors)
+                raise errors[job.current_day]
+            job.current_day = None
+            job.status = "done"
+        except asyncio.CancelledError:
+            for task in running.values():
+                task.cancel()
+            job.status = "failed"
+            job.error = "scheduler stopped"
+            raise
+        except Exception as e:
+            job.status = "failed"
+            job.error = f"{job.current_day or 'pending days'}: {e}"
+            if isinstance(e, BrokenProcessPool) and self._owns_executor:
+                # A worker died (e.g. out of memory): the pool takes no more work
+                self.executor.shutdown(wait=False)
+                self.executor = self._new_pool()
+            print(f"⚠ LAB_003 consolidation job {job.job_id} failed: {job.error}")
+        finally:
+            job.finished_at = datetime.now()
+            lab003_consolidation_pending_days.set(0)
+            self._trim_history()
+
+    def get_stats(self) -> Dict:
+        """Scheduler state for GET /memory/consolidate/jobs"""
+        return {
+            "workers": self.workers,
+            "catchup_interval_seconds": self.catchup_interval,
+            "days_consolidated": self.days_consolidated,
+            "days_failed": self.days_failed,
+            "active_jobs": sum(job.active for job in self.jobs.values())
+        }
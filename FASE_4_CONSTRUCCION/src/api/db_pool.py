@@ -0,0 +1,161 @@
+"""
+NEXUS Cerebro API - Async PostgreSQL Connection Pool
+
+Managed psycopg 3 AsyncConnectionPool shared by every API handler:
+- Opened once in the FastAPI lifespan (min/max size from env)
+- Connections health-checked before being handed out
+- Server-side statement_timeout applied to every session
+- Pool saturation exported as Prometheus metrics
+"""
+
+import os
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+from fastapi import HTTPException, status
+from prometheus_client import Counter, Gauge, Histogram
+from psycopg import AsyncConnection
+from psycopg_pool import AsyncConnectionPool, PoolTimeout
+
+# ============================================
+# Configuration
+# ============================================
+DB_POOL_MIN_SIZE = int(os.getenv("DB_POOL_MIN_SIZE", "4"))
+DB_POOL_MAX_SIZE = int(os.getenv("DB_POOL_MAX_SIZE", "20"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "10"))  # seconds to wait for a free connection
+DB_POOL_MAX_WAITING = int(os.getenv("DB_POOL_MAX_WAITING", "0"))  # 0 = unbounded queue
+DB_POOL_MAX_IDLE = float(os.getenv("DB_POOL_MAX_IDLE", "300"))
+DB_POOL_MAX_LIFETIME = float(os.getenv("DB_POOL_MAX_LIFETIME", "3600"))
+DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "15000"))
+DB_APPLICATION_NAME = os.getenv("DB_APPLICATION_NAME", "nexus_api")
+
+# ============================================
+# Prometheus Metrics
+# ============================================
+db_pool_size = Gauge(
+    'nexus_db_pool_size',
+    'Connections currently managed by the pool (idle + in use)'
+)
+
+db_pool_available = Gauge(
+    'nexus_db_pool_available',
+    'Idle connections ready to be handed out'
+)
+
+db_pool_in_use = Gauge(
+    'nexus_db_pool_in_use',
+    'Connections currently checked out by requests'
+)
+
+db_pool_requests_waiting = Gauge(
+    'nexus_db_pool_requests_waiting',
+    'Requests queued waiting for a pooled connection'
+)
+
+db_pool_max_size = Gauge(
+    'nexus_db_pool_max_size',
+    'Configured maximum pool size'
+)
+
+db_pool_wait_seconds = Histogram(
+    'nexus_db_pool_wait_seconds',
+    'Time spent waiting to acquire a pooled connection',
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+)
+
+db_pool_timeouts_total = Counter(
+    'nexus_db_pool_timeouts_total',
+    'Connection requests that timed out waiting for the pool'
+)
+
+
+# ============================================
+# Pool Lifecycle
+# ============================================
+async def create_db_pool(conninfo: str) -> AsyncConnectionPool:
+    """
+    Create and open the shared async pool
+
+    Args:
+        conninfo: PostgreSQL connection string
+
+    Returns:
+        Opened AsyncConnectionPool
+    """
+    pool = AsyncConnectionPool(
+        conninfo,
+        min_size=DB_POOL_MIN_SIZE,
+        max_size=DB_POOL_MAX_SIZE,
+        timeout=DB_POOL_TIMEOUT,
+        max_waiting=DB_POOL_MAX_WAITING,
+        max_idle=DB_POOL_MAX_IDLE,
+        max_lifetime=DB_POOL_MAX_LIFETIME,
+        check=AsyncConnectionPool.check_connection,
+        kwargs={
+            "options": f"-c statement_timeout={DB_STATEMENT_TIMEOUT_MS}",
+            "application_name": DB_APPLICATION_NAME,
+        },
+        name="nexus_api",
+        open=False,
+    )
+    await pool.open(wait=True, timeout=DB_POOL_TIMEOUT)
+    db_pool_max_size.set(DB_POOL_MAX_SIZE)
+    update_pool_metrics(pool)
+    return pool
+
+
+def update_pool_metrics(pool: Optional[AsyncConnectionPool]):
+    """Refresh pool saturation gauges from pool statistics"""
+    if pool is None:
+        return
+
+    stats = pool.get_stats()
+    size = stats.get("pool_size", 0)
+    available = stats.get("pool_available", 0)
+
+    db_pool_size.set(size)
+    db_pool_available.set(available)
+    db_pool_in_use.set(max(size - available, 0))
+    db_pool_requests_waiting.set(stats.get("requests_waiting", 0))
+
+
+@asynccontextmanager
+async def pooled_connection(pool: Optional[AsyncConnectionPool]) -> AsyncIterator[AsyncConnection]:
+    """
+    Borrow a connection from the pool
+
+    The transaction is committed when the block exits cleanly and rolled
+    back on error; the connection is then returned to the pool.
+
+    Raises:
+        HTTPException 503: pool not initialized or no connection available in time
+    """
+    if pool is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Database connection failed: pool not initialized"
+        )
+
+    wait_start = time.perf_counter()
+    try:
+        conn = await pool.getconn()
+    except PoolTimeout as e:
+        db_pool_timeouts_total.inc()
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Database connection failed: {str(e)}"
+        )
+    db_pool_wait_seconds.observe(time.perf_counter() - wait_start)
+
+    try:
+        yield conn
+    except BaseException:
+        if not conn.closed:
+            await conn.rollback()
+        raise
+    else:
+        if not conn.closed:
+            await conn.commit()
+    finally:
+        await pool.putconn(conn)
@@ -0,0 +1,256 @@
+"""
+NEXUS Cerebro API - Embedding Backends
+
+One interface for the embedding model used by the API and the embeddings
+worker (EMBEDDINGS_BACKEND):
+- sentence-transformers: reference PyTorch model (default)
+- onnx:                  same weights exported to ONNX, run by ONNX Runtime
+- onnx-int8:             ONNX export with int8 dynamic quantization of the
+                         weights (smaller, faster on CPU, ~0.99 cosine parity)
+
+Every backend exposes encode(texts, batch_size) -> float32 (n, dim) unit
+vectors plus tokenizer / max_seq_length, which is all text_chunking and
+EmbeddingService need.
+
+ONNX files are exported once into EMBEDDINGS_ONNX_DIR and reused. The ONNX
+Runtime session is created on first encode(), so the supervisor can prepare
+the backend before forking workers without sharing a session across fork().
+
+onnxruntime and the export path (torch, transformers) are imported only when
+an ONNX backend is selected.
+"""
+
+import os
+import re
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+# ============================================
+# Configuration
+# ============================================
+EMBEDDINGS_BACKEND = os.getenv("EMBEDDINGS_BACKEND", "sentence-transformers")
+EMBEDDINGS_ONNX_DIR = os.getenv("EMBEDDINGS_ONNX_DIR", os.path.expanduser("~/.cache/nexus/onnx"))
+EMBEDDINGS_MAX_SEQ_LENGTH = int(os.getenv("EMBEDDINGS_MAX_SEQ_LENGTH", "256"))  # all-MiniLM-L6-v2 config
+ONNX_OPSET = 14
+
+BACKENDS = ("sentence-transformers", "onnx", "onnx-int8")
+
+# Stored in zep_episodic_memory.embedding_version. Vectors from different
+# runtimes / precisions are not interchangeable, so every backend but the
+# reference one tags its rows with "+<runtime>-<precision>"
+EMBEDDING_VERSION_BASE = "miniLM-384-chunked@v2"
+_BACKEND_PRECISION = {"sentence-transformers": None, "onnx": "onnx-fp32", "onnx-int8": "onnx-int8"}
+
+# Positional order of BERT-style forward(); the tokenizer returns a different order
+_MODEL_INPUTS = ("input_ids", "attention_mask", "token_type_ids")
+
+
+class EmbeddingBackend:
+    """Base interface - see module docstring"""
+
+    name = "base"
+    tokenizer = None
+    max_seq_length = EMBEDDINGS_MAX_SEQ_LENGTH
+
+    def encode(self, texts: Sequence[str], batch_size: int = 32) -> np.ndarray:
+        raise NotImplementedError
+
+    def set_num_threads(self, num_threads: int):
+        """Limit intra-op threads (one share of the cores per worker process)"""
+
+
+def mean_pool(last_hidden_state: np.ndarray, attention_mask: np.ndarray) -> np.ndarray:
+    """Masked mean over tokens, L2-normalized (sentence-transformers Pooling + Normalize)"""
+    mask = attention_mask[..., None].astype(np.float32)
+    summed = (last_hidden_state * mask).sum(axis=1)
+    pooled = summed / np.maximum(mask.sum(axis=1), 1e-9)
+    return pooled / np.maximum(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12)
+
+
+class SentenceTransformerBackend(EmbeddingBackend):
+    """Reference backend: sentence_transformers.SentenceTransformer"""
+
+    name = "sentence-transformers"
+
+    def __init__(self, model_name: str):
+        from sentence_transformers import SentenceTransformer
+
+        self.model = SentenceTransformer(model_name)
+        self.tokenizer = self.model.tokenizer
+        self.max_seq_length = self.model.max_seq_length
+
+    def encode(self, texts: Sequence[str], batch_size: int = 32) -> np.ndarray:
+        return np.asarray(
+            self.model.encode(list(texts), batch_size=batch_size, normalize_embeddings=True),
+            dtype=np.float32
+        )
+
+    def set_num_threads(self, num_threads: int):
+        import torch
+        torch.set_num_threads(num_threads)
+
+
+class OnnxBackend(EmbeddingBackend):
+    """
+    ONNX Runtime backend (fp32 or int8 dynamically quantized)
+
+    Args:
+        model_name: Hugging Face model id (same as the reference backend)
+        quantize: Use the int8 dynamic-quantized export
+        onnx_dir: Directory holding exported models
+    """
+
+    def __init__(self, model_name: str, quantize: bool = False, onnx_dir: str = EMBEDDINGS_ONNX_DIR):
+        from transformers import AutoTokenizer
+
+        self.name = "onnx-int8" if quantize else "onnx"
+        self.model_name = model_name
+        self.tokenizer = AutoTokenizer.from_pretrained(model_name)
+        self.max_seq_length = min(EMBEDDINGS_MAX_SEQ_LENGTH, self.tokenizer.model_max_length)
+
+        model_dir = os.path.join(onnx_dir, re.sub(r"[^A-Za-z0-9_.-]", "_", model_name))
+        self.model_path = os.path.join(model_dir, "model_int8.onnx" if quantize else "model.onnx")
+        if not os.path.exists(self.model_path):
+            fp32_path = export_onnx(model_name, os.path.join(model_dir, "model.onnx"))
+            if quantize:
+                quantize_onnx(fp32_path, self.model_path)
+
+        self.num_threads = 0  # ONNX Runtime default: all cores
+        self._session = None
+        self._input_names: List[str] = []
+
+    @property
+    def session(self):
+        if self._session is None:
+            import onnxruntime as ort
+
+            options = ort.SessionOptions()
+            options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+            if self.num_threads:
+                options.intra_op_num_threads = self.num_threads
+            self._session = ort.InferenceSession(
+                self.model_path, sess_options=options, providers=["CPUExecutionProvider"]
+            )
+            self._input_names = [i.name for i in self._session.get_inputs()]
+        return self._session
+
+    def set_num_threads(self, num_threads: int):
+        self.num_threads = num_threads
+        self._session = None
+
+    def encode(self, texts: Sequence[str], batch_size: int = 32) -> np.ndarray:
+        texts = list(texts)
+        session = self.session
+        # Length-sorted batches keep padding (wasted compute) small
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        vectors = [None] * len(texts)
+
+        for start in range(0, len(order), max(1, batch_size)):
+            indices = order[start:start + batch_size]
+            encoded = self.tokenizer(
+                [texts[i] for i in indices],
+                padding=True,
+                truncation=True,
+                max_length=self.max_seq_length,
+                return_tensors="np"
+            )
+            feed = {name: encoded[name].astype(np.int64) for name in self._input_names if name in encoded}
+            last_hidden_state = session.run(None, feed)[0]
+            for i, vector in zip(indices, mean_pool(last_hidden_state, encoded["attention_mask"])):
+                vectors[i] = vector
+
+        if not vectors:
+            return np.zeros((0, 0), dtype=np.float32)
+        return np.stack(vectors).astype(np.float32)
+
+
+def export_onnx(model_name: str, path: str) -> str:
+    """
+    Export the transformer (without pooling) to ONNX with dynamic batch/sequence axes
+
+    Returns:
+        Path of the exported model
+    """
+    if os.path.exists(path):
+        return path
+
+    import torch
+    from transformers import AutoModel, AutoTokenizer
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    model = AutoModel.from_pretrained(model_name)
+    model.eval()
+    sample = AutoTokenizer.from_pretrained(model_name)(["onnx export sample"], return_tensors="pt")
+    input_names = [name for name in _MODEL_INPUTS if name in sample]
+
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+    dynamic_axes["last_hidden_state"] = {0: "batch", 1: "sequence"}
+
+    # Export to a temp name and rename, so a crash never leaves a truncated model
+    tmp_path = f"{path}.tmp"
+    with torch.no_grad():
+        torch.onnx.export(
+            model,
+            tuple(sample[name] for name in input_names),
+            tmp_path,
+            input_names=input_names,
+            output_names=["last_hidden_state"],
+            dynamic_axes=dynamic_axes,
+            opset_version=ONNX_OPSET
+        )
+    os.replace(tmp_path, path)
+    return path
+
+
+def quantize_onnx(fp32_path: str, int8_path: str) -> str:
+    """int8 dynamic quantization of weights (activations quantized at run time)"""
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    tmp_path = f"{int8_path}.tmp"
+    quantize_dynamic(fp32_path, tmp_path, weight_type=QuantType.QInt8)
+    os.replace(tmp_path, int8_path)
+    return int8_path
+
+
+def embedding_version(name: Optional[str] = None) -> str:
+    """
+    Embedding version written by (and expected from) a backend
+
+    Args:
+        name: One of BACKENDS (default: EMBEDDINGS_BACKEND)
+
+    Returns:
+        e.g. "miniLM-384-chunked@v2" (reference) or "miniLM-384-chunked@v2+onnx-int8"
+
+    Raises:
+        ValueError: Unknown backend
+    """
+    name = name or EMBEDDINGS_BACKEND
+    if name not in _BACKEND_PRECISION:
+        raise ValueError(f"Unknown embedding backend: {name!r} (expected one of {', '.join(BACKENDS)})")
+    precision = _BACKEND_PRECISION[name]
+    return f"{EMBEDDING_VERSION_BASE}+{precision}" if precision else EMBEDDING_VERSION_BASE
+
+
+def load_embedding_backend(name: Optional[str] = None, model_name: Optional[str] = None) -> EmbeddingBackend:
+    """
+    Create the configured embedding backend
+
+    Args:
+        name: One of BACKENDS (default: EMBEDDINGS_BACKEND)
+        model_name: Hugging Face model id (default: EMBEDDINGS_MODEL env)
+
+    Returns:
+        EmbeddingBackend instance
+    """
+    name = name or EMBEDDINGS_BACKEND
+    model_name = model_name or os.getenv("EMBEDDINGS_MODEL", "sentence-transformers/all-MiniLM-L6-v2")
+
+    if name == "sentence-transformers":
+        return SentenceTransformerBackend(model_name)
+    if name == "onnx":
+        return OnnxBackend(model_name, quantize=False)
+    if name == "onnx-int8":
+        return OnnxBackend(model_name, quantize=True)
+    raise ValueError(f"Unknown embedding backend: {name!r} (expected one of {', '.join(BACKENDS)})")
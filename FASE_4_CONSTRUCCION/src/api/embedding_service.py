@@ -0,0 +1,194 @@
+"""
+NEXUS Cerebro API - Embedding Service
+
+Non-blocking query embedding with micro-batching:
+- Concurrent request texts are queued and grouped into micro-batches
+  (bounded by batch size and by a wait time in milliseconds)
+- Each batch runs one model.encode() call on a dedicated executor thread,
+  so the event loop keeps serving other requests while the model works
+- Long texts are chunked and pooled exactly like the worker embeds episodes
+  (text_chunking.encode_chunked), so queries and documents stay comparable
+- Every caller awaits its own future, resolved with its own vector
+- Batch size, queue wait and encode time exported as Prometheus histograms
+"""
+
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+
+from prometheus_client import Histogram
+
+from text_chunking import encode_chunked
+
+# ============================================
+# Configuration
+# ============================================
+EMBEDDING_BATCH_MAX_SIZE = int(os.getenv("EMBEDDING_BATCH_MAX_SIZE", "32"))
+EMBEDDING_BATCH_MAX_WAIT_MS = float(os.getenv("EMBEDDING_BATCH_MAX_WAIT_MS", "5"))
+
+# ============================================
+# Prometheus Metrics
+# ============================================
+embedding_batch_size = Histogram(
+    'nexus_embedding_batch_size',
+    'Number of texts encoded per micro-batch',
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128)
+)
+
+embedding_queue_wait_seconds = Histogram(
+    'nexus_embedding_queue_wait_seconds',
+    'Time a text waited in the queue before its batch started encoding',
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+)
+
+embedding_encode_seconds = Histogram(
+    'nexus_embedding_encode_seconds',
+    'Model encode() time per micro-batch',
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+)
+
+
+class EmbeddingService:
+    """
+    Micro-batching front end for a SentenceTransformer-compatible model
+
+    Usage:
+        service = EmbeddingService(model)
+        await service.start()
+        vector = await service.encode("query text")
+        await service.stop()
+    """
+
+    def __init__(self,
+                 model,
+                 max_batch_size: int = EMBEDDING_BATCH_MAX_SIZE,
+                 max_wait_ms: float = EMBEDDING_BATCH_MAX_WAIT_MS):
+        """
+        Initialize embedding service
+
+        Args:
+            model: Object exposing encode(List[str], batch_size=...) -> array
+            max_batch_size: Max texts per encode() call
+            max_wait_ms: Max time the first text of a batch waits for company
+        """
+        self.model = model
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000.0
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._inflight: List[Tuple[str, asyncio.Future, float]] = []
+
+    @property
+    def running(self) -> bool:
+        return self._worker is not None and not self._worker.done()
+
+    async def start(self):
+        """Start the batching loop and its encode executor"""
+        if self.running:
+            return
+        self._queue = asyncio.Queue()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="nexus-embed")
+        self._worker = asyncio.create_task(self._batch_loop())
+
+    async def stop(self):
+        """Stop the batching loop; pending callers receive an error"""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+        pending = list(self._inflight)
+        self._inflight = []
+        if self._queue is not None:
+            while not self._queue.empty():
+                pending.append(self._queue.get_nowait())
+        for _, future, _ in pending:
+            if not future.done():
+                future.set_exception(RuntimeError("Embedding service stopped"))
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    async def encode(self, text: str) -> List[float]:
+        """
+        Queue one text and wait for its embedding
+
+        Args:
+            text: Text to embed (any length - chunked and pooled)
+
+        Returns:
+            Embedding as list of floats
+        """
+        if not self.running:
+            raise RuntimeError("Embedding service not running")
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((text, future, time.perf_counter()))
+        return await future
+
+    async def _collect_batch(self) -> List[Tuple[str, asyncio.Future, float]]:
+        """Block for the first item, then gather more until size or deadline"""
+        batch = self._inflight = [await self._queue.get()]
+        deadline = time.perf_counter() + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            # Drain whatever is already queued without waiting
+            while len(batch) < self.max_batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            if len(batch) >= self.max_batch_size:
+                break
+
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    def _encode_batch(self, texts: List[str]):
+        """Executor-side encode of one micro-batch"""
+        vectors, _ = encode_chunked(self.model, texts)
+        return vectors
+
+    async def _batch_loop(self):
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = await self._collect_batch()
+
+            # Callers that gave up (request cancelled) do not need encoding
+            batch = self._inflight = [item for item in batch if not item[1].done()]
+            if not batch:
+                continue
+
+            texts = [item[0] for item in batch]
+            started = time.perf_counter()
+            for _, _, enqueued_at in batch:
+                embedding_queue_wait_seconds.observe(started - enqueued_at)
+            embedding_batch_size.observe(len(batch))
+
+            try:
+                vectors = await loop.run_in_executor(self._executor, self._encode_batch, texts)
+            except Exception as e:
+                for _, future, _ in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            finally:
+                embedding_encode_seconds.observe(time.perf_counter() - started)
+
+            for (_, future, _), vector in zip(batch, vectors):
+                if not future.done():
+                    future.set_result(vector.tolist() if hasattr(vector, 'tolist') else list(vector))
+            self._inflight = []
@@ -14,13 +14,41 @@ Lab: LAB_001 - Emotional Salience
 """
 
 import math
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any, List
 from dataclasses import dataclass
 from datetime import datetime
 import psycopg
 from psycopg.rows import dict_row
 
 
+# Nearest emotional state and somatic marker at or before each timestamp,
+# resolved for a whole batch in one round trip (index-backed LATERAL probes)
+BATCH_CONTEXT_SQL = """
+    SELECT
+        t.idx,
+        es.joy, es.trust, es.fear, es.surprise, es.sadness, es.disgust, es.anger,
+        es.anticipation, es.complexity, es.created_at AS es_created_at,
+        sm.situation, sm.valence, sm.arousal, sm.strength, sm.created_at AS sm_created_at
+    FROM unnest(%s::timestamptz[]) WITH ORDINALITY AS t(ts, idx)
+    LEFT JOIN LATERAL (
+        SELECT joy, trust, fear, surprise, sadness, disgust, anger, anticipation,
+               complexity, created_at
+        FROM consciousness.emotional_states_log
+        WHERE created_at <= t.ts
+        ORDER BY created_at DESC
+        LIMIT 1
+    ) es ON true
+    LEFT JOIN LATERAL (
+        SELECT situation, valence, arousal, strength, created_at
+        FROM consciousness.somatic_markers_log
+        WHERE created_at <= t.ts
+        ORDER BY created_at DESC
+        LIMIT 1
+    ) sm ON true
+    ORDER BY t.idx
+"""
+
+
 @dataclass
 class EmotionalState:
     """Plutchik 8D LOVE emotional state"""
@@ -173,6 +201,72 @@ class EmotionalSalienceScorer:
             cursor.close()
             conn.close()
 
+    @staticmethod
+    def _context_from_row(row: Dict[str, Any]) -> Tuple[Optional[EmotionalState], Optional[SomaticMarker]]:
+        """Build (EmotionalState, SomaticMarker) from a BATCH_CONTEXT_SQL row"""
+        emotional_state = None
+        if row['es_created_at'] is not None:
+            emotional_state = EmotionalState(
+                joy=float(row['joy']),
+                trust=float(row['trust']),
+                fear=float(row['fear']),
+                surprise=float(row['surprise']),
+                sadness=float(row['sadness']),
+                disgust=float(row['disgust']),
+                anger=float(row['anger']),
+                anticipation=float(row['anticipation']),
+                complexity=float(row['complexity']),
+                created_at=row['es_created_at']
+            )
+
+        somatic_marker = None
+        if row['sm_created_at'] is not None:
+            somatic_marker = SomaticMarker(
+                situation=row['situation'],
+                valence=float(row['valence']),
+                arousal=float(row['arousal']),
+                strength=float(row['strength']),
+                timestamp=row['sm_created_at']
+            )
+
+        return emotional_state, somatic_marker
+
+    def get_emotional_contexts(self, timestamps: List[datetime]) -> List[Tuple[Optional[EmotionalState], Optional[SomaticMarker]]]:
+        """
+        Fetch emotional and somatic context for many timestamps in one query
+
+        Args:
+            timestamps: Episode creation timestamps
+
+        Returns:
+            List of (EmotionalState, SomaticMarker) aligned with timestamps
+        """
+        if not timestamps:
+            return []
+
+        with self._get_db_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(BATCH_CONTEXT_SQL, [list(timestamps)])
+                return [self._context_from_row(row) for row in cursor.fetchall()]
+
+    async def get_emotional_contexts_async(self, conn, timestamps: List[datetime]) -> List[Tuple[Optional[EmotionalState], Optional[SomaticMarker]]]:
+        """
+        Async variant of get_emotional_contexts on a caller-provided connection
+
+        Args:
+            conn: psycopg AsyncConnection (e.g. borrowed from the API pool)
+            timestamps: Episode creation timestamps
+
+        Returns:
+            List of (EmotionalState, SomaticMarker) aligned with timestamps
+        """
+        if not timestamps:
+            return []
+
+        async with conn.cursor(row_factory=dict_row) as cursor:
+            await cursor.execute(BATCH_CONTEXT_SQL, [list(timestamps)])
+            return [self._context_from_row(row) for row in await cursor.fetchall()]
+
     def emotional_intensity(self, emotional_state: EmotionalState) -> float:
         """
         Calculate overall emotional arousal from 8D vector
@@ -329,7 +423,20 @@ class EmotionalSalienceScorer:
         """
         # Fetch emotional context
         emotional_state, somatic_marker = self.get_emotional_context(timestamp)
+        return self.score_context(emotional_state, somatic_marker)
 
+    def score_context(self, emotional_state: Optional[EmotionalState],
+                      somatic_marker: Optional[SomaticMarker]) -> SalienceScore:
+        """
+        Score an already-resolved emotional/somatic context
+
+        Args:
+            emotional_state: Nearest emotional state (or None)
+            somatic_marker: Nearest somatic marker (or None)
+
+        Returns:
+            SalienceScore object with total and component scores
+        """
         # If no context available, return neutral salience
         if not emotional_state or not somatic_marker:
             return SalienceScore(
@@ -377,22 +484,38 @@ class EmotionalSalienceScorer:
         """
         Calculate salience for multiple episodes efficiently
 
+        One connection, one query for the whole batch.
+
         Args:
             episodes: List of dicts with 'episode_id' and 'timestamp'
 
         Returns:
             Dict mapping episode_id -> SalienceScore
         """
-        results = {}
+        contexts = self.get_emotional_contexts([e['timestamp'] for e in episodes])
 
-        for episode in episodes:
-            episode_id = episode['episode_id']
-            timestamp = episode['timestamp']
+        return {
+            episode['episode_id']: self.score_context(emotional_state, somatic_marker)
+            for episode, (emotional_state, somatic_marker) in zip(episodes, contexts)
+        }
+
+    async def batch_calculate_salience_async(self, conn, episodes: list) -> Dict[str, SalienceScore]:
+        """
+        Async batch salience on a caller-provided connection (one round trip)
+
+        Args:
+            conn: psycopg AsyncConnection
+            episodes: List of dicts with 'episode_id' and 'timestamp'
 
-            salience = self.calculate_salience(episode_id, timestamp)
-            results[episode_id] = salience
+        Returns:
+            Dict mapping episode_id -> SalienceScore
+        """
+        contexts = await self.get_emotional_contexts_async(conn, [e['timestamp'] for e in episodes])
 
-        return results
+        return {
+            episode['episode_id']: self.score_context(emotional_state, somatic_marker)
+            for episode, (emotional_state, somatic_marker) in zip(episodes, contexts)
+        }
 
 
 # Example usage
@@ -0,0 +1,309 @@
+"""
+NEXUS Cerebro API - LAB_005 Graph Snapshots
+
+Persists the spreading activation state across API restarts:
+- SimilarityGraph: float32 embedding matrix, CSR neighbour adjacency
+  (indptr / indices / weights) and the uuid table
+- ActivationManager: activation levels with wall-clock access times (decay
+  continues across the restart) and their source episodes
+
+One file per snapshot: a fixed-size header (magic + JSON layout) followed by
+64-byte aligned raw arrays, so every section opens with np.memmap and a
+restore costs the index rebuild, not a parse. Written to a temp file,
+fsynced and renamed over the previous snapshot (readers never see a partial
+file), on a timer and on shutdown.
+
+The priming cache is not persisted: it is rebuilt by the first accesses.
+"""
+
+import asyncio
+import json
+import os
+import struct
+import time
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+from prometheus_client import Counter, Gauge, Histogram
+
+# ============================================
+# Configuration
+# ============================================
+LAB005_SNAPSHOT_PATH = os.getenv("LAB005_SNAPSHOT_PATH", "")  # Empty = snapshots disabled
+LAB005_SNAPSHOT_INTERVAL = float(os.getenv("LAB005_SNAPSHOT_INTERVAL", "600"))  # seconds, 0 = shutdown only
+
+SNAPSHOT_MAGIC = b"NXLAB005"
+SNAPSHOT_FORMAT_VERSION = 1
+HEADER_SIZE = 4096
+SECTION_ALIGNMENT = 64
+
+# Activation states below this are not restored (same as engine cleanup)
+RESTORE_ACTIVATION_THRESHOLD = 0.1
+
+# ============================================
+# Prometheus Metrics
+# ============================================
+lab005_snapshot_writes_total = Counter(
+    'nexus_lab005_snapshot_writes_total',
+    'LAB_005 graph snapshot writes',
+    ['status']
+)
+
+lab005_snapshot_write_seconds = Histogram(
+    'nexus_lab005_snapshot_write_seconds',
+    'Time to capture and write one graph snapshot',
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+)
+
+lab005_snapshot_bytes = Gauge(
+    'nexus_lab005_snapshot_bytes',
+    'Size of the last written graph snapshot'
+)
+
+lab005_snapshot_restore_seconds = Gauge(
+    'nexus_lab005_snapshot_restore_seconds',
+    'Time to restore the graph from the snapshot at startup'
+)
+
+
+# ============================================
+# File Format
+# ============================================
+def write_snapshot(path: str, sections: Dict[str, np.ndarray], meta: Dict) -> int:
+    """
+    Atomically write arrays + metadata to `path`
+
+    Args:
+        path: Snapshot file (replaced with os.replace)
+        sections: Named arrays (any fixed-size dtype)
+        meta: JSON-serializable metadata
+
+    Returns:
+        File size in bytes
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp-{os.getpid()}"
+
+    layout = {}
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(b"\0" * HEADER_SIZE)
+            offset = HEADER_SIZE
+            for name, array in sections.items():
+                array = np.ascontiguousarray(array)
+                padding = -offset % SECTION_ALIGNMENT
+                f.write(b"\0" * padding)
+                offset += padding
+                layout[name] = {"dtype": array.dtype.str, "shape": list(array.shape), "offset": offset}
+                if array.nbytes:
+                    f.write(memoryview(array).cast("B"))
+                offset += array.nbytes
+
+            header = json.dumps({
+                "format": SNAPSHOT_FORMAT_VERSION, "meta": meta, "sections": layout
+            }).encode()
+            if len(SNAPSHOT_MAGIC) + 4 + len(header) > HEADER_SIZE:
+                raise ValueError("Snapshot header exceeds HEADER_SIZE")
+            f.seek(0)
+            f.write(SNAPSHOT_MAGIC + struct.pack("<I", len(header)) + header)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+    # Persist the rename itself
+    dir_fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+    return offset
+
+
+def read_snapshot(path: str, mode: str = "c") -> Tuple[Dict[str, np.ndarray], Dict]:
+    """
+    Open a snapshot without reading its arrays
+
+    Args:
+        path: Snapshot file
+        mode: np.memmap mode ("c" = copy-on-write, writes stay private)
+
+    Returns:
+        (sections as np.memmap, meta)
+
+    Raises:
+        ValueError: Not a snapshot or unknown format version
+    """
+    with open(path, "rb") as f:
+        prefix = f.read(len(SNAPSHOT_MAGIC) + 4)
+        if prefix[:len(SNAPSHOT_MAGIC)] != SNAPSHOT_MAGIC:
+            raise ValueError(f"{path} is not a LAB_005 snapshot")
+        (header_length,) = struct.unpack("<I", prefix[len(SNAPSHOT_MAGIC):])
+        header = json.loads(f.read(header_length))
+    if header["format"] != SNAPSHOT_FORMAT_VERSION:
+        raise ValueError(f"Unsupported snapshot format {header['format']}")
+
+    sections = {}
+    for name, spec in header["sections"].items():
+        dtype, shape = np.dtype(spec["dtype"]), tuple(spec["shape"])
+        if 0 in shape:
+            sections[name] = np.zeros(shape, dtype=dtype)  # mmap cannot map zero bytes
+        else:
+            sections[name] = np.memmap(path, dtype=dtype, mode=mode, offset=spec["offset"], shape=shape)
+    return sections, header["meta"]
+
+
+# ============================================
+# Engine Save / Restore
+# ============================================
+def engine_meta(engine, embedding_version: str) -> Dict:
+    """Parameters a snapshot must match to be restored into `engine`"""
+    return {
+        "embedding_version": embedding_version,
+        "similarity_threshold": engine.similarity_graph.similarity_threshold,
+        "max_neighbors": engine.similarity_graph.max_neighbors,
+        "decay_half_life": engine.activation_manager.decay_half_life
+    }
+
+
+def save_engine_snapshot(engine, path: str, embedding_version: str,
+                         watermark: Optional[datetime] = None) -> Dict:
+    """
+    Capture the engine under its lock, then write outside it
+
+    Args:
+        engine: SpreadingActivationEngine
+        path: Snapshot file
+        embedding_version: Recorded so other model versions are not restored
+        watermark: Graph loader sync watermark (lets a restore resume syncing)
+
+    Returns:
+        Snapshot stats (episodes, bytes, seconds)
+    """
+    start = time.perf_counter()
+    with engine.lock:
+        graph = engine.similarity_graph.export_arrays()
+        activations = engine.activation_manager.export_arrays()
+
+    sections = {f"graph.{name}": array for name, array in graph.items()}
+    sections.update({f"activation.{name}": array for name, array in activations.items()})
+    meta = {
+        **engine_meta(engine, embedding_version),
+        "created_at": time.time(),
+        "episodes": len(graph["uuids"]),
+        "watermark": watermark.isoformat() if watermark else None
+    }
+    size = write_snapshot(path, sections, meta)
+    return {"episodes": meta["episodes"], "bytes": size, "seconds": time.perf_counter() - start}
+
+
+def load_engine_snapshot(engine, path: str, embedding_version: str) -> Optional[Dict]:
+    """
+    Restore graph + activation state into `engine`
+
+    Returns:
+        Snapshot meta, or None if there is no snapshot or it was written
+        with different parameters (the engine is left untouched)
+    """
+    if not os.path.exists(path):
+        return None
+    sections, meta = read_snapshot(path)
+    expected = engine_meta(engine, embedding_version)
+    if any(meta.get(key) != value for key, value in expected.items()):
+        return None
+
+    graph = {name[len("graph."):]: array for name, array in sections.items() if name.startswith("graph.")}
+    activations = {name[len("activation."):]: array for name, array in sections.items() if name.startswith("activation.")}
+    with engine.lock:
+        engine.similarity_graph.load_arrays(**graph)
+        engine.activation_manager.load_arrays(**activations, threshold=RESTORE_ACTIVATION_THRESHOLD)
+    return meta
+
+
+class GraphSnapshotter:
+    """
+    Restores the engine at startup and snapshots it on a timer and on stop
+
+    Args:
+        engine: SpreadingActivationEngine
+        path: Snapshot file
+        embedding_version: Current embedding version
+        interval: Seconds between snapshots (0 = only on stop)
+        loader: Optional GraphWarmStartLoader; its watermark is saved once
+            the initial load has completed
+    """
+
+    def __init__(self, engine, path: str, embedding_version: str,
+                 interval: float = LAB005_SNAPSHOT_INTERVAL, loader=None):
+        self.engine = engine
+        self.path = path
+        self.embedding_version = embedding_version
+        self.interval = interval
+        self.loader = loader
+        self.last_snapshot: Optional[Dict] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def restore(self) -> Optional[Dict]:
+        """Load the snapshot if compatible; returns its meta"""
+        start = time.perf_counter()
+        try:
+            meta = await asyncio.to_thread(load_engine_snapshot, self.engine, self.path, self.embedding_version)
+        except Exception as e:
+            print(f"⚠ LAB_005 snapshot restore failed: {e}")
+            return None
+        if meta is None:
+            return None
+
+        elapsed = time.perf_counter() - start
+        lab005_snapshot_restore_seconds.set(elapsed)
+        print(f"✓ LAB_005 graph restored from snapshot: {meta['episodes']} episodes in {elapsed * 1000:.0f}ms")
+        return meta
+
+    async def save(self) -> Optional[Dict]:
+        """Write one snapshot (in a worker thread)"""
+        watermark = None
+        if self.loader is not None and self.loader.state == "syncing":
+            watermark = self.loader.watermark
+
+        start = time.perf_counter()
+        try:
+            self.last_snapshot = await asyncio.to_thread(
+                save_engine_snapshot, self.engine, self.path, self.embedding_version, watermark
+            )
+        except Exception as e:
+            print(f"⚠ LAB_005 snapshot write failed: {e}")
+            lab005_snapshot_writes_total.labels(status='error').inc()
+            return None
+        finally:
+            lab005_snapshot_write_seconds.observe(time.perf_counter() - start)
+
+        lab005_snapshot_writes_total.labels(status='success').inc()
+        lab005_snapshot_bytes.set(self.last_snapshot["bytes"])
+        return self.last_snapshot
+
+    async def start(self):
+        """Start the periodic snapshot loop"""
+        if self._task is None and self.interval > 0:
+            self._task = asyncio.create_task(self._snapshot_loop())
+
+    async def stop(self):
+        """Stop the loop and write a final snapshot"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if len(self.engine.similarity_graph):
+            await self.save()
+
+    async def _snapshot_loop(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.save()
@@ -0,0 +1,420 @@
+"""
+NEXUS Cerebro API - LAB_005 Similarity Graph Warm Start
+
+Fills the spreading activation graph from zep_episodic_memory in the
+background so priming finds neighbours right after a restart:
+- Initial load streams (episode_id, embedding) newest first through a
+  server-side cursor, one FETCH of LAB005_WARM_START_BATCH_SIZE rows at a
+  time, and bulk-inserts them with SimilarityGraph.add_episodes
+- Then keeps the graph in sync by polling embeddings_queue for rows the
+  worker marked done since the last watermark (new and re-embedded episodes)
+- Memory budget: the graph is pre-sized once and capped at
+  LAB005_GRAPH_MAX_EPISODES or LAB005_GRAPH_MEMORY_MB, whichever comes
+  first. The cap is the graph's own max_episodes, so every insert (loader,
+  sync, /memory/prime) checks it under the engine lock; once full, the
+  oldest episodes are evicted for new ones (newest episodes win)
+- After a restore from a graph snapshot (graph_snapshot.py) the initial load
+  is skipped and syncing resumes from the snapshot's watermark
+
+Embeddings travel in pgvector's binary form (vector_send) and are decoded
+with one np.frombuffer per batch. Graph inserts run in a worker thread
+under the engine lock, in chunks, so priming requests keep being served
+while the load is in progress.
+"""
+
+import asyncio
+import os
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+from prometheus_client import Counter, Gauge
+
+from spreading_activation import SimilarityGraph
+
+# ============================================
+# Configuration
+# ============================================
+LAB005_WARM_START_BATCH_SIZE = int(os.getenv("LAB005_WARM_START_BATCH_SIZE", "2000"))  # rows per FETCH
+LAB005_WARM_START_INSERT_CHUNK = int(os.getenv("LAB005_WARM_START_INSERT_CHUNK", "512"))  # rows per engine lock hold
+LAB005_WARM_START_RETRY_SECONDS = float(os.getenv("LAB005_WARM_START_RETRY_SECONDS", "30"))
+LAB005_GRAPH_MAX_EPISODES = int(os.getenv("LAB005_GRAPH_MAX_EPISODES", "200000"))
+LAB005_GRAPH_MEMORY_MB = float(os.getenv("LAB005_GRAPH_MEMORY_MB", "256"))
+LAB005_SYNC_INTERVAL = float(os.getenv("LAB005_SYNC_INTERVAL", "5"))  # seconds between incremental syncs
+LAB005_SYNC_LAG_SECONDS = float(os.getenv("LAB005_SYNC_LAG_SECONDS", "30"))  # re-read window for late commits
+
+# uuid string + dict entry + list slot, per episode
+PYTHON_BYTES_PER_EPISODE = 200
+
+# Newest first: when the budget truncates, recent episodes are the ones kept
+COUNT_EPISODES_SQL = """
+    SELECT count(*), now()
+    FROM nexus_memory.zep_episodic_memory
+    WHERE embedding IS NOT NULL AND embedding_version = %s
+"""
+
+SCAN_EPISODES_SQL = """
+    SELECT episode_id, vector_send(embedding)
+    FROM nexus_memory.zep_episodic_memory
+    WHERE embedding IS NOT NULL AND embedding_version = %s
+    ORDER BY created_at DESC
+"""
+
+# Keyset pagination on (processed_at, episode_id)
+SYNC_EPISODES_SQL = """
+    SELECT q.episode_id, vector_send(e.embedding), q.processed_at
+    FROM memory_system.embeddings_queue q
+    JOIN nexus_memory.zep_episodic_memory e ON e.episode_id = q.episode_id
+    WHERE q.state = 'done'
+      AND (q.processed_at, q.episode_id) > (%s, %s::uuid)
+      AND e.embedding IS NOT NULL
+      AND e.embedding_version = %s
+    ORDER BY q.processed_at, q.episode_id
+    LIMIT %s
+"""
+
+MIN_UUID = "00000000-0000-0000-0000-000000000000"
+
+# ============================================
+# Prometheus Metrics
+# ============================================
+lab005_graph_episodes = Gauge(
+    'nexus_lab005_graph_episodes',
+    'Episodes in the LAB_005 similarity graph'
+)
+
+lab005_graph_bytes = Gauge(
+    'nexus_lab005_graph_bytes',
+    'Bytes allocated by the similarity graph matrix and neighbour arrays'
+)
+
+lab005_warm_start_progress = Gauge(
+    'nexus_lab005_warm_start_progress_ratio',
+    'Initial graph load progress (loaded / target episodes)'
+)
+
+lab005_warm_start_rows_total = Counter(
+    'nexus_lab005_warm_start_rows_total',
+    'Rows streamed from PostgreSQL by the initial graph load'
+)
+
+lab005_warm_start_seconds = Gauge(
+    'nexus_lab005_warm_start_seconds',
+    'Duration of the last completed initial graph load'
+)
+
+lab005_graph_sync_total = Counter(
+    'nexus_lab005_graph_sync_total',
+    'Incremental graph sync polls',
+    ['status']
+)
+
+lab005_graph_sync_episodes_total = Counter(
+    'nexus_lab005_graph_sync_episodes_total',
+    'Episodes added or re-embedded in the graph by incremental sync'
+)
+
+lab005_graph_budget_skipped_total = Counter(
+    'nexus_lab005_graph_budget_skipped_total',
+    'Episodes not admitted to the graph because the memory budget is full'
+)
+
+lab005_graph_evicted_total = Counter(
+    'nexus_lab005_graph_evicted_total',
+    'Oldest episodes evicted from the full similarity graph to admit new ones'
+)
+
+
+def decode_vectors(blobs: Sequence[bytes]) -> np.ndarray:
+    """
+    Decode pgvector binary values (vector_send) into a float32 matrix
+
+    Each value is int16 dim, int16 unused, then dim big-endian float4.
+
+    Args:
+        blobs: Binary vectors, all of the same dimension
+
+    Returns:
+        (len(blobs), dim) float32 array
+    """
+    if not blobs:
+        return np.zeros((0, 0), dtype=np.float32)
+    dimension = int.from_bytes(bytes(blobs[0][:2]), "big")
+    raw = np.frombuffer(b"".join(blobs), dtype=np.uint8).reshape(len(blobs), 4 + 4 * dimension)
+    return raw[:, 4:].copy().view(">f4").astype(np.float32)
+
+
+def graph_bytes_per_episode(dimension: int, max_neighbors: int) -> int:
+    """Matrix row + neighbour arrays + admission bar + Python bookkeeping"""
+    return dimension * 4 + max_neighbors * 8 + 4 + PYTHON_BYTES_PER_EPISODE
+
+
+class GraphWarmStartLoader:
+    """
+    Background loader keeping a SpreadingActivationEngine's graph filled
+
+    Args:
+        engine: SpreadingActivationEngine to fill
+        pool: psycopg AsyncConnectionPool
+        embedding_version: Only embeddings of this version are loaded
+        batch_size: Rows per server-side cursor FETCH / sync page
+        insert_chunk: Rows inserted per engine lock hold
+        max_episodes: Hard cap on graph episodes
+        memory_mb: Graph memory budget (matrix + neighbour lists)
+        sync_interval: Seconds between incremental syncs
+        sync_lag: Each sync re-reads this many seconds before the watermark
+            (queue rows committed late with an earlier processed_at)
+    """
+
+    def __init__(self,
+                 engine,
+                 pool,
+                 embedding_version: str,
+                 batch_size: int = LAB005_WARM_START_BATCH_SIZE,
+                 insert_chunk: int = LAB005_WARM_START_INSERT_CHUNK,
+                 max_episodes: int = LAB005_GRAPH_MAX_EPISODES,
+                 memory_mb: float = LAB005_GRAPH_MEMORY_MB,
+                 sync_interval: float = LAB005_SYNC_INTERVAL,
+                 sync_lag: float = LAB005_SYNC_LAG_SECONDS):
+        self.engine = engine
+        self.pool = pool
+        self.embedding_version = embedding_version
+        self.batch_size = max(1, batch_size)
+        self.insert_chunk = max(1, insert_chunk)
+        self.max_episodes = max(1, max_episodes)
+        self.memory_bytes = int(memory_mb * 1024 * 1024)
+        self.sync_interval = sync_interval
+        self.sync_lag = timedelta(seconds=sync_lag)
+
+        self.state = "idle"  # idle -> loading -> syncing (failed while retrying the load)
+        self.loaded = 0
+        self.target = 0
+        self.skipped_budget = 0
+        self.synced = 0
+        self.scanned = 0  # Initial load rows seen (newest first -> eviction keys)
+        self.load_seconds: Optional[float] = None
+        self.watermark: Optional[datetime] = None
+        self.last_error: Optional[str] = None
+        self._budget_episodes: Optional[int] = None  # Known once the dimension is
+        self._evicted_seen = 0
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        """Start the load + sync loop"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Cancel the loop (an interrupted load leaves a partial, usable graph)"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def resume(self, watermark: datetime):
+        """
+        Skip the initial load: the graph was restored from a snapshot whose
+        contents are complete up to `watermark`; only sync from there
+        """
+        self.watermark = watermark
+        graph = self.engine.similarity_graph
+        if len(graph):
+            self._set_budget(graph.matrix.shape[1])
+        self.loaded = self.target = len(graph)
+        self.load_seconds = 0.0
+        self.state = "syncing"
+        lab005_warm_start_progress.set(1.0)
+        lab005_graph_episodes.set(len(self.engine.similarity_graph))
+
+    async def _run(self):
+        while self.state != "syncing":
+            try:
+                await self.load()
+            except Exception as e:
+                self.state = "failed"
+                self.last_error = str(e)
+                print(f"⚠ LAB_005 graph warm start failed: {e} (retrying in {LAB005_WARM_START_RETRY_SECONDS:.0f}s)")
+                await asyncio.sleep(LAB005_WARM_START_RETRY_SECONDS)
+
+        while True:
+            await asyncio.sleep(self.sync_interval)
+            try:
+                await self.sync()
+                lab005_graph_sync_total.labels(status='success').inc()
+            except Exception as e:
+                self.last_error = str(e)
+                lab005_graph_sync_total.labels(status='error').inc()
+                print(f"⚠ LAB_005 graph sync failed: {e}")
+
+    async def load(self):
+        """Stream every current-version embedding into the graph"""
+        self.state = "loading"
+        started = time.perf_counter()
+
+        async with self.pool.connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(COUNT_EPISODES_SQL, (self.embedding_version,))
+                total, snapshot_time = await cur.fetchone()
+            self.target = min(total, self.max_episodes)
+            # Episodes embedded while the scan runs are picked up by the first sync
+            self.watermark = snapshot_time
+            print(f"LAB_005 graph warm start: {total} embedded episodes (loading up to {self.target})")
+
+            async with conn.transaction():
+                async with conn.cursor(name="lab005_graph_warm_start", binary=True) as cur:
+                    await cur.execute(SCAN_EPISODES_SQL, (self.embedding_version,))
+                    while not self._budget_full():
+                        rows = await cur.fetchmany(self.batch_size)
+                        if not rows:
+                            break
+                        lab005_warm_start_rows_total.inc(len(rows))
+                        self.loaded += await asyncio.to_thread(self._apply, rows, True)
+                        if self.target:
+                            lab005_warm_start_progress.set(min(1.0, self.loaded / self.target))
+
+        self.load_seconds = time.perf_counter() - started
+        self.state = "syncing"
+        self.last_error = None
+        lab005_warm_start_progress.set(1.0)
+        lab005_warm_start_seconds.set(self.load_seconds)
+        print(f"✓ LAB_005 graph warm start: {len(self.engine.similarity_graph)} episodes "
+              f"in {self.load_seconds:.1f}s ({self.engine.similarity_graph.nbytes / 1e6:.0f} MB)")
+
+    async def sync(self) -> int:
+        """
+        Apply episodes embedded since the watermark
+
+        Returns:
+            Episodes added or re-embedded
+        """
+        if self.watermark is None:
+            return 0
+
+        applied = 0
+        cursor_time, cursor_id = self.watermark - self.sync_lag, MIN_UUID
+        newest = self.watermark
+        async with self.pool.connection() as conn:
+            async with conn.cursor(binary=True) as cur:
+                while True:
+                    await cur.execute(SYNC_EPISODES_SQL, (
+                        cursor_time, cursor_id, self.embedding_version, self.batch_size
+                    ))
+                    rows = await cur.fetchall()
+                    if not rows:
+                        break
+                    applied += await asyncio.to_thread(self._apply, [row[:2] for row in rows])
+                    cursor_time, cursor_id = rows[-1][2], str(rows[-1][0])
+                    newest = max(newest, cursor_time)
+                    if len(rows) < self.batch_size:
+                        break
+
+        self.watermark = newest
+        self.synced += applied
+        lab005_graph_sync_episodes_total.inc(applied)
+        self._publish()
+        return applied
+
+    def _budget_full(self) -> bool:
+        return self._budget_episodes is not None and len(self.engine.similarity_graph) >= self._budget_episodes
+
+    def _set_budget(self, dimension: int):
+        """Episode cap for the memory budget, enforced by the graph itself"""
+        graph = self.engine.similarity_graph
+        per_episode = graph_bytes_per_episode(dimension, graph.max_neighbors)
+        self._budget_episodes = max(1, min(self.max_episodes, self.memory_bytes // per_episode))
+        self.target = min(self.target, self._budget_episodes)
+        with self.engine.lock:
+            graph.max_episodes = self._budget_episodes
+
+    def _apply(self, rows: List[tuple], scan: bool = False) -> int:
+        """
+        Insert a batch of (episode_id, binary vector) rows (worker thread)
+
+        Episodes already in the graph with the same embedding are skipped
+        (sync re-reads its lag window). Past the budget the graph evicts its
+        oldest rows for synced episodes; initial load rows (`scan`, newest
+        first) rank below everything loaded before them, so they are not
+        admitted instead.
+
+        Returns:
+            Episodes added or replaced
+        """
+        graph = self.engine.similarity_graph
+        uuids = [str(row[0]) for row in rows]
+        vectors = decode_vectors([row[1] for row in rows])
+        dimension = vectors.shape[1]
+        first_key = self.scanned
+        if scan:
+            self.scanned += len(rows)
+
+        if self._budget_episodes is None:
+            self._set_budget(dimension)
+
+        with self.engine.lock:
+            known = [i for i, uuid in enumerate(uuids) if uuid in graph]
+            changed = set(range(len(uuids)))
+            if known:
+                stored = graph.matrix[[graph.index[uuids[i]] for i in known]]
+                same = np.all(np.abs(stored - SimilarityGraph._normalize(vectors[known])) <= 1e-6, axis=1)
+                changed.difference_update(i for i, unchanged in zip(known, same) if unchanged)
+            keep = sorted(changed)
+            if not keep:
+                return 0
+
+            # Allocate once up to the target, then grow without passing the budget
+            needed = len(graph) + len(keep)
+            if graph.nbytes == 0 or (needed > graph.capacity and graph.capacity < self._budget_episodes):
+                capacity = max(needed, int(self.target * 1.1), 2 * graph.capacity if graph.nbytes else 0)
+                graph.reserve(min(capacity, self._budget_episodes), dimension)
+
+        # Chunked so accesses interleave with a long load; the budget check and
+        # the insert happen inside one add_episodes call, under the engine lock
+        applied = 0
+        for c0 in range(0, len(keep), self.insert_chunk):
+            chunk = keep[c0:c0 + self.insert_chunk]
+            chunk_uuids = [uuids[i] for i in chunk]
+            recency = [-(first_key + i + 1) for i in chunk] if scan else None
+            with self.engine.lock:
+                self.engine.add_episodes(chunk_uuids, vectors[chunk], recency)
+                rejected = sum(uuid not in graph for uuid in chunk_uuids)
+            applied += len(chunk) - rejected
+            if rejected:
+                self.skipped_budget += rejected
+                lab005_graph_budget_skipped_total.inc(rejected)
+
+        self._publish()
+        return applied
+
+    def _publish(self):
+        """Graph size gauges + evictions (including those by /memory/prime inserts)"""
+        graph = self.engine.similarity_graph
+        evicted = graph.evicted - self._evicted_seen
+        if evicted > 0:
+            if self._evicted_seen == 0:
+                print(f"⚠ LAB_005 similarity graph at its budget ({self._budget_episodes} episodes): "
+                      f"evicting the oldest episodes for new ones")
+            lab005_graph_evicted_total.inc(evicted)
+            self._evicted_seen = graph.evicted
+        lab005_graph_episodes.set(len(graph))
+        lab005_graph_bytes.set(graph.nbytes)
+
+    def get_stats(self) -> Dict:
+        """Loader state for /memory/priming/stats"""
+        return {
+            "state": self.state,
+            "loaded": self.loaded,
+            "target": self.target,
+            "progress": min(1.0, self.loaded / self.target) if self.target else (1.0 if self.state == "syncing" else 0.0),
+            "load_seconds": self.load_seconds,
+            "synced": self.synced,
+            "skipped_budget": self.skipped_budget,
+            "evicted": self.engine.similarity_graph.evicted,
+            "budget_episodes": self._budget_episodes,
+            "graph_bytes": self.engine.similarity_graph.nbytes,
+            "watermark": self.watermark.isoformat() if self.watermark else None,
+            "last_error": self.last_error
+        }
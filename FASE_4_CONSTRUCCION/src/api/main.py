@@ -4,21 +4,22 @@ FastAPI Application - Core Endpoints
 DÍA 5 FASE 4 - Base Implementation
 """
 
-from fastapi import FastAPI, HTTPException, status
+from fastapi import FastAPI, HTTPException, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
 from typing import Optional, List, Dict, Any
-from datetime import datetime, timedelta
+from datetime import datetime
 import os
-import psycopg
 from psycopg.types.json import Json
 from contextlib import asynccontextmanager
+import asyncio
 from prometheus_client import Counter, Histogram, Gauge, generate_latest, CONTENT_TYPE_LATEST
 from starlette.responses import Response
 import time
 import redis
 import json as json_module
-from sentence_transformers import SentenceTransformer
+import uuid as uuid_module
+import itertools
 
 # FASE_8_UPGRADE: Hybrid Memory System
 import sys
@@ -28,20 +29,29 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from fact_extractor import extract_facts_from_content
 from fact_schemas import FactQueryRequest, FactQueryResponse, HybridQueryRequest, HybridQueryResponse
 
-# LAB_001: Emotional Salience
-from emotional_salience_scorer import EmotionalSalienceScorer
+# Cold start: numpy and everything built on it are imported where first used,
+# so /health and non-embedding endpoints answer before they are loaded:
+# LAB_001 emotional_salience_scorer, LAB_002 decay_modulator (search rerank)
+# LAB_003 consolidation_engine / consolidation_scheduler (day jobs run in a process pool)
+# LAB_005 spreading_activation / graph_warm_start / graph_snapshot (prime endpoints, loader + snapshot tasks)
+# LAB_007 predictive_preloading (prefetch workers, started with the pool)
+# ab_testing (A/B endpoints)
+# embedding_backends / embedding_service / query_embedding_cache (model warm-up task)
 
-# LAB_002: Decay Modulation
-from decay_modulator import DecayModulator
+# Async PostgreSQL connection pool
+from db_pool import create_db_pool, pooled_connection, update_pool_metrics
 
-# LAB_003: Sleep Consolidation (lazy import to avoid psycopg2 dependency at startup)
-# from consolidation_engine import ConsolidationEngine
+# Write-behind access tracking (intelligent decay)
+from access_tracking import AccessTrackingBuffer
 
-# LAB_005: Spreading Activation
-from spreading_activation import SpreadingActivationEngine
+# pgvector ANN index management + per-request recall knobs
+from vector_index import apply_search_params, verify_index, MAX_EF_SEARCH, MAX_PROBES
 
-# A/B Testing Framework
-from ab_testing import get_ab_test_manager, TestVariant
+# Redis tier for primed / preloaded episode payloads, shared across replicas
+from shared_episode_cache import SharedEpisodeCache, SHARED_EPISODE_CACHE_ENABLED, episode_cache_requests_total
+
+# Incremental NDJSON / JSON array parsing for /memory/actions/bulk
+from bulk_body import BulkBodyParser
 
 # ============================================
 # Configuration
@@ -98,11 +108,29 @@ embeddings_queue_depth = Gauge(
     ['state']
 )
 
+# LAB_005 Metrics
+lab005_priming_cache_lookups_total = Counter(
+    'nexus_lab005_priming_cache_lookups_total',
+    'Episode payload lookups served by (hit) or missing from (miss) the priming cache',
+    ['endpoint', 'result']
+)
+
+lab005_priming_payload_fetch_seconds = Histogram(
+    'nexus_lab005_priming_payload_fetch_seconds',
+    'Batched payload query per priming event',
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25)
+)
+
 # ============================================
 # Database Connection
 # ============================================
 DB_CONN_STRING = f"postgresql://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DB}"
 
+# Max rows accepted by /memory/actions/bulk in one request (one transaction)
+BULK_INGEST_MAX_ROWS = int(os.getenv("BULK_INGEST_MAX_ROWS", "20000"))
+# Max body size, enforced while the body streams in (it is never buffered whole)
+BULK_INGEST_MAX_BYTES = int(os.getenv("BULK_INGEST_MAX_BYTES", str(64 * 1024 * 1024)))
+
 # ============================================
 # Redis Configuration
 # ============================================
@@ -123,10 +151,50 @@ except FileNotFoundError:
 # Embeddings Model Configuration
 # ============================================
 EMBEDDINGS_MODEL = os.getenv("EMBEDDINGS_MODEL", "sentence-transformers/all-MiniLM-L6-v2")
+EMBEDDINGS_BACKEND = os.getenv("EMBEDDINGS_BACKEND", "sentence-transformers")  # See embedding_backends.py
+EMBEDDING_VERSION = os.getenv("EMBEDDING_VERSION", "")  # Empty = derived from EMBEDDINGS_BACKEND, like the worker
+EMBEDDINGS_WARMUP_RETRY_SECONDS = float(os.getenv("EMBEDDINGS_WARMUP_RETRY_SECONDS", "30"))
 
-# Global model instance (loaded in lifespan)
+# Global model instance (loaded in the background after startup)
 embeddings_model = None
 
+# "warming" until the model + embedding service are up, then "ready" ("failed" between retries)
+embeddings_model_state = "warming"
+
+# Micro-batching front end for the model (started in lifespan)
+embedding_service = None
+
+# Query vector cache (L1 in-process, optional Redis L2)
+query_embedding_cache = None
+
+# ============================================
+# LAB_005 Configuration
+# ============================================
+# Background load of the similarity graph from the database (see graph_warm_start.py)
+LAB005_WARM_START_ENABLED = os.getenv("LAB005_WARM_START_ENABLED", "true").lower() == "true"
+# Graph + activation snapshot file, restored at startup (see graph_snapshot.py); empty = disabled
+LAB005_SNAPSHOT_PATH = os.getenv("LAB005_SNAPSHOT_PATH", "")
+# Strongest new episodes kept per propagation hop (bounds multi-source priming); 0 = unbounded
+LAB005_MAX_FRONTIER = int(os.getenv("LAB005_MAX_FRONTIER", "200"))
+# Priming cache bounds (entries and estimated payload bytes), split across lock-protected shards
+LAB005_PRIMING_CACHE_SIZE = int(os.getenv("LAB005_PRIMING_CACHE_SIZE", "2000"))
+LAB005_PRIMING_CACHE_MB = float(os.getenv("LAB005_PRIMING_CACHE_MB", "32"))
+LAB005_PRIMING_CACHE_SHARDS = int(os.getenv("LAB005_PRIMING_CACHE_SHARDS", "16"))
+
+# ============================================
+# LAB_003 Configuration
+# ============================================
+# Background consolidation jobs with per-day checkpoints (see consolidation_scheduler.py)
+LAB003_SCHEDULER_ENABLED = os.getenv("LAB003_SCHEDULER_ENABLED", "true").lower() == "true"
+
+# ============================================
+# LAB_007 Configuration
+# ============================================
+# Predict the next episodes from access sequences and prefetch them (see predictive_preloading.py)
+LAB007_PRELOAD_ENABLED = os.getenv("LAB007_PRELOAD_ENABLED", "true").lower() == "true"
+# Episodes of one response whose tags are kept as prediction context (not learned as a sequence)
+LAB007_FEED_PER_REQUEST = int(os.getenv("LAB007_FEED_PER_REQUEST", "5"))
+
 # ============================================
 # Pydantic Models
 # ============================================
@@ -142,6 +210,14 @@ class MemoryActionResponse(BaseModel):
     timestamp: datetime
     message: str
 
+class BulkMemoryActionResponse(BaseModel):
+    success: bool
+    count: int
+    episode_ids: List[str]  # Same order as the submitted rows
+    timestamp: datetime
+    duration_ms: float
+    message: str
+
 class HealthResponse(BaseModel):
     status: str
     version: str
@@ -149,6 +225,7 @@ class HealthResponse(BaseModel):
     database: str
     redis: Optional[str] = None
     queue_depth: Optional[int] = None
+    embeddings_model: Optional[str] = None
     timestamp: datetime
 
 class SearchRequest(BaseModel):
@@ -159,6 +236,8 @@ class SearchRequest(BaseModel):
     salience_boost_alpha: float = Field(default=0.5, ge=0.0, le=2.0, description="LAB_001: Salience boost factor (0=none, 0.5=moderate, 1.0=strong)")
     use_decay_modulation: bool = Field(default=False, description="LAB_002: Modulate decay rate by emotional salience (requires LAB_001)")
     decay_base: float = Field(default=0.95, ge=0.90, le=0.98, description="LAB_002: Daily decay rate (0.95=standard, 0.93=faster, 0.97=slower)")
+    ef_search: Optional[int] = Field(default=None, ge=1, le=MAX_EF_SEARCH, description="HNSW candidate list size for this query (higher = better recall, slower; server default if unset)")
+    probes: Optional[int] = Field(default=None, ge=1, le=MAX_PROBES, description="IVFFlat lists probed for this query (only used with an IVFFlat index)")
 
 class SearchResult(BaseModel):
     episode_id: str
@@ -213,6 +292,9 @@ class TemporalLinkRequest(BaseModel):
     target_id: str = Field(..., description="Target episode UUID")
     relationship: str = Field(..., description="Relationship type: 'before', 'after', 'causes', 'effects'")
 
+class PrimeContextRequest(BaseModel):
+    episode_ids: List[str] = Field(..., min_length=1, max_length=100, description="Episodes of the current context, primed together")
+
 class ABTestMetricRequest(BaseModel):
     variant: str = Field(..., description="Test variant: 'control' or 'treatment'")
     retrieval_time_ms: float = Field(..., description="Retrieval time in milliseconds")
@@ -238,9 +320,69 @@ class TemporalResponse(BaseModel):
 # ============================================
 # Lifespan Context Manager
 # ============================================
+def get_embedding_version() -> str:
+    """Version tag of the configured backend's vectors (must match the embeddings worker)"""
+    if EMBEDDING_VERSION:
+        return EMBEDDING_VERSION
+    from embedding_backends import embedding_version
+
+    return embedding_version(EMBEDDINGS_BACKEND)
+
+
+def load_embeddings_backend():
+    """Import the embedding stack and load the model (runs in a worker thread)"""
+    from embedding_backends import load_embedding_backend
+
+    model = load_embedding_backend(EMBEDDINGS_BACKEND, EMBEDDINGS_MODEL)
+    # First encode initializes lazy runtime state (ONNX session, torch kernels)
+    model.encode(["warm-up"], batch_size=1)
+    return model
+
+
+async def warm_up_embeddings(app: FastAPI):
+    """
+    Load the embeddings model in the background, then start the services using it
+
+    Until this finishes /health reports embeddings_model="warming" and
+    embedding endpoints answer 503 with Retry-After; everything else serves.
+    Failed loads are retried every EMBEDDINGS_WARMUP_RETRY_SECONDS.
+    """
+    global embeddings_model, embedding_service, query_embedding_cache, embeddings_model_state
+
+    started = time.time()
+    while embeddings_model is None:
+        try:
+            print(f"Loading embeddings model: {EMBEDDINGS_MODEL} (backend: {EMBEDDINGS_BACKEND})")
+            embeddings_model = await asyncio.to_thread(load_embeddings_backend)
+            print(f"✓ Embeddings model loaded successfully ({time.time() - started:.1f}s)")
+        except Exception as e:
+            print(f"⚠ Embeddings model loading failed: {e} (retrying in {EMBEDDINGS_WARMUP_RETRY_SECONDS:.0f}s)")
+            embeddings_model_state = "failed"
+            await asyncio.sleep(EMBEDDINGS_WARMUP_RETRY_SECONDS)
+
+    from embedding_service import EmbeddingService
+    from query_embedding_cache import (
+        QueryEmbeddingCache, QUERY_EMBEDDING_CACHE_REDIS_ENABLED, tokenizer_lowercases
+    )
+
+    # Query embedding cache (Redis tier stores raw float32 bytes)
+    query_embedding_cache = QueryEmbeddingCache(
+        model_key=f"{EMBEDDINGS_MODEL}|{EMBEDDINGS_BACKEND}|{get_embedding_version()}",
+        redis_client=app.state.redis_binary_client if QUERY_EMBEDDING_CACHE_REDIS_ENABLED else None,
+        lowercase=tokenizer_lowercases(getattr(embeddings_model, "tokenizer", None))
+    )
+
+    # Micro-batching embedding service
+    embedding_service = EmbeddingService(embeddings_model)
+    await embedding_service.start()
+    embeddings_model_state = "ready"
+    print(f"✓ Embedding service started (batch≤{embedding_service.max_batch_size}, "
+          f"wait≤{embedding_service.max_wait * 1000:.1f}ms)")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    global embeddings_model
+    global embedding_service, preloading_engine
 
     # Startup - Initialize Redis connection
     try:
@@ -259,18 +401,129 @@ async def lifespan(app: FastAPI):
         print(f"⚠ Redis connection failed: {e}")
         app.state.redis_client = None
 
-    # Startup - Load embeddings model
+    # Binary values (query vectors, shared episode cache) on the same Redis
+    app.state.redis_binary_client = None
+    if app.state.redis_client:
+        app.state.redis_binary_client = redis.Redis(
+            host=REDIS_HOST,
+            port=REDIS_PORT,
+            db=REDIS_DB,
+            password=REDIS_PASSWORD if REDIS_PASSWORD else None,
+            decode_responses=False,
+            socket_connect_timeout=5
+        )
+
+    # Startup - Shared episode cache + cross-replica invalidation listener
+    app.state.shared_episode_cache = None
+    if app.state.redis_binary_client and SHARED_EPISODE_CACHE_ENABLED:
+        app.state.shared_episode_cache = SharedEpisodeCache(app.state.redis_binary_client)
+        app.state.shared_episode_cache.add_invalidation_handler(invalidate_priming_cache)
+        await app.state.shared_episode_cache.start()
+
+    # Startup - Load embeddings model in the background (does not block serving)
+    app.state.embeddings_warmup = asyncio.create_task(warm_up_embeddings(app))
+
+    # Startup - Open async PostgreSQL connection pool
     try:
-        print(f"Loading embeddings model: {EMBEDDINGS_MODEL}")
-        embeddings_model = SentenceTransformer(EMBEDDINGS_MODEL)
-        print(f"✓ Embeddings model loaded successfully")
+        app.state.db_pool = await create_db_pool(DB_CONN_STRING)
+        print(f"✓ PostgreSQL pool opened: {POSTGRES_HOST}:{POSTGRES_PORT}")
     except Exception as e:
-        print(f"⚠ Embeddings model loading failed: {e}")
-        embeddings_model = None
+        print(f"⚠ PostgreSQL pool initialization failed: {e}")
+        app.state.db_pool = None
+
+    # Startup - Write-behind access tracking
+    app.state.access_tracker = AccessTrackingBuffer(app.state.db_pool)
+    await app.state.access_tracker.start()
+
+    # Startup - LAB_005 graph snapshot restore (memory-mapped, milliseconds)
+    app.state.graph_snapshotter = None
+    snapshot_meta = None
+    if LAB005_SNAPSHOT_PATH:
+        from graph_snapshot import GraphSnapshotter
+
+        app.state.graph_snapshotter = GraphSnapshotter(get_spreading_engine(), LAB005_SNAPSHOT_PATH, get_embedding_version())
+        snapshot_meta = await app.state.graph_snapshotter.restore()
+
+    # Startup - LAB_005 similarity graph warm start (streams in the background,
+    # or only syncs what changed since a restored snapshot)
+    app.state.graph_loader = None
+    if app.state.db_pool and LAB005_WARM_START_ENABLED:
+        from graph_warm_start import GraphWarmStartLoader
+
+        app.state.graph_loader = GraphWarmStartLoader(get_spreading_engine(), app.state.db_pool, get_embedding_version())
+        if snapshot_meta and snapshot_meta.get("watermark"):
+            app.state.graph_loader.resume(datetime.fromisoformat(snapshot_meta["watermark"]))
+        await app.state.graph_loader.start()
+
+    if app.state.graph_snapshotter:
+        app.state.graph_snapshotter.loader = app.state.graph_loader
+        await app.state.graph_snapshotter.start()
+
+    # Startup - LAB_007 predictive preloading (prefetch workers use the pool)
+    if app.state.db_pool and LAB007_PRELOAD_ENABLED:
+        from predictive_preloading import PredictivePreloadingEngine
+
+        preloading_engine = PredictivePreloadingEngine(
+            fetch_preload_payloads,
+            embedding_fn=graph_embedding,
+            shared_cache=app.state.shared_episode_cache
+        )
+        if app.state.shared_episode_cache:
+            app.state.shared_episode_cache.add_invalidation_handler(preloading_engine.invalidate)
+        await preloading_engine.start()
+
+    # Startup - LAB_003 consolidation scheduler (catches up on pending days)
+    app.state.consolidation_scheduler = None
+    if app.state.db_pool and LAB003_SCHEDULER_ENABLED:
+        from consolidation_scheduler import ConsolidationScheduler
+
+        app.state.consolidation_scheduler = ConsolidationScheduler(
+            dict(db_host=POSTGRES_HOST, db_port=POSTGRES_PORT, db_name=POSTGRES_DB,
+                 db_user=POSTGRES_USER, db_password=POSTGRES_PASSWORD),
+            on_day_done=invalidate_episode_caches
+        )
+        await app.state.consolidation_scheduler.start()
 
     yield
 
-    # Shutdown - Close Redis connection
+    # Shutdown - Stop taking consolidation jobs
+    if app.state.consolidation_scheduler:
+        await app.state.consolidation_scheduler.stop()
+
+    # Shutdown - Stop prefetching (needs the pool)
+    if preloading_engine is not None:
+        await preloading_engine.stop()
+        preloading_engine = None
+
+    # Shutdown - Stop the graph loader (needs the pool), then write the final snapshot
+    if app.state.graph_loader:
+        await app.state.graph_loader.stop()
+    if app.state.graph_snapshotter:
+        await app.state.graph_snapshotter.stop()
+
+    # Shutdown - Drain pending access tracking (needs the pool)
+    await app.state.access_tracker.stop()
+
+    # Shutdown - Stop model warm-up if still running, then the embedding service
+    if not app.state.embeddings_warmup.done():
+        app.state.embeddings_warmup.cancel()
+        try:
+            await app.state.embeddings_warmup
+        except asyncio.CancelledError:
+            pass
+    if embedding_service is not None:
+        await embedding_service.stop()
+        embedding_service = None
+
+    # Shutdown - Close PostgreSQL pool
+    if app.state.db_pool:
+        await app.state.db_pool.close()
+
+    # Shutdown - Stop the invalidation listener, then close Redis connections
+    if app.state.shared_episode_cache:
+        await app.state.shared_episode_cache.stop()
+    if app.state.redis_binary_client:
+        app.state.redis_binary_client.close()
     if app.state.redis_client:
         app.state.redis_client.close()
 
@@ -318,16 +571,24 @@ async def prometheus_middleware(request, call_next):
 # ============================================
 # Helper Functions
 # ============================================
+def get_db_pool():
+    """Get async PostgreSQL pool from app state"""
+    return app.state.db_pool if hasattr(app.state, 'db_pool') else None
+
 def get_db_connection():
-    """Get database connection"""
-    try:
-        conn = psycopg.connect(DB_CONN_STRING)
-        return conn
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=f"Database connection failed: {str(e)}"
-        )
+    """
+    Borrow a pooled async database connection
+
+    Usage: async with get_db_connection() as conn
+    Commits on clean exit, rolls back on error.
+    """
+    return pooled_connection(get_db_pool())
+
+def record_episode_access(episode_ids):
+    """Queue access hits for intelligent decay (flushed in the background)"""
+    tracker = app.state.access_tracker if hasattr(app.state, 'access_tracker') else None
+    if tracker is not None:
+        tracker.record(episode_ids)
 
 def get_redis_client():
     """Get Redis client from app state"""
@@ -369,24 +630,39 @@ def cache_invalidate(pattern: str):
     except Exception as e:
         print(f"Cache invalidate error: {e}")
 
-def generate_query_embedding(text: str):
-    """Generate embedding for search query"""
-    global embeddings_model
+async def generate_query_embedding(text: str, use_cache: bool = True):
+    """
+    Generate embedding for search query
 
-    if embeddings_model is None:
+    Repeated queries are served from the query embedding cache; misses are
+    queued on the embedding service, where concurrent queries are encoded
+    together in one micro-batch off the event loop.
+
+    Args:
+        text: Query text
+        use_cache: Consult/populate the query cache (off for episode content)
+    """
+    if embedding_service is None or not embedding_service.running:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Embeddings model not loaded"
+            detail=f"Embeddings model not ready ({embeddings_model_state})",
+            headers={"Retry-After": "5"}
         )
 
-    try:
-        # Truncate to 4000 chars (same as worker)
-        text_truncated = text[:4000] if len(text) > 4000 else text
-
-        # Generate embedding
-        embedding = embeddings_model.encode(text_truncated)
+    normalized = None
+    if use_cache and query_embedding_cache is not None:
+        # The normalized form is only the key; the model sees the text as sent
+        normalized = query_embedding_cache.normalize(text)
+        cached = query_embedding_cache.get(normalized)
+        if cached is not None:
+            return cached
 
-        return embedding.tolist()
+    try:
+        # Long queries are chunked and pooled by the service (same as worker)
+        embedding = await embedding_service.encode(text)
+        if normalized is not None:
+            query_embedding_cache.put(normalized, embedding)
+        return embedding
 
     except Exception as e:
         raise HTTPException(
@@ -418,20 +694,19 @@ async def health_check():
 
     # Check PostgreSQL
     try:
-        conn = get_db_connection()
-        with conn.cursor() as cur:
-            cur.execute("SELECT 1")
-            result = cur.fetchone()
-
-            # Get queue depth
-            cur.execute("""
-                SELECT COUNT(*)
-                FROM memory_system.embeddings_queue
-                WHERE state IN ('pending', 'processing')
-            """)
-            queue_depth = cur.fetchone()[0]
-
-        conn.close()
+        async with get_db_connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute("SELECT 1")
+                result = await cur.fetchone()
+
+                # Get queue depth
+                await cur.execute("""
+                    SELECT COUNT(*)
+                    FROM memory_system.embeddings_queue
+                    WHERE state IN ('pending', 'processing')
+                """)
+                queue_depth = (await cur.fetchone())[0]
+
         db_status = "connected" if result else "disconnected"
     except Exception as e:
         db_status = f"error: {str(e)[:100]}"
@@ -453,6 +728,10 @@ async def health_check():
     if queue_depth and queue_depth > 1000:
         overall_status = "degraded"  # High queue depth is warning
 
+    # Model not ready: everything except embedding endpoints is serving
+    if embeddings_model_state != "ready" and overall_status == "healthy":
+        overall_status = "warming" if embeddings_model_state == "warming" else "degraded"
+
     return HealthResponse(
         status=overall_status,
         version="2.0.0",
@@ -460,9 +739,40 @@ async def health_check():
         database=db_status,
         redis=redis_status,
         queue_depth=queue_depth,
+        embeddings_model=embeddings_model_state,
         timestamp=datetime.now()
         )
 
+def prepare_episode_row(request: MemoryActionRequest):
+    """
+    Map a MemoryActionRequest to zep_episodic_memory column values
+
+    Returns:
+        Tuple of (content, importance_score, tags, metadata)
+    """
+    # Prepare content from action_details
+    # FIXED: Use actual content field if exists, otherwise serialize full details
+    if "content" in request.action_details:
+        # Use explicit content field
+        content = request.action_details["content"]
+    elif request.action_details:
+        # Serialize full action_details as JSON string for embeddings
+        content = json_module.dumps(request.action_details, indent=2, default=str)
+    else:
+        # Fallback to action_type only
+        content = request.action_type
+
+    # Calculate importance_score (default 0.5, can be customized)
+    importance_score = request.action_details.get("importance_score", 0.5) if request.action_details else 0.5
+
+    metadata = {
+        "action_type": request.action_type,
+        "action_details": request.action_details,
+        "context_state": request.context_state
+    }
+
+    return content, importance_score, request.tags or [], metadata
+
 @app.post("/memory/action", response_model=MemoryActionResponse, tags=["Memory"])
 async def memory_action(request: MemoryActionRequest):
     """
@@ -470,47 +780,26 @@ async def memory_action(request: MemoryActionRequest):
     Automatically triggers embeddings generation via database trigger
     """
     try:
-        conn = get_db_connection()
-
-        # Prepare content from action_details
-        # FIXED: Use actual content field if exists, otherwise serialize full details
-        if "content" in request.action_details:
-            # Use explicit content field
-            content = request.action_details["content"]
-        elif request.action_details:
-            # Serialize full action_details as JSON string for embeddings
-            content = json_module.dumps(request.action_details, indent=2, default=str)
-        else:
-            # Fallback to action_type only
-            content = request.action_type
-
-        # Calculate importance_score (default 0.5, can be customized)
-        importance_score = request.action_details.get("importance_score", 0.5) if request.action_details else 0.5
-
-        # Insert into episodic memory
-        with conn.cursor() as cur:
-            cur.execute("""
-                INSERT INTO nexus_memory.zep_episodic_memory
-                (content, importance_score, tags, metadata)
-                VALUES (%s, %s, %s, %s)
-                RETURNING episode_id, created_at
-            """, (
-                content,
-                importance_score,
-                request.tags or [],
-                Json({
-                    "action_type": request.action_type,
-                    "action_details": request.action_details,
-                    "context_state": request.context_state
-                })
-            ))
-
-            result = cur.fetchone()
-            episode_id = str(result[0])
-            created_at = result[1]
+        content, importance_score, tags, metadata = prepare_episode_row(request)
+
+        async with get_db_connection() as conn:
+            # Insert into episodic memory
+            async with conn.cursor() as cur:
+                await cur.execute("""
+                    INSERT INTO nexus_memory.zep_episodic_memory
+                    (content, importance_score, tags, metadata)
+                    VALUES (%s, %s, %s, %s)
+                    RETURNING episode_id, created_at
+                """, (
+                    content,
+                    importance_score,
+                    tags,
+                    Json(metadata)
+                ))
 
-        conn.commit()
-        conn.close()
+                result = await cur.fetchone()
+                episode_id = str(result[0])
+                created_at = result[1]
 
         # Invalidate episodes cache
         cache_invalidate("episodes:recent:*")
@@ -531,6 +820,132 @@ async def memory_action(request: MemoryActionRequest):
             detail=f"Error creating memory: {str(e)}"
         )
 
+def bulk_body_too_large() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"Bulk body exceeds {BULK_INGEST_MAX_BYTES} bytes"
+    )
+
+def validate_bulk_rows(items: List[Any], actions: List[MemoryActionRequest]):
+    """
+    Validate parsed rows into actions, enforcing BULK_INGEST_MAX_ROWS
+
+    Raises:
+        HTTPException 413/422: too many rows, invalid row
+    """
+    if len(actions) + len(items) > BULK_INGEST_MAX_ROWS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Bulk batch has more than {BULK_INGEST_MAX_ROWS} rows"
+        )
+
+    for item in items:
+        try:
+            actions.append(MemoryActionRequest.model_validate(item))
+        except ValidationError as e:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"Row {len(actions)}: {e.errors()}"
+            )
+
+async def read_bulk_actions(request: Request) -> List[MemoryActionRequest]:
+    """
+    Stream a bulk ingest body (NDJSON or JSON array) into validated requests
+
+    Rows are parsed and validated as chunks arrive; the size cap stops the
+    upload as soon as it is exceeded.
+
+    Raises:
+        HTTPException 400/413/422: malformed body, body or batch too large, invalid row
+    """
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > BULK_INGEST_MAX_BYTES:
+        raise bulk_body_too_large()
+
+    parser = BulkBodyParser(request.headers.get("content-type", ""))
+    actions = []
+    received = 0
+    try:
+        async for chunk in request.stream():
+            received += len(chunk)
+            if received > BULK_INGEST_MAX_BYTES:
+                raise bulk_body_too_large()
+            validate_bulk_rows(parser.feed(chunk), actions)
+        validate_bulk_rows(parser.feed(b"", final=True), actions)
+    except ValueError as e:  # UnicodeDecodeError / JSONDecodeError
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid bulk body: {str(e)}"
+        )
+
+    return actions
+
+@app.post("/memory/actions/bulk", response_model=BulkMemoryActionResponse, tags=["Memory"])
+async def memory_actions_bulk(request: Request):
+    """
+    Create many episodic memories in one call
+
+    Body: JSON array of MemoryActionRequest objects, or NDJSON
+    (Content-Type: application/x-ndjson) with one object per line.
+
+    Rows are loaded with COPY in a single transaction (all or nothing).
+    Embeddings are queued by the same database trigger as /memory/action.
+    Returns the new episode IDs in submission order.
+    """
+    start_time = time.time()
+    actions = await read_bulk_actions(request)
+
+    if not actions:
+        return BulkMemoryActionResponse(
+            success=True,
+            count=0,
+            episode_ids=[],
+            timestamp=datetime.now(),
+            duration_ms=(time.time() - start_time) * 1000,
+            message="No actions submitted"
+        )
+
+    try:
+        # IDs generated up front: COPY has no RETURNING
+        episode_ids = [uuid_module.uuid4() for _ in actions]
+
+        async with get_db_connection() as conn:
+            async with conn.cursor() as cur:
+                async with cur.copy("""
+                    COPY nexus_memory.zep_episodic_memory
+                    (episode_id, content, importance_score, tags, metadata)
+                    FROM STDIN
+                """) as copy:
+                    for episode_id, action in zip(episode_ids, actions):
+                        content, importance_score, tags, metadata = prepare_episode_row(action)
+                        await copy.write_row((episode_id, content, importance_score, tags, Json(metadata)))
+
+                # created_at defaults to NOW(), i.e. the transaction start time
+                await cur.execute("SELECT NOW()")
+                created_at = (await cur.fetchone())[0]
+
+        # One cache invalidation for the whole batch
+        cache_invalidate("episodes:recent:*")
+
+        episodes_created_total.inc(len(actions))
+
+        return BulkMemoryActionResponse(
+            success=True,
+            count=len(actions),
+            episode_ids=[str(e) for e in episode_ids],
+            timestamp=created_at,
+            duration_ms=(time.time() - start_time) * 1000,
+            message=f"{len(actions)} acciones registradas exitosamente"
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error creating memories in bulk: {str(e)}"
+        )
+
 @app.get("/memory/episodic/recent", tags=["Memory"])
 async def get_recent_episodes(limit: int = 10):
     """Get recent episodic memories with Redis cache"""
@@ -543,25 +958,34 @@ async def get_recent_episodes(limit: int = 10):
             return cached_data
 
         # Cache miss - query database
-        conn = get_db_connection()
-
-        with conn.cursor() as cur:
-            cur.execute("""
-                SELECT
-                    episode_id,
-                    content,
-                    importance_score,
-                    tags,
-                    created_at,
-                    embedding IS NOT NULL as has_embedding
-                FROM nexus_memory.zep_episodic_memory
-                ORDER BY created_at DESC
-                LIMIT %s
-            """, (limit,))
-
-            results = cur.fetchall()
+        async with get_db_connection() as conn:
+            async with conn.cursor() as cur:
+                if episode_caches_in_use():
+                    # LAB_005/LAB_007: ids only, payloads from the priming /
+                    # preload caches, one query for the episodes they do not hold
+                    await cur.execute("""
+                        SELECT episode_id
+                        FROM nexus_memory.zep_episodic_memory
+                        ORDER BY created_at DESC
+                        LIMIT %s
+                    """, (limit,))
+                    episode_ids = [str(row[0]) for row in await cur.fetchall()]
+                    results = await cached_episode_rows(cur, episode_ids, "recent")
+                else:
+                    await cur.execute("""
+                        SELECT
+                            episode_id,
+                            content,
+                            importance_score,
+                            tags,
+                            created_at,
+                            embedding IS NOT NULL as has_embedding
+                        FROM nexus_memory.zep_episodic_memory
+                        ORDER BY created_at DESC
+                        LIMIT %s
+                    """, (limit,))
 
-        conn.close()
+                    results = await cur.fetchall()
 
         episodes = []
         for row in results:
@@ -600,49 +1024,61 @@ async def search_memories(request: SearchRequest):
     """
     try:
         # Generate embedding for search query
-        query_embedding = generate_query_embedding(request.query)
+        query_embedding = await generate_query_embedding(request.query)
+
+        # LAB_005/LAB_007: with primed or preloaded episodes cached, the ANN
+        # query returns ids only and payloads come from those caches (misses
+        # in one query)
+        use_episode_caches = episode_caches_in_use()
+        payload_columns = "" if use_episode_caches else "content, importance_score, tags, created_at,"
 
         # Perform vector similarity search
-        conn = get_db_connection()
-
-        with conn.cursor() as cur:
-            # Cosine similarity search using pgvector <=> operator
-            # Lower distance = higher similarity
-            # Convert distance to similarity score (1 - distance)
-            cur.execute("""
-                SELECT
-                    episode_id,
-                    content,
-                    importance_score,
-                    tags,
-                    created_at,
-                    1 - (embedding <=> %s::vector) as similarity_score
-                FROM nexus_memory.zep_episodic_memory
-                WHERE embedding IS NOT NULL
-                    AND 1 - (embedding <=> %s::vector) >= %s
-                ORDER BY embedding <=> %s::vector
-                LIMIT %s
-            """, (
-                query_embedding,
-                query_embedding,
-                request.min_similarity,
-                query_embedding,
-                request.limit
-            ))
+        async with get_db_connection() as conn:
+            async with conn.cursor() as cur:
+                # Per-request recall/latency knobs (transaction-local)
+                await apply_search_params(cur, request.ef_search, request.probes)
+
+                # Cosine similarity search using pgvector <=> operator
+                # Lower distance = higher similarity
+                # Convert distance to similarity score (1 - distance)
+                # The inner ORDER BY distance LIMIT k is served by the HNSW
+                # index; the similarity threshold is applied to those k rows
+                # only (a WHERE on the distance would force a full scan)
+                await cur.execute(f"""
+                    SELECT
+                        episode_id,
+                        {payload_columns}
+                        1 - distance as similarity_score
+                    FROM (
+                        SELECT
+                            episode_id,
+                            {payload_columns}
+                            embedding <=> %s::vector as distance
+                        FROM nexus_memory.zep_episodic_memory
+                        WHERE embedding IS NOT NULL
+                        ORDER BY embedding <=> %s::vector
+                        LIMIT %s
+                    ) nearest
+                    WHERE distance <= %s
+                    ORDER BY distance
+                """, (
+                    query_embedding,
+                    query_embedding,
+                    request.limit,
+                    1 - request.min_similarity
+                ))
 
-            results = cur.fetchall()
+                results = await cur.fetchall()
 
-        # Track access for retrieved episodes (intelligent decay feature)
-        if results:
-            episode_ids = [str(row[0]) for row in results]
-            for ep_id in episode_ids:
-                with conn.cursor() as cur:
-                    cur.execute("""
-                        SELECT nexus_memory.update_access_tracking(%s::uuid)
-                    """, (ep_id,))
-            conn.commit()
+                if use_episode_caches:
+                    similarities = {str(row[0]): row[1] for row in results}
+                    rows = await cached_episode_rows(cur, list(similarities), "search")
+                    results = [row[:5] + (similarities[row[0]],) for row in rows]
 
-        conn.close()
+        # Track access for retrieved episodes (intelligent decay feature)
+        # Buffered: written off the request path in one set-based UPDATE
+        record_episode_access(row[0] for row in results)
+        feed_preloader(returned=((row[0], row[3]) for row in results))
 
         # Initialize search_results (will be populated below)
         search_results = []
@@ -650,7 +1086,9 @@ async def search_memories(request: SearchRequest):
         # LAB_001: Apply emotional salience re-ranking if enabled
         if request.use_emotional_salience and results:
             try:
-                # Initialize scorer (connects inside nexus_postgresql container)
+                from emotional_salience_scorer import EmotionalSalienceScorer
+
+                # Initialize scorer (queries run on the pooled connection)
                 scorer = EmotionalSalienceScorer(
                     db_host=POSTGRES_HOST,
                     db_port=POSTGRES_PORT,
@@ -659,15 +1097,21 @@ async def search_memories(request: SearchRequest):
                     db_password=POSTGRES_PASSWORD
                 )
 
+                # Resolve emotional context for all results in one round trip
+                async with get_db_connection() as conn:
+                    saliences = await scorer.batch_calculate_salience_async(
+                        conn,
+                        [{'episode_id': str(row[0]), 'timestamp': row[4]} for row in results]
+                    )
+
                 # Calculate salience for each result
                 reranked_results = []
                 for row in results:
                     episode_id = str(row[0])
                     original_similarity = float(row[5])
-                    timestamp = row[4]
 
-                    # Calculate emotional salience
-                    salience = scorer.calculate_salience(episode_id, timestamp)
+                    # Emotional salience (batch-resolved above)
+                    salience = saliences[episode_id]
 
                     # Apply re-ranking: final_score = similarity * (1 + alpha * salience)
                     final_score = original_similarity * (1 + request.salience_boost_alpha * salience.total_score)
@@ -681,6 +1125,8 @@ async def search_memories(request: SearchRequest):
 
                 # LAB_002: Apply decay modulation if enabled (requires LAB_001 salience)
                 if request.use_decay_modulation:
+                    from decay_modulator import DecayModulator
+
                     modulator = DecayModulator(decay_base=request.decay_base)
 
                     for item in reranked_results:
@@ -772,22 +1218,19 @@ async def search_memories(request: SearchRequest):
 async def get_stats():
     """Get database statistics and update Prometheus gauges"""
     try:
-        conn = get_db_connection()
-
-        with conn.cursor() as cur:
-            # Count episodic memories
-            cur.execute("SELECT COUNT(*) FROM nexus_memory.zep_episodic_memory")
-            total_episodes = cur.fetchone()[0]
-
-            # Count embeddings queue
-            cur.execute("SELECT state, COUNT(*) FROM memory_system.embeddings_queue GROUP BY state")
-            queue_stats = {row[0]: row[1] for row in cur.fetchall()}
+        async with get_db_connection() as conn:
+            async with conn.cursor() as cur:
+                # Count episodic memories
+                await cur.execute("SELECT COUNT(*) FROM nexus_memory.zep_episodic_memory")
+                total_episodes = (await cur.fetchone())[0]
 
-            # Count with embeddings
-            cur.execute("SELECT COUNT(*) FROM nexus_memory.zep_episodic_memory WHERE embedding IS NOT NULL")
-            total_with_embeddings = cur.fetchone()[0]
+                # Count embeddings queue
+                await cur.execute("SELECT state, COUNT(*) FROM memory_system.embeddings_queue GROUP BY state")
+                queue_stats = {row[0]: row[1] for row in await cur.fetchall()}
 
-        conn.close()
+                # Count with embeddings
+                await cur.execute("SELECT COUNT(*) FROM nexus_memory.zep_episodic_memory WHERE embedding IS NOT NULL")
+                total_with_embeddings = (await cur.fetchone())[0]
 
         # Update Prometheus gauges
         episodes_total.set(total_episodes)
@@ -814,10 +1257,39 @@ async def get_stats():
             detail=f"Error fetching stats: {str(e)}"
         )
 
+@app.get("/stats/vector-index", tags=["Stats"])
+async def get_vector_index_status():
+    """
+    Verify the episodic embedding ANN index
+
+    Reports validity, build parameters (m / ef_construction), size and
+    whether the planner uses it for k-NN search. Create/rebuild are done
+    offline with `python src/api/vector_index.py create|rebuild`.
+    """
+    try:
+        async with get_db_connection() as conn:
+            report = await verify_index(conn)
+
+        return {
+            "success": True,
+            "vector_index": report
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error verifying vector index: {str(e)}"
+        )
+
 # ============================================
 # FASE_8_UPGRADE: Temporal Reasoning Endpoints
 # ============================================
 
+TEMPORAL_EPISODE_COLUMNS = "episode_id, content, importance_score, tags, created_at"
+TEMPORAL_ID_COLUMNS = "episode_id"
+
 @app.post("/memory/temporal/before", response_model=TemporalResponse, tags=["Temporal"])
 async def get_episodes_before(request: TemporalBeforeRequest):
     """
@@ -825,29 +1297,31 @@ async def get_episodes_before(request: TemporalBeforeRequest):
     Ordered by timestamp DESC (most recent first)
     """
     try:
-        conn = get_db_connection()
-
-        with conn.cursor() as cur:
-            # Base query
-            query = """
-                SELECT episode_id, content, importance_score, tags, created_at
-                FROM nexus_memory.zep_episodic_memory
-                WHERE created_at < %s
-            """
-            params = [request.timestamp]
+        async with get_db_connection() as conn:
+            async with conn.cursor() as cur:
+                # Base query (ids only when the LAB_005/LAB_007 caches hold payloads)
+                ids_first = episode_caches_in_use()
+                query = f"""
+                    SELECT {TEMPORAL_ID_COLUMNS if ids_first else TEMPORAL_EPISODE_COLUMNS}
+                    FROM nexus_memory.zep_episodic_memory
+                    WHERE created_at < %s
+                """
+                params = [request.timestamp]
 
-            # Optional: filter by tags
-            if request.tags:
-                query += " AND tags && %s"
-                params.append(request.tags)
+                # Optional: filter by tags
+                if request.tags:
+                    query += " AND tags && %s"
+                    params.append(request.tags)
 
-            query += " ORDER BY created_at DESC LIMIT %s"
-            params.append(request.limit)
+                query += " ORDER BY created_at DESC LIMIT %s"
+                params.append(request.limit)
 
-            cur.execute(query, params)
-            results = cur.fetchall()
+                await cur.execute(query, params)
+                results = await cur.fetchall()
+                if ids_first:
+                    results = await cached_episode_rows(cur, [str(row[0]) for row in results], "temporal_before")
 
-        conn.close()
+        feed_preloader(returned=((row[0], row[3]) for row in results))
 
         # Build response
         episodes = []
@@ -880,29 +1354,31 @@ async def get_episodes_after(request: TemporalAfterRequest):
     Ordered by timestamp ASC (oldest first)
     """
     try:
-        conn = get_db_connection()
-
-        with conn.cursor() as cur:
-            # Base query
-            query = """
-                SELECT episode_id, content, importance_score, tags, created_at
-                FROM nexus_memory.zep_episodic_memory
-                WHERE created_at > %s
-            """
-            params = [request.timestamp]
+        async with get_db_connection() as conn:
+            async with conn.cursor() as cur:
+                # Base query (ids only when the LAB_005/LAB_007 caches hold payloads)
+                ids_first = episode_caches_in_use()
+                query = f"""
+                    SELECT {TEMPORAL_ID_COLUMNS if ids_first else TEMPORAL_EPISODE_COLUMNS}
+                    FROM nexus_memory.zep_episodic_memory
+                    WHERE created_at > %s
+                """
+                params = [request.timestamp]
 
-            # Optional: filter by tags
-            if request.tags:
-                query += " AND tags && %s"
-                params.append(request.tags)
+                # Optional: filter by tags
+                if request.tags:
+                    query += " AND tags && %s"
+                    params.append(request.tags)
 
-            query += " ORDER BY created_at ASC LIMIT %s"
-            params.append(request.limit)
+                query += " ORDER BY created_at ASC LIMIT %s"
+                params.append(request.limit)
 
-            cur.execute(query, params)
-            results = cur.fetchall()
+                await cur.execute(query, params)
+                results = await cur.fetchall()
+                if ids_first:
+                    results = await cached_episode_rows(cur, [str(row[0]) for row in results], "temporal_after")
 
-        conn.close()
+        feed_preloader(returned=((row[0], row[3]) for row in results))
 
         # Build response
         episodes = []
@@ -935,39 +1411,33 @@ async def get_episodes_in_range(request: TemporalRangeRequest):
     Ordered by timestamp ASC (chronological order)
     """
     try:
-        conn = get_db_connection()
-
-        with conn.cursor() as cur:
-            # Base query
-            query = """
-                SELECT episode_id, content, importance_score, tags, created_at
-                FROM nexus_memory.zep_episodic_memory
-                WHERE created_at BETWEEN %s AND %s
-            """
-            params = [request.start, request.end]
-
-            # Optional: filter by tags
-            if request.tags:
-                query += " AND tags && %s"
-                params.append(request.tags)
-
-            query += " ORDER BY created_at ASC LIMIT %s"
-            params.append(request.limit)
-
-            cur.execute(query, params)
-            results = cur.fetchall()
-
-        # Track access for retrieved episodes
-        if results:
-            episode_ids = [str(row[0]) for row in results]
-            for ep_id in episode_ids:
-                with conn.cursor() as cur:
-                    cur.execute("""
-                        SELECT nexus_memory.update_access_tracking(%s::uuid)
-                    """, (ep_id,))
-            conn.commit()
-
-        conn.close()
+        async with get_db_connection() as conn:
+            async with conn.cursor() as cur:
+                # Base query (ids only when the LAB_005/LAB_007 caches hold payloads)
+                ids_first = episode_caches_in_use()
+                query = f"""
+                    SELECT {TEMPORAL_ID_COLUMNS if ids_first else TEMPORAL_EPISODE_COLUMNS}
+                    FROM nexus_memory.zep_episodic_memory
+                    WHERE created_at BETWEEN %s AND %s
+                """
+                params = [request.start, request.end]
+
+                # Optional: filter by tags
+                if request.tags:
+                    query += " AND tags && %s"
+                    params.append(request.tags)
+
+                query += " ORDER BY created_at ASC LIMIT %s"
+                params.append(request.limit)
+
+                await cur.execute(query, params)
+                results = await cur.fetchall()
+                if ids_first:
+                    results = await cached_episode_rows(cur, [str(row[0]) for row in results], "temporal_range")
+
+        # Track access for retrieved episodes (buffered, flushed in background)
+        record_episode_access(row[0] for row in results)
+        feed_preloader(returned=((row[0], row[3]) for row in results))
 
         # Build response
         episodes = []
@@ -1000,46 +1470,49 @@ async def get_temporally_related(request: TemporalRelatedRequest):
     Uses PostgreSQL function get_temporal_refs() from Phase 1
     """
     try:
-        conn = get_db_connection()
-
-        with conn.cursor() as cur:
-            # Use Phase 1 SQL function to get temporal refs
-            if request.relationship_type:
-                # Get specific relationship type
-                cur.execute("""
-                    SELECT ref_episode_id
-                    FROM nexus_memory.get_temporal_refs(%s::uuid, %s)
-                """, (request.episode_id, request.relationship_type))
-            else:
-                # Get all relationships
-                cur.execute("""
-                    SELECT ref_episode_id
-                    FROM nexus_memory.get_temporal_refs(%s::uuid)
-                """, (request.episode_id,))
-
-            ref_ids = [row[0] for row in cur.fetchall()]
-
-            # If no references found, return empty
-            if not ref_ids:
-                conn.close()
-                return TemporalResponse(
-                    success=True,
-                    count=0,
-                    episodes=[],
-                    timestamp=datetime.now()
-                )
+        async with get_db_connection() as conn:
+            async with conn.cursor() as cur:
+                # Use Phase 1 SQL function to get temporal refs
+                if request.relationship_type:
+                    # Get specific relationship type
+                    await cur.execute("""
+                        SELECT ref_episode_id
+                        FROM nexus_memory.get_temporal_refs(%s::uuid, %s)
+                    """, (request.episode_id, request.relationship_type))
+                else:
+                    # Get all relationships
+                    await cur.execute("""
+                        SELECT ref_episode_id
+                        FROM nexus_memory.get_temporal_refs(%s::uuid)
+                    """, (request.episode_id,))
+
+                ref_ids = [row[0] for row in await cur.fetchall()]
+
+                # If no references found, return empty
+                if not ref_ids:
+                    return TemporalResponse(
+                        success=True,
+                        count=0,
+                        episodes=[],
+                        timestamp=datetime.now()
+                    )
 
-            # Fetch full episode data for referenced episodes
-            cur.execute("""
-                SELECT episode_id, content, importance_score, tags, created_at
-                FROM nexus_memory.zep_episodic_memory
-                WHERE episode_id = ANY(%s)
-                ORDER BY created_at DESC
-            """, (ref_ids,))
+                # Fetch full episode data for referenced episodes
+                if episode_caches_in_use():
+                    results = await cached_episode_rows(cur, [str(e) for e in ref_ids], "temporal_related")
+                    results.sort(key=lambda row: row[4], reverse=True)
+                else:
+                    await cur.execute("""
+                        SELECT episode_id, content, importance_score, tags, created_at
+                        FROM nexus_memory.zep_episodic_memory
+                        WHERE episode_id = ANY(%s)
+                        ORDER BY created_at DESC
+                    """, (ref_ids,))
 
-            results = cur.fetchall()
+                    results = await cur.fetchall()
 
-        conn.close()
+        # The source episode was read; its related episodes were only returned
+        feed_preloader(request.episode_id, ((row[0], row[3]) for row in results))
 
         # Build response
         episodes = []
@@ -1080,16 +1553,12 @@ async def link_episodes_temporally(request: TemporalLinkRequest):
                 detail=f"Invalid relationship type. Must be one of: {valid_types}"
             )
 
-        conn = get_db_connection()
-
-        with conn.cursor() as cur:
-            # Use Phase 1 SQL function to add temporal reference
-            cur.execute("""
-                SELECT nexus_memory.add_temporal_ref(%s::uuid, %s::uuid, %s)
-            """, (request.source_id, request.target_id, request.relationship))
-
-        conn.commit()
-        conn.close()
+        async with get_db_connection() as conn:
+            async with conn.cursor() as cur:
+                # Use Phase 1 SQL function to add temporal reference
+                await cur.execute("""
+                    SELECT nexus_memory.add_temporal_ref(%s::uuid, %s::uuid, %s)
+                """, (request.source_id, request.target_id, request.relationship))
 
         # Invalidate cache (if temporal queries are cached in future)
         cache_invalidate(f"temporal:related:{request.source_id}")
@@ -1203,63 +1672,59 @@ async def update_consciousness_state(request: ConsciousnessUpdateRequest):
         content = f"Consciousness {request.state_type} state update: {json_module.dumps(request.state_data, indent=2)}"
 
         # Get database connection
-        conn = get_db_connection()
-
-        previous_episode_id = None
-        chain_length = 0
-
-        # Find previous state of same type (if auto_link enabled)
-        if request.auto_link_previous:
-            with conn.cursor() as cur:
-                cur.execute("""
-                    SELECT episode_id, metadata
-                    FROM nexus_memory.zep_episodic_memory
-                    WHERE %s = ANY(tags)
-                    ORDER BY created_at DESC
-                    LIMIT 1
-                """, (f"{request.state_type}_state",))
-
-                previous = cur.fetchone()
-                if previous:
-                    previous_episode_id = str(previous[0])
-
-                    # Calculate chain length from previous state
-                    prev_metadata = previous[1] or {}
-                    prev_chain_length = prev_metadata.get("temporal_chain_length", 0)
-                    chain_length = prev_chain_length + 1
-
-        # Create new episode
-        with conn.cursor() as cur:
-            cur.execute("""
-                INSERT INTO nexus_memory.zep_episodic_memory
-                (content, importance_score, tags, metadata)
-                VALUES (%s, %s, %s, %s)
-                RETURNING episode_id, created_at
-            """, (
-                content,
-                request.importance,
-                tags,
-                Json({
-                    "state_type": request.state_type,
-                    "state_data": request.state_data,
-                    "temporal_chain_length": chain_length
-                })
-            ))
-
-            result = cur.fetchone()
-            new_episode_id = str(result[0])
-            created_at = result[1]
+        async with get_db_connection() as conn:
+            previous_episode_id = None
+            chain_length = 0
+
+            # Find previous state of same type (if auto_link enabled)
+            if request.auto_link_previous:
+                async with conn.cursor() as cur:
+                    await cur.execute("""
+                        SELECT episode_id, metadata
+                        FROM nexus_memory.zep_episodic_memory
+                        WHERE %s = ANY(tags)
+                        ORDER BY created_at DESC
+                        LIMIT 1
+                    """, (f"{request.state_type}_state",))
+
+                    previous = await cur.fetchone()
+                    if previous:
+                        previous_episode_id = str(previous[0])
+
+                        # Calculate chain length from previous state
+                        prev_metadata = previous[1] or {}
+                        prev_chain_length = prev_metadata.get("temporal_chain_length", 0)
+                        chain_length = prev_chain_length + 1
+
+            # Create new episode
+            async with conn.cursor() as cur:
+                await cur.execute("""
+                    INSERT INTO nexus_memory.zep_episodic_memory
+                    (content, importance_score, tags, metadata)
+                    VALUES (%s, %s, %s, %s)
+                    RETURNING episode_id, created_at
+                """, (
+                    content,
+                    request.importance,
+                    tags,
+                    Json({
+                        "state_type": request.state_type,
+                        "state_data": request.state_data,
+                        "temporal_chain_length": chain_length
+                    })
+                ))
 
-        # Create temporal link if previous exists
-        if previous_episode_id and request.auto_link_previous:
-            with conn.cursor() as cur:
-                # Link: new_episode --after--> previous_episode
-                cur.execute("""
-                    SELECT nexus_memory.add_temporal_ref(%s::uuid, %s::uuid, 'after')
-                """, (new_episode_id, previous_episode_id))
+                result = await cur.fetchone()
+                new_episode_id = str(result[0])
+                created_at = result[1]
 
-        conn.commit()
-        conn.close()
+            # Create temporal link if previous exists
+            if previous_episode_id and request.auto_link_previous:
+                async with conn.cursor() as cur:
+                    # Link: new_episode --after--> previous_episode
+                    await cur.execute("""
+                        SELECT nexus_memory.add_temporal_ref(%s::uuid, %s::uuid, 'after')
+                    """, (new_episode_id, previous_episode_id))
 
         # Invalidate cache
         cache_invalidate("consciousness:*")
@@ -1300,70 +1765,67 @@ async def analyze_decay_scores(request: DecayAnalysisRequest):
     Returns distribution by score category and counts
     """
     try:
-        conn = get_db_connection()
-
-        with conn.cursor() as cur:
-            # Calculate decay scores and distribution
-            cur.execute("""
-                WITH decay_scores AS (
+        async with get_db_connection() as conn:
+            async with conn.cursor() as cur:
+                # Calculate decay scores and distribution
+                await cur.execute("""
+                    WITH decay_scores AS (
+                        SELECT
+                            episode_id,
+                            nexus_memory.calculate_decay_score(
+                                importance_score,
+                                created_at,
+                                metadata
+                            ) as decay_score,
+                            EXTRACT(EPOCH FROM (NOW() - created_at)) / 86400.0 as age_days
+                        FROM nexus_memory.zep_episodic_memory
+                        WHERE EXTRACT(EPOCH FROM (NOW() - created_at)) / 86400.0 >= %s
+                        LIMIT %s
+                    )
                     SELECT
-                        episode_id,
-                        nexus_memory.calculate_decay_score(
-                            importance_score,
-                            created_at,
-                            metadata
-                        ) as decay_score,
-                        EXTRACT(EPOCH FROM (NOW() - created_at)) / 86400.0 as age_days
-                    FROM nexus_memory.zep_episodic_memory
-                    WHERE EXTRACT(EPOCH FROM (NOW() - created_at)) / 86400.0 >= %s
-                    LIMIT %s
-                )
-                SELECT
-                    CASE
+                        CASE
+                            WHEN decay_score >= 0.8 THEN 'Very High (0.8-1.0)'
+                            WHEN decay_score >= 0.6 THEN 'High (0.6-0.8)'
+                            WHEN decay_score >= 0.4 THEN 'Medium (0.4-0.6)'
+                            WHEN decay_score >= 0.2 THEN 'Low (0.2-0.4)'
+                            ELSE 'Very Low (0.0-0.2)'
+                        END as score_category,
+                        COUNT(*) as episode_count,
+                        ROUND(AVG(decay_score)::NUMERIC, 3) as avg_score
+                    FROM decay_scores
+                    GROUP BY CASE
                         WHEN decay_score >= 0.8 THEN 'Very High (0.8-1.0)'
                         WHEN decay_score >= 0.6 THEN 'High (0.6-0.8)'
                         WHEN decay_score >= 0.4 THEN 'Medium (0.4-0.6)'
                         WHEN decay_score >= 0.2 THEN 'Low (0.2-0.4)'
                         ELSE 'Very Low (0.0-0.2)'
-                    END as score_category,
-                    COUNT(*) as episode_count,
-                    ROUND(AVG(decay_score)::NUMERIC, 3) as avg_score
-                FROM decay_scores
-                GROUP BY CASE
-                    WHEN decay_score >= 0.8 THEN 'Very High (0.8-1.0)'
-                    WHEN decay_score >= 0.6 THEN 'High (0.6-0.8)'
-                    WHEN decay_score >= 0.4 THEN 'Medium (0.4-0.6)'
-                    WHEN decay_score >= 0.2 THEN 'Low (0.2-0.4)'
-                    ELSE 'Very Low (0.0-0.2)'
-                END
-                ORDER BY MIN(decay_score) DESC
-            """, (request.min_age_days, request.limit))
-
-            distribution_rows = cur.fetchall()
-
-            # Count low/high value episodes
-            cur.execute("""
-                WITH decay_scores AS (
-                    SELECT
-                        nexus_memory.calculate_decay_score(
-                            importance_score,
-                            created_at,
-                            metadata
-                        ) as decay_score
-                    FROM nexus_memory.zep_episodic_memory
-                    WHERE EXTRACT(EPOCH FROM (NOW() - created_at)) / 86400.0 >= %s
-                    LIMIT %s
-                )
-                SELECT
-                    SUM(CASE WHEN decay_score < 0.2 THEN 1 ELSE 0 END) as low_value_count,
-                    SUM(CASE WHEN decay_score > 0.7 THEN 1 ELSE 0 END) as high_value_count,
-                    COUNT(*) as total_count
-                FROM decay_scores
-            """, (request.min_age_days, request.limit))
+                    END
+                    ORDER BY MIN(decay_score) DESC
+                """, (request.min_age_days, request.limit))
+
+                distribution_rows = await cur.fetchall()
 
-            counts = cur.fetchone()
+                # Count low/high value episodes
+                await cur.execute("""
+                    WITH decay_scores AS (
+                        SELECT
+                            nexus_memory.calculate_decay_score(
+                                importance_score,
+                                created_at,
+                                metadata
+                            ) as decay_score
+                        FROM nexus_memory.zep_episodic_memory
+                        WHERE EXTRACT(EPOCH FROM (NOW() - created_at)) / 86400.0 >= %s
+                        LIMIT %s
+                    )
+                    SELECT
+                        SUM(CASE WHEN decay_score < 0.2 THEN 1 ELSE 0 END) as low_value_count,
+                        SUM(CASE WHEN decay_score > 0.7 THEN 1 ELSE 0 END) as high_value_count,
+                        COUNT(*) as total_count
+                    FROM decay_scores
+                """, (request.min_age_days, request.limit))
 
-        conn.close()
+                counts = await cur.fetchone()
 
         # Build distribution
         distribution = []
@@ -1403,60 +1865,57 @@ async def preview_pruning(request: PruningPreviewRequest):
     Returns list of pruning candidates for review
     """
     try:
-        conn = get_db_connection()
-
-        protected_tags = ['milestone', 'critical', 'protected', 'consciousness']
+        async with get_db_connection() as conn:
+            protected_tags = ['milestone', 'critical', 'protected', 'consciousness']
 
-        with conn.cursor() as cur:
-            # Find pruning candidates
-            cur.execute("""
-                WITH decay_scores AS (
+            async with conn.cursor() as cur:
+                # Find pruning candidates
+                await cur.execute("""
+                    WITH decay_scores AS (
+                        SELECT
+                            episode_id,
+                            content,
+                            importance_score,
+                            tags,
+                            created_at,
+                            metadata,
+                            nexus_memory.calculate_decay_score(
+                                importance_score,
+                                created_at,
+                                metadata
+                            ) as decay_score,
+                            EXTRACT(EPOCH FROM (NOW() - created_at)) / 86400.0 as age_days,
+                            CASE
+                                WHEN metadata->'access_tracking'->>'last_accessed' IS NOT NULL THEN
+                                    EXTRACT(EPOCH FROM (NOW() - (metadata->'access_tracking'->>'last_accessed')::TIMESTAMPTZ)) / 86400.0
+                                ELSE
+                                    999999  -- Never accessed
+                            END as last_accessed_days
+                        FROM nexus_memory.zep_episodic_memory
+                    )
                     SELECT
                         episode_id,
-                        content,
+                        LEFT(content, 100) as content_preview,
+                        decay_score,
                         importance_score,
+                        age_days,
                         tags,
-                        created_at,
-                        metadata,
-                        nexus_memory.calculate_decay_score(
-                            importance_score,
-                            created_at,
-                            metadata
-                        ) as decay_score,
-                        EXTRACT(EPOCH FROM (NOW() - created_at)) / 86400.0 as age_days,
                         CASE
-                            WHEN metadata->'access_tracking'->>'last_accessed' IS NOT NULL THEN
-                                EXTRACT(EPOCH FROM (NOW() - (metadata->'access_tracking'->>'last_accessed')::TIMESTAMPTZ)) / 86400.0
-                            ELSE
-                                999999  -- Never accessed
-                        END as last_accessed_days
-                    FROM nexus_memory.zep_episodic_memory
-                )
-                SELECT
-                    episode_id,
-                    LEFT(content, 100) as content_preview,
-                    decay_score,
-                    importance_score,
-                    age_days,
-                    tags,
-                    CASE
-                        WHEN importance_score > 0.8 THEN 1
-                        WHEN tags && %s THEN 1
-                        WHEN age_days < %s THEN 1
-                        WHEN last_accessed_days < 7 THEN 1
-                        ELSE 0
-                    END as is_protected
-                FROM decay_scores
-                WHERE decay_score < %s
-                    AND age_days >= %s
-                ORDER BY decay_score ASC
-                LIMIT %s
-            """, (protected_tags, request.min_age_days, request.min_score_threshold,
-                  request.min_age_days, request.max_prune_count))
-
-            candidates_rows = cur.fetchall()
-
-        conn.close()
+                            WHEN importance_score > 0.8 THEN 1
+                            WHEN tags && %s THEN 1
+                            WHEN age_days < %s THEN 1
+                            WHEN last_accessed_days < 7 THEN 1
+                            ELSE 0
+                        END as is_protected
+                    FROM decay_scores
+                    WHERE decay_score < %s
+                        AND age_days >= %s
+                    ORDER BY decay_score ASC
+                    LIMIT %s
+                """, (protected_tags, request.min_age_days, request.min_score_threshold,
+                      request.min_age_days, request.max_prune_count))
+
+                candidates_rows = await cur.fetchall()
 
         # Build candidate list
         candidates = []
@@ -1514,45 +1973,42 @@ async def execute_pruning(request: PruningExecuteRequest):
     try:
         if request.dry_run:
             # Dry run mode: just count what would be pruned
-            conn = get_db_connection()
-
-            protected_tags = ['milestone', 'critical', 'protected', 'consciousness']
-
-            with conn.cursor() as cur:
-                cur.execute("""
-                    WITH decay_scores AS (
-                        SELECT
-                            episode_id,
-                            nexus_memory.calculate_decay_score(
+            async with get_db_connection() as conn:
+                protected_tags = ['milestone', 'critical', 'protected', 'consciousness']
+
+                async with conn.cursor() as cur:
+                    await cur.execute("""
+                        WITH decay_scores AS (
+                            SELECT
+                                episode_id,
+                                nexus_memory.calculate_decay_score(
+                                    importance_score,
+                                    created_at,
+                                    metadata
+                                ) as decay_score,
                                 importance_score,
-                                created_at,
-                                metadata
-                            ) as decay_score,
-                            importance_score,
-                            EXTRACT(EPOCH FROM (NOW() - created_at)) / 86400.0 as age_days,
-                            tags,
-                            CASE
-                                WHEN metadata->'access_tracking'->>'last_accessed' IS NOT NULL THEN
-                                    EXTRACT(EPOCH FROM (NOW() - (metadata->'access_tracking'->>'last_accessed')::TIMESTAMPTZ)) / 86400.0
-                                ELSE
-                                    999999
-                            END as last_accessed_days
-                        FROM nexus_memory.zep_episodic_memory
-                    )
-                    SELECT COUNT(*)
-                    FROM decay_scores
-                    WHERE decay_score < %s
-                        AND age_days >= %s
-                        AND importance_score <= 0.8
-                        AND NOT (tags && %s)
-                        AND last_accessed_days >= 7
-                    LIMIT %s
-                """, (request.min_score_threshold, request.min_age_days,
-                      protected_tags, request.max_prune_count))
-
-                would_prune_count = cur.fetchone()[0]
-
-            conn.close()
+                                EXTRACT(EPOCH FROM (NOW() - created_at)) / 86400.0 as age_days,
+                                tags,
+                                CASE
+                                    WHEN metadata->'access_tracking'->>'last_accessed' IS NOT NULL THEN
+                                        EXTRACT(EPOCH FROM (NOW() - (metadata->'access_tracking'->>'last_accessed')::TIMESTAMPTZ)) / 86400.0
+                                    ELSE
+                                        999999
+                                END as last_accessed_days
+                            FROM nexus_memory.zep_episodic_memory
+                        )
+                        SELECT COUNT(*)
+                        FROM decay_scores
+                        WHERE decay_score < %s
+                            AND age_days >= %s
+                            AND importance_score <= 0.8
+                            AND NOT (tags && %s)
+                            AND last_accessed_days >= 7
+                        LIMIT %s
+                    """, (request.min_score_threshold, request.min_age_days,
+                          protected_tags, request.max_prune_count))
+
+                    would_prune_count = (await cur.fetchone())[0]
 
             return PruningExecuteResponse(
                 success=True,
@@ -1579,6 +2035,9 @@ async def execute_pruning(request: PruningExecuteRequest):
 @app.get("/metrics", tags=["Monitoring"])
 async def metrics():
     """Prometheus metrics endpoint"""
+    update_pool_metrics(get_db_pool())
+    if query_embedding_cache is not None:
+        query_embedding_cache.update_metrics()
     return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
 
 # ============================================
@@ -1595,8 +2054,8 @@ async def query_facts(request: FactQueryRequest):
     start_time = time.time()
 
     try:
-        with get_db_connection() as conn:
-            with conn.cursor() as cur:
+        async with get_db_connection() as conn:
+            async with conn.cursor() as cur:
                 # Build query
                 query_parts = ["SELECT episode_id, content, metadata, created_at, tags FROM nexus_memory.zep_episodic_memory"]
                 where_clauses = []
@@ -1632,8 +2091,8 @@ async def query_facts(request: FactQueryRequest):
 
                 query = " ".join(query_parts)
 
-                cur.execute(query, params)
-                rows = cur.fetchall()
+                await cur.execute(query, params)
+                rows = await cur.fetchall()
 
                 if not rows:
                     raise HTTPException(
@@ -1735,11 +2194,12 @@ async def hybrid_query(request: HybridQueryRequest):
 
     # Strategy 2: Semantic search (narrative)
     try:
+        # Generate embedding (micro-batched with concurrent queries)
+        embedding = await generate_query_embedding(request.query)
+
         # Use existing /memory/search endpoint logic
-        with get_db_connection() as conn:
-            with conn.cursor() as cur:
-                # Generate embedding
-                embedding = model.encode(request.query).tolist()
+        async with get_db_connection() as conn:
+            async with conn.cursor() as cur:
 
                 # Build query
                 query_parts = [
@@ -1758,13 +2218,15 @@ async def hybrid_query(request: HybridQueryRequest):
                 if where_clauses:
                     query_parts.append("WHERE " + " AND ".join(where_clauses))
 
-                query_parts.append("ORDER BY similarity DESC")
+                # Order by raw distance so the HNSW index can serve the scan
+                query_parts.append("ORDER BY embedding <=> %s::vector")
+                params.append(embedding)
                 query_parts.append(f"LIMIT {request.limit}")
 
                 query = " ".join(query_parts)
 
-                cur.execute(query, params)
-                rows = cur.fetchall()
+                await cur.execute(query, params)
+                rows = await cur.fetchall()
 
                 if not rows:
                     raise HTTPException(
@@ -1789,6 +2251,8 @@ async def hybrid_query(request: HybridQueryRequest):
                     query_time_ms=query_time_ms
                 )
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -1800,12 +2264,23 @@ async def hybrid_query(request: HybridQueryRequest):
 # LAB_003: Sleep Consolidation
 # ==============================================================================
 
-@app.post("/memory/consolidate", tags=["LAB_003"])
+def get_consolidation_scheduler():
+    """LAB_003 scheduler, or 503 when it is not running (no database / disabled)"""
+    scheduler = getattr(app.state, "consolidation_scheduler", None)
+    if scheduler is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Consolidation scheduler not available"
+        )
+    return scheduler
+
+
+@app.post("/memory/consolidate", tags=["LAB_003"], status_code=status.HTTP_202_ACCEPTED)
 async def consolidate_memories(
     date_str: Optional[str] = None
 ):
     """
-    Manually trigger sleep consolidation for a specific date
+    Queue sleep consolidation as a background job
 
     LAB_003: Mimics biological sleep consolidation
     - Detects breakthrough episodes
@@ -1813,44 +2288,33 @@ async def consolidate_memories(
     - Calculates consolidated salience scores
     - Creates memory traces
 
+    Days run in the consolidation process pool and are checkpointed; poll
+    GET /memory/consolidate/jobs/{job_id} for progress and per-day reports.
+
     Args:
-        date_str: Date to consolidate (YYYY-MM-DD format). Defaults to yesterday.
+        date_str: Date to (re)consolidate (YYYY-MM-DD format). Defaults to
+            every day before today whose episodes changed since it was last
+            consolidated, oldest first.
 
     Returns:
-        Consolidation report with statistics
+        Job ID and initial status
     """
+    scheduler = get_consolidation_scheduler()
     try:
-        # Lazy import (avoid psycopg2 dependency at startup)
-        from consolidation_engine import ConsolidationEngine
-
-        # Parse date
-        if date_str:
-            target_date = datetime.strptime(date_str, "%Y-%m-%d")
-        else:
-            target_date = datetime.now() - timedelta(days=1)
-
-        # Execute consolidation
-        with ConsolidationEngine(
-            db_host=POSTGRES_HOST,
-            db_port=POSTGRES_PORT,
-            db_name=POSTGRES_DB,
-            db_user=POSTGRES_USER,
-            db_password=POSTGRES_PASSWORD
-        ) as engine:
-            report = engine.consolidate_daily_memories(target_date)
+        dates = [datetime.strptime(date_str, "%Y-%m-%d").date()] if date_str else None
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid date_str: {date_str} (expected YYYY-MM-DD)"
+        )
 
+    try:
+        job = scheduler.submit(dates)
         return {
             "success": True,
-            "date": report.date.isoformat(),
-            "episodes_processed": report.episodes_processed,
-            "breakthrough_count": report.breakthrough_count,
-            "chain_count": report.chain_count,
-            "episodes_boosted": report.episodes_boosted,
-            "trace_count": report.trace_count,
-            "avg_boost": round(report.avg_boost, 3),
-            "max_boost": round(report.max_boost, 3),
-            "processing_time_seconds": round(report.processing_time_seconds, 2),
-            "top_breakthroughs": report.top_breakthroughs
+            "job_id": job.job_id,
+            "status": job.status,
+            "status_url": f"/memory/consolidate/jobs/{job.job_id}"
         }
 
     except Exception as e:
@@ -1860,6 +2324,35 @@ async def consolidate_memories(
         )
 
 
+@app.get("/memory/consolidate/jobs/{job_id}", tags=["LAB_003"])
+async def get_consolidation_job(job_id: str):
+    """
+    Progress of a consolidation job
+
+    Returns:
+        Status, days done / total, the day in progress and one report per
+        consolidated day
+    """
+    job = get_consolidation_scheduler().get_job(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Consolidation job {job_id} not found"
+        )
+    return {"success": True, **job.to_dict()}
+
+
+@app.get("/memory/consolidate/jobs", tags=["LAB_003"])
+async def list_consolidation_jobs():
+    """Scheduler statistics and the jobs kept for polling (newest first)"""
+    scheduler = get_consolidation_scheduler()
+    return {
+        "success": True,
+        **scheduler.get_stats(),
+        "jobs": [job.to_dict() for job in reversed(scheduler.jobs.values())]
+    }
+
+
 # ==============================================================================
 # LAB_005: Spreading Activation & Contextual Priming
 # ==============================================================================
@@ -1871,16 +2364,199 @@ def get_spreading_engine():
     """Lazy initialization of spreading activation engine"""
     global spreading_engine
     if spreading_engine is None:
+        from spreading_activation import SpreadingActivationEngine
+
         spreading_engine = SpreadingActivationEngine(
             similarity_threshold=0.7,
             decay_half_life=30.0,
-            cache_size=50,
+            cache_size=LAB005_PRIMING_CACHE_SIZE,
             top_k_related=5,
-            max_hops=2
+            max_hops=2,
+            max_frontier=LAB005_MAX_FRONTIER or None,
+            cache_bytes=int(LAB005_PRIMING_CACHE_MB * 1024 * 1024),
+            cache_shards=LAB005_PRIMING_CACHE_SHARDS
         )
     return spreading_engine
 
 
+def get_priming_cache():
+    """LAB_005 priming cache, or None before the engine exists (never creates it)"""
+    return spreading_engine.priming_cache if spreading_engine is not None else None
+
+
+def get_shared_episode_cache():
+    """Redis tier shared by the replicas, or None (no Redis / disabled)"""
+    return getattr(app.state, "shared_episode_cache", None)
+
+
+def invalidate_priming_cache(episode_ids: List[str]):
+    """Invalidation handler: drop episodes from this process's priming cache"""
+    priming_cache = get_priming_cache()
+    if priming_cache is not None:
+        priming_cache.invalidate(episode_ids)
+
+
+def invalidate_episode_caches(episode_ids: List[str]):
+    """Episodes changed or were removed: drop them on every replica and in Redis"""
+    shared_cache = get_shared_episode_cache()
+    if shared_cache is not None:
+        shared_cache.invalidate(episode_ids)
+    else:
+        invalidate_priming_cache(episode_ids)
+        if preloading_engine is not None:
+            preloading_engine.invalidate(episode_ids)
+
+
+def episode_caches_in_use() -> bool:
+    """True when the priming or preload cache holds payloads (ids-first queries pay off)"""
+    priming_cache = get_priming_cache()
+    if priming_cache is not None and len(priming_cache) > 0:
+        return True
+    return preloading_engine is not None and len(preloading_engine.preload_scheduler.cache) > 0
+
+
+EPISODE_PAYLOADS_SQL = """
+    SELECT
+        episode_id,
+        content,
+        importance_score,
+        tags,
+        created_at,
+        embedding IS NOT NULL as has_embedding
+    FROM nexus_memory.zep_episodic_memory
+    WHERE episode_id = ANY(%s::uuid[])
+"""
+
+
+async def fetch_episode_payloads(cur, episode_ids: List[str]) -> Dict[str, Dict]:
+    """Payload columns for `episode_ids` in one query (deleted ids are absent)"""
+    await cur.execute(EPISODE_PAYLOADS_SQL, (list(episode_ids),))
+    return {
+        str(row[0]): {
+            "content": row[1],
+            "importance_score": row[2],
+            "tags": row[3] or [],
+            "created_at": row[4],
+            "has_embedding": row[5]
+        }
+        for row in await cur.fetchall()
+    }
+
+
+async def resolve_episode_payloads(cur, episode_ids: List[str], endpoint: str) -> Dict[str, Dict]:
+    """
+    Payloads for `episode_ids`: priming cache, LAB_007 preload cache, shared
+    Redis priming tier, then one query for the rest
+
+    Args:
+        cur: Open cursor (misses are fetched on the caller's connection)
+        episode_ids: Episode UUIDs as strings
+        endpoint: Metrics label
+
+    Returns:
+        episode_id -> payload dict (see fetch_episode_payloads)
+    """
+    payloads = {}
+    priming_cache = get_priming_cache()
+    if priming_cache is not None:
+        for episode_id, primed in priming_cache.get_many(episode_ids).items():
+            payloads[episode_id] = {
+                "content": primed.content,
+                "importance_score": primed.importance_score,
+                "tags": primed.tags,
+                "created_at": primed.created_at,
+                "has_embedding": primed.has_embedding
+            }
+        lab005_priming_cache_lookups_total.labels(endpoint=endpoint, result='hit').inc(len(payloads))
+        lab005_priming_cache_lookups_total.labels(endpoint=endpoint, result='miss').inc(len(episode_ids) - len(payloads))
+        episode_cache_requests_total.labels(cache='priming', tier='memory', result='hit').inc(len(payloads))
+        episode_cache_requests_total.labels(cache='priming', tier='memory', result='miss').inc(len(episode_ids) - len(payloads))
+
+    # LAB_007: prefetched because they were predicted to be read next
+    missing = [e for e in episode_ids if e not in payloads]
+    preloaded, preload_lookups = {}, len(missing)
+    if missing and preloading_engine is not None:
+        preloaded = preloading_engine.get_many(missing)
+        payloads.update(preloaded)
+        episode_cache_requests_total.labels(cache='preload', tier='memory', result='hit').inc(len(preloaded))
+        episode_cache_requests_total.labels(cache='preload', tier='memory', result='miss').inc(len(missing) - len(preloaded))
+        missing = [e for e in missing if e not in payloads]
+
+    # Primed by another replica: serve and keep locally while its activation lasts
+    shared_cache = get_shared_episode_cache()
+    if missing and priming_cache is not None and shared_cache is not None:
+        for episode_id, (payload, activation, primed_at, source_uuid) in shared_cache.get_many("priming", missing).items():
+            payloads[episode_id] = payload
+            spreading_engine.prime_payloads([(episode_id, activation, source_uuid)], {episode_id: payload}, primed_at)
+        missing = [e for e in missing if e not in payloads]
+
+    if preloading_engine is not None and preload_lookups:
+        # A request the preload hits spared its payload query saves one query latency
+        preloading_engine.record_lookup(endpoint, len(preloaded), preload_lookups - len(preloaded),
+                                        avoided_query=bool(preloaded) and not missing)
+
+    if missing:
+        start = time.perf_counter()
+        payloads.update(await fetch_episode_payloads(cur, missing))
+        if preloading_engine is not None:
+            preloading_engine.observe_fetch(time.perf_counter() - start)
+    return payloads
+
+
+async def cached_episode_rows(cur, episode_ids: List[str], endpoint: str) -> List[tuple]:
+    """
+    (episode_id, content, importance_score, tags, created_at, has_embedding)
+    rows for `episode_ids`, in that order, payloads via resolve_episode_payloads
+    """
+    payloads = await resolve_episode_payloads(cur, episode_ids, endpoint)
+    rows = []
+    for episode_id in episode_ids:
+        payload = payloads.get(episode_id)
+        if payload is not None:  # Deleted between the two queries
+            rows.append((
+                episode_id, payload["content"], payload["importance_score"],
+                payload["tags"], payload["created_at"], payload["has_embedding"]
+            ))
+    return rows
+
+
+async def prime_activated_payloads(engine, result: Dict) -> int:
+    """
+    Fill the priming cache for one priming event
+
+    The payloads of all activated episodes not already cached are read from
+    the shared Redis tier (one MGET), the rest in a single query; fetched
+    payloads are published to Redis with a TTL tied to their activation.
+    Returns the number of episodes cached.
+    """
+    missing = result["missing_payloads"]
+    if not missing:
+        return 0
+
+    payloads = {}
+    shared_cache = get_shared_episode_cache()
+    if shared_cache is not None:
+        payloads = {e: entry[0] for e, entry in shared_cache.get_many("priming", missing).items()}
+        missing = [e for e in missing if e not in payloads]
+
+    if missing:
+        start = time.perf_counter()
+        async with get_db_connection() as conn:
+            async with conn.cursor() as cur:
+                fetched = await fetch_episode_payloads(cur, missing)
+        lab005_priming_payload_fetch_seconds.observe(time.perf_counter() - start)
+        payloads.update(fetched)
+
+        if shared_cache is not None and fetched:
+            now = time.time()
+            shared_cache.put_many("priming", [
+                (episode_id, fetched[episode_id], activation, now, source_uuid, engine.priming_cache.ttl(activation))
+                for episode_id, activation, source_uuid in result["activated"] if episode_id in fetched
+            ])
+
+    return engine.prime_payloads(result["activated"], payloads)
+
+
 @app.post("/memory/prime/{episode_uuid}", tags=["LAB_005"])
 async def prime_episode(episode_uuid: str):
     """
@@ -1902,16 +2578,16 @@ async def prime_episode(episode_uuid: str):
         engine = get_spreading_engine()
 
         # Fetch episode from database
-        with psycopg.connect(DB_CONN_STRING) as conn:
-            with conn.cursor() as cur:
-                cur.execute("""
-                    SELECT uuid, content, embedding
-                    FROM zep_episodic_memory
-                    WHERE uuid = %s
+        async with get_db_connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute("""
+                    SELECT episode_id, content, embedding
+                    FROM nexus_memory.zep_episodic_memory
+                    WHERE episode_id = %s
                     LIMIT 1
                 """, (episode_uuid,))
 
-                row = cur.fetchone()
+                row = await cur.fetchone()
                 if not row:
                     raise HTTPException(
                         status_code=status.HTTP_404_NOT_FOUND,
@@ -1919,25 +2595,108 @@ async def prime_episode(episode_uuid: str):
                     )
 
                 uuid, content, embedding = row
+                uuid = str(uuid)
+
+        # Episodes still waiting on the worker are embedded here
+        # (micro-batched with concurrent search/hybrid queries)
+        import numpy as np
+        if embedding is None:
+            embedding = await generate_query_embedding(content, use_cache=False)
+        elif isinstance(embedding, str):
+            embedding = json_module.loads(embedding)  # pgvector text form '[...]'
+        embedding_array = np.array(embedding, dtype=np.float32)
+
+        # Ensure episode is in similarity graph (not yet loaded/synced by the warm start)
+        # Engine calls run in a thread: they wait on the engine lock while the loader inserts
+        if uuid not in engine.similarity_graph.embeddings:
+            await asyncio.to_thread(engine.add_episode, uuid, content, embedding_array)
+
+        # Access episode (triggers spreading activation)
+        result = await asyncio.to_thread(engine.access_episode, uuid, content, embedding_array)
+        cached_count = await prime_activated_payloads(engine, result)
+        feed_preloader(uuid)
+
+        return {
+            "success": True,
+            "episode_uuid": uuid,
+            "primed_episodes": result["primed_episodes"],
+            "activation_count": result["activation_count"],
+            "payloads_fetched": cached_count,
+            "processing_time_ms": result["processing_time_ms"],
+            "cache_stats": engine.priming_cache.get_stats()
+        }
 
-                # Ensure episode is in similarity graph
-                if uuid not in engine.similarity_graph.embeddings:
-                    import numpy as np
-                    embedding_array = np.array(embedding) if embedding else None
-                    if embedding_array is not None:
-                        engine.add_episode(uuid, content, embedding_array)
-
-                # Access episode (triggers spreading activation)
-                result = engine.access_episode(uuid, content, embedding_array or np.zeros(384))
-
-                return {
-                    "success": True,
-                    "episode_uuid": uuid,
-                    "primed_episodes": result["primed_episodes"],
-                    "activation_count": result["activation_count"],
-                    "processing_time_ms": result["processing_time_ms"],
-                    "cache_stats": engine.priming_cache.get_stats()
-                }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Priming failed: {str(e)}"
+        )
+
+
+@app.post("/memory/prime", tags=["LAB_005"])
+async def prime_context(request: PrimeContextRequest):
+    """
+    Activate a whole session context and spread activation from all of it
+
+    LAB_005: one multi-source propagation instead of one /memory/prime/{uuid}
+    call per episode. Episodes missing from the similarity graph are fetched
+    in one query.
+
+    Returns:
+        Priming report with statistics (unknown ids listed in "not_found")
+    """
+    try:
+        engine = get_spreading_engine()
+        episode_ids = list(dict.fromkeys(request.episode_ids))
+
+        missing = [e for e in episode_ids if e not in engine.similarity_graph]
+        fetched = {}
+        if missing:
+            async with get_db_connection() as conn:
+                async with conn.cursor() as cur:
+                    await cur.execute("""
+                        SELECT episode_id, content, embedding
+                        FROM nexus_memory.zep_episodic_memory
+                        WHERE episode_id = ANY(%s::uuid[])
+                    """, (missing,))
+                    for episode_id, content, embedding in await cur.fetchall():
+                        fetched[str(episode_id)] = (content, embedding)
+
+        import numpy as np
+        new_ids, new_vectors = [], []
+        for episode_id, (content, embedding) in fetched.items():
+            if embedding is None:
+                embedding = await generate_query_embedding(content, use_cache=False)
+            elif isinstance(embedding, str):
+                embedding = json_module.loads(embedding)  # pgvector text form '[...]'
+            new_ids.append(episode_id)
+            new_vectors.append(np.asarray(embedding, dtype=np.float32))
+        if new_ids:
+            await asyncio.to_thread(engine.add_episodes, new_ids, np.stack(new_vectors))
+
+        found = [e for e in episode_ids if e in engine.similarity_graph]
+        if not found:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="None of the episodes were found"
+            )
+
+        result = await asyncio.to_thread(engine.access_episodes, found)
+        cached_count = await prime_activated_payloads(engine, result)
+        # A session context is a set of episodes, not an access sequence: not fed to LAB_007
+
+        return {
+            "success": True,
+            "episode_uuids": found,
+            "not_found": [e for e in episode_ids if e not in engine.similarity_graph],
+            "primed_episodes": result["primed_episodes"],
+            "activation_count": result["activation_count"],
+            "payloads_fetched": cached_count,
+            "processing_time_ms": result["processing_time_ms"],
+            "cache_stats": engine.priming_cache.get_stats()
+        }
 
     except HTTPException:
         raise
@@ -1958,10 +2717,16 @@ async def get_priming_stats():
     try:
         engine = get_spreading_engine()
         stats = engine.get_statistics()
+        graph_loader = getattr(app.state, "graph_loader", None)
+        graph_snapshotter = getattr(app.state, "graph_snapshotter", None)
+        shared_cache = get_shared_episode_cache()
 
         return {
             "success": True,
             "statistics": stats,
+            "shared_cache": shared_cache.get_stats() if shared_cache else None,
+            "graph_loader": graph_loader.get_stats() if graph_loader else None,
+            "last_snapshot": graph_snapshotter.last_snapshot if graph_snapshotter else None,
             "engine_status": "active" if engine else "inactive"
         }
 
@@ -1982,6 +2747,17 @@ async def get_primed_episode(episode_uuid: str):
     try:
         engine = get_spreading_engine()
         primed = engine.try_primed_access(episode_uuid)
+        lab005_priming_cache_lookups_total.labels(endpoint='primed', result='hit' if primed else 'miss').inc()
+        episode_cache_requests_total.labels(cache='priming', tier='memory', result='hit' if primed else 'miss').inc()
+
+        # Primed by another replica
+        shared_cache = get_shared_episode_cache()
+        if not primed and shared_cache is not None:
+            entry = shared_cache.get_many("priming", [episode_uuid]).get(episode_uuid)
+            if entry is not None:
+                payload, activation, primed_at, source_uuid = entry
+                engine.prime_payloads([(episode_uuid, activation, source_uuid)], {episode_uuid: payload}, primed_at)
+                primed = engine.try_primed_access(episode_uuid)
 
         if primed:
             return {
@@ -1989,8 +2765,12 @@ async def get_primed_episode(episode_uuid: str):
                 "cached": True,
                 "episode_uuid": primed.uuid,
                 "content": primed.content,
+                "importance_score": primed.importance_score,
+                "tags": primed.tags,
+                "created_at": primed.created_at,
                 "activation": primed.activation,
                 "primed_at": primed.primed_at,
+                "expires_at": primed.expires_at,
                 "source_uuid": primed.source_uuid
             }
         else:
@@ -2008,6 +2788,68 @@ async def get_primed_episode(episode_uuid: str):
         )
 
 
+# ==============================================================================
+# LAB_007: Predictive Preloading
+# ==============================================================================
+
+# Global predictive preloading engine (created at startup when the pool is open)
+preloading_engine = None
+
+
+def graph_embedding(episode_id: str):
+    """Episode embedding from the LAB_005 similarity graph, for LAB_007 context scoring"""
+    if spreading_engine is None:
+        return None
+    return spreading_engine.similarity_graph.embeddings[episode_id]
+
+
+async def fetch_preload_payloads(episode_ids: List[str]) -> Dict[str, Dict]:
+    """LAB_007 prefetch: payloads of one batch of predicted episodes in one query"""
+    start = time.perf_counter()
+    async with get_db_connection() as conn:
+        async with conn.cursor() as cur:
+            payloads = await fetch_episode_payloads(cur, episode_ids)
+    if preloading_engine is not None:
+        preloading_engine.observe_fetch(time.perf_counter() - start)
+    return payloads
+
+
+def feed_preloader(accessed=None, returned=()):
+    """
+    LAB_007: learn from an episode access and queue prefetch of the
+    predicted next ones; never waits on the prefetch
+
+    Args:
+        accessed: Episode the request read (one step of the access
+            sequence), or None for queries that only return results
+        returned: (episode_id, tags) pairs the request returned; the first
+            LAB007_FEED_PER_REQUEST only add context (their rank order is
+            not an access sequence)
+    """
+    if preloading_engine is None:
+        return
+    try:
+        preloading_engine.observe_results(
+            (str(episode_id), tags) for episode_id, tags in itertools.islice(returned, LAB007_FEED_PER_REQUEST))
+        if accessed is not None:
+            preloading_engine.on_episode_access(str(accessed))
+    except Exception as e:
+        print(f"LAB_007 access feed failed: {e}")
+
+
+@app.get("/memory/preload/stats", tags=["LAB_007"])
+async def get_preload_stats():
+    """
+    Get predictive preloading statistics
+
+    Returns learned patterns, prefetch queue / cache state, and per-endpoint
+    hit rate and estimated latency saved
+    """
+    if preloading_engine is None:
+        return {"success": True, "enabled": False}
+    return {"success": True, "enabled": True, **preloading_engine.get_stats()}
+
+
 # ============================================
 # A/B Testing Endpoints
 # ============================================
@@ -2022,6 +2864,8 @@ async def record_ab_test_metric(request: ABTestMetricRequest):
     - "treatment": With LAB_005 spreading activation
     """
     try:
+        from ab_testing import get_ab_test_manager, TestVariant
+
         ab_manager = get_ab_test_manager(DB_CONN_STRING)
 
         # Validate variant
@@ -2067,6 +2911,8 @@ async def compare_ab_test_variants(hours_back: int = 24):
     - Statistical significance
     """
     try:
+        from ab_testing import get_ab_test_manager
+
         ab_manager = get_ab_test_manager(DB_CONN_STRING)
         comparison = ab_manager.compare_variants(hours_back=hours_back)
 
@@ -2086,6 +2932,8 @@ async def compare_ab_test_variants(hours_back: int = 24):
 async def get_variant_metrics(variant: str, hours_back: int = 24):
     """Get aggregated metrics for a specific variant"""
     try:
+        from ab_testing import get_ab_test_manager, TestVariant
+
         ab_manager = get_ab_test_manager(DB_CONN_STRING)
         test_variant = TestVariant(variant)
 
@@ -2130,6 +2978,8 @@ async def get_variant_metrics(variant: str, hours_back: int = 24):
 async def get_variant_timeseries(variant: str, hours_back: int = 24):
     """Get time-series data for a variant (for visualization)"""
     try:
+        from ab_testing import get_ab_test_manager, TestVariant
+
         ab_manager = get_ab_test_manager(DB_CONN_STRING)
         test_variant = TestVariant(variant)
 
@@ -2158,6 +3008,8 @@ async def get_variant_timeseries(variant: str, hours_back: int = 24):
 async def clear_ab_test_data(variant: Optional[str] = None):
     """Clear A/B test data (for resetting experiments)"""
     try:
+        from ab_testing import get_ab_test_manager, TestVariant
+
         ab_manager = get_ab_test_manager(DB_CONN_STRING)
 
         if variant:
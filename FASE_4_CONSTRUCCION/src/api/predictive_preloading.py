@@ -0,0 +1,972 @@
+"""
+NEXUS Cerebro API - LAB_007 Predictive Preloading
+
+API integration of NEXUS_LABS/LAB_007_Predictive_Preloading: learns which
+episodes follow which (bigram / trigram access sequences), predicts the next
+ones on every access and prefetches their payloads before they are requested.
+
+Differences from the lab module:
+- Successor lookups are indexed by source (the lab scanned every pattern);
+  sources are LRU-bounded and keep a bounded number of successors
+- Only real episode accesses are learned as a sequence; the episodes a
+  response returns (search, temporal queries) only feed the context
+- on_episode_access never waits on I/O: predictions are queued and a
+  fixed number of prefetch workers drain the queue, fetching each batch of
+  episode ids with one query (or from the shared Redis tier)
+- The preload cache is bounded by entries, estimated bytes and age
+  (LAB007_PRELOAD_TTL); entries evicted without being read count as wasted
+- Hits, misses and the database time they saved are recorded per endpoint
+"""
+
+import asyncio
+import math
+import os
+import sys
+import time
+from collections import OrderedDict, defaultdict, deque
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+from prometheus_client import Counter, Gauge, Histogram
+
+# ============================================
+# Configuration
+# ============================================
+LAB007_PRELOAD_CACHE_SIZE = int(os.getenv("LAB007_PRELOAD_CACHE_SIZE", "1000"))
+LAB007_PRELOAD_CACHE_MB = float(os.getenv("LAB007_PRELOAD_CACHE_MB", "16"))
+LAB007_PREFETCH_CONCURRENCY = int(os.getenv("LAB007_PREFETCH_CONCURRENCY", "2"))  # Concurrent prefetch queries
+LAB007_PREFETCH_BATCH_SIZE = int(os.getenv("LAB007_PREFETCH_BATCH_SIZE", "32"))  # Episode ids per query
+LAB007_PREFETCH_QUEUE_SIZE = int(os.getenv("LAB007_PREFETCH_QUEUE_SIZE", "512"))  # Pending ids; more are dropped
+LAB007_PREDICTION_K = int(os.getenv("LAB007_PREDICTION_K", "5"))
+LAB007_MIN_CONFIDENCE = float(os.getenv("LAB007_MIN_CONFIDENCE", "0.5"))
+LAB007_METADATA_SIZE = int(os.getenv("LAB007_METADATA_SIZE", "10000"))  # Episodes whose tags are kept for context
+LAB007_MAX_PATTERN_SOURCES = int(os.getenv("LAB007_MAX_PATTERN_SOURCES", "10000"))  # Per model, LRU
+LAB007_MAX_SUCCESSORS = int(os.getenv("LAB007_MAX_SUCCESSORS", "32"))  # Per source, least recently seen dropped
+LAB007_PRELOAD_TTL = float(os.getenv("LAB007_PRELOAD_TTL", "300"))  # seconds a prefetched payload is served
+
+PATTERN_DECAY_RATE = 0.1  # per day (lab value)
+PATTERN_DECAY_INTERVAL = 3600.0  # seconds between decay_patterns sweeps
+FETCH_LATENCY_SMOOTHING = 0.1  # EWMA weight of the newest payload query
+
+# Per-entry bookkeeping on top of the payload (dataclass, dict slots)
+_ENTRY_OVERHEAD_BYTES = 400
+
+# ============================================
+# Prometheus Metrics
+# ============================================
+lab007_preload_lookups_total = Counter(
+    'nexus_lab007_preload_lookups_total',
+    'Episode payload lookups served by (hit) or missing from (miss) the preload cache',
+    ['endpoint', 'result']
+)
+
+lab007_latency_saved_seconds_total = Counter(
+    'nexus_lab007_latency_saved_seconds_total',
+    'Estimated database time saved by requests answered without a payload query',
+    ['endpoint']
+)
+
+lab007_prefetch_episodes_total = Counter(
+    'nexus_lab007_prefetch_episodes_total',
+    'Predicted episodes prefetched, by source',
+    ['source']
+)
+
+lab007_prefetch_dropped_total = Counter(
+    'nexus_lab007_prefetch_dropped_total',
+    'Predicted episodes not queued because the prefetch queue was full'
+)
+
+lab007_prefetch_seconds = Histogram(
+    'nexus_lab007_prefetch_seconds',
+    'Time to prefetch one batch of predicted episodes',
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5)
+)
+
+lab007_preload_cache_bytes = Gauge(
+    'nexus_lab007_preload_cache_bytes',
+    'Estimated payload bytes held by the preload cache'
+)
+
+lab007_patterns_evicted_total = Counter(
+    'nexus_lab007_patterns_evicted_total',
+    'Learned patterns dropped by the source / successor bounds',
+    ['model']
+)
+
+
+# ============================================================================
+# Data Structures
+# ============================================================================
+
+@dataclass
+class AccessEvent:
+    """Single memory access event"""
+    episode_id: str
+    timestamp: datetime
+    tags: Set[str]
+    embedding: Optional[np.ndarray] = None
+
+
+@dataclass
+class Prediction:
+    """Predicted next episode with confidence"""
+    episode_id: str
+    confidence: float
+    sources: List[str]  # Which algorithms contributed
+
+    def __lt__(self, other):
+        """For heapq (max heap by confidence)"""
+        return self.confidence > other.confidence
+
+
+@dataclass
+class SessionContext:
+    """Current session context for prediction"""
+    recent_episodes: List[str]
+    recent_tags: Set[str]
+    time_of_day: int  # 0-23
+    day_of_week: int  # 0-6
+    mean_embedding: Optional[np.ndarray] = None
+
+
+@dataclass
+class PreloadedEpisode:
+    """Prefetched payload with the confidence it was predicted with"""
+    payload: Dict
+    confidence: float
+    preloaded_at: float
+    nbytes: int
+    hits: int = 0
+
+
+def _pattern_weight(last_seen: datetime, now: datetime) -> float:
+    """Decay weight of a pattern last seen `now - last_seen` ago"""
+    return math.exp(-PATTERN_DECAY_RATE * (now - last_seen).days)
+
+
+# ============================================================================
+# Component 1: TemporalPatternLearner
+# ============================================================================
+
+class TemporalPatternLearner:
+    """
+    Learn temporal sequences from access history.
+    Implements bigram and trigram models with pattern decay.
+
+    Successors are indexed by source so a prediction touches only the
+    patterns of the current episode. Memory is bounded: each model keeps
+    at most max_sources sources (least recently learned dropped with all
+    their patterns) and max_successors successors per source (least
+    recently seen dropped).
+    """
+
+    def __init__(self, history_size: int = 100,
+                 max_sources: int = LAB007_MAX_PATTERN_SOURCES,
+                 max_successors: int = LAB007_MAX_SUCCESSORS):
+        self.access_history: deque = deque(maxlen=history_size)
+        self.max_sources = max(1, max_sources)
+        self.max_successors = max(1, max_successors)
+
+        # Bigram model: (source, target) -> count
+        self.bigram_counts: Dict[Tuple[str, str], int] = {}
+        self.bigram_last_seen: Dict[Tuple[str, str], datetime] = {}
+        self.bigram_successors: "OrderedDict[str, Set[str]]" = OrderedDict()  # LRU by source
+
+        # Trigram model: (prev_prev, prev, current) -> count
+        self.trigram_counts: Dict[Tuple[str, str, str], int] = {}
+        self.trigram_last_seen: Dict[Tuple[str, str, str], datetime] = {}
+        self.trigram_successors: "OrderedDict[Tuple[str, str], Set[str]]" = OrderedDict()
+
+        # Total transitions from each source (for probability calculation)
+        self.source_totals: Dict[str, int] = {}
+        self.trigram_source_totals: Dict[Tuple[str, str], int] = {}
+
+    def learn_from_access(self, episode_id: str, timestamp: datetime):
+        """
+        Update patterns based on new access.
+
+        Args:
+            episode_id: Accessed episode
+            timestamp: When it was accessed
+        """
+        recent = self.access_history
+
+        # Learn bigram: previous → current
+        if len(recent) >= 1:
+            self._learn('bigram', recent[-1], episode_id, timestamp)
+
+        # Learn trigram: (prev_prev, prev) → current
+        if len(recent) >= 2:
+            self._learn('trigram', (recent[-2], recent[-1]), episode_id, timestamp)
+
+        # Add to history
+        self.access_history.append(episode_id)
+
+    def _model(self, model: str):
+        if model == 'bigram':
+            return self.bigram_counts, self.bigram_last_seen, self.bigram_successors, self.source_totals
+        return self.trigram_counts, self.trigram_last_seen, self.trigram_successors, self.trigram_source_totals
+
+    @staticmethod
+    def _key(source, target) -> tuple:
+        return (*source, target) if isinstance(source, tuple) else (source, target)
+
+    def _learn(self, model: str, source, target: str, timestamp: datetime):
+        counts, last_seen, successors, totals = self._model(model)
+        key = self._key(source, target)
+        targets = successors.get(source)
+        if targets is None:
+            targets = successors[source] = set()
+        successors.move_to_end(source)
+
+        if target not in targets and len(targets) >= self.max_successors:
+            stalest = min(targets, key=lambda t: last_seen[self._key(source, t)])
+            self._drop(model, source, stalest)
+            lab007_patterns_evicted_total.labels(model=model).inc()
+            targets = successors.setdefault(source, set())
+
+        counts[key] = counts.get(key, 0) + 1
+        last_seen[key] = timestamp
+        targets.add(target)
+        totals[source] = totals.get(source, 0) + 1
+
+        while len(successors) > self.max_sources:
+            oldest, dropped = successors.popitem(last=False)
+            for stale_target in dropped:
+                stale_key = self._key(oldest, stale_target)
+                del counts[stale_key], last_seen[stale_key]
+            del totals[oldest]
+            lab007_patterns_evicted_total.labels(model=model).inc(len(dropped))
+
+    def _drop(self, model: str, source, target: str):
+        """Remove one pattern from every index of its model"""
+        counts, last_seen, successors, totals = self._model(model)
+        key = self._key(source, target)
+        totals[source] -= counts.pop(key)
+        del last_seen[key]
+        successors[source].discard(target)
+        if not successors[source]:
+            del successors[source]
+            del totals[source]
+
+    def get_bigram_successors(
+        self,
+        source_id: str,
+        min_confidence: float = 0.1
+    ) -> List[Tuple[str, float, float]]:
+        """
+        Get likely next episodes based on bigram patterns.
+
+        Returns:
+            List of (target_id, probability, weight) sorted by probability * weight
+        """
+        total = self.source_totals.get(source_id)
+        if not total:
+            return []
+
+        now = datetime.now()
+        successors = []
+        for target in self.bigram_successors.get(source_id, ()):
+            key = (source_id, target)
+            probability = self.bigram_counts[key] / total
+            if probability >= min_confidence:
+                successors.append((target, probability, _pattern_weight(self.bigram_last_seen[key], now)))
+
+        successors.sort(key=lambda x: x[1] * x[2], reverse=True)
+        return successors
+
+    def get_trigram_successors(
+        self,
+        prev_prev_id: str,
+        prev_id: str,
+        min_confidence: float = 0.1
+    ) -> List[Tuple[str, float, float]]:
+        """
+        Get likely next episodes based on trigram patterns.
+
+        Returns:
+            List of (target_id, probability, weight)
+        """
+        source = (prev_prev_id, prev_id)
+        total = self.trigram_source_totals.get(source)
+        if not total:
+            return []
+
+        now = datetime.now()
+        successors = []
+        for target in self.trigram_successors.get(source, ()):
+            key = (prev_prev_id, prev_id, target)
+            probability = self.trigram_counts[key] / total
+            if probability >= min_confidence:
+                successors.append((target, probability, _pattern_weight(self.trigram_last_seen[key], now)))
+
+        successors.sort(key=lambda x: x[1] * x[2], reverse=True)
+        return successors
+
+    def decay_patterns(self) -> int:
+        """
+        Remove old patterns that have decayed to near zero.
+        Call periodically (the preloading engine does, hourly).
+
+        Returns:
+            Number of patterns removed
+        """
+        threshold_weight = 0.01  # 1% strength
+        now = datetime.now()
+
+        stale = [key for key, last_seen in self.bigram_last_seen.items()
+                 if _pattern_weight(last_seen, now) < threshold_weight]
+        for source, target in stale:
+            self._drop('bigram', source, target)
+
+        stale_trigrams = [key for key, last_seen in self.trigram_last_seen.items()
+                          if _pattern_weight(last_seen, now) < threshold_weight]
+        for pp, p, curr in stale_trigrams:
+            self._drop('trigram', (pp, p), curr)
+
+        return len(stale) + len(stale_trigrams)
+
+
+# ============================================================================
+# Component 2: ContextAnalyzer
+# ============================================================================
+
+class ContextAnalyzer:
+    """
+    Analyze current session context for prediction.
+    Computes similarity between candidates and current context.
+    """
+
+    def __init__(self, metadata_size: int = LAB007_METADATA_SIZE):
+        # Tags of recently accessed episodes (candidate metadata), LRU-bounded
+        self.episode_metadata: "OrderedDict[str, Set[str]]" = OrderedDict()
+        self.metadata_size = metadata_size
+
+    def remember(self, episode_id: str, tags: Set[str]):
+        """Keep an accessed episode's tags for later context scoring"""
+        self.episode_metadata[episode_id] = tags
+        self.episode_metadata.move_to_end(episode_id)
+        while len(self.episode_metadata) > self.metadata_size:
+            self.episode_metadata.popitem(last=False)
+
+    def build_context(
+        self,
+        recent_events: List[AccessEvent]
+    ) -> SessionContext:
+        """
+        Build session context from recent access history.
+
+        Args:
+            recent_events: Recent access events (last 5-10)
+
+        Returns:
+            SessionContext object
+        """
+        now = datetime.now()
+        if not recent_events:
+            return SessionContext(
+                recent_episodes=[],
+                recent_tags=set(),
+                time_of_day=now.hour,
+                day_of_week=now.weekday()
+            )
+
+        recent_tags = set()
+        for event in recent_events:
+            recent_tags.update(event.tags)
+
+        embeddings = [e.embedding for e in recent_events if e.embedding is not None]
+        mean_embedding = np.mean(embeddings, axis=0) if embeddings else None
+
+        return SessionContext(
+            recent_episodes=[e.episode_id for e in recent_events],
+            recent_tags=recent_tags,
+            time_of_day=now.hour,
+            day_of_week=now.weekday(),
+            mean_embedding=mean_embedding
+        )
+
+    def compute_context_similarity(
+        self,
+        candidate_id: str,
+        candidate_tags: Set[str],
+        candidate_embedding: Optional[np.ndarray],
+        context: SessionContext
+    ) -> float:
+        """
+        Score how well candidate fits current context.
+
+        Returns:
+            Similarity score (0.0 - 1.0)
+        """
+        scores = []
+
+        # 1. Tag overlap
+        if context.recent_tags:
+            tag_overlap = len(candidate_tags & context.recent_tags) / len(context.recent_tags)
+            scores.append((0.4, tag_overlap))
+
+        # 2. Semantic similarity (embeddings)
+        if candidate_embedding is not None and context.mean_embedding is not None:
+            norm = np.linalg.norm(candidate_embedding) * np.linalg.norm(context.mean_embedding)
+            if norm > 0:
+                cos_sim = float(np.dot(candidate_embedding, context.mean_embedding) / norm)
+                scores.append((0.6, (cos_sim + 1.0) / 2.0))
+
+        if not scores:
+            return 0.5  # Neutral if no information
+
+        total_weight = sum(w for w, _ in scores)
+        return sum(w * s for w, s in scores) / total_weight
+
+
+# ============================================================================
+# Component 3: PredictionEngine
+# ============================================================================
+
+class PredictionEngine:
+    """
+    Generate predictions by combining pattern learning and context analysis.
+    """
+
+    def __init__(
+        self,
+        pattern_learner: TemporalPatternLearner,
+        context_analyzer: ContextAnalyzer
+    ):
+        self.pattern_learner = pattern_learner
+        self.context_analyzer = context_analyzer
+
+    def predict_next_episodes(
+        self,
+        current_episode_id: str,
+        context: SessionContext,
+        candidate_pool: Dict[str, dict],  # {episode_id: {tags, embedding, ...}}
+        k: int = 5,
+        min_confidence: float = 0.5
+    ) -> List[Prediction]:
+        """
+        Predict top-K most likely next episodes.
+
+        Args:
+            current_episode_id: Currently accessed episode
+            context: Session context
+            candidate_pool: Pool of candidate episodes to consider
+            k: Number of predictions to return
+            min_confidence: Minimum confidence threshold
+
+        Returns:
+            List of Prediction objects, sorted by confidence (desc)
+        """
+        candidate_scores: Dict[str, Dict[str, float]] = defaultdict(lambda: {
+            'pattern': 0.0,
+            'context': 0.0,
+            'recency': 0.0
+        })
+
+        # Source 1: Bigram patterns (60% weight)
+        for target_id, prob, weight in self.pattern_learner.get_bigram_successors(current_episode_id, 0.1):
+            if target_id in candidate_pool:
+                candidate_scores[target_id]['pattern'] += 0.6 * prob * weight
+
+        # Source 2: Trigram patterns (30% weight)
+        if len(context.recent_episodes) >= 2:
+            prev_prev, prev = context.recent_episodes[-2], context.recent_episodes[-1]
+            for target_id, prob, weight in self.pattern_learner.get_trigram_successors(prev_prev, prev, 0.1):
+                if target_id in candidate_pool:
+                    candidate_scores[target_id]['pattern'] += 0.3 * prob * weight
+
+        # Source 3: Context similarity (30% weight)
+        for episode_id, metadata in candidate_pool.items():
+            candidate_scores[episode_id]['context'] = 0.3 * self.context_analyzer.compute_context_similarity(
+                episode_id,
+                metadata.get('tags', set()),
+                metadata.get('embedding'),
+                context
+            )
+
+        # Source 4: Recency boost (10% weight)
+        for episode_id in context.recent_episodes[-3:]:
+            if episode_id in candidate_scores:
+                candidate_scores[episode_id]['recency'] = 0.1
+
+        predictions = [
+            Prediction(
+                episode_id=episode_id,
+                confidence=scores['pattern'] + scores['context'] + scores['recency'],
+                sources=[name for name, value in scores.items() if value > 0]
+            )
+            for episode_id, scores in candidate_scores.items()
+        ]
+        predictions = [p for p in predictions if p.confidence >= min_confidence]
+        predictions.sort(key=lambda p: p.confidence, reverse=True)
+        return predictions[:k]
+
+
+# ============================================================================
+# Component 4: PreloadingScheduler
+# ============================================================================
+
+class PreloadingScheduler:
+    """
+    Prefetch predicted episodes in the background and hold their payloads.
+
+    schedule() only enqueues; max_concurrency worker tasks drain the queue,
+    each fetching up to batch_size ids in one call to fetch_many_fn (after
+    the shared Redis tier, if any). The cache is bounded by entries and
+    estimated bytes and evicts the lowest recency * confidence first;
+    entries older than `ttl` are no longer served (a prediction for one
+    fetches it again).
+
+    Args:
+        fetch_many_fn: async (episode_ids) -> {episode_id: payload}
+        ttl: Seconds a prefetched payload is served
+        shared_cache: Optional SharedEpisodeCache ("preload" namespace)
+    """
+
+    def __init__(
+        self,
+        fetch_many_fn: Callable[[List[str]], Awaitable[Dict[str, Dict]]],
+        max_cache_size: int = LAB007_PRELOAD_CACHE_SIZE,
+        max_bytes: int = int(LAB007_PRELOAD_CACHE_MB * 1024 * 1024),
+        max_concurrency: int = LAB007_PREFETCH_CONCURRENCY,
+        batch_size: int = LAB007_PREFETCH_BATCH_SIZE,
+        queue_size: int = LAB007_PREFETCH_QUEUE_SIZE,
+        ttl: float = LAB007_PRELOAD_TTL,
+        shared_cache=None
+    ):
+        self.fetch_many_fn = fetch_many_fn
+        self.max_cache_size = max_cache_size
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.max_concurrency = max(1, max_concurrency)
+        self.batch_size = max(1, batch_size)
+        self.shared_cache = shared_cache
+
+        self.cache: "OrderedDict[str, PreloadedEpisode]" = OrderedDict()
+        self.cache_bytes = 0
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self._pending: Dict[str, float] = {}  # Queued or in flight -> confidence
+        self._workers: List[asyncio.Task] = []
+
+        self.metrics = {
+            'preload_success': 0,
+            'preload_failure': 0,
+            'preload_wasted': 0,  # Evicted or expired without being read
+            'preload_expired': 0,
+            'prefetch_batches': 0,
+            'prefetch_dropped': 0,
+            'shared_hits': 0,
+            'cache_hits': 0,
+            'cache_misses': 0
+        }
+
+    def schedule(self, predictions: Iterable[Prediction]) -> int:
+        """
+        Queue predicted episodes that are neither cached nor pending
+
+        Returns:
+            Number of episodes queued
+        """
+        queued = 0
+        now = time.time()
+        for prediction in predictions:
+            episode_id = prediction.episode_id
+            entry = self.cache.get(episode_id)
+            if entry is not None and self._expired(entry, now):
+                self._expire(episode_id)
+            elif entry is not None:
+                entry.confidence = max(entry.confidence, prediction.confidence)
+                continue
+            if episode_id in self._pending:
+                self._pending[episode_id] = max(self._pending[episode_id], prediction.confidence)
+                continue
+            try:
+                self._queue.put_nowait(episode_id)
+            except asyncio.QueueFull:
+                self.metrics['prefetch_dropped'] += 1
+                lab007_prefetch_dropped_total.inc()
+                continue
+            self._pending[episode_id] = prediction.confidence
+            queued += 1
+        return queued
+
+    async def start(self):
+        """Start the prefetch workers"""
+        if not self._workers:
+            self._workers = [asyncio.create_task(self._worker()) for _ in range(self.max_concurrency)]
+
+    async def stop(self):
+        """Cancel the prefetch workers (queued predictions are dropped)"""
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def _worker(self):
+        while True:
+            episode_ids = [await self._queue.get()]
+            while len(episode_ids) < self.batch_size and not self._queue.empty():
+                episode_ids.append(self._queue.get_nowait())
+            try:
+                await self.prefetch(episode_ids)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"LAB_007 prefetch failed: {e}")
+                self.metrics['preload_failure'] += len(episode_ids)
+            finally:
+                for episode_id in episode_ids:
+                    self._pending.pop(episode_id, None)
+
+    async def prefetch(self, episode_ids: List[str]) -> int:
+        """
+        Fetch one batch of predicted episodes and cache them
+
+        Returns:
+            Number of episodes cached
+        """
+        start = time.perf_counter()
+        payloads, from_shared = {}, set()
+        if self.shared_cache is not None:
+            for episode_id, entry in self.shared_cache.get_many("preload", episode_ids).items():
+                payloads[episode_id] = entry[0]
+            from_shared = set(payloads)
+            self.metrics['shared_hits'] += len(from_shared)
+
+        missing = [e for e in episode_ids if e not in payloads]
+        fetched = await self.fetch_many_fn(missing) if missing else {}
+        payloads.update(fetched)
+
+        now = time.time()
+        if self.shared_cache is not None and fetched:
+            self.shared_cache.put_many("preload", [
+                (e, payload, self._pending.get(e, 0.0), now, "", self.shared_cache.weighted_ttl(self._pending.get(e, 0.0)))
+                for e, payload in fetched.items()
+            ])
+
+        stored = 0
+        for episode_id, payload in payloads.items():
+            if episode_id not in self._pending:
+                continue  # Invalidated while the fetch was in flight
+            stored += self._store(episode_id, payload, self._pending[episode_id], now)
+        self._enforce_budget()
+
+        self.metrics['prefetch_batches'] += 1
+        self.metrics['preload_success'] += len(payloads)
+        self.metrics['preload_failure'] += len(episode_ids) - len(payloads)
+        lab007_prefetch_episodes_total.labels(source='redis').inc(len(from_shared))
+        lab007_prefetch_episodes_total.labels(source='database').inc(len(fetched))
+        lab007_prefetch_seconds.observe(time.perf_counter() - start)
+        lab007_preload_cache_bytes.set(self.cache_bytes)
+        return stored
+
+    @staticmethod
+    def _estimate_nbytes(payload: Dict) -> int:
+        return (_ENTRY_OVERHEAD_BYTES + sys.getsizeof(payload.get("content", ""))
+                + sum(sys.getsizeof(tag) for tag in payload.get("tags") or []))
+
+    def _store(self, episode_id: str, payload: Dict, confidence: float, now: float) -> bool:
+        nbytes = self._estimate_nbytes(payload)
+        if nbytes > self.max_bytes:
+            return False
+        previous = self.cache.pop(episode_id, None)
+        if previous is not None:
+            self.cache_bytes -= previous.nbytes
+        self.cache[episode_id] = PreloadedEpisode(payload, confidence, now, nbytes)
+        self.cache_bytes += nbytes
+        return True
+
+    def _expired(self, entry: PreloadedEpisode, now: float) -> bool:
+        return now - entry.preloaded_at > self.ttl
+
+    def _expire(self, episode_id: str):
+        entry = self.cache.pop(episode_id)
+        self.cache_bytes -= entry.nbytes
+        self.metrics['preload_expired'] += 1
+        if entry.hits == 0:
+            self.metrics['preload_wasted'] += 1
+
+    def _enforce_budget(self):
+        """
+        Drop expired entries (oldest first, insertion order), then evict
+        lowest recency * confidence entries until within both bounds
+        (one scoring pass per batch, not per insert)
+        """
+        now = time.time()
+        while self.cache:
+            episode_id, entry = next(iter(self.cache.items()))
+            if not self._expired(entry, now):
+                break
+            self._expire(episode_id)
+        if len(self.cache) <= self.max_cache_size and self.cache_bytes <= self.max_bytes:
+            return
+        ranked = sorted(
+            self.cache.items(),
+            key=lambda item: math.exp(-(now - item[1].preloaded_at) / 3600) * item[1].confidence
+        )
+        for episode_id, entry in ranked:
+            if len(self.cache) <= self.max_cache_size and self.cache_bytes <= self.max_bytes:
+                break
+            del self.cache[episode_id]
+            self.cache_bytes -= entry.nbytes
+            if entry.hits == 0:
+                self.metrics['preload_wasted'] += 1
+
+    def get_cached(self, episode_id: str) -> Optional[dict]:
+        """Payload if preloaded, else None"""
+        return self.get_many([episode_id]).get(episode_id)
+
+    def get_many(self, episode_ids: List[str]) -> Dict[str, dict]:
+        """Preloaded subset of `episode_ids` (expired entries are dropped, not served)"""
+        found = {}
+        now = time.time()
+        for episode_id in episode_ids:
+            entry = self.cache.get(episode_id)
+            if entry is None:
+                continue
+            if self._expired(entry, now):
+                self._expire(episode_id)
+                continue
+            entry.hits += 1
+            found[episode_id] = entry.payload
+        self.metrics['cache_hits'] += len(found)
+        self.metrics['cache_misses'] += len(episode_ids) - len(found)
+        return found
+
+    def invalidate(self, episode_ids: List[str]):
+        """Drop changed / deleted episodes (and cancel their pending prefetch)"""
+        for episode_id in episode_ids:
+            entry = self.cache.pop(episode_id, None)
+            if entry is not None:
+                self.cache_bytes -= entry.nbytes
+            self._pending.pop(episode_id, None)
+
+    def get_cache_stats(self) -> dict:
+        """Get cache performance statistics"""
+        total_requests = self.metrics['cache_hits'] + self.metrics['cache_misses']
+        total_preloads = self.metrics['preload_success'] + self.metrics['preload_failure']
+        return {
+            'cache_size': len(self.cache),
+            'max_cache_size': self.max_cache_size,
+            'cache_bytes': self.cache_bytes,
+            'max_bytes': self.max_bytes,
+            'ttl_seconds': self.ttl,
+            'queue_depth': self._queue.qsize(),
+            'in_flight': len(self._pending),
+            'cache_hit_rate': self.metrics['cache_hits'] / total_requests if total_requests else 0.0,
+            'preload_success_rate': self.metrics['preload_success'] / total_preloads if total_preloads else 0.0,
+            'preload_waste_rate': (self.metrics['preload_wasted'] / self.metrics['preload_success']
+                                   if self.metrics['preload_success'] else 0.0),
+            **self.metrics
+        }
+
+
+# ============================================================================
+# Main Predictive Preloading Engine
+# ============================================================================
+
+class PredictivePreloadingEngine:
+    """
+    Main orchestrator for LAB_007.
+    Integrates all components into unified predictive system.
+
+    Args:
+        fetch_many_fn: async (episode_ids) -> {episode_id: payload}, one query
+        embedding_fn: Optional episode_id -> embedding (e.g. the LAB_005
+            similarity graph) for the semantic part of the context score
+        shared_cache: Optional SharedEpisodeCache
+    """
+
+    def __init__(
+        self,
+        fetch_many_fn: Callable[[List[str]], Awaitable[Dict[str, Dict]]],
+        prediction_k: int = LAB007_PREDICTION_K,
+        min_confidence: float = LAB007_MIN_CONFIDENCE,
+        embedding_fn: Optional[Callable[[str], Optional[np.ndarray]]] = None,
+        shared_cache=None,
+        **scheduler_options
+    ):
+        self.pattern_learner = TemporalPatternLearner()
+        self.context_analyzer = ContextAnalyzer()
+        self.prediction_engine = PredictionEngine(
+            self.pattern_learner,
+            self.context_analyzer
+        )
+        self.preload_scheduler = PreloadingScheduler(fetch_many_fn, shared_cache=shared_cache, **scheduler_options)
+
+        self.prediction_k = prediction_k
+        self.min_confidence = min_confidence
+        self.embedding_fn = embedding_fn
+
+        # Recent access history for context
+        self.recent_events: deque = deque(maxlen=10)
+        self.predictions_made = 0
+
+        # Per-endpoint serving stats + smoothed cost of one payload query
+        self.fetch_latency = None
+        self.endpoint_stats: Dict[str, Dict[str, float]] = defaultdict(lambda: {
+            'requests': 0, 'hits': 0, 'misses': 0, 'requests_without_db': 0, 'saved_seconds': 0.0
+        })
+        self._decay_task: Optional[asyncio.Task] = None
+
+    def _embedding(self, episode_id: str) -> Optional[np.ndarray]:
+        if self.embedding_fn is None:
+            return None
+        try:
+            return self.embedding_fn(episode_id)
+        except Exception:
+            return None
+
+    def on_episode_access(
+        self,
+        episode_id: str,
+        tags: Iterable[str] = (),
+        embedding: Optional[np.ndarray] = None
+    ) -> List[Prediction]:
+        """
+        Called when an episode is accessed (one step of the access sequence).
+
+        1. Learn from this access
+        2. Build current context
+        3. Generate predictions
+        4. Queue preloading (returns without waiting for it)
+
+        Returns:
+            Predictions queued for preloading
+        """
+        now = datetime.now()
+        tags = set(tags or ())
+        if embedding is None:
+            embedding = self._embedding(episode_id)
+        self.recent_events.append(AccessEvent(episode_id, now, tags, embedding))
+        self.context_analyzer.remember(episode_id, tags)
+        self.pattern_learner.learn_from_access(episode_id, now)
+
+        context = self.context_analyzer.build_context(list(self.recent_events))
+        predictions = self.prediction_engine.predict_next_episodes(
+            current_episode_id=episode_id,
+            context=context,
+            candidate_pool=self._candidate_pool(episode_id, context),
+            k=self.prediction_k,
+            min_confidence=self.min_confidence
+        )
+        self.predictions_made += len(predictions)
+        self.preload_scheduler.schedule(predictions)
+        return predictions
+
+    def observe_results(self, results: Iterable[Tuple[str, Iterable[str]]]):
+        """
+        Remember the tags of episodes a response returned, for context scoring
+
+        A ranked result list is not an access sequence: nothing is learned
+        from its order and no prediction is made.
+
+        Args:
+            results: (episode_id, tags or None = unknown) pairs
+        """
+        for episode_id, tags in results:
+            if tags is not None:
+                self.context_analyzer.remember(episode_id, set(tags))
+
+    def _candidate_pool(self, current: str, context: SessionContext) -> Dict[str, dict]:
+        """Learned successors of the current context plus the recent episodes"""
+        candidates = set(self.pattern_learner.bigram_successors.get(current, ()))
+        if len(context.recent_episodes) >= 2:
+            candidates |= self.pattern_learner.trigram_successors.get(tuple(context.recent_episodes[-2:]), set())
+        candidates.update(context.recent_episodes[-3:])
+        return {
+            episode_id: {
+                'tags': self.context_analyzer.episode_metadata.get(episode_id, set()),
+                'embedding': self._embedding(episode_id)
+            }
+            for episode_id in candidates
+        }
+
+    def get_cached(self, episode_id: str) -> Optional[dict]:
+        """Try to retrieve episode from predictive cache"""
+        return self.preload_scheduler.get_cached(episode_id)
+
+    def get_many(self, episode_ids: List[str]) -> Dict[str, dict]:
+        """Preloaded payloads for the subset of `episode_ids` that is cached"""
+        return self.preload_scheduler.get_many(episode_ids)
+
+    def invalidate(self, episode_ids: List[str]):
+        """Invalidation handler (see SharedEpisodeCache)"""
+        self.preload_scheduler.invalidate(episode_ids)
+
+    def observe_fetch(self, seconds: float):
+        """Record the latency of one payload query (the cost a full hit avoids)"""
+        if self.fetch_latency is None:
+            self.fetch_latency = seconds
+        else:
+            self.fetch_latency += FETCH_LATENCY_SMOOTHING * (seconds - self.fetch_latency)
+
+    def record_lookup(self, endpoint: str, hits: int, misses: int, avoided_query: bool):
+        """
+        Account one request's preload lookups
+
+        Args:
+            endpoint: Metrics label
+            hits / misses: Episodes found / not found in the preload cache
+            avoided_query: The request needed no payload query because of
+                the hits (saves one smoothed query latency)
+        """
+        stats = self.endpoint_stats[endpoint]
+        stats['requests'] += 1
+        stats['hits'] += hits
+        stats['misses'] += misses
+        lab007_preload_lookups_total.labels(endpoint=endpoint, result='hit').inc(hits)
+        lab007_preload_lookups_total.labels(endpoint=endpoint, result='miss').inc(misses)
+        if avoided_query:
+            stats['requests_without_db'] += 1
+            if self.fetch_latency is not None:
+                stats['saved_seconds'] += self.fetch_latency
+                lab007_latency_saved_seconds_total.labels(endpoint=endpoint).inc(self.fetch_latency)
+
+    async def start(self):
+        """Start prefetch workers and the hourly pattern decay"""
+        await self.preload_scheduler.start()
+        if self._decay_task is None:
+            self._decay_task = asyncio.create_task(self._decay_loop())
+
+    async def stop(self):
+        """Stop prefetching and pattern decay"""
+        if self._decay_task is not None:
+            self._decay_task.cancel()
+            try:
+                await self._decay_task
+            except asyncio.CancelledError:
+                pass
+            self._decay_task = None
+        await self.preload_scheduler.stop()
+
+    async def _decay_loop(self):
+        while True:
+            await asyncio.sleep(PATTERN_DECAY_INTERVAL)
+            self.pattern_learner.decay_patterns()
+
+    def get_stats(self) -> dict:
+        """Get comprehensive statistics"""
+        endpoints = {}
+        for endpoint, stats in self.endpoint_stats.items():
+            lookups = stats['hits'] + stats['misses']
+            endpoints[endpoint] = {
+                **stats,
+                'hit_rate': stats['hits'] / lookups if lookups else 0.0,
+                'saved_ms': round(stats['saved_seconds'] * 1000, 3)
+            }
+        return {
+            'pattern_learner': {
+                'bigram_patterns': len(self.pattern_learner.bigram_counts),
+                'trigram_patterns': len(self.pattern_learner.trigram_counts),
+                'history_size': len(self.pattern_learner.access_history)
+            },
+            'predictions_made': self.predictions_made,
+            'payload_query_ms': round(self.fetch_latency * 1000, 3) if self.fetch_latency is not None else None,
+            'preload_scheduler': self.preload_scheduler.get_cache_stats(),
+            'endpoints': endpoints
+        }
@@ -0,0 +1,193 @@
+"""
+NEXUS Cerebro API - Query Embedding Cache
+
+Two-tier cache of query vectors so repeated search strings skip the model:
+- L1: bounded in-process LRU of float32 arrays
+- L2 (optional): Redis, values stored as raw float32 bytes (1.5 KB per
+  384-d vector instead of ~8 KB of JSON)
+
+Keys combine the normalized query text with the model name and
+EMBEDDING_VERSION, so switching model or version invalidates every entry.
+"""
+
+import hashlib
+import os
+from collections import OrderedDict
+from typing import List, Optional
+
+import numpy as np
+from prometheus_client import Counter, Gauge
+
+# ============================================
+# Configuration
+# ============================================
+QUERY_EMBEDDING_CACHE_SIZE = int(os.getenv("QUERY_EMBEDDING_CACHE_SIZE", "2048"))
+QUERY_EMBEDDING_CACHE_REDIS_ENABLED = os.getenv("QUERY_EMBEDDING_CACHE_REDIS_ENABLED", "true").lower() == "true"
+QUERY_EMBEDDING_CACHE_REDIS_TTL = int(os.getenv("QUERY_EMBEDDING_CACHE_REDIS_TTL", "86400"))  # 24 hours
+QUERY_EMBEDDING_CACHE_PREFIX = "nexus:qemb"
+
+# ============================================
+# Prometheus Metrics
+# ============================================
+query_embedding_cache_requests_total = Counter(
+    'nexus_query_embedding_cache_requests_total',
+    'Query embedding cache lookups',
+    ['tier', 'result']
+)
+
+query_embedding_cache_hit_rate = Gauge(
+    'nexus_query_embedding_cache_hit_rate',
+    'Fraction of query embeddings served without running the model'
+)
+
+query_embedding_cache_entries = Gauge(
+    'nexus_query_embedding_cache_entries',
+    'Query vectors held in the in-process LRU'
+)
+
+query_embedding_cache_memory_bytes = Gauge(
+    'nexus_query_embedding_cache_memory_bytes',
+    'Approximate memory held by the in-process LRU (vectors + keys)'
+)
+
+
+def normalize_query(text: str, lowercase: bool = False) -> str:
+    """
+    Normalize query text for cache keying (the model still encodes the original)
+
+    Collapses whitespace, which the tokenizer splits on anyway. Case is only
+    folded for uncased tokenizers (all-MiniLM-L6-v2), where "Memory" and
+    "memory" produce the same embedding; a cased model must key them apart.
+    """
+    text = " ".join(text.split())
+    return text.lower() if lowercase else text
+
+
+def tokenizer_lowercases(tokenizer) -> bool:
+    """True when the tokenizer lowercases its input (HF do_lower_case); unknown = cased"""
+    return bool(getattr(tokenizer, "do_lower_case", False))
+
+
+class QueryEmbeddingCache:
+    """
+    LRU of query vectors with an optional Redis second tier
+
+    Args:
+        model_key: Model name + embedding version; part of every key
+        max_entries: In-process LRU capacity
+        redis_client: Redis client with decode_responses=False, or None
+        redis_ttl: Expiry for Redis entries in seconds
+        lowercase: Fold case in keys (only for uncased tokenizers)
+    """
+
+    def __init__(self,
+                 model_key: str,
+                 max_entries: int = QUERY_EMBEDDING_CACHE_SIZE,
+                 redis_client=None,
+                 redis_ttl: int = QUERY_EMBEDDING_CACHE_REDIS_TTL,
+                 lowercase: bool = False):
+        self.model_key = model_key
+        self.lowercase = lowercase
+        self.max_entries = max(1, max_entries)
+        self.redis_client = redis_client
+        self.redis_ttl = redis_ttl
+
+        self._entries: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._memory_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def normalize(self, text: str) -> str:
+        """Cache key text for a query (see normalize_query)"""
+        return normalize_query(text, self.lowercase)
+
+    def make_key(self, normalized_text: str) -> str:
+        """Digest of model key + normalized text"""
+        digest = hashlib.sha1(f"{self.model_key}\0{normalized_text}".encode("utf-8")).hexdigest()
+        return f"{QUERY_EMBEDDING_CACHE_PREFIX}:{digest}"
+
+    def get(self, normalized_text: str) -> Optional[List[float]]:
+        """
+        Look up a query vector (L1, then Redis)
+
+        Args:
+            normalized_text: Output of normalize()
+
+        Returns:
+            Embedding as list of floats, or None on miss
+        """
+        key = self.make_key(normalized_text)
+
+        vector = self._entries.get(key)
+        if vector is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            query_embedding_cache_requests_total.labels(tier='memory', result='hit').inc()
+            return vector.tolist()
+        query_embedding_cache_requests_total.labels(tier='memory', result='miss').inc()
+
+        if self.redis_client is not None:
+            try:
+                raw = self.redis_client.get(key)
+            except Exception as e:
+                print(f"Query embedding cache get error: {e}")
+                raw = None
+            if raw:
+                vector = np.frombuffer(raw, dtype=np.float32).copy()
+                self._store_local(key, vector)
+                self.hits += 1
+                query_embedding_cache_requests_total.labels(tier='redis', result='hit').inc()
+                return vector.tolist()
+            query_embedding_cache_requests_total.labels(tier='redis', result='miss').inc()
+
+        self.misses += 1
+        return None
+
+    def put(self, normalized_text: str, embedding: List[float]):
+        """Store a freshly computed query vector in both tiers"""
+        key = self.make_key(normalized_text)
+        vector = np.asarray(embedding, dtype=np.float32)
+
+        self._store_local(key, vector)
+
+        if self.redis_client is not None:
+            try:
+                self.redis_client.setex(key, self.redis_ttl, vector.tobytes())
+            except Exception as e:
+                print(f"Query embedding cache set error: {e}")
+
+    def _store_local(self, key: str, vector: np.ndarray):
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= previous.nbytes + len(key)
+
+        self._entries[key] = vector
+        self._memory_bytes += vector.nbytes + len(key)
+
+        while len(self._entries) > self.max_entries:
+            old_key, old_vector = self._entries.popitem(last=False)
+            self._memory_bytes -= old_vector.nbytes + len(old_key)
+
+    def clear(self):
+        """Drop the in-process tier"""
+        self._entries.clear()
+        self._memory_bytes = 0
+
+    def get_stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "memory_bytes": self._memory_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total > 0 else 0.0,
+            "redis_enabled": self.redis_client is not None
+        }
+
+    def update_metrics(self):
+        """Refresh gauges exported on /metrics"""
+        stats = self.get_stats()
+        query_embedding_cache_hit_rate.set(stats["hit_rate"])
+        query_embedding_cache_entries.set(stats["entries"])
+        query_embedding_cache_memory_bytes.set(stats["memory_bytes"])
@@ -0,0 +1,342 @@
+"""
+NEXUS Cerebro API - Shared Episode Cache
+
+Redis tier shared by all API replicas, behind each process's in-memory
+episode caches (LAB_005 priming cache, LAB_007 preload cache):
+- Values use a compact binary encoding (struct header + UTF-8 tags and
+  content, zlib above SHARED_EPISODE_CACHE_COMPRESS_BYTES) instead of JSON
+- TTLs are weighted by the activation (or prediction confidence) that
+  cached the episode, so strongly primed episodes outlive weak ones
+- Updated / pruned episodes are deleted from Redis and their ids published
+  on a pub/sub channel; every replica drops them from its in-process tiers
+
+Keys are namespaced per cache ("priming", "preload"); a replica that primes
+an episode makes its payload available to the others without a database
+read.
+"""
+
+import asyncio
+import os
+import struct
+import zlib
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from prometheus_client import Counter
+
+# ============================================
+# Configuration
+# ============================================
+SHARED_EPISODE_CACHE_ENABLED = os.getenv("SHARED_EPISODE_CACHE_ENABLED", "true").lower() == "true"
+SHARED_EPISODE_CACHE_MIN_TTL = float(os.getenv("SHARED_EPISODE_CACHE_MIN_TTL", "5"))  # seconds
+SHARED_EPISODE_CACHE_MAX_TTL = float(os.getenv("SHARED_EPISODE_CACHE_MAX_TTL", "3600"))  # seconds
+SHARED_EPISODE_CACHE_COMPRESS_BYTES = int(os.getenv("SHARED_EPISODE_CACHE_COMPRESS_BYTES", "1024"))
+SHARED_EPISODE_CACHE_PREFIX = "nexus:epcache"
+SHARED_EPISODE_CACHE_NAMES = ("priming", "preload")
+EPISODE_INVALIDATION_CHANNEL = "nexus:episode-invalidate"
+
+ENCODING_VERSION = 2  # 2: float64 importance / weight
+_FLAG_HAS_EMBEDDING = 0x01
+_FLAG_COMPRESSED = 0x02
+_FLAG_HAS_CREATED_AT = 0x04
+
+# version, flags, created_at, cached_at (epoch seconds), importance, weight, tag count, source length
+_HEADER = struct.Struct("<BBddddHH")
+_LENGTH = struct.Struct("<H")
+_MAX_FIELD = 0xFFFF  # Tag count, tag and source lengths are uint16
+
+# ============================================
+# Prometheus Metrics
+# ============================================
+episode_cache_requests_total = Counter(
+    'nexus_episode_cache_requests_total',
+    'Episode payload lookups per cache (priming / preload) and tier (memory / redis)',
+    ['cache', 'tier', 'result']
+)
+
+episode_cache_invalidations_total = Counter(
+    'nexus_episode_cache_invalidations_total',
+    'Episode ids invalidated across replicas',
+    ['origin']
+)
+
+
+# ============================================
+# Binary Encoding
+# ============================================
+def encode_episode(payload: Dict, weight: float, cached_at: float, source_uuid: str = "") -> bytes:
+    """
+    Pack an episode payload for Redis
+
+    Args:
+        payload: {"content", "importance_score", "tags", "created_at", "has_embedding"}
+        weight: Activation / confidence the episode was cached with
+        cached_at: Epoch seconds (lets other replicas continue the decay)
+        source_uuid: Episode that caused the caching
+
+    Returns:
+        Header + length-prefixed tags + source + content bytes
+
+    Raises:
+        ValueError: More than 65535 tags, or a tag / source over 65535 bytes
+    """
+    content = payload["content"].encode("utf-8")
+    flags = 0
+    if payload.get("has_embedding", True):
+        flags |= _FLAG_HAS_EMBEDDING
+    if len(content) > SHARED_EPISODE_CACHE_COMPRESS_BYTES:
+        compressed = zlib.compress(content, 1)
+        if len(compressed) < len(content):
+            content = compressed
+            flags |= _FLAG_COMPRESSED
+    created_at = payload.get("created_at")
+    if created_at is not None:
+        flags |= _FLAG_HAS_CREATED_AT
+
+    tags = [tag.encode("utf-8") for tag in payload.get("tags") or []]
+    source = source_uuid.encode("utf-8")
+    if len(tags) > _MAX_FIELD or len(source) > _MAX_FIELD or any(len(tag) > _MAX_FIELD for tag in tags):
+        raise ValueError(f"Episode does not fit the encoding ({len(tags)} tags, "
+                         f"longest {max(map(len, tags), default=0)} bytes, source {len(source)} bytes)")
+    parts = [_HEADER.pack(
+        ENCODING_VERSION, flags,
+        created_at.timestamp() if created_at is not None else 0.0,
+        cached_at,
+        float(payload.get("importance_score", 0.5)),
+        weight,
+        len(tags),
+        len(source)
+    )]
+    for tag in tags:
+        parts.append(_LENGTH.pack(len(tag)))
+        parts.append(tag)
+    parts.append(source)
+    parts.append(content)
+    return b"".join(parts)
+
+
+def decode_episode(raw: bytes) -> Tuple[Dict, float, float, str]:
+    """
+    Inverse of encode_episode
+
+    Returns:
+        (payload, weight, cached_at, source_uuid)
+
+    Raises:
+        ValueError: Unknown encoding version
+    """
+    version, flags, created_at, cached_at, importance, weight, tag_count, source_length = \
+        _HEADER.unpack_from(raw)
+    if version != ENCODING_VERSION:
+        raise ValueError(f"Unknown episode encoding version {version}")
+
+    offset = _HEADER.size
+    tags = []
+    for _ in range(tag_count):
+        (length,) = _LENGTH.unpack_from(raw, offset)
+        offset += _LENGTH.size
+        tags.append(raw[offset:offset + length].decode("utf-8"))
+        offset += length
+    source = raw[offset:offset + source_length].decode("utf-8")
+    content = raw[offset + source_length:]
+    if flags & _FLAG_COMPRESSED:
+        content = zlib.decompress(content)
+
+    payload = {
+        "content": content.decode("utf-8"),
+        "importance_score": importance,
+        "tags": tags,
+        "created_at": (datetime.fromtimestamp(created_at, tz=timezone.utc)
+                       if flags & _FLAG_HAS_CREATED_AT else None),
+        "has_embedding": bool(flags & _FLAG_HAS_EMBEDDING)
+    }
+    return payload, weight, cached_at, source
+
+
+# ============================================
+# Shared Cache
+# ============================================
+class SharedEpisodeCache:
+    """
+    Redis tier for episode payloads, shared across API replicas
+
+    Args:
+        redis_client: Redis client with decode_responses=False
+        min_ttl / max_ttl: TTL bounds in seconds (weighted_ttl maps weights
+            0..1 onto them; callers may pass their own TTL)
+
+    Redis errors are logged and treated as misses: the in-process tiers and
+    the database keep serving.
+    """
+
+    def __init__(self, redis_client,
+                 min_ttl: float = SHARED_EPISODE_CACHE_MIN_TTL,
+                 max_ttl: float = SHARED_EPISODE_CACHE_MAX_TTL):
+        self.redis_client = redis_client
+        self.min_ttl = min_ttl
+        self.max_ttl = max_ttl
+        self._handlers: List[Callable[[List[str]], None]] = []
+        self._pubsub = None
+        self._task: Optional[asyncio.Task] = None
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.skipped = 0  # Entries too large for the encoding
+        self.errors = 0
+
+    @staticmethod
+    def make_key(cache: str, episode_id: str) -> str:
+        return f"{SHARED_EPISODE_CACHE_PREFIX}:{cache}:{episode_id}"
+
+    def weighted_ttl(self, weight: float) -> float:
+        """TTL for an entry cached with activation / confidence `weight` (0..1)"""
+        weight = min(max(weight, 0.0), 1.0)
+        return self.min_ttl + (self.max_ttl - self.min_ttl) * weight
+
+    def get_many(self, cache: str, episode_ids: List[str]) -> Dict[str, Tuple[Dict, float, float, str]]:
+        """
+        Fetch entries in one MGET
+
+        Returns:
+            episode_id -> (payload, weight, cached_at, source_uuid) for hits
+        """
+        if not episode_ids:
+            return {}
+        try:
+            values = self.redis_client.mget([self.make_key(cache, e) for e in episode_ids])
+        except Exception as e:
+            print(f"Shared episode cache get error: {e}")
+            self.errors += 1
+            values = [None] * len(episode_ids)
+
+        found = {}
+        for episode_id, raw in zip(episode_ids, values):
+            if raw:
+                try:
+                    found[episode_id] = decode_episode(raw)
+                except Exception as e:
+                    print(f"Shared episode cache decode error: {e}")
+        self.hits += len(found)
+        self.misses += len(episode_ids) - len(found)
+        episode_cache_requests_total.labels(cache=cache, tier='redis', result='hit').inc(len(found))
+        episode_cache_requests_total.labels(cache=cache, tier='redis', result='miss').inc(len(episode_ids) - len(found))
+        return found
+
+    def put_many(self, cache: str, entries: Iterable[Tuple[str, Dict, float, float, str, float]]):
+        """
+        Store entries in one pipeline
+
+        Args:
+            cache: "priming" or "preload"
+            entries: (episode_id, payload, weight, cached_at, source_uuid, ttl_seconds);
+                an entry that cannot be encoded is skipped, not the batch
+        """
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            count = 0
+            for episode_id, payload, weight, cached_at, source_uuid, ttl in entries:
+                if ttl < 1:
+                    continue
+                try:
+                    value = encode_episode(payload, weight, cached_at, source_uuid)
+                except ValueError as e:
+                    print(f"Shared episode cache skipped {episode_id}: {e}")
+                    self.skipped += 1
+                    continue
+                pipe.set(self.make_key(cache, episode_id), value, px=int(ttl * 1000))
+                count += 1
+            if count:
+                pipe.execute()
+                self.writes += count
+        except Exception as e:
+            print(f"Shared episode cache set error: {e}")
+            self.errors += 1
+
+    # ----------------------------------------
+    # Cross-replica invalidation
+    # ----------------------------------------
+    def add_invalidation_handler(self, handler: Callable[[List[str]], None]):
+        """Register a callable that drops ids from an in-process tier"""
+        self._handlers.append(handler)
+
+    def _apply_invalidation(self, episode_ids: List[str]):
+        for handler in self._handlers:
+            try:
+                handler(episode_ids)
+            except Exception as e:
+                print(f"Episode cache invalidation handler error: {e}")
+
+    def invalidate(self, episode_ids: List[str]):
+        """
+        Drop episodes everywhere: local tiers, Redis keys of every cache,
+        and (via pub/sub) the in-process tiers of the other replicas
+        """
+        episode_ids = [str(e) for e in episode_ids]
+        if not episode_ids:
+            return
+        self._apply_invalidation(episode_ids)
+        episode_cache_invalidations_total.labels(origin='local').inc(len(episode_ids))
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.delete(*[self.make_key(cache, e) for cache in SHARED_EPISODE_CACHE_NAMES for e in episode_ids])
+            pipe.publish(EPISODE_INVALIDATION_CHANNEL, ",".join(episode_ids).encode())
+            pipe.execute()
+        except Exception as e:
+            print(f"Shared episode cache invalidate error: {e}")
+            self.errors += 1
+
+    async def start(self):
+        """Subscribe to invalidations published by other replicas"""
+        if self._task is not None:
+            return
+        try:
+            self._pubsub = self.redis_client.pubsub(ignore_subscribe_messages=True)
+            self._pubsub.subscribe(EPISODE_INVALIDATION_CHANNEL)
+        except Exception as e:
+            print(f"⚠ Episode invalidation subscribe failed: {e}")
+            self._pubsub = None
+            return
+        self._task = asyncio.create_task(self._listen_loop())
+
+    async def stop(self):
+        """Stop listening for invalidations"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._pubsub is not None:
+            self._pubsub.close()
+            self._pubsub = None
+
+    async def _listen_loop(self):
+        while True:
+            try:
+                message = await asyncio.to_thread(self._pubsub.get_message, timeout=1.0)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Episode invalidation listener error: {e}")
+                await asyncio.sleep(1.0)
+                continue
+            if not message or message.get("type") != "message":
+                continue
+            episode_ids = [e for e in message["data"].decode().split(",") if e]
+            # Own publications come back too; handlers are idempotent
+            self._apply_invalidation(episode_ids)
+            episode_cache_invalidations_total.labels(origin='pubsub').inc(len(episode_ids))
+
+    def get_stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total > 0 else 0.0,
+            "writes": self.writes,
+            "skipped": self.skipped,
+            "errors": self.errors,
+            "listening": self._task is not None,
+            "ttl_range_seconds": [self.min_ttl, self.max_ttl]
+        }
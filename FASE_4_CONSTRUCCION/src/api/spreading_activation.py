@@ -7,13 +7,20 @@ and activation spreading, reducing retrieval latency and improving context coher
 Based on: Collins & Loftus (1975) Spreading Activation Theory
 """
 
+import math
+import sys
+import threading
 import time
 from typing import List, Dict, Tuple, Optional, Set
 from dataclasses import dataclass, field
 from collections import OrderedDict
+from collections.abc import Mapping
 import numpy as np
 from datetime import datetime, timedelta
 
+# Per-entry bookkeeping (dataclass, OrderedDict slot, fields) on top of the payload
+_ENTRY_OVERHEAD_BYTES = 400
+
 
 @dataclass
 class ActivationState:
@@ -27,61 +34,551 @@ class ActivationState:
 
 @dataclass
 class PrimedEpisode:
-    """Cached episode with activation metadata"""
+    """Cached episode payload with activation metadata"""
     uuid: str
     content: str
-    embedding: np.ndarray
+    embedding: Optional[np.ndarray]  # None: read it from the similarity graph
     activation: float
     primed_at: float
     source_uuid: str  # Episode that triggered priming
+    importance_score: float = 0.5
+    tags: List[str] = field(default_factory=list)
+    created_at: Optional[datetime] = None
+    has_embedding: bool = True
+    expires_at: float = 0.0  # Set by PrimingCache.add
+    nbytes: int = 0
+
+
+class _EmbeddingView(Mapping):
+    """Read-only uuid -> normalized embedding mapping over the graph matrix"""
+
+    def __init__(self, graph: "SimilarityGraph"):
+        self._graph = graph
+
+    def __getitem__(self, uuid: str) -> np.ndarray:
+        return self._graph.matrix[self._graph.index[uuid]]
+
+    def __contains__(self, uuid) -> bool:
+        return uuid in self._graph.index
+
+    def __iter__(self):
+        return iter(self._graph.uuids)
+
+    def __len__(self) -> int:
+        return len(self._graph.uuids)
+
+
+def _topk_merge(idx_a: np.ndarray, sim_a: np.ndarray,
+                idx_b: np.ndarray, sim_b: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Row-wise top-k of two (rows, *) candidate sets"""
+    idx = np.concatenate([idx_a, idx_b], axis=1)
+    sim = np.concatenate([sim_a, sim_b], axis=1)
+    if sim.shape[1] > k:
+        part = np.argpartition(-sim, k - 1, axis=1)[:, :k]
+        idx = np.take_along_axis(idx, part, axis=1)
+        sim = np.take_along_axis(sim, part, axis=1)
+    return np.where(np.isneginf(sim), -1, idx).astype(np.int32), sim
 
 
 class SimilarityGraph:
     """
     Builds and maintains semantic similarity network between episodes.
-    Uses embeddings to compute cosine similarity.
+
+    Embeddings live in one contiguous float32 matrix of pre-normalized rows
+    (cosine = dot product) with a uuid <-> row index; capacity doubles when
+    full. Each row keeps its top `max_neighbors` neighbours above the
+    similarity threshold as arrays, updated exactly on every insert:
+    - add_episode: one matrix-vector product against all rows, argpartition
+      for the new row's neighbours, vectorized merge into existing rows
+    - add_episodes: same thing in blocks (matrix-matrix), for bulk loads
+    get_related(top_k <= max_neighbors) is then a sort of <= max_neighbors values.
+
+    With `max_episodes` set, inserts never grow the graph past it: the rows
+    with the lowest recency keys (default: insertion order) are evicted in
+    the same call to make room for newer ones.
     """
 
-    def __init__(self, similarity_threshold: float = 0.7):
+    BLOCK_COLUMNS = 512      # New rows per matrix-matrix block in add_episodes
+    BLOCK_ROWS = 16384       # Existing rows per block (bounds the temp sims matrix)
+
+    def __init__(self, similarity_threshold: float = 0.7, max_neighbors: int = 32,
+                 initial_capacity: int = 1024, max_episodes: Optional[int] = None):
         self.similarity_threshold = similarity_threshold
-        self.graph: Dict[str, List[Tuple[str, float]]] = {}
-        self.embeddings: Dict[str, np.ndarray] = {}
+        self.max_neighbors = max(1, max_neighbors)
+        self.max_episodes = max_episodes  # None = unbounded
+        self.evicted = 0
+        self.index: Dict[str, int] = {}
+        self.uuids: List[str] = []
+        self.embeddings = _EmbeddingView(self)
+
+        self._capacity = max(1, initial_capacity)
+        self._matrix: Optional[np.ndarray] = None        # (capacity, dim) float32
+        self._nbr_idx: Optional[np.ndarray] = None       # (capacity, K) int32, -1 = empty
+        self._nbr_sim: Optional[np.ndarray] = None       # (capacity, K) float32, -inf = empty
+        self._admit: Optional[np.ndarray] = None         # (capacity,) weakest kept similarity per row
+        self._recency: Optional[np.ndarray] = None       # (capacity,) int64 eviction key, lowest goes first
+        self._next_recency = 0
+
+    def __len__(self) -> int:
+        return len(self.uuids)
+
+    def __contains__(self, uuid) -> bool:
+        return uuid in self.index
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """(n, dim) view of the normalized embeddings, row i = uuids[i]"""
+        if self._matrix is None:
+            return np.zeros((0, 0), dtype=np.float32)
+        return self._matrix[:len(self.uuids)]
+
+    @property
+    def neighbor_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """(n, K) neighbour rows (-1 = empty) and similarities (-inf = empty)"""
+        n = len(self.uuids)
+        if self._nbr_idx is None:
+            return np.zeros((0, self.max_neighbors), np.int32), np.zeros((0, self.max_neighbors), np.float32)
+        return self._nbr_idx[:n], self._nbr_sim[:n]
+
+    def _ensure_capacity(self, needed: int, dimension: int):
+        if self._matrix is None:
+            self._capacity = max(self._capacity, needed)
+            self._matrix = np.zeros((self._capacity, dimension), dtype=np.float32)
+            self._nbr_idx = np.full((self._capacity, self.max_neighbors), -1, dtype=np.int32)
+            self._nbr_sim = np.full((self._capacity, self.max_neighbors), -np.inf, dtype=np.float32)
+            self._admit = np.full(self._capacity, -np.inf, dtype=np.float32)
+            self._recency = np.zeros(self._capacity, dtype=np.int64)
+            return
+        if self._matrix.shape[1] != dimension:
+            raise ValueError(f"Embedding dimension {dimension} != graph dimension {self._matrix.shape[1]}")
+        if needed <= self._capacity:
+            return
+
+        # Amortized O(1) growth: double until it fits (never past max_episodes)
+        capacity = self._capacity
+        while capacity < needed:
+            capacity *= 2
+        if self.max_episodes is not None:
+            capacity = max(needed, min(capacity, self.max_episodes))
+        self._grow(capacity)
+
+    def _grow(self, capacity: int):
+        n = len(self.uuids)
+        dimension = self._matrix.shape[1]
+        matrix = np.zeros((capacity, dimension), dtype=np.float32)
+        matrix[:n] = self._matrix[:n]
+        nbr_idx = np.full((capacity, self.max_neighbors), -1, dtype=np.int32)
+        nbr_idx[:n] = self._nbr_idx[:n]
+        nbr_sim = np.full((capacity, self.max_neighbors), -np.inf, dtype=np.float32)
+        nbr_sim[:n] = self._nbr_sim[:n]
+        admit = np.full(capacity, -np.inf, dtype=np.float32)
+        admit[:n] = self._admit[:n]
+        recency = np.zeros(capacity, dtype=np.int64)
+        recency[:n] = self._recency[:n]
+        self._matrix, self._nbr_idx, self._nbr_sim, self._admit = matrix, nbr_idx, nbr_sim, admit
+        self._recency = recency
+        self._capacity = capacity
+
+    def reserve(self, capacity: int, dimension: int):
+        """
+        Pre-size storage for `capacity` episodes
+
+        Lets bulk loaders allocate once (and stay inside a memory budget)
+        instead of doubling past it.
+        """
+        if self._matrix is None:
+            self._capacity = max(1, capacity)
+            self._ensure_capacity(0, dimension)
+        else:
+            self._ensure_capacity(0, dimension)  # Dimension check
+            if capacity > self._capacity:
+                self._grow(capacity)
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the matrix and neighbour arrays (allocated capacity)"""
+        if self._matrix is None:
+            return 0
+        return (self._matrix.nbytes + self._nbr_idx.nbytes + self._nbr_sim.nbytes
+                + self._admit.nbytes + self._recency.nbytes)
+
+    def export_arrays(self) -> Dict[str, np.ndarray]:
+        """
+        Copy of the graph as flat arrays (snapshot format)
+
+        Returns:
+            matrix (n, dim) float32, CSR adjacency indptr/indices/weights
+            (neighbours by descending similarity), the uuid table (bytes) and
+            the rows' recency keys
+        """
+        n = len(self.uuids)
+        idx, sim = self.neighbor_arrays
+        order = np.argsort(-sim, axis=1, kind="stable")
+        idx = np.take_along_axis(idx, order, axis=1)
+        sim = np.take_along_axis(sim, order, axis=1)
+        valid = idx >= 0
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(valid.sum(axis=1), out=indptr[1:])
+        return {
+            "matrix": self.matrix.copy(),
+            "indptr": indptr,
+            "indices": idx[valid].astype(np.int32),
+            "weights": sim[valid].astype(np.float32),
+            "uuids": np.array([u.encode() for u in self.uuids] or [b""])[:n],
+            "recency": (self._recency[:n] if n else np.zeros(0, np.int64)).copy()
+        }
+
+    def load_arrays(self, matrix: np.ndarray, indptr: np.ndarray, indices: np.ndarray,
+                    weights: np.ndarray, uuids: np.ndarray, recency: Optional[np.ndarray] = None):
+        """
+        Replace the graph with exported arrays
+
+        `matrix` is used as-is (e.g. a copy-on-write np.memmap); the first
+        insert past its size moves the graph to regular memory. Without
+        `recency` (older snapshots) rows keep their stored order as keys.
+        """
+        n = len(uuids)
+        self.uuids = [u.decode() for u in uuids.tolist()]
+        self.index = {uuid: row for row, uuid in enumerate(self.uuids)}
+        if n == 0:
+            self._matrix = self._nbr_idx = self._nbr_sim = self._admit = self._recency = None
+            self._next_recency = 0
+            return
+
+        k = self.max_neighbors
+        indptr, indices, weights = np.asarray(indptr), np.asarray(indices), np.asarray(weights)
+        counts = np.diff(indptr)
+        if counts.max() > k:
+            # Snapshot written with more neighbours: lists are sorted, keep the strongest k
+            rows = np.repeat(np.arange(n), counts)
+            keep = np.arange(len(indices)) - indptr[rows] < k
+            indices, weights, counts = indices[keep], weights[keep], np.minimum(counts, k)
+
+        # Row-major boolean fill: row i gets its counts[i] entries in order
+        slots = np.arange(k) < counts[:, None]
+        self._matrix = matrix
+        self._capacity = n
+        self._nbr_idx = np.full((n, k), -1, dtype=np.int32)
+        self._nbr_sim = np.full((n, k), -np.inf, dtype=np.float32)
+        self._nbr_idx[slots] = indices
+        self._nbr_sim[slots] = weights
+        self._admit = self._nbr_sim.min(axis=1)
+        self._recency = np.array(recency if recency is not None else np.arange(n), dtype=np.int64)
+        self._next_recency = int(self._recency.max()) + 1
+
+    @staticmethod
+    def _normalize(vectors: np.ndarray) -> np.ndarray:
+        vectors = np.asarray(vectors, dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+        return vectors / np.where(norms == 0, 1.0, norms)
+
+    def add_episode(self, uuid: str, embedding: np.ndarray) -> List[str]:
+        """Add new episode (or replace its embedding) and update neighbour lists"""
+        return self.add_episodes([uuid], np.asarray(embedding, dtype=np.float32).reshape(1, -1))
+
+    def add_episodes(self, uuids: List[str], embeddings: np.ndarray,
+                     recency: Optional[List[int]] = None) -> List[str]:
+        """
+        Bulk insert: neighbours computed block-wise with matrix products
 
-    def add_episode(self, uuid: str, embedding: np.ndarray):
-        """Add new episode and compute similarities with existing ones"""
-        self.embeddings[uuid] = embedding
-        self.graph[uuid] = []
+        Args:
+            uuids: Episode ids (already-known ids replace their embedding)
+            embeddings: (len(uuids), dim) array
+            recency: Eviction keys for new ids (lower = evicted first);
+                default: after every row already inserted
 
-        # Compute similarities with all existing episodes
-        for other_uuid, other_embedding in self.embeddings.items():
-            if other_uuid == uuid:
+        Returns:
+            Episodes evicted to stay within max_episodes. New ids whose key
+            ranks below everything kept are not inserted at all.
+        """
+        if not len(uuids):
+            return []
+        vectors = self._normalize(np.asarray(embeddings, dtype=np.float32).reshape(len(uuids), -1))
+        if recency is None:
+            recency = range(self._next_recency, self._next_recency + len(uuids))
+
+        new_rows = []
+        seen = {}
+        for uuid, vector, key in zip(uuids, vectors, recency):
+            if uuid in self.index:
+                self._replace(self.index[uuid], vector)
+            elif uuid in seen:
+                new_rows[seen[uuid]] = (uuid, vector, key)  # Last one wins, like repeated add_episode
+            else:
+                seen[uuid] = len(new_rows)
+                new_rows.append((uuid, vector, key))
+        self._next_recency = max(self._next_recency, max(recency, default=-1) + 1)
+        if not new_rows:
+            return []
+
+        evicted = []
+        overflow = len(self.uuids) + len(new_rows) - (self.max_episodes or sys.maxsize)
+        if overflow > 0:
+            # Keep the max_episodes highest keys among existing + new rows
+            n = len(self.uuids)
+            keys = np.concatenate([self._recency[:n] if n else np.zeros(0, np.int64),
+                                   np.array([key for _, _, key in new_rows], dtype=np.int64)])
+            dropped = np.argpartition(keys, overflow - 1)[:overflow] if overflow < len(keys) else np.arange(len(keys))
+            rejected = set((dropped[dropped >= n] - n).tolist())
+            new_rows = [row for i, row in enumerate(new_rows) if i not in rejected]
+            evicted = self._remove_rows(dropped[dropped < n])
+            if not new_rows:
+                return evicted
+
+        start = len(self.uuids)
+        self._ensure_capacity(start + len(new_rows), vectors.shape[1])
+        for offset, (uuid, vector, key) in enumerate(new_rows):
+            self._matrix[start + offset] = vector
+            self._recency[start + offset] = key
+            self.index[uuid] = start + offset
+            self.uuids.append(uuid)
+
+        for b0 in range(start, start + len(new_rows), self.BLOCK_COLUMNS):
+            self._link_block(b0, min(b0 + self.BLOCK_COLUMNS, start + len(new_rows)))
+        return evicted
+
+    def _remove_rows(self, rows: np.ndarray) -> List[str]:
+        """
+        Delete rows, filling their slots with the last rows (O(moved + n*K))
+
+        Neighbour entries pointing at removed rows are dropped; like _replace,
+        a list that loses an entry does not recover its k+1-th neighbour.
+
+        Returns:
+            Removed episode ids
+        """
+        if not len(rows):
+            return []
+        n = len(self.uuids)
+        m = n - len(rows)
+        removed = np.zeros(n, dtype=bool)
+        removed[rows] = True
+        holes = np.flatnonzero(removed[:m])
+        movers = m + np.flatnonzero(~removed[m:])
+
+        remap = np.arange(n, dtype=np.int32)
+        remap[removed] = -1
+        remap[movers] = holes
+
+        evicted = [self.uuids[row] for row in rows.tolist()]
+        for uuid in evicted:
+            del self.index[uuid]
+        for hole, mover in zip(holes.tolist(), movers.tolist()):
+            self.uuids[hole] = self.uuids[mover]
+            self.index[self.uuids[hole]] = hole
+        del self.uuids[m:]
+
+        for array in (self._matrix, self._nbr_idx, self._nbr_sim, self._admit, self._recency):
+            array[holes] = array[movers]
+        self._nbr_idx[m:n] = -1
+        self._nbr_sim[m:n] = -np.inf
+        self._admit[m:n] = -np.inf
+
+        idx = self._nbr_idx[:m]
+        mapped = np.where(idx >= 0, remap[np.maximum(idx, 0)], -1)
+        lost = (idx >= 0) & (mapped < 0)
+        self._nbr_idx[:m] = mapped
+        touched = np.flatnonzero(lost.any(axis=1))
+        if len(touched):
+            self._nbr_sim[:m][lost] = -np.inf
+            self._admit[touched] = self._nbr_sim[touched].min(axis=1)
+
+        self.evicted += len(evicted)
+        return evicted
+
+    def _link_block(self, b0: int, b1: int):
+        """Neighbour lists for rows [b0, b1) against rows [0, b1), and back"""
+        k = self.max_neighbors
+        threshold = self.similarity_threshold
+        block = self._matrix[b0:b1]
+        block_rows = np.arange(b0, b1, dtype=np.int32)
+
+        own_idx = np.full((b1 - b0, k), -1, dtype=np.int32)
+        own_sim = np.full((b1 - b0, k), -np.inf, dtype=np.float32)
+
+        for r0 in range(0, b1, self.BLOCK_ROWS):
+            r1 = min(r0 + self.BLOCK_ROWS, b1)
+            sims = self._matrix[r0:r1] @ block.T          # (rows, block) - one matvec when block == 1
+            sims[sims < threshold] = -np.inf
+
+            # No self edges
+            overlap = np.arange(max(r0, b0), min(r1, b1))
+            sims[overlap - r0, overlap - b0] = -np.inf
+
+            # New rows' own neighbours (top-k per column of this chunk)
+            cand_sim = sims.T
+            cand_idx = np.broadcast_to(np.arange(r0, r1, dtype=np.int32), cand_sim.shape)
+            if cand_sim.shape[1] > k:
+                part = np.argpartition(-cand_sim, k - 1, axis=1)[:, :k]
+                cand_idx = np.take_along_axis(cand_idx, part, axis=1)
+                cand_sim = np.take_along_axis(cand_sim, part, axis=1)
+            own_idx, own_sim = _topk_merge(own_idx, own_sim, cand_idx, cand_sim, k)
+
+            # Older rows that gained a neighbour in this block (rows >= b0 are in the block itself)
+            older = min(r1, b0) - r0
+            if older <= 0:
                 continue
+            older_sims = sims[:older]
+            admit = self._admit[r0:r0 + older]
+            if older_sims.shape[1] == 1:
+                touched = np.flatnonzero(older_sims[:, 0] > admit)
+            else:
+                touched = np.flatnonzero((older_sims > admit[:, None]).any(axis=1))
+            if len(touched):
+                self._merge_into(r0 + touched, older_sims[touched], block_rows)
+
+        self._nbr_idx[b0:b1], self._nbr_sim[b0:b1] = own_idx, own_sim
+        self._admit[b0:b1] = own_sim.min(axis=1)
+
+    def _merge_into(self, rows: np.ndarray, cand_sim: np.ndarray, cand_rows: np.ndarray):
+        """Merge candidate neighbours (columns = cand_rows) into the lists of `rows`"""
+        cand_idx = np.broadcast_to(cand_rows, cand_sim.shape)
+        merged_idx, merged_sim = _topk_merge(
+            self._nbr_idx[rows], self._nbr_sim[rows], cand_idx, cand_sim, self.max_neighbors
+        )
+        self._nbr_idx[rows], self._nbr_sim[rows] = merged_idx, merged_sim
+        self._admit[rows] = merged_sim.min(axis=1)
 
-            similarity = self._cosine_similarity(embedding, other_embedding)
+    def _replace(self, row: int, vector: np.ndarray):
+        """
+        New embedding for a known episode
 
-            if similarity >= self.similarity_threshold:
-                # Add bidirectional edge
-                self.graph[uuid].append((other_uuid, similarity))
-                self.graph[other_uuid].append((uuid, similarity))
+        Its own list is recomputed exactly; other rows update their similarity
+        to it (dropping it below threshold) and may gain it as a neighbour.
+        A row that drops it does not recover its previous k+1-th neighbour.
+        """
+        self._matrix[row] = vector
+        n = len(self.uuids)
+        sims = self._matrix[:n] @ vector
+        sims[row] = -np.inf
+        sims[sims < self.similarity_threshold] = -np.inf
+
+        rows, cols = np.nonzero(self._nbr_idx[:n] == row)
+        self._nbr_sim[rows, cols] = sims[rows]
+        self._nbr_idx[rows, cols] = np.where(np.isneginf(sims[rows]), -1, row)
+        self._admit[rows] = self._nbr_sim[rows].min(axis=1)
+
+        k = self.max_neighbors
+        others = np.setdiff1d(np.flatnonzero(sims > self._admit[:n]), rows)
+        if len(others):
+            self._merge_into(others, sims[others, None], np.array([row], dtype=np.int32))
+
+        top = np.argpartition(-sims, k - 1)[:k] if n > k else np.arange(n)
+        own_sim = np.full(k, -np.inf, dtype=np.float32)
+        own_idx = np.full(k, -1, dtype=np.int32)
+        own_sim[:len(top)] = sims[top]
+        own_idx[:len(top)] = np.where(np.isneginf(sims[top]), -1, top)
+        self._nbr_idx[row], self._nbr_sim[row] = own_idx, own_sim
+        self._admit[row] = own_sim.min()
 
     def get_related(self, uuid: str, top_k: int = 5) -> List[Tuple[str, float]]:
-        """Get top-K most similar episodes"""
-        if uuid not in self.graph:
+        """Get top-K most similar episodes (above similarity threshold)"""
+        row = self.index.get(uuid)
+        if row is None:
             return []
 
-        # Sort by similarity descending
-        related = sorted(self.graph[uuid], key=lambda x: x[1], reverse=True)
-        return related[:top_k]
+        if top_k <= self.max_neighbors:
+            idx, sim = self._nbr_idx[row], self._nbr_sim[row]
+        else:
+            # Wider than the stored lists: one matvec + argpartition
+            sim = self.matrix @ self._matrix[row]
+            sim[row] = -np.inf
+            sim[sim < self.similarity_threshold] = -np.inf
+            idx = np.arange(len(sim))
+            if len(sim) > top_k:
+                part = np.argpartition(-sim, top_k - 1)[:top_k]
+                idx, sim = idx[part], sim[part]
+
+        order = np.argsort(-sim, kind="stable")[:top_k]
+        return [(self.uuids[idx[i]], float(sim[i])) for i in order if idx[i] >= 0 and not np.isneginf(sim[i])]
+
+    def spread(self, sources: np.ndarray, levels: Optional[np.ndarray] = None, top_k: int = 5,
+               max_hops: int = 2, hop_decay=0.7, min_activation: float = 0.2,
+               max_frontier: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Multi-hop activation propagation over the neighbour arrays
+
+        Each hop is one sparse matrix-vector product over the (max, x)
+        semiring: every frontier row passes activation * similarity * decay
+        to its top_k neighbours and each target keeps its strongest incoming
+        value. Targets below min_activation or already visited are dropped;
+        max_frontier keeps only the strongest new rows per hop.
+
+        Args:
+            sources: Source rows (any number, propagated together)
+            levels: Source activation levels (default 1.0)
+            top_k: Neighbours followed per row (capped at max_neighbors)
+            max_hops: Propagation depth
+            hop_decay: Decay per hop, scalar or one value per hop
+            min_activation: Rows below this are neither activated nor expanded
+            max_frontier: Top-k pruning of each hop's new rows (None = no cap)
+
+        Returns:
+            (rows, activation levels, parent rows), hop by hop, strongest first within a hop
+        """
+        empty = (np.zeros(0, np.int64), np.zeros(0, np.float32), np.zeros(0, np.int64))
+        n = len(self.uuids)
+        frontier = np.asarray(sources, dtype=np.int64).reshape(-1)
+        if n == 0 or len(frontier) == 0:
+            return empty
+        decays = np.broadcast_to(np.asarray(hop_decay, dtype=np.float32), (max_hops,))
+        activation = (np.ones(len(frontier), np.float32) if levels is None
+                      else np.asarray(levels, dtype=np.float32).reshape(-1))
+        k = min(top_k, self.max_neighbors)
+
+        visited = np.zeros(n, dtype=bool)
+        visited[frontier] = True
+        out_rows, out_levels, out_parents = [], [], []
+
+        for hop in range(max_hops):
+            idx, sim = self._nbr_idx[frontier], self._nbr_sim[frontier]
+            if k < self.max_neighbors:
+                part = np.argpartition(-sim, k - 1, axis=1)[:, :k]
+                idx = np.take_along_axis(idx, part, axis=1)
+                sim = np.take_along_axis(sim, part, axis=1)
+
+            candidate = activation[:, None] * sim * decays[hop]
+            parents = np.broadcast_to(frontier[:, None], idx.shape)
+            valid = idx >= 0
+            valid[valid] = ~visited[idx[valid]]
+            valid &= candidate >= min_activation
+            targets, candidate, parents = idx[valid], candidate[valid], parents[valid]
+            if len(targets) == 0:
+                break
+
+            # Strongest incoming value per target (first after sorting by target, -activation)
+            order = np.lexsort((-candidate, targets))
+            targets, candidate, parents = targets[order], candidate[order], parents[order]
+            first = np.ones(len(targets), dtype=bool)
+            first[1:] = targets[1:] != targets[:-1]
+            targets, candidate, parents = targets[first], candidate[first], parents[first]
+
+            order = np.argsort(-candidate, kind="stable")
+            if max_frontier is not None and len(order) > max_frontier:
+                order = order[:max_frontier]
+            targets, candidate, parents = targets[order], candidate[order], parents[order]
+
+            visited[targets] = True
+            out_rows.append(targets)
+            out_levels.append(candidate)
+            out_parents.append(parents)
+            frontier, activation = targets.astype(np.int64), candidate
+
+        if not out_rows:
+            return empty
+        return (np.concatenate(out_rows).astype(np.int64), np.concatenate(out_levels),
+                np.concatenate(out_parents).astype(np.int64))
 
     def get_similarity(self, uuid1: str, uuid2: str) -> float:
         """Get similarity between two episodes"""
-        if uuid1 not in self.embeddings or uuid2 not in self.embeddings:
+        if uuid1 not in self.index or uuid2 not in self.index:
             return 0.0
 
-        return self._cosine_similarity(
-            self.embeddings[uuid1],
-            self.embeddings[uuid2]
-        )
+        return float(np.dot(self._matrix[self.index[uuid1]], self._matrix[self.index[uuid2]]))
 
     @staticmethod
     def _cosine_similarity(vec1: np.ndarray, vec2: np.ndarray) -> float:
@@ -151,36 +648,92 @@ class ActivationManager:
         Spread activation from source episode through similarity network.
         Returns list of (uuid, activation_level) tuples.
         """
-        activated = []
-        visited = {source_uuid}
-
-        # Initialize with direct neighbors
-        queue = [(source_uuid, 1.0, 0)]  # (uuid, activation, hop_count)
-
-        while queue:
-            current_uuid, current_activation, hops = queue.pop(0)
+        return self.spread_activation_many([source_uuid], similarity_graph, top_k=top_k, max_hops=max_hops)
 
-            if hops >= max_hops:
-                continue
+    def spread_activation_many(
+        self,
+        source_uuids: List[str],
+        similarity_graph: SimilarityGraph,
+        top_k: int = 5,
+        max_hops: int = 2,
+        hop_decay=0.7,
+        min_activation: float = 0.2,
+        max_frontier: Optional[int] = None
+    ) -> List[Tuple[str, float]]:
+        """
+        Spread activation from several sources at once (e.g. a session context)
 
-            # Get related episodes
-            related = similarity_graph.get_related(current_uuid, top_k=top_k)
+        Activation diminishes with distance and similarity (hop_decay each
+        hop) and stops spreading below min_activation; see SimilarityGraph.spread.
+        Returns list of (uuid, activation_level) tuples.
+        """
+        return [(uuid, level) for uuid, level, _ in self.propagate(
+            source_uuids, similarity_graph, top_k, max_hops, hop_decay, min_activation, max_frontier
+        )]
 
-            for related_uuid, similarity in related:
-                if related_uuid in visited:
-                    continue
+    def propagate(
+        self,
+        source_uuids: List[str],
+        similarity_graph: SimilarityGraph,
+        top_k: int = 5,
+        max_hops: int = 2,
+        hop_decay=0.7,
+        min_activation: float = 0.2,
+        max_frontier: Optional[int] = None
+    ) -> List[Tuple[str, float, str]]:
+        """spread_activation_many, also returning the episode each one was activated from"""
+        sources = [similarity_graph.index[uuid] for uuid in source_uuids if uuid in similarity_graph.index]
+        rows, levels, parents = similarity_graph.spread(
+            np.array(sources, dtype=np.int64), top_k=top_k, max_hops=max_hops, hop_decay=hop_decay,
+            min_activation=min_activation, max_frontier=max_frontier
+        )
 
-                visited.add(related_uuid)
+        uuids = similarity_graph.uuids
+        activated = []
+        for row, level, parent in zip(rows.tolist(), levels.tolist(), parents.tolist()):
+            self.activate(uuids[row], level, source=uuids[parent])
+            activated.append((uuids[row], level, uuids[parent]))
+        return activated
 
-                # Activation diminishes with distance and similarity
-                new_activation = current_activation * similarity * 0.7  # 70% each hop
+    def export_arrays(self) -> Dict[str, np.ndarray]:
+        """Activation states as flat arrays (snapshot format); sources as CSR"""
+        states = list(self.activations.values())
+        sources = [source.encode() for state in states for source in state.source_episodes]
+        source_indptr = np.zeros(len(states) + 1, dtype=np.int64)
+        np.cumsum([len(state.source_episodes) for state in states], out=source_indptr[1:])
+        return {
+            "uuids": np.array([state.episode_uuid.encode() for state in states] or [b""])[:len(states)],
+            "level": np.array([state.activation_level for state in states], dtype=np.float32),
+            "last_accessed": np.array([state.last_accessed for state in states], dtype=np.float64),
+            "access_count": np.array([state.access_count for state in states], dtype=np.int32),
+            "source_indptr": source_indptr,
+            "sources": np.array(sources or [b""])[:len(sources)]
+        }
 
-                if new_activation >= 0.2:  # Threshold to continue spreading
-                    self.activate(related_uuid, new_activation, source=current_uuid)
-                    activated.append((related_uuid, new_activation))
-                    queue.append((related_uuid, new_activation, hops + 1))
+    def load_arrays(self, uuids: np.ndarray, level: np.ndarray, last_accessed: np.ndarray,
+                    access_count: np.ndarray, source_indptr: np.ndarray, sources: np.ndarray,
+                    threshold: float = 0.0):
+        """
+        Replace activation states with exported arrays
 
-        return activated
+        last_accessed is wall-clock time, so decay continues across a restart;
+        states already decayed below `threshold` are dropped.
+        """
+        decayed = level * 0.5 ** ((time.time() - last_accessed) / self.decay_half_life)
+        source_ids = [s.decode() for s in sources.tolist()]
+        uuid_list = [u.decode() for u in uuids.tolist()]
+        # Plain lists: per-element indexing of np.memmap is slow
+        level, last_accessed, access_count = level.tolist(), last_accessed.tolist(), access_count.tolist()
+        source_indptr = source_indptr.tolist()
+        self.activations = {}
+        for i in np.flatnonzero(decayed >= threshold).tolist():
+            self.activations[uuid_list[i]] = ActivationState(
+                episode_uuid=uuid_list[i],
+                activation_level=level[i],
+                last_accessed=last_accessed[i],
+                access_count=access_count[i],
+                source_episodes=set(source_ids[source_indptr[i]:source_indptr[i + 1]])
+            )
 
     def cleanup(self, threshold: float = 0.1):
         """Remove episodes with activation below threshold"""
@@ -195,64 +748,195 @@ class ActivationManager:
         return len(to_remove)
 
 
+class _CacheShard:
+    """One PrimingCache shard: LRU order, byte total and counters under one lock"""
+
+    __slots__ = ("lock", "entries", "nbytes", "hits", "misses", "evictions", "expirations")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries: OrderedDict[str, PrimedEpisode] = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+
 class PrimingCache:
     """
-    Fast in-memory cache for primed episodes.
-    Uses LRU eviction policy when cache is full.
+    Fast in-memory cache for primed episodes (real payloads, not placeholders).
+
+    Sharded by uuid hash, one lock per shard, so the event loop (lookups from
+    search / recent / primed endpoints) and engine threads (priming) only
+    contend on the same shard. Each shard is an LRU bounded by its share of
+    max_size entries and max_bytes of estimated payload size.
+
+    Entries expire with the activation that primed them: an entry primed at
+    activation A lives until A * 0.5^(age / decay_half_life) < min_activation,
+    and re-priming refreshes it.
     """
 
-    def __init__(self, max_size: int = 50):
+    def __init__(
+        self,
+        max_size: int = 50,
+        max_bytes: int = 32 * 1024 * 1024,
+        num_shards: int = 8,
+        decay_half_life: float = 30.0,
+        min_activation: float = 0.1
+    ):
         self.max_size = max_size
-        self.cache: OrderedDict[str, PrimedEpisode] = OrderedDict()
-        self.hits = 0
-        self.misses = 0
+        self.max_bytes = max_bytes
+        self.num_shards = max(1, min(num_shards, max_size))
+        self.decay_half_life = decay_half_life
+        self.min_activation = min_activation
+        self._shards = [_CacheShard() for _ in range(self.num_shards)]
+        self._shard_size = -(-max_size // self.num_shards)
+        self._shard_bytes = max_bytes // self.num_shards
+
+    def _shard(self, uuid: str) -> _CacheShard:
+        return self._shards[hash(uuid) % self.num_shards]
+
+    def ttl(self, activation: float) -> float:
+        """Seconds until `activation` decays below min_activation"""
+        if activation <= self.min_activation:
+            return 0.0
+        return self.decay_half_life * math.log2(activation / self.min_activation)
 
-    def add(self, primed_episode: PrimedEpisode):
-        """Add episode to cache, evicting LRU if needed"""
-        if primed_episode.uuid in self.cache:
-            # Move to end (most recently used)
-            self.cache.move_to_end(primed_episode.uuid)
-            # Update activation
-            self.cache[primed_episode.uuid].activation = primed_episode.activation
-        else:
-            # Add new entry
-            if len(self.cache) >= self.max_size:
-                # Evict LRU
-                self.cache.popitem(last=False)
+    @staticmethod
+    def _estimate_nbytes(episode: PrimedEpisode) -> int:
+        size = _ENTRY_OVERHEAD_BYTES + sys.getsizeof(episode.content)
+        size += sum(sys.getsizeof(tag) for tag in episode.tags)
+        if episode.embedding is not None:
+            size += episode.embedding.nbytes
+        return size
+
+    def add(self, primed_episode: PrimedEpisode) -> bool:
+        """
+        Add episode to cache, evicting LRU entries of its shard if needed
 
-            self.cache[primed_episode.uuid] = primed_episode
+        Returns:
+            False if the payload alone exceeds the shard byte budget or the
+            activation has already decayed (entries restored from another tier)
+        """
+        primed_episode.nbytes = self._estimate_nbytes(primed_episode)
+        primed_episode.expires_at = primed_episode.primed_at + self.ttl(primed_episode.activation)
+        if primed_episode.nbytes > self._shard_bytes or primed_episode.expires_at <= time.time():
+            return False
+
+        shard = self._shard(primed_episode.uuid)
+        with shard.lock:
+            previous = shard.entries.pop(primed_episode.uuid, None)
+            if previous is not None:
+                shard.nbytes -= previous.nbytes
+            while shard.entries and (len(shard.entries) >= self._shard_size or
+                                     shard.nbytes + primed_episode.nbytes > self._shard_bytes):
+                _, evicted = shard.entries.popitem(last=False)
+                shard.nbytes -= evicted.nbytes
+                shard.evictions += 1
+            shard.entries[primed_episode.uuid] = primed_episode
+            shard.nbytes += primed_episode.nbytes
+        return True
+
+    def refresh(self, activated: List[Tuple[str, float, str]]) -> List[str]:
+        """
+        Re-prime cached episodes without refetching their payloads
+
+        Args:
+            activated: (uuid, activation, source_uuid) from one propagation
+
+        Returns:
+            uuids that are not cached (their payloads need fetching)
+        """
+        now = time.time()
+        missing = []
+        for uuid, activation, source_uuid in activated:
+            shard = self._shard(uuid)
+            with shard.lock:
+                entry = shard.entries.get(uuid)
+                if entry is None or entry.expires_at <= now:
+                    missing.append(uuid)
+                    continue
+                shard.entries.move_to_end(uuid)
+                entry.activation = activation
+                entry.primed_at = now
+                entry.source_uuid = source_uuid
+                entry.expires_at = now + self.ttl(activation)
+        return missing
 
     def get(self, uuid: str) -> Optional[PrimedEpisode]:
         """Retrieve episode from cache"""
-        if uuid in self.cache:
-            self.hits += 1
-            # Move to end (most recently used)
-            self.cache.move_to_end(uuid)
-            return self.cache[uuid]
-        else:
-            self.misses += 1
-            return None
+        return self.get_many([uuid]).get(uuid)
+
+    def get_many(self, uuids: List[str]) -> Dict[str, PrimedEpisode]:
+        """Retrieve the cached subset of `uuids` (expired entries count as misses)"""
+        now = time.time()
+        found = {}
+        for uuid in uuids:
+            shard = self._shard(uuid)
+            with shard.lock:
+                entry = shard.entries.get(uuid)
+                if entry is not None and entry.expires_at <= now:
+                    del shard.entries[uuid]
+                    shard.nbytes -= entry.nbytes
+                    shard.expirations += 1
+                    entry = None
+                if entry is None:
+                    shard.misses += 1
+                    continue
+                shard.entries.move_to_end(uuid)
+                shard.hits += 1
+            found[uuid] = entry
+        return found
+
+    def invalidate(self, uuids: List[str]) -> int:
+        """Drop entries whose episodes changed or were deleted"""
+        removed = 0
+        for uuid in uuids:
+            shard = self._shard(uuid)
+            with shard.lock:
+                entry = shard.entries.pop(uuid, None)
+                if entry is not None:
+                    shard.nbytes -= entry.nbytes
+                    removed += 1
+        return removed
 
     def get_hit_rate(self) -> float:
         """Calculate cache hit rate"""
-        total = self.hits + self.misses
+        hits = sum(shard.hits for shard in self._shards)
+        total = hits + sum(shard.misses for shard in self._shards)
         if total == 0:
             return 0.0
-        return self.hits / total
+        return hits / total
 
     def clear(self):
         """Clear all cache entries"""
-        self.cache.clear()
+        for shard in self._shards:
+            with shard.lock:
+                shard.entries.clear()
+                shard.nbytes = 0
+
+    def __len__(self) -> int:
+        return sum(len(shard.entries) for shard in self._shards)
 
     def get_stats(self) -> Dict:
         """Get cache statistics"""
+        activations = []
+        for shard in self._shards:
+            with shard.lock:
+                activations.extend(e.activation for e in shard.entries.values())
         return {
-            "size": len(self.cache),
+            "size": len(activations),
             "max_size": self.max_size,
-            "hits": self.hits,
-            "misses": self.misses,
+            "bytes": sum(shard.nbytes for shard in self._shards),
+            "max_bytes": self.max_bytes,
+            "shards": self.num_shards,
+            "hits": sum(shard.hits for shard in self._shards),
+            "misses": sum(shard.misses for shard in self._shards),
             "hit_rate": self.get_hit_rate(),
-            "avg_activation": np.mean([e.activation for e in self.cache.values()]) if self.cache else 0.0
+            "evictions": sum(shard.evictions for shard in self._shards),
+            "expirations": sum(shard.expirations for shard in self._shards),
+            "avg_activation": float(np.mean(activations)) if activations else 0.0
         }
 
 
@@ -260,6 +944,13 @@ class SpreadingActivationEngine:
     """
     Main LAB_005 engine integrating all components.
     Coordinates similarity graph, activation spreading, and priming cache.
+
+    Priming is two-phase: access_episode(s) propagates and reports the
+    activated episodes whose payloads are not cached ("missing_payloads");
+    the caller fetches those in one query and hands them to prime_payloads.
+
+    `lock` serializes graph writes (background warm-start loader thread)
+    against accesses; it is held for one insert call at a time.
     """
 
     def __init__(
@@ -268,58 +959,74 @@ class SpreadingActivationEngine:
         decay_half_life: float = 30.0,
         cache_size: int = 50,
         top_k_related: int = 5,
-        max_hops: int = 2
+        max_hops: int = 2,
+        max_frontier: Optional[int] = None,
+        cache_bytes: int = 32 * 1024 * 1024,
+        cache_shards: int = 8
     ):
         self.similarity_graph = SimilarityGraph(similarity_threshold)
         self.activation_manager = ActivationManager(decay_half_life)
-        self.priming_cache = PrimingCache(cache_size)
+        self.priming_cache = PrimingCache(cache_size, cache_bytes, cache_shards, decay_half_life)
 
         self.top_k_related = top_k_related
         self.max_hops = max_hops
+        self.max_frontier = max_frontier
+        self.lock = threading.RLock()
 
         # Statistics
         self.total_accesses = 0
         self.primed_accesses = 0
         self.avg_retrieval_time = 0.0
 
-    def add_episode(self, uuid: str, content: str, embedding: np.ndarray):
-        """Add new episode to the system"""
-        self.similarity_graph.add_episode(uuid, embedding)
+    def add_episode(self, uuid: str, content: str, embedding: np.ndarray) -> List[str]:
+        """Add new episode to the system (returns episodes evicted for it)"""
+        with self.lock:
+            return self.similarity_graph.add_episode(uuid, embedding)
+
+    def add_episodes(self, uuids: List[str], embeddings: np.ndarray,
+                     recency: Optional[List[int]] = None) -> List[str]:
+        """Bulk add episodes (block matrix products, see SimilarityGraph.add_episodes)"""
+        with self.lock:
+            return self.similarity_graph.add_episodes(uuids, embeddings, recency)
 
     def access_episode(self, uuid: str, content: str, embedding: np.ndarray) -> Dict:
         """
         Main access point: activates episode and spreads activation.
         Returns primed episodes that should be loaded.
         """
+        with self.lock:
+            result = self._access_episodes([uuid])
+        result["uuid"] = uuid
+        return result
+
+    def access_episodes(self, uuids: List[str]) -> Dict:
+        """
+        Activate several episodes (a session context) and spread from all
+        of them in one propagation. Returns primed episodes.
+        """
+        with self.lock:
+            result = self._access_episodes(uuids)
+        result["uuids"] = list(uuids)
+        return result
+
+    def _access_episodes(self, uuids: List[str]) -> Dict:
         start_time = time.time()
 
-        # Activate the accessed episode
-        self.activation_manager.activate(uuid, level=1.0)
+        # Activate the accessed episodes
+        for uuid in uuids:
+            self.activation_manager.activate(uuid, level=1.0)
 
         # Spread activation through network
-        activated = self.activation_manager.spread_activation(
-            source_uuid=uuid,
+        activated = self.activation_manager.propagate(
+            source_uuids=uuids,
             similarity_graph=self.similarity_graph,
             top_k=self.top_k_related,
-            max_hops=self.max_hops
+            max_hops=self.max_hops,
+            max_frontier=self.max_frontier
         )
 
-        # Load activated episodes into priming cache
-        primed_uuids = []
-        for activated_uuid, activation_level in activated:
-            # Check if we have the episode data (in real system, fetch from DB)
-            if activated_uuid in self.similarity_graph.embeddings:
-                primed_episode = PrimedEpisode(
-                    uuid=activated_uuid,
-                    content=f"[Content for {activated_uuid}]",  # Placeholder
-                    embedding=self.similarity_graph.embeddings[activated_uuid],
-                    activation=activation_level,
-                    primed_at=time.time(),
-                    source_uuid=uuid
-                )
-
-                self.priming_cache.add(primed_episode)
-                primed_uuids.append(activated_uuid)
+        # Cached episodes are re-primed in place; the rest need their payloads
+        missing_payloads = self.priming_cache.refresh(activated)
 
         # Update statistics
         self.total_accesses += 1
@@ -330,12 +1037,48 @@ class SpreadingActivationEngine:
         )
 
         return {
-            "uuid": uuid,
-            "primed_episodes": primed_uuids,
+            "primed_episodes": [uuid for uuid, _, _ in activated],
             "activation_count": len(activated),
+            "activated": activated,
+            "missing_payloads": missing_payloads,
             "processing_time_ms": elapsed,
         }
 
+    def prime_payloads(self, activated: List[Tuple[str, float, str]], payloads: Dict[str, Dict],
+                       primed_at: Optional[float] = None) -> int:
+        """
+        Store fetched episode payloads in the priming cache
+
+        Args:
+            activated: (uuid, activation, source_uuid) from access_episode(s)
+            payloads: uuid -> {"content", "importance_score", "tags",
+                "created_at", "has_embedding"} (episodes without one are skipped)
+            primed_at: When the activation was set (default now; earlier for
+                entries primed by another replica, so their decay continues)
+
+        Returns:
+            Number of episodes cached
+        """
+        now = time.time() if primed_at is None else primed_at
+        cached = 0
+        for uuid, activation, source_uuid in activated:
+            payload = payloads.get(uuid)
+            if payload is None:
+                continue
+            cached += self.priming_cache.add(PrimedEpisode(
+                uuid=uuid,
+                content=payload["content"],
+                embedding=None,
+                activation=activation,
+                primed_at=now,
+                source_uuid=source_uuid,
+                importance_score=payload.get("importance_score", 0.5),
+                tags=payload.get("tags") or [],
+                created_at=payload.get("created_at"),
+                has_embedding=payload.get("has_embedding", True)
+            ))
+        return cached
+
     def try_primed_access(self, uuid: str) -> Optional[PrimedEpisode]:
         """Try to retrieve episode from priming cache"""
         result = self.priming_cache.get(uuid)
@@ -357,7 +1100,7 @@ class SpreadingActivationEngine:
             "avg_retrieval_time_ms": self.avg_retrieval_time,
             "cache_stats": self.priming_cache.get_stats(),
             "active_episodes": len(self.activation_manager.activations),
-            "similarity_graph_size": len(self.similarity_graph.graph),
+            "similarity_graph_size": len(self.similarity_graph),
         }
 
     def cleanup(self):
@@ -403,6 +1146,9 @@ if __name__ == "__main__":
         episodes[5][2]
     )
 
+    # Payloads of the activated episodes (the API fetches them in one query)
+    engine.prime_payloads(result["activated"], {uuid: {"content": content} for uuid, content, _ in episodes})
+
     print(f"✅ Primed {result['activation_count']} related episodes")
     print(f"⚡ Processing time: {result['processing_time_ms']:.2f}ms")
     print(f"📋 Primed UUIDs: {result['primed_episodes'][:3]}...")
@@ -0,0 +1,147 @@
+"""
+NEXUS Cerebro API - Token-Aware Chunking and Pooled Embeddings
+
+MiniLM only sees the first max_seq_length (256) word pieces of a text, so
+long episodes used to be embedded from their opening paragraph only. Here:
+- Texts are split into overlapping token windows using the model tokenizer
+  (character offsets keep chunk boundaries on real text)
+- The chunks of ALL texts in a batch go through one model.encode() call
+- Each text's chunk vectors are mean-pooled back into one unit vector,
+  stored in the existing embedding column (no schema change, same search)
+
+Short texts (one window) are encoded exactly as before.
+Shared by the API (query embeddings) and the embeddings worker.
+"""
+
+import os
+import re
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# ============================================
+# Configuration
+# ============================================
+EMBEDDINGS_CHUNK_SIZE = int(os.getenv("EMBEDDINGS_CHUNK_SIZE", "256"))  # tokens per window
+EMBEDDINGS_CHUNK_OVERLAP = int(os.getenv("EMBEDDINGS_CHUNK_OVERLAP", "50"))  # tokens shared by neighbours
+EMBEDDINGS_MAX_CHUNKS = int(os.getenv("EMBEDDINGS_MAX_CHUNKS", "64"))  # per text, bounds encode cost
+
+# Whitespace words per model token when no tokenizer is available (English ~0.75)
+WORDS_PER_TOKEN = 0.75
+
+_WORD = re.compile(r"\S+")
+
+
+def _window_size(model, chunk_tokens: int) -> int:
+    """Chunk size capped to what the model can actually attend to"""
+    max_seq_length = getattr(model, "max_seq_length", None)
+    if max_seq_length:
+        # [CLS] and [SEP] take two positions
+        return max(8, min(chunk_tokens, int(max_seq_length) - 2))
+    return max(8, chunk_tokens)
+
+
+def _token_spans(texts: Sequence[str], tokenizer) -> List[List[Tuple[int, int]]]:
+    """Character (start, end) of every token, batch-tokenized when possible"""
+    if tokenizer is not None:
+        try:
+            encoded = tokenizer(
+                list(texts),
+                add_special_tokens=False,
+                return_offsets_mapping=True,
+                truncation=False,
+                verbose=False
+            )
+            return [[tuple(span) for span in offsets] for offsets in encoded["offset_mapping"]]
+        except Exception:
+            pass  # Slow tokenizers have no offsets - fall back to words
+
+    return [[match.span() for match in _WORD.finditer(text)] for text in texts]
+
+
+def chunk_texts(texts: Sequence[str],
+                tokenizer=None,
+                chunk_tokens: int = EMBEDDINGS_CHUNK_SIZE,
+                overlap_tokens: int = EMBEDDINGS_CHUNK_OVERLAP,
+                max_chunks: int = EMBEDDINGS_MAX_CHUNKS) -> List[List[str]]:
+    """
+    Split texts into overlapping token windows
+
+    Args:
+        texts: Texts to split
+        tokenizer: HF fast tokenizer (offsets); None = whitespace words
+        chunk_tokens: Window size in tokens
+        overlap_tokens: Tokens repeated at the start of the next window
+        max_chunks: Windows kept per text (the rest of the text is dropped)
+
+    Returns:
+        One list of chunk strings per text (at least one, possibly the text itself)
+    """
+    if tokenizer is None:
+        chunk_tokens = max(1, int(chunk_tokens * WORDS_PER_TOKEN))
+        overlap_tokens = int(overlap_tokens * WORDS_PER_TOKEN)
+    step = max(1, chunk_tokens - min(overlap_tokens, chunk_tokens - 1))
+
+    chunked = []
+    for text, spans in zip(texts, _token_spans(texts, tokenizer)):
+        if len(spans) <= chunk_tokens:
+            chunked.append([text])
+            continue
+
+        chunks = []
+        for start in range(0, len(spans), step):
+            window = spans[start:start + chunk_tokens]
+            chunks.append(text[window[0][0]:window[-1][1]])
+            if start + chunk_tokens >= len(spans) or len(chunks) >= max_chunks:
+                break
+        chunked.append(chunks)
+
+    return chunked
+
+
+def pool_vectors(vectors: np.ndarray) -> np.ndarray:
+    """Mean of unit-normalized chunk vectors, renormalized (cosine-ready)"""
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    pooled = (vectors / np.maximum(norms, 1e-12)).mean(axis=0)
+    return pooled / max(float(np.linalg.norm(pooled)), 1e-12)
+
+
+def encode_chunked(model,
+                   texts: Sequence[str],
+                   batch_size: Optional[int] = None,
+                   chunk_tokens: int = EMBEDDINGS_CHUNK_SIZE,
+                   overlap_tokens: int = EMBEDDINGS_CHUNK_OVERLAP,
+                   max_chunks: int = EMBEDDINGS_MAX_CHUNKS) -> Tuple[np.ndarray, List[int]]:
+    """
+    Embed texts of any length with a single batched encode() call
+
+    Args:
+        model: Object exposing encode(List[str], batch_size=...) and
+               optionally tokenizer / max_seq_length (SentenceTransformer)
+        texts: Texts to embed
+        batch_size: encode() batch size (default: number of chunks)
+
+    Returns:
+        (float32 array of shape (len(texts), dim), chunk count per text)
+    """
+    chunked = chunk_texts(
+        texts,
+        tokenizer=getattr(model, "tokenizer", None),
+        chunk_tokens=_window_size(model, chunk_tokens),
+        overlap_tokens=overlap_tokens,
+        max_chunks=max_chunks
+    )
+    flat = [chunk for chunks in chunked for chunk in chunks]
+    vectors = np.asarray(model.encode(flat, batch_size=batch_size or len(flat)), dtype=np.float32)
+
+    pooled = []
+    position = 0
+    for chunks in chunked:
+        count = len(chunks)
+        if count == 1:
+            pooled.append(vectors[position])
+        else:
+            pooled.append(pool_vectors(vectors[position:position + count]))
+        position += count
+
+    return np.stack(pooled).astype(np.float32), [len(chunks) for chunks in chunked]
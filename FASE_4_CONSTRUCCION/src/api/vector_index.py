@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+NEXUS Cerebro API - Vector (ANN) Index Management
+
+pgvector index lifecycle for nexus_memory.zep_episodic_memory.embedding:
+- Create HNSW (m, ef_construction) or IVFFlat (lists) indexes
+- Rebuild concurrently with new parameters (build side index, swap, drop)
+- Verify validity, build parameters, size and that the planner uses it
+- Per-transaction recall/latency knobs: hnsw.ef_search / ivfflat.probes
+
+CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction, so the
+lifecycle functions expect an autocommit connection (see admin_connection).
+
+CLI:
+    python vector_index.py verify
+    python vector_index.py rebuild --m 24 --ef-construction 128
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import re
+from typing import Any, Dict, Optional
+
+import psycopg
+from psycopg import sql
+
+# ============================================
+# Configuration
+# ============================================
+VECTOR_INDEX_SCHEMA = "nexus_memory"
+VECTOR_INDEX_TABLE = "zep_episodic_memory"
+VECTOR_INDEX_COLUMN = "embedding"
+VECTOR_INDEX_NAME = "idx_episodic_embedding_hnsw"  # Created by init_scripts/05_create_indexes.sql
+VECTOR_INDEX_OPCLASS = "vector_cosine_ops"
+
+HNSW_DEFAULT_M = 16
+HNSW_DEFAULT_EF_CONSTRUCTION = 64
+IVFFLAT_DEFAULT_LISTS = 100
+
+# Upper bounds accepted from API requests
+MAX_EF_SEARCH = 1000
+MAX_PROBES = 1000
+
+_IDENTIFIER = re.compile(r"^[a-z_][a-z0-9_]{0,62}$")
+
+
+def _check_identifier(name: str) -> str:
+    """Index names are interpolated into DDL - only allow plain identifiers"""
+    if not _IDENTIFIER.match(name):
+        raise ValueError(f"Invalid index name: {name!r}")
+    return name
+
+
+# ============================================
+# Query-time knobs
+# ============================================
+async def apply_search_params(cur, ef_search: Optional[int] = None, probes: Optional[int] = None):
+    """
+    Set ANN recall/latency knobs for the current transaction only
+
+    Uses set_config(..., is_local => true) so values reset at commit and
+    never leak to the next request using the pooled connection.
+
+    Args:
+        cur: Async cursor inside a transaction
+        ef_search: HNSW candidate list size (higher = better recall, slower)
+        probes: IVFFlat lists probed (higher = better recall, slower)
+    """
+    if ef_search is not None:
+        await cur.execute("SELECT set_config('hnsw.ef_search', %s, true)", (str(int(ef_search)),))
+    if probes is not None:
+        await cur.execute("SELECT set_config('ivfflat.probes', %s, true)", (str(int(probes)),))
+
+
+# ============================================
+# Index lifecycle (autocommit connection required)
+# ============================================
+async def admin_connection(conninfo: str) -> psycopg.AsyncConnection:
+    """Open an autocommit connection suitable for CONCURRENTLY operations"""
+    return await psycopg.AsyncConnection.connect(conninfo, autocommit=True)
+
+
+def index_ddl(name: str,
+              method: str = "hnsw",
+              m: int = HNSW_DEFAULT_M,
+              ef_construction: int = HNSW_DEFAULT_EF_CONSTRUCTION,
+              lists: int = IVFFLAT_DEFAULT_LISTS,
+              concurrently: bool = True,
+              table: Optional[str] = None) -> str:
+    """
+    Build CREATE INDEX statement for the episodic embedding column
+
+    Args:
+        name: Index name
+        method: 'hnsw' or 'ivfflat'
+        m: HNSW max connections per layer
+        ef_construction: HNSW build candidate list size
+        lists: IVFFlat list count
+        concurrently: Build without blocking writes
+        table: Qualified table override (benchmarks); defaults to episodic memory
+
+    Returns:
+        DDL string
+    """
+    _check_identifier(name)
+    if method == "hnsw":
+        options = f"m = {int(m)}, ef_construction = {int(ef_construction)}"
+    elif method == "ivfflat":
+        options = f"lists = {int(lists)}"
+    else:
+        raise ValueError(f"Unsupported index method: {method}")
+
+    return (
+        f"CREATE INDEX {'CONCURRENTLY ' if concurrently else ''}IF NOT EXISTS {name} "
+        f"ON {table or f'{VECTOR_INDEX_SCHEMA}.{VECTOR_INDEX_TABLE}'} "
+        f"USING {method} ({VECTOR_INDEX_COLUMN} {VECTOR_INDEX_OPCLASS}) "
+        f"WITH ({options})"
+    )
+
+
+async def create_index(conn,
+                       name: str = VECTOR_INDEX_NAME,
+                       method: str = "hnsw",
+                       m: int = HNSW_DEFAULT_M,
+                       ef_construction: int = HNSW_DEFAULT_EF_CONSTRUCTION,
+                       lists: int = IVFFLAT_DEFAULT_LISTS,
+                       maintenance_work_mem: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Create a vector index concurrently (no-op if it already exists)
+
+    Args:
+        conn: Autocommit AsyncConnection
+        name: Index name
+        method: 'hnsw' or 'ivfflat'
+        m, ef_construction: HNSW build parameters
+        lists: IVFFlat build parameter
+        maintenance_work_mem: Optional session override (e.g. '2GB') for faster builds
+
+    Returns:
+        verify_index() report for the new index
+    """
+    async with conn.cursor() as cur:
+        if maintenance_work_mem:
+            await cur.execute("SELECT set_config('maintenance_work_mem', %s, false)", (maintenance_work_mem,))
+        await cur.execute(index_ddl(name, method, m, ef_construction, lists, concurrently=True))
+    return await verify_index(conn, name)
+
+
+async def rebuild_index(conn,
+                        name: str = VECTOR_INDEX_NAME,
+                        method: str = "hnsw",
+                        m: int = HNSW_DEFAULT_M,
+                        ef_construction: int = HNSW_DEFAULT_EF_CONSTRUCTION,
+                        lists: int = IVFFLAT_DEFAULT_LISTS,
+                        maintenance_work_mem: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Rebuild an index with new parameters without blocking reads or writes
+
+    Builds `<name>_rebuild` concurrently, checks it is valid, drops the old
+    index concurrently and renames the new one into place. Searches keep
+    using the old index until the swap.
+
+    Returns:
+        verify_index() report for the rebuilt index
+    """
+    _check_identifier(name)
+    temp_name = _check_identifier(f"{name[:55]}_rebuild")
+
+    async with conn.cursor() as cur:
+        # Leftover from an interrupted rebuild is INVALID and must go first
+        await cur.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {VECTOR_INDEX_SCHEMA}.{temp_name}")
+
+    report = await create_index(conn, temp_name, method, m, ef_construction, lists, maintenance_work_mem)
+    if not report["valid"]:
+        raise RuntimeError(f"Rebuilt index {temp_name} is not valid: {report}")
+
+    async with conn.cursor() as cur:
+        await cur.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {VECTOR_INDEX_SCHEMA}.{name}")
+        await cur.execute(f"ALTER INDEX {VECTOR_INDEX_SCHEMA}.{temp_name} RENAME TO {name}")
+
+    return await verify_index(conn, name)
+
+
+async def verify_index(conn, name: str = VECTOR_INDEX_NAME) -> Dict[str, Any]:
+    """
+    Inspect a vector index and check the planner uses it for k-NN search
+
+    Args:
+        conn: AsyncConnection
+        name: Index name
+
+    Returns:
+        Dict with exists, valid, ready, method, options, size_bytes, used_by_planner
+    """
+    async with conn.cursor() as cur:
+        await cur.execute("""
+            SELECT
+                i.indisvalid,
+                i.indisready,
+                am.amname,
+                c.reloptions,
+                pg_relation_size(c.oid)
+            FROM pg_class c
+            JOIN pg_index i ON i.indexrelid = c.oid
+            JOIN pg_am am ON am.oid = c.relam
+            JOIN pg_namespace n ON n.oid = c.relnamespace
+            WHERE n.nspname = %s AND c.relname = %s
+        """, (VECTOR_INDEX_SCHEMA, name))
+        row = await cur.fetchone()
+
+        if not row:
+            return {"index": name, "exists": False, "valid": False, "used_by_planner": False}
+
+        valid, ready, method, reloptions, size_bytes = row
+        options = dict(opt.split("=", 1) for opt in (reloptions or []))
+
+        # Probe the plan with a real stored vector so the shape matches search
+        await cur.execute(f"""
+            SELECT {VECTOR_INDEX_COLUMN}::text
+            FROM {VECTOR_INDEX_SCHEMA}.{VECTOR_INDEX_TABLE}
+            WHERE {VECTOR_INDEX_COLUMN} IS NOT NULL
+            LIMIT 1
+        """)
+        sample = await cur.fetchone()
+
+        used_by_planner = None  # Unknown on an empty table
+        if sample:
+            await cur.execute(sql.SQL(f"""
+                EXPLAIN (FORMAT JSON)
+                SELECT episode_id
+                FROM {VECTOR_INDEX_SCHEMA}.{VECTOR_INDEX_TABLE}
+                ORDER BY {VECTOR_INDEX_COLUMN} <=> {{}}::vector
+                LIMIT 10
+            """).format(sql.Literal(sample[0])))
+            plan = (await cur.fetchone())[0]
+            plan_text = plan if isinstance(plan, str) else json.dumps(plan)
+            used_by_planner = f'"{name}"' in plan_text
+
+    return {
+        "index": name,
+        "exists": True,
+        "valid": bool(valid),
+        "ready": bool(ready),
+        "method": method,
+        "options": options,
+        "size_bytes": size_bytes,
+        "used_by_planner": used_by_planner
+    }
+
+
+# ============================================
+# CLI
+# ============================================
+async def _main():
+    parser = argparse.ArgumentParser(description="NEXUS vector index management")
+    parser.add_argument("action", choices=["create", "rebuild", "verify"])
+    parser.add_argument("--dsn", default=os.getenv("NEXUS_DB_DSN"),
+                        help="PostgreSQL DSN (default: $NEXUS_DB_DSN)")
+    parser.add_argument("--name", default=VECTOR_INDEX_NAME)
+    parser.add_argument("--method", choices=["hnsw", "ivfflat"], default="hnsw")
+    parser.add_argument("--m", type=int, default=HNSW_DEFAULT_M)
+    parser.add_argument("--ef-construction", type=int, default=HNSW_DEFAULT_EF_CONSTRUCTION)
+    parser.add_argument("--lists", type=int, default=IVFFLAT_DEFAULT_LISTS)
+    parser.add_argument("--maintenance-work-mem", help="e.g. 2GB")
+    args = parser.parse_args()
+
+    if not args.dsn:
+        parser.error("--dsn or NEXUS_DB_DSN is required")
+
+    conn = await admin_connection(args.dsn)
+    try:
+        if args.action == "verify":
+            report = await verify_index(conn, args.name)
+        elif args.action == "create":
+            report = await create_index(conn, args.name, args.method, args.m,
+                                        args.ef_construction, args.lists, args.maintenance_work_mem)
+        else:
+            report = await rebuild_index(conn, args.name, args.method, args.m,
+                                         args.ef_construction, args.lists, args.maintenance_work_mem)
+    finally:
+        await conn.close()
+
+    print(json.dumps(report, indent=2, default=str))
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
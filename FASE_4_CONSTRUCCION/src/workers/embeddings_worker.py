@@ -2,15 +2,39 @@
 NEXUS Cerebro - Embeddings Worker V2.0.0
 Background worker for automatic embeddings generation
 DÍA 5 FASE 4 - Base Implementation
+
+Supervisor mode (WORKER_PROCESSES > 1): the model is loaded once and N worker
+processes are forked from it, so the weights are shared copy-on-write. The
+workers coordinate through the FOR UPDATE SKIP LOCKED claim in
+get_pending_items(); the supervisor restarts crashed workers and drains them
+on SIGTERM.
 """
 
+import gc
 import os
 import time
+import select
+import signal
 import logging
+import tempfile
 from datetime import datetime
+
+# Supervisor mode aggregates per-process metrics through prometheus_client
+# multiprocess files; the directory must exist before prometheus_client loads
+WORKER_PROCESSES = int(os.getenv("WORKER_PROCESSES", "1"))
+if WORKER_PROCESSES > 1 and not os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+    os.environ["PROMETHEUS_MULTIPROC_DIR"] = tempfile.mkdtemp(prefix="nexus_embeddings_metrics_")
+
+import sys
 import psycopg
-from sentence_transformers import SentenceTransformer
-from prometheus_client import Counter, Histogram, Gauge, start_http_server
+from prometheus_client import (
+    CollectorRegistry, Counter, Histogram, Gauge, multiprocess, start_http_server
+)
+
+# Chunking/pooling is shared with the API so queries and episodes match
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'api'))
+from text_chunking import encode_chunked, EMBEDDINGS_CHUNK_SIZE, EMBEDDINGS_CHUNK_OVERLAP
+from embedding_backends import embedding_version, load_embedding_backend, EMBEDDINGS_BACKEND
 
 # ============================================
 # Configuration
@@ -29,11 +53,15 @@ except FileNotFoundError:
     POSTGRES_PASSWORD = os.getenv("POSTGRES_PASSWORD", "default_password")
 
 # Worker configuration
-POLL_INTERVAL = int(os.getenv("POLL_INTERVAL", "5"))  # seconds
+POLL_INTERVAL = int(os.getenv("POLL_INTERVAL", "5"))  # seconds (used when LISTEN is unavailable)
+FALLBACK_POLL_INTERVAL = int(os.getenv("FALLBACK_POLL_INTERVAL", "30"))  # safety poll while LISTENing
+QUEUE_NOTIFY_CHANNEL = "embeddings_queue"  # pg_notify channel used by trigger_generate_embedding()
 BATCH_SIZE = int(os.getenv("BATCH_SIZE", "10"))
+ENCODE_BATCH_SIZE = int(os.getenv("ENCODE_BATCH_SIZE", "32"))  # model.encode() internal batch
+BATCH_ENCODE = os.getenv("BATCH_ENCODE", "true").lower() == "true"  # false = legacy per-item path (A/B)
 MAX_RETRIES = int(os.getenv("MAX_RETRIES", "5"))
 EMBEDDINGS_MODEL = os.getenv("EMBEDDINGS_MODEL", "sentence-transformers/all-MiniLM-L6-v2")
-EMBEDDING_VERSION = "miniLM-384-chunked@v2"
+EMBEDDING_VERSION = os.getenv("EMBEDDING_VERSION") or embedding_version(EMBEDDINGS_BACKEND)  # e.g. miniLM-384-chunked@v2+onnx-int8
 
 # Database connection string
 DB_CONN_STRING = f"postgresql://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DB}"
@@ -41,6 +69,11 @@ DB_CONN_STRING = f"postgresql://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{POSTGRES_HO
 # Prometheus metrics port
 METRICS_PORT = int(os.getenv("METRICS_PORT", "9090"))
 
+# Supervisor configuration (WORKER_PROCESSES above)
+THREADS_PER_WORKER = int(os.getenv("THREADS_PER_WORKER", "0"))  # 0 = cpu_count // WORKER_PROCESSES
+WORKER_DRAIN_TIMEOUT = int(os.getenv("WORKER_DRAIN_TIMEOUT", "60"))  # seconds before SIGKILL on shutdown
+WORKER_RESTART_BACKOFF = float(os.getenv("WORKER_RESTART_BACKOFF", "5"))  # seconds, doubles per fast crash (max 60)
+
 # ============================================
 # Prometheus Metrics
 # ============================================
@@ -48,27 +81,73 @@ METRICS_PORT = int(os.getenv("METRICS_PORT", "9090"))
 # Processing metrics
 embeddings_processed_total = Counter(
     'nexus_embeddings_processed_total',
-    'Total embeddings processed successfully'
+    'Total embeddings processed successfully',
+    ['worker']
 )
 
 embeddings_failed_total = Counter(
     'nexus_embeddings_failed_total',
-    'Total embeddings that failed processing'
+    'Total embeddings that failed processing',
+    ['worker']
 )
 
 embeddings_dead_total = Counter(
     'nexus_embeddings_dead_total',
-    'Total embeddings moved to dead letter queue'
+    'Total embeddings moved to dead letter queue',
+    ['worker']
 )
 
 embeddings_processing_duration_seconds = Histogram(
     'nexus_embeddings_processing_duration_seconds',
-    'Time taken to process a single embedding'
+    'Time taken to process a single embedding',
+    ['worker']
+)
+
+embeddings_batch_duration_seconds = Histogram(
+    'nexus_embeddings_batch_duration_seconds',
+    'Time taken to encode and write back one claimed batch',
+    ['worker'],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+)
+
+embeddings_insert_to_available_seconds = Histogram(
+    'nexus_embeddings_insert_to_available_seconds',
+    'Time from queue insert (episode stored/changed) to embedding committed',
+    ['worker'],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0, 1800.0)
+)
+
+embeddings_worker_wakeups_total = Counter(
+    'nexus_embeddings_worker_wakeups_total',
+    'Idle worker wakeups',
+    ['worker', 'reason']
+)
+
+embeddings_chunks_per_episode = Histogram(
+    'nexus_embeddings_chunks_per_episode',
+    'Token windows encoded per episode (1 = fits in one model window)',
+    ['worker'],
+    buckets=(1, 2, 3, 4, 6, 8, 16, 32, 64)
 )
 
 embeddings_batch_size = Gauge(
     'nexus_embeddings_batch_size',
-    'Current batch size being processed'
+    'Current batch size being processed',
+    ['worker'],
+    multiprocess_mode='liveall'
+)
+
+# Supervisor metrics
+embeddings_worker_processes_alive = Gauge(
+    'nexus_embeddings_worker_processes_alive',
+    'Worker processes currently running under the supervisor',
+    multiprocess_mode='liveall'
+)
+
+embeddings_worker_restarts_total = Counter(
+    'nexus_embeddings_worker_restarts_total',
+    'Worker processes restarted after an unexpected exit',
+    ['worker']
 )
 
 # ============================================
@@ -84,27 +163,139 @@ logger = logging.getLogger("embeddings_worker")
 # Embeddings Worker Class
 # ============================================
 class EmbeddingsWorker:
-    def __init__(self):
-        self.model = None
+    def __init__(self, worker_id: str = "0", model=None, serve_metrics: bool = True):
+        self.worker_id = worker_id
+        self.model = model  # Preloaded by the supervisor (shared copy-on-write)
+        self.serve_metrics = serve_metrics
         self.conn = None
+        self.listen_conn = None
         self.running = True
+        # Self-pipe so SIGTERM interrupts an idle select() immediately
+        self._stop_r, self._stop_w = os.pipe()
+
+    def stop(self, *_):
+        """Finish the current batch, then exit the run loop (SIGTERM/SIGINT handler)"""
+        self.running = False
+        try:
+            os.write(self._stop_w, b"x")
+        except OSError:
+            pass
 
     def initialize(self):
         """Initialize model and database connection"""
         try:
-            logger.info(f"Loading embeddings model: {EMBEDDINGS_MODEL}")
-            self.model = SentenceTransformer(EMBEDDINGS_MODEL)
-            logger.info("✓ Model loaded successfully")
+            if self.model is None:
+                logger.info(f"Loading embeddings model: {EMBEDDINGS_MODEL} (backend: {EMBEDDINGS_BACKEND})")
+                self.model = load_embedding_backend(EMBEDDINGS_BACKEND, EMBEDDINGS_MODEL)
+                logger.info("✓ Model loaded successfully")
 
             logger.info("Connecting to database...")
             self.conn = psycopg.connect(DB_CONN_STRING)
             logger.info("✓ Database connected")
 
+            self.adopt_embedding_version()
+
+            self.connect_listener()
+
             return True
         except Exception as e:
             logger.error(f"Initialization failed: {e}")
             return False
 
+    def adopt_embedding_version(self):
+        """
+        Record EMBEDDING_VERSION as the current version (embedding_config) and,
+        when it changed (e.g. EMBEDDINGS_BACKEND switched), re-enqueue every
+        episode embedded with another version: vectors of different versions
+        are different spaces and must not share the embedding column.
+
+        Workers starting together serialize on the config row; only the first
+        one sees the change and re-enqueues.
+        """
+        try:
+            with self.conn.cursor() as cur:
+                cur.execute("""
+                    INSERT INTO memory_system.embedding_config (current_version)
+                    VALUES (%s)
+                    ON CONFLICT (singleton) DO UPDATE
+                        SET current_version = EXCLUDED.current_version,
+                            updated_at = NOW()
+                        WHERE embedding_config.current_version IS DISTINCT FROM EXCLUDED.current_version
+                    RETURNING current_version
+                """, (EMBEDDING_VERSION,))
+                changed = cur.fetchone() is not None
+
+                requeued = 0
+                if changed:
+                    # Low priority: new episodes keep being embedded first
+                    cur.execute("""
+                        INSERT INTO memory_system.embeddings_queue (episode_id, text_checksum, state, priority)
+                        SELECT
+                            episode_id,
+                            encode(sha256(convert_to(LEFT(content, 4000), 'UTF8')), 'hex'),
+                            'pending',
+                            'low'
+                        FROM nexus_memory.zep_episodic_memory
+                        WHERE embedding_version IS DISTINCT FROM %s
+                        ON CONFLICT (episode_id) DO UPDATE
+                            SET state = 'pending',
+                                retry_count = 0,
+                                enqueued_at = NOW()
+                            WHERE embeddings_queue.state IN ('done', 'dead')
+                    """, (EMBEDDING_VERSION,))
+                    requeued = cur.rowcount
+                    cur.execute("SELECT pg_notify(%s, '')", (QUEUE_NOTIFY_CHANNEL,))
+
+            self.conn.commit()
+            if changed:
+                logger.info(f"✓ Embedding version is now {EMBEDDING_VERSION}: {requeued} episodes re-enqueued")
+        except Exception as e:
+            self.conn.rollback()
+            logger.warning(f"Could not record embedding version {EMBEDDING_VERSION} (migration 011 applied?): {e}")
+
+    def connect_listener(self):
+        """Open the autocommit LISTEN connection (falls back to polling on failure)"""
+        try:
+            self.listen_conn = psycopg.connect(DB_CONN_STRING, autocommit=True)
+            self.listen_conn.execute(f"LISTEN {QUEUE_NOTIFY_CHANNEL}")
+            logger.info(f"✓ Listening on channel '{QUEUE_NOTIFY_CHANNEL}'")
+        except Exception as e:
+            logger.warning(f"LISTEN unavailable, polling every {POLL_INTERVAL}s: {e}")
+            self.listen_conn = None
+
+    def wait_for_work(self):
+        """
+        Block until the queue trigger sends NOTIFY, or the fallback poll expires
+
+        Notifications sent while a batch was being processed are already
+        buffered on the socket, so select() returns immediately for them.
+        """
+        if self.listen_conn is None:
+            select.select([self._stop_r], [], [], POLL_INTERVAL)
+            embeddings_worker_wakeups_total.labels(worker=self.worker_id, reason='poll').inc()
+            # Try to restore LISTEN for the next idle period
+            self.connect_listener()
+            return
+
+        try:
+            listen_fd = self.listen_conn.fileno()
+            ready, _, _ = select.select([listen_fd, self._stop_r], [], [], FALLBACK_POLL_INTERVAL)
+            if not self.running:
+                return
+            if listen_fd in ready:
+                # Any statement consumes pending input, including notifications
+                self.listen_conn.execute("SELECT 1")
+                embeddings_worker_wakeups_total.labels(worker=self.worker_id, reason='notify').inc()
+            else:
+                embeddings_worker_wakeups_total.labels(worker=self.worker_id, reason='timeout').inc()
+        except Exception as e:
+            logger.warning(f"LISTEN connection lost: {e}")
+            try:
+                self.listen_conn.close()
+            except Exception:
+                pass
+            self.listen_conn = None
+
     def get_pending_items(self):
         """Get pending items from embeddings_queue"""
         try:
@@ -139,6 +330,9 @@ class EmbeddingsWorker:
 
                     items = cur.fetchall()
 
+                # End the read transaction before encoding: the batch is
+                # written in a fresh one, so processed_at stays close to commit
+                self.conn.commit()
                 return items
             return []
 
@@ -148,27 +342,123 @@ class EmbeddingsWorker:
             return []
 
     def generate_embedding(self, text: str):
-        """Generate embedding for text"""
+        """Generate embedding for text (chunked and pooled when longer than one window)"""
         try:
-            # Truncate to 4000 chars (matches trigger checksum)
-            text_truncated = text[:4000] if len(text) > 4000 else text
-
-            # Generate embedding
-            embedding = self.model.encode(text_truncated)
-
-            return embedding.tolist()
+            return self.generate_embeddings([text])[0]
 
         except Exception as e:
             logger.error(f"Error generating embedding: {e}")
             return None
 
-    def process_item(self, episode_id, content):
-        """Process single item"""
+    def generate_embeddings(self, texts):
+        """
+        Generate embeddings for a whole batch in one encode() call
+
+        Long episodes are split into token windows; the windows of every
+        episode in the batch are encoded together and mean-pooled per episode.
+
+        Returns:
+            List of embeddings (list of floats), aligned with texts
+        """
+        vectors, chunk_counts = encode_chunked(self.model, texts, batch_size=ENCODE_BATCH_SIZE)
+        for count in chunk_counts:
+            embeddings_chunks_per_episode.labels(worker=self.worker_id).observe(count)
+        return [vector.tolist() for vector in vectors]
+
+    def process_batch(self, items):
+        """
+        Process a claimed batch: one encode, one embedding UPDATE, one queue UPDATE
+
+        Rows that cannot be encoded or written fall back to the per-item
+        path, so a bad row gets its own retry/dead accounting without
+        failing the rest of the batch.
+
+        Returns:
+            Number of items processed successfully
+        """
+        start_time = time.time()
+
+        # Encode everything at once; isolate failures only if that fails
+        encoded = []
+        failed = []
+        try:
+            embeddings = self.generate_embeddings([content for _, content in items])
+            encoded = [(episode_id, embedding) for (episode_id, _), embedding in zip(items, embeddings)]
+        except Exception as e:
+            logger.warning(f"Batch encode failed ({e}), falling back to per-item encode")
+            failed = list(items)
+
+        processed = 0
+        if encoded:
+            try:
+                self.write_embeddings(encoded)
+                processed = len(encoded)
+                embeddings_processed_total.labels(worker=self.worker_id).inc(processed)
+
+                # Amortized per-embedding time (same metric as per-item path)
+                per_item = (time.time() - start_time) / processed
+                for _ in range(processed):
+                    embeddings_processing_duration_seconds.labels(worker=self.worker_id).observe(per_item)
+
+                logger.info(f"✓ Wrote {processed} embeddings in one batch")
+            except Exception as e:
+                logger.warning(f"Bulk write failed ({e}), falling back to per-item writes")
+                self.conn.rollback()
+                contents = dict(items)
+                for episode_id, embedding in encoded:
+                    if self.process_item(episode_id, contents[episode_id], embedding):
+                        processed += 1
+
+        for episode_id, content in failed:
+            if self.process_item(episode_id, content):
+                processed += 1
+
+        embeddings_batch_duration_seconds.labels(worker=self.worker_id).observe(time.time() - start_time)
+        return processed
+
+    def write_embeddings(self, encoded):
+        """
+        Write a batch of embeddings and mark their queue rows done (one transaction)
+
+        Args:
+            encoded: List of (episode_id, embedding) tuples
+        """
+        episode_ids = [episode_id for episode_id, _ in encoded]
+        vectors = ["[" + ",".join(map(str, embedding)) + "]" for _, embedding in encoded]  # pgvector text form
+
+        with self.conn.cursor() as cur:
+            cur.execute("""
+                UPDATE nexus_memory.zep_episodic_memory AS e
+                SET embedding = v.embedding::vector,
+                    embedding_version = %s
+                FROM unnest(%s::uuid[], %s::text[]) AS v(episode_id, embedding)
+                WHERE e.episode_id = v.episode_id
+            """, (EMBEDDING_VERSION, episode_ids, vectors))
+
+            # clock_timestamp(), not NOW() (transaction start): the LAB_005 graph
+            # sync pages on processed_at and only re-reads LAB005_SYNC_LAG_SECONDS
+            cur.execute("""
+                UPDATE memory_system.embeddings_queue
+                SET state = 'done',
+                    processed_at = clock_timestamp()
+                WHERE episode_id = ANY(%s)
+                RETURNING EXTRACT(EPOCH FROM (clock_timestamp() - enqueued_at))
+            """, (episode_ids,))
+            latencies = [row[0] for row in cur.fetchall()]
+
+        self.conn.commit()
+
+        for latency in latencies:
+            embeddings_insert_to_available_seconds.labels(worker=self.worker_id).observe(float(latency))
+
+    def process_item(self, episode_id, content, embedding=None):
+        """Process single item (optionally with a precomputed embedding)"""
         start_time = time.time()
 
         try:
             # Generate embedding
-            embedding = self.generate_embedding(content)
+            if embedding is None:
+                embedding = self.generate_embedding(content)
 
             if embedding is None:
                 raise Exception("Embedding generation failed")
@@ -187,16 +477,21 @@ class EmbeddingsWorker:
                 cur.execute("""
                     UPDATE memory_system.embeddings_queue
                     SET state = 'done',
-                        processed_at = NOW()
+                        processed_at = clock_timestamp()
                     WHERE episode_id = %s
+                    RETURNING EXTRACT(EPOCH FROM (clock_timestamp() - enqueued_at))
                 """, (episode_id,))
+                latency = cur.fetchone()
 
             self.conn.commit()
 
+            if latency:
+                embeddings_insert_to_available_seconds.labels(worker=self.worker_id).observe(float(latency[0]))
+
             # Record metrics
             duration = time.time() - start_time
-            embeddings_processing_duration_seconds.observe(duration)
-            embeddings_processed_total.inc()
+            embeddings_processing_duration_seconds.labels(worker=self.worker_id).observe(duration)
+            embeddings_processed_total.labels(worker=self.worker_id).inc()
 
             logger.info(f"✓ Processed episode {episode_id}")
             return True
@@ -206,7 +501,7 @@ class EmbeddingsWorker:
             self.conn.rollback()
 
             # Record failure metric
-            embeddings_failed_total.inc()
+            embeddings_failed_total.labels(worker=self.worker_id).inc()
 
             # Increment retry count
             is_dead = False
@@ -231,7 +526,7 @@ class EmbeddingsWorker:
 
                 # Track dead letter queue
                 if is_dead:
-                    embeddings_dead_total.inc()
+                    embeddings_dead_total.labels(worker=self.worker_id).inc()
 
             except Exception as retry_error:
                 logger.error(f"Error updating retry count: {retry_error}")
@@ -242,25 +537,30 @@ class EmbeddingsWorker:
     def run(self):
         """Main worker loop"""
         logger.info("=" * 60)
-        logger.info("NEXUS Embeddings Worker V2.0.0 - Starting")
+        logger.info(f"NEXUS Embeddings Worker V2.0.0 - Starting (worker {self.worker_id}, pid {os.getpid()})")
         logger.info("=" * 60)
 
+        signal.signal(signal.SIGTERM, self.stop)
+
         if not self.initialize():
             logger.error("Worker initialization failed. Exiting.")
-            return
+            return False
 
-        # Start Prometheus metrics server
-        try:
-            start_http_server(METRICS_PORT)
-            logger.info(f"✓ Prometheus metrics server started on port {METRICS_PORT}")
-        except Exception as e:
-            logger.warning(f"Could not start metrics server: {e}")
+        # Start Prometheus metrics server (the supervisor serves it in multi-process mode)
+        if self.serve_metrics:
+            try:
+                start_http_server(METRICS_PORT)
+                logger.info(f"✓ Prometheus metrics server started on port {METRICS_PORT}")
+            except Exception as e:
+                logger.warning(f"Could not start metrics server: {e}")
 
         logger.info(f"Worker configuration:")
-        logger.info(f"  - Poll interval: {POLL_INTERVAL}s")
+        logger.info(f"  - Wakeup: LISTEN {QUEUE_NOTIFY_CHANNEL} (fallback poll {FALLBACK_POLL_INTERVAL}s, no-LISTEN poll {POLL_INTERVAL}s)")
         logger.info(f"  - Batch size: {BATCH_SIZE}")
+        logger.info(f"  - Encode batch size: {ENCODE_BATCH_SIZE} (batch encode: {BATCH_ENCODE})")
+        logger.info(f"  - Chunking: {EMBEDDINGS_CHUNK_SIZE} tokens, {EMBEDDINGS_CHUNK_OVERLAP} overlap")
         logger.info(f"  - Max retries: {MAX_RETRIES}")
-        logger.info(f"  - Model: {EMBEDDINGS_MODEL}")
+        logger.info(f"  - Model: {EMBEDDINGS_MODEL} (backend: {EMBEDDINGS_BACKEND})")
         logger.info(f"  - Metrics port: {METRICS_PORT}")
         logger.info("=" * 60)
         logger.info("Worker ready. Polling for pending items...")
@@ -272,36 +572,194 @@ class EmbeddingsWorker:
 
                 if items:
                     # Record batch size metric
-                    embeddings_batch_size.set(len(items))
+                    embeddings_batch_size.labels(worker=self.worker_id).set(len(items))
 
                     logger.info(f"Processing {len(items)} items...")
 
-                    for episode_id, content in items:
-                        self.process_item(episode_id, content)
+                    if BATCH_ENCODE:
+                        processed = self.process_batch(items)
+                    else:
+                        processed = sum(1 for episode_id, content in items if self.process_item(episode_id, content))
 
-                    logger.info(f"✓ Batch processed ({len(items)} items)")
+                    logger.info(f"✓ Batch processed ({processed}/{len(items)} items)")
                 else:
                     # No items, reset batch size
-                    embeddings_batch_size.set(0)
-                    # Sleep
-                    time.sleep(POLL_INTERVAL)
+                    embeddings_batch_size.labels(worker=self.worker_id).set(0)
+                    # Block until NOTIFY (or fallback poll)
+                    self.wait_for_work()
 
             except KeyboardInterrupt:
                 logger.info("Shutdown signal received")
                 self.running = False
             except Exception as e:
                 logger.error(f"Worker error: {e}")
-                time.sleep(POLL_INTERVAL * 2)  # Back off on error
+                select.select([self._stop_r], [], [], POLL_INTERVAL * 2)  # Back off on error
 
         # Cleanup
+        if self.listen_conn:
+            self.listen_conn.close()
         if self.conn:
             self.conn.close()
 
         logger.info("Worker stopped")
+        return True
+
+
+# ============================================
+# Supervisor (multi-process mode)
+# ============================================
+class WorkerSupervisor:
+    """
+    Load the model once, fork N EmbeddingsWorker processes and keep them alive
+
+    Args:
+        num_workers: Worker processes to run
+    """
+
+    def __init__(self, num_workers: int = WORKER_PROCESSES):
+        self.num_workers = num_workers
+        self.threads_per_worker = THREADS_PER_WORKER or max(1, (os.cpu_count() or 1) // num_workers)
+        self.model = None
+        self.children = {}  # pid -> worker index
+        self.started_at = {}  # worker index -> last fork time
+        self.backoff = {}  # worker index -> restart delay
+        self.restart_at = {}  # worker index -> time its restart is due
+        self.stopping = False
+
+    def spawn(self, index: int):
+        """Fork one worker; the child inherits the loaded model copy-on-write"""
+        pid = os.fork()
+        if pid == 0:
+            signal.signal(signal.SIGINT, signal.SIG_IGN)  # Ctrl+C is handled by the supervisor
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            exit_code = 1
+            try:
+                # One intra-op thread pool per core share, so N workers don't oversubscribe
+                self.model.set_num_threads(self.threads_per_worker)
+
+                worker = EmbeddingsWorker(worker_id=str(index), model=self.model, serve_metrics=False)
+                exit_code = 0 if worker.run() else 1
+            except Exception as e:
+                logger.error(f"Worker {index} crashed: {e}")
+            finally:
+                logging.shutdown()
+                os._exit(exit_code)
+
+        self.children[pid] = index
+        self.started_at[index] = time.time()
+        embeddings_worker_processes_alive.set(len(self.children))
+        logger.info(f"✓ Worker {index} started (pid {pid})")
+
+    def request_stop(self, signum, _frame):
+        """Forward SIGTERM to workers; they finish their claimed batch and exit"""
+        if not self.stopping:
+            logger.info(f"Signal {signum} received - draining {len(self.children)} workers")
+        self.stopping = True
+        for pid in list(self.children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    def reap(self, pid: int, status: int):
+        """Handle one exited worker: clean its metrics and restart it unless stopping"""
+        index = self.children.pop(pid, None)
+        multiprocess.mark_process_dead(pid)
+        embeddings_worker_processes_alive.set(len(self.children))
+        if index is None or self.stopping:
+            return
+
+        exit_code = os.waitstatus_to_exitcode(status)
+        uptime = time.time() - self.started_at.get(index, 0)
+        # Crash loops (e.g. database down) back off exponentially, healthy runs reset it
+        delay = WORKER_RESTART_BACKOFF if uptime > 60 else min(60.0, self.backoff.get(index, WORKER_RESTART_BACKOFF / 2) * 2)
+        self.backoff[index] = delay
+
+        logger.warning(f"Worker {index} (pid {pid}) exited with {exit_code} after {uptime:.0f}s - restarting in {delay:.0f}s")
+        embeddings_worker_restarts_total.labels(worker=str(index)).inc()
+        # Spawned from run()'s loop, so other exits are reaped during the backoff
+        self.restart_at[index] = time.time() + delay
+
+    def spawn_due(self):
+        """Restart the workers whose backoff has elapsed (none once stopping)"""
+        if self.stopping:
+            self.restart_at.clear()
+            return
+        now = time.time()
+        for index, due in list(self.restart_at.items()):
+            if due <= now:
+                del self.restart_at[index]
+                self.spawn(index)
+
+    def run(self):
+        """Supervisor main loop"""
+        logger.info("=" * 60)
+        logger.info(f"NEXUS Embeddings Supervisor V2.0.0 - {self.num_workers} workers "
+                    f"x {self.threads_per_worker} threads")
+        logger.info("=" * 60)
+
+        logger.info(f"Loading embeddings model: {EMBEDDINGS_MODEL} (backend: {EMBEDDINGS_BACKEND})")
+        self.model = load_embedding_backend(EMBEDDINGS_BACKEND, EMBEDDINGS_MODEL)
+        logger.info("✓ Model loaded successfully (shared with workers copy-on-write)")
+
+        # Move everything allocated so far to the permanent generation, so the
+        # cyclic GC in the children doesn't touch (and un-share) model pages
+        gc.collect()
+        gc.freeze()
+
+        # Aggregated /metrics for all workers; series carry worker="<index>"
+        try:
+            registry = CollectorRegistry()
+            multiprocess.MultiProcessCollector(registry)
+            start_http_server(METRICS_PORT, registry=registry)
+            logger.info(f"✓ Prometheus metrics server started on port {METRICS_PORT}")
+        except Exception as e:
+            logger.warning(f"Could not start metrics server: {e}")
+
+        signal.signal(signal.SIGTERM, self.request_stop)
+        signal.signal(signal.SIGINT, self.request_stop)
+
+        for index in range(self.num_workers):
+            self.spawn(index)
+
+        drain_deadline = None
+        while self.children or (self.restart_at and not self.stopping):
+            if self.stopping and drain_deadline is None:
+                drain_deadline = time.time() + WORKER_DRAIN_TIMEOUT
+
+            if drain_deadline is not None and time.time() > drain_deadline:
+                logger.warning(f"Drain timeout - killing {len(self.children)} workers")
+                for pid in list(self.children):
+                    try:
+                        os.kill(pid, signal.SIGKILL)
+                    except ProcessLookupError:
+                        pass
+                drain_deadline = float("inf")
+
+            self.spawn_due()
+            if not self.children:
+                time.sleep(0.5)  # Every worker is waiting out its backoff
+                continue
+
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                break
+            if pid == 0:
+                time.sleep(0.5)
+                continue
+            self.reap(pid, status)
+
+        logger.info("Supervisor stopped")
+
 
 # ============================================
 # Main
 # ============================================
 if __name__ == "__main__":
-    worker = EmbeddingsWorker()
-    worker.run()
+    if WORKER_PROCESSES > 1:
+        WorkerSupervisor(WORKER_PROCESSES).run()
+    else:
+        worker = EmbeddingsWorker()
+        signal.signal(signal.SIGINT, worker.stop)
+        worker.run()
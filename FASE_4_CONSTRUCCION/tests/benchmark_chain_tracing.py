@@ -0,0 +1,174 @@
+"""
+Backward chain tracing benchmark for NEXUS Cerebro (LAB_003)
+Indexed trace_breakthrough_chains vs the previous per-breakthrough day scan
+
+- Bursty synthetic days of 1k-100k episodes: 16 conversations (30 min of
+  activity every 90 min), session_id = conversation for 60% of episodes,
+  0-3 tags from a 200-tag vocabulary, optional embeddings
+- Breakthroughs: top 20% by identify_breakthroughs (same for both paths)
+- Legacy: the previous implementation (scan all episodes per breakthrough,
+  sort the window, pairwise cosine_similarity). Above --legacy-full
+  episodes it runs on a random sample of breakthroughs and is
+  extrapolated; the sampled chains are still compared with the new ones
+- Chains are compared for identity (same episodes, same order)
+
+A chain always contains the breakthrough's own conversation up to it
+(gaps under 1 hour), so the output grows with conversation length; a day
+without gaps over an hour makes every chain its whole 12-hour window.
+
+Usage:
+    python tests/benchmark_chain_tracing.py [--sizes 1000 10000 100000] [--embedding-dim 0]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'api'))
+
+from consolidation_engine import ConsolidationEngine, Episode
+
+# Configuration
+CONVERSATIONS = 16
+CONVERSATION_SPACING = timedelta(minutes=90)
+CONVERSATION_LENGTH_S = 30 * 60
+TAG_VOCABULARY = [f"tag-{i}" for i in range(200)]
+LEGACY_SAMPLE = 100
+
+
+def bursty_day(n, embedding_dim=0, seed=42):
+    rng = random.Random(seed)
+    start = datetime(2025, 11, 3)
+    rows = []
+    for _ in range(n):
+        conversation = rng.randrange(CONVERSATIONS)
+        created_at = start + conversation * CONVERSATION_SPACING + timedelta(
+            seconds=rng.uniform(0, CONVERSATION_LENGTH_S))
+        rows.append((created_at, conversation))
+    rows.sort()
+    return [
+        Episode(
+            episode_id=f"ep-{i}",
+            content=f"episode {i}",
+            embedding=[rng.gauss(0, 1) for _ in range(embedding_dim)],
+            created_at=created_at,
+            session_id=f"conversation-{conversation}" if rng.random() < 0.6 else None,
+            tags=rng.sample(TAG_VOCABULARY, rng.randrange(4)),
+            importance_score=rng.random(),
+            salience_score=rng.random(),
+            emotional_8d={'joy': rng.random(), 'trust': rng.random(),
+                          'anticipation': rng.random(), 'surprise': rng.random()},
+            somatic_7d={'valence': rng.uniform(-1, 1)}
+        )
+        for i, (created_at, conversation) in enumerate(rows)
+    ]
+
+
+def legacy_trace(engine, breakthroughs, all_episodes):
+    """Previous ConsolidationEngine.trace_breakthrough_chains"""
+    chains = []
+    for breakthrough in breakthroughs:
+        chain = [breakthrough]
+        current_time = breakthrough.created_at
+        window_start = current_time - timedelta(hours=12)
+        candidates = [e for e in all_episodes if window_start <= e.created_at < current_time]
+        candidates.sort(key=lambda x: x.created_at, reverse=True)
+        for candidate in candidates:
+            is_related = False
+            if (candidate.session_id and breakthrough.session_id and
+                    candidate.session_id == breakthrough.session_id):
+                is_related = True
+            if candidate.embedding and breakthrough.embedding:
+                if engine.cosine_similarity(candidate.embedding, breakthrough.embedding) > 0.65:
+                    is_related = True
+            if len(set(candidate.tags) & set(breakthrough.tags)) >= 2:
+                is_related = True
+            if (current_time - candidate.created_at).total_seconds() < 3600:
+                is_related = True
+            if is_related:
+                chain.insert(0, candidate)
+                current_time = candidate.created_at
+        if len(chain) >= 2:
+            chains.append(chain)
+    return chains
+
+
+def chain_ids(chains):
+    return [[e.episode_id for e in chain] for chain in chains]
+
+
+def benchmark_size(n, embedding_dim, legacy_full):
+    print(f"\n{'='*60}")
+    print(f"BENCHMARK: Chain tracing ({n:,} episodes, embedding dim {embedding_dim})")
+    print(f"{'='*60}")
+
+    engine = ConsolidationEngine()
+    episodes = bursty_day(n, embedding_dim)
+    breakthroughs = engine.identify_breakthroughs(episodes)
+
+    start = time.perf_counter()
+    chains = engine.trace_breakthrough_chains(breakthroughs, episodes)
+    indexed_s = time.perf_counter() - start
+    members = sum(len(chain) for chain in chains)
+
+    if n <= legacy_full:
+        sample = breakthroughs
+    else:
+        sample = random.Random(7).sample(breakthroughs, min(LEGACY_SAMPLE, len(breakthroughs)))
+    start = time.perf_counter()
+    expected = legacy_trace(engine, sample, episodes)
+    legacy_s = (time.perf_counter() - start) * len(breakthroughs) / len(sample)
+
+    if sample is breakthroughs:
+        identical = chain_ids(chains) == chain_ids(expected)
+    else:
+        identical = chain_ids(engine.trace_breakthrough_chains(sample, episodes)) == chain_ids(expected)
+
+    extrapolated = " (extrapolated)" if sample is not breakthroughs else ""
+    print(f"  Breakthroughs: {len(breakthroughs):,}  chains: {len(chains):,}  "
+          f"chain members: {members:,}  identical: {identical}")
+    print(f"  Legacy:  {legacy_s:.2f}s{extrapolated}")
+    print(f"  Indexed: {indexed_s:.3f}s  ({legacy_s / indexed_s:.0f}x)")
+
+    return {
+        "episodes": n,
+        "embedding_dim": embedding_dim,
+        "breakthroughs": len(breakthroughs),
+        "chains": len(chains),
+        "chain_members": members,
+        "identical": identical,
+        "legacy_s": legacy_s,
+        "legacy_extrapolated": sample is not breakthroughs,
+        "indexed_s": indexed_s
+    }
+
+
+def run_all_benchmarks(sizes, embedding_dim, legacy_full):
+    results = {
+        "timestamp": datetime.now().isoformat(),
+        "conversations": CONVERSATIONS,
+        "sizes": [benchmark_size(n, embedding_dim, legacy_full) for n in sizes]
+    }
+
+    filename = f"benchmark_chain_tracing_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(filename, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResults saved to: {filename}")
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="LAB_003 backward chain tracing benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--embedding-dim", type=int, default=0,
+                        help="0 = no embeddings (what the nightly fetch provides)")
+    parser.add_argument("--legacy-full", type=int, default=10_000,
+                        help="Largest day traced in full by the legacy path")
+    args = parser.parse_args()
+
+    run_all_benchmarks(args.sizes, args.embedding_dim, args.legacy_full)
@@ -0,0 +1,188 @@
+"""
+Consolidation scoring benchmark for NEXUS Cerebro (LAB_003)
+Columnar breakthrough scoring + chain boosts vs the object-by-object path
+
+- Synthetic days of 10k-100k episodes with LAB_001 emotional / somatic
+  dicts and LAB_004 novelty scores
+- Legacy: the previous per-Episode scoring loop (dict lookups per episode),
+  percentile threshold over a Python list, consolidate_chain per chain
+- Columnar: EpisodeColumns.from_episodes (counted), identify_breakthroughs
+  and consolidate_chains over the arrays
+- Chains are synthetic (up to 8 preceding episodes per breakthrough) so
+  chain tracing does not dominate; both paths get the same chains
+- Results are checked for identical scores and boosts
+
+Usage:
+    python tests/benchmark_consolidation.py [--sizes 10000 50000 100000]
+"""
+
+import argparse
+import copy
+import json
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'api'))
+
+from consolidation_engine import ConsolidationEngine, Episode, EpisodeColumns
+
+# Configuration
+MAX_CHAIN_PRECURSORS = 8
+PRECURSOR_WINDOW = 50  # Precursors drawn from this many preceding episodes
+
+
+def synthetic_day(n, seed=42):
+    rng = random.Random(seed)
+    start = datetime(2025, 11, 3)
+    offsets = sorted(rng.uniform(0, 86_400) for _ in range(n))
+    return [
+        Episode(
+            episode_id=f"ep-{i}",
+            content=f"episode {i}",
+            embedding=[],
+            created_at=start + timedelta(seconds=offset),
+            session_id=None,
+            tags=[],
+            importance_score=rng.random(),
+            salience_score=rng.random(),
+            emotional_8d={d: rng.random() for d in ('joy', 'trust', 'fear', 'surprise', 'sadness',
+                                                    'disgust', 'anger', 'anticipation')},
+            somatic_7d={d: rng.random() for d in ('valence', 'arousal', 'body_state', 'cognitive_load',
+                                                  'emotional_regulation', 'social_engagement',
+                                                  'temporal_awareness')},
+            novelty_score=rng.random()
+        )
+        for i, offset in enumerate(offsets)
+    ]
+
+
+def legacy_identify_breakthroughs(episodes, threshold_percentile=80):
+    """Previous ConsolidationEngine.identify_breakthroughs (per-episode loop)"""
+    has_novelty = any(ep.novelty_score > 0 for ep in episodes)
+    for episode in episodes:
+        score = 0.0
+        breakthrough_emotions = ['joy', 'trust', 'anticipation', 'surprise']
+        emotion_sum = sum(episode.emotional_8d.get(e, 0) for e in breakthrough_emotions)
+        valence = episode.somatic_7d.get('valence', 0)
+        if has_novelty:
+            score += episode.salience_score * 0.35
+            score += (emotion_sum / 4) * 0.20
+            score += max(0, valence) * 0.15
+            score += episode.importance_score * 0.15
+            score += episode.novelty_score * 0.15
+        else:
+            score += episode.salience_score * 0.4
+            score += (emotion_sum / 4) * 0.25
+            score += max(0, valence) * 0.15
+            score += episode.importance_score * 0.20
+        episode.breakthrough_score = score
+
+    scores = [e.breakthrough_score for e in episodes]
+    threshold = np.percentile(scores, threshold_percentile)
+    breakthroughs = [e for e in episodes if e.breakthrough_score >= threshold]
+    breakthroughs.sort(key=lambda x: x.breakthrough_score, reverse=True)
+    return breakthroughs
+
+
+def synthetic_chains(episodes, breakthrough_ids, seed=7):
+    """Index chains: precursor positions + breakthrough position"""
+    rng = random.Random(seed)
+    position = {ep.episode_id: i for i, ep in enumerate(episodes)}
+    chains = []
+    for episode_id in breakthrough_ids:
+        end = position[episode_id]
+        window = range(max(0, end - PRECURSOR_WINDOW), end)
+        count = min(len(window), rng.randrange(MAX_CHAIN_PRECURSORS + 1))
+        chains.append(sorted(rng.sample(window, count)) + [end])
+    return chains
+
+
+def benchmark_size(n):
+    print(f"\n{'='*60}")
+    print(f"BENCHMARK: Breakthrough scoring + chain boosts ({n:,} episodes)")
+    print(f"{'='*60}")
+
+    engine = ConsolidationEngine()
+    legacy_episodes = synthetic_day(n)
+    columnar_episodes = copy.deepcopy(legacy_episodes)
+
+    start = time.perf_counter()
+    legacy_breakthroughs = legacy_identify_breakthroughs(legacy_episodes)
+    legacy_scoring_s = time.perf_counter() - start
+
+    chain_positions = synthetic_chains(legacy_episodes, [b.episode_id for b in legacy_breakthroughs])
+
+    start = time.perf_counter()
+    for positions in chain_positions:
+        engine.consolidate_chain([legacy_episodes[i] for i in positions])
+    legacy_boost_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    columns = EpisodeColumns.from_episodes(columnar_episodes)
+    columns_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    breakthroughs = engine.identify_breakthroughs(columnar_episodes, columns=columns)
+    scoring_s = time.perf_counter() - start
+
+    chains = [[columnar_episodes[i] for i in positions] for positions in chain_positions]
+    start = time.perf_counter()
+    engine.consolidate_chains(chains, columns)
+    boost_s = time.perf_counter() - start
+
+    identical = (
+        [b.episode_id for b in breakthroughs] == [b.episode_id for b in legacy_breakthroughs]
+        and all(a.breakthrough_score == b.breakthrough_score
+                and a.consolidated_salience_score == b.consolidated_salience_score
+                and a.importance_score == b.importance_score
+                for a, b in zip(columnar_episodes, legacy_episodes))
+    )
+    legacy_total = legacy_scoring_s + legacy_boost_s
+    columnar_total = columns_s + scoring_s + boost_s
+
+    print(f"  Breakthroughs: {len(breakthroughs):,}  chains: {len(chains):,}  identical: {identical}")
+    print(f"  Legacy:   scoring {legacy_scoring_s*1000:.1f}ms  boosts {legacy_boost_s*1000:.1f}ms  "
+          f"total {legacy_total*1000:.1f}ms")
+    print(f"  Columnar: columns {columns_s*1000:.1f}ms  scoring {scoring_s*1000:.1f}ms  "
+          f"boosts {boost_s*1000:.1f}ms  total {columnar_total*1000:.1f}ms  "
+          f"({legacy_total / columnar_total:.1f}x)")
+
+    return {
+        "episodes": n,
+        "breakthroughs": len(breakthroughs),
+        "chains": len(chains),
+        "identical": identical,
+        "legacy_scoring_ms": legacy_scoring_s * 1000,
+        "legacy_boost_ms": legacy_boost_s * 1000,
+        "columns_ms": columns_s * 1000,
+        "columnar_scoring_ms": scoring_s * 1000,
+        "columnar_boost_ms": boost_s * 1000,
+        "speedup": legacy_total / columnar_total
+    }
+
+
+def run_all_benchmarks(sizes):
+    results = {
+        "timestamp": datetime.now().isoformat(),
+        "sizes": [benchmark_size(n) for n in sizes]
+    }
+
+    filename = f"benchmark_consolidation_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(filename, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResults saved to: {filename}")
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="LAB_003 consolidation scoring benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 50_000, 100_000])
+    args = parser.parse_args()
+
+    run_all_benchmarks(args.sizes)
@@ -0,0 +1,151 @@
+"""
+Parallel backfill benchmark for NEXUS Cerebro (LAB_003)
+ConsolidationEngine.consolidate_date_range across 1..N worker processes
+
+- A 90-day backfill of bursty synthetic days (16 conversations, sessions,
+  tags, LAB_001 scores), generated inside each worker by BackfillEngine
+  instead of fetched, so the run needs no database
+- Write-back is skipped (counted only): this measures the CPU-bound part
+  that the process pool parallelises; with a real database each worker
+  also spends its fetch / COPY time on its own connection
+- Reports days/min, episodes/sec and the speedup over one worker; the
+  speedup is bounded by the cores available (printed with the results)
+
+Usage:
+    python tests/benchmark_consolidation_backfill.py [--days 90] [--episodes-per-day 5000] [--workers 1 2 4]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'api'))
+
+from consolidation_engine import ConsolidationEngine, Episode
+
+# Configuration
+CONVERSATIONS = 16
+CONVERSATION_SPACING = timedelta(minutes=90)
+CONVERSATION_LENGTH_S = 30 * 60
+TAG_VOCABULARY = [f"tag-{i}" for i in range(200)]
+START_DAY = date(2025, 8, 1)
+
+
+def bursty_day(day, n):
+    rng = random.Random(day.toordinal())
+    start = datetime.combine(day, datetime.min.time())
+    rows = []
+    for _ in range(n):
+        conversation = rng.randrange(CONVERSATIONS)
+        created_at = start + conversation * CONVERSATION_SPACING + timedelta(
+            seconds=rng.uniform(0, CONVERSATION_LENGTH_S))
+        rows.append((created_at, conversation))
+    rows.sort()
+    return [
+        Episode(
+            episode_id=f"{day.isoformat()}-{i}",
+            content=f"episode {i}",
+            embedding=[],
+            created_at=created_at,
+            session_id=f"conversation-{conversation}" if rng.random() < 0.6 else None,
+            tags=rng.sample(TAG_VOCABULARY, rng.randrange(4)),
+            importance_score=rng.random(),
+            salience_score=rng.random(),
+            emotional_8d={'joy': rng.random(), 'trust': rng.random(),
+                          'anticipation': rng.random(), 'surprise': rng.random()},
+            somatic_7d={'valence': rng.uniform(-1, 1)}
+        )
+        for i, (created_at, conversation) in enumerate(rows)
+    ]
+
+
+class BackfillEngine(ConsolidationEngine):
+    """Generated days, no connection, write-back counted only"""
+
+    episodes_per_day = int(os.getenv("BACKFILL_EPISODES_PER_DAY", "5000"))
+
+    def connect(self):
+        pass
+
+    def close(self):
+        pass
+
+    def read_checkpoint_version(self, day):
+        return 0
+
+    def fetch_episodes_from_date(self, target_date):
+        return bursty_day(target_date.date(), self.episodes_per_day)
+
+    def fetch_old_important_memories(self, sample_size, days_back=7):
+        return []
+
+    def write_consolidation_results(self, episodes, traces, checkpoint=None, day=None):
+        return len({ep.episode_id for ep in episodes}), len(traces)
+
+
+def benchmark_workers(workers, days):
+    print(f"\n{'='*60}")
+    print(f"BENCHMARK: {days}-day backfill, {workers} worker(s)")
+    print(f"{'='*60}")
+
+    batch = BackfillEngine().consolidate_date_range(START_DAY, START_DAY + timedelta(days=days), workers=workers)
+
+    print(f"  Days: {batch.days_processed}  failed: {len(batch.days_failed)}  "
+          f"episodes: {batch.episodes_processed:,}  traces: {batch.trace_count:,}")
+    print(f"  Wall: {batch.wall_seconds:.1f}s  {batch.days_per_minute:.1f} days/min  "
+          f"{batch.episodes_per_second:,.0f} episodes/sec")
+
+    return {
+        "workers": batch.workers,
+        "days": batch.days_processed,
+        "days_failed": len(batch.days_failed),
+        "episodes": batch.episodes_processed,
+        "traces": batch.trace_count,
+        "wall_s": batch.wall_seconds,
+        "days_per_minute": batch.days_per_minute,
+        "episodes_per_second": batch.episodes_per_second
+    }
+
+
+def run_all_benchmarks(days, episodes_per_day, workers):
+    # Read by the spawned workers' BackfillEngine as well
+    os.environ["BACKFILL_EPISODES_PER_DAY"] = str(episodes_per_day)
+    BackfillEngine.episodes_per_day = episodes_per_day
+
+    runs = [benchmark_workers(w, days) for w in workers]
+    baseline = runs[0]["wall_s"]
+    for run in runs:
+        run["speedup"] = baseline / run["wall_s"]
+
+    cpus = os.cpu_count()
+    print(f"\nCPUs available: {cpus}")
+    for run in runs:
+        print(f"  {run['workers']} worker(s): {run['speedup']:.2f}x")
+
+    results = {
+        "timestamp": datetime.now().isoformat(),
+        "cpus": cpus,
+        "days": days,
+        "episodes_per_day": episodes_per_day,
+        "runs": runs
+    }
+
+    filename = f"benchmark_consolidation_backfill_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(filename, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResults saved to: {filename}")
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="LAB_003 parallel consolidation backfill benchmark")
+    parser.add_argument("--days", type=int, default=90)
+    parser.add_argument("--episodes-per-day", type=int, default=5_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    args = parser.parse_args()
+
+    run_all_benchmarks(args.days, args.episodes_per_day, args.workers)
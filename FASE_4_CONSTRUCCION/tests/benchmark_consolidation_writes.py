@@ -0,0 +1,193 @@
+"""
+Consolidation write-back benchmark for NEXUS Cerebro (LAB_003)
+COPY-staged set-based writes vs the previous per-row UPDATE / INSERT loops
+
+- Needs a PostgreSQL with the nexus_memory schema and migration
+  008_memory_traces.sql applied (POSTGRES_* environment variables, same
+  defaults as consolidation_engine.py)
+- Each run seeds --updates synthetic episodes into zep_episodic_memory
+  with COPY, times the write-back, then ROLLS BACK: nothing is left behind
+- Legacy: one UPDATE ... metadata || jsonb_build_object(...) per episode,
+  the information_schema check, one INSERT per trace
+- Bulk: ConsolidationEngine.update_consolidated_scores + store_memory_traces
+  (temp tables filled by COPY, one UPDATE ... FROM, one INSERT ... SELECT)
+- Round-trip latency dominates the legacy path, so run it against the real
+  database host rather than a local socket to see production numbers
+
+Usage:
+    python tests/benchmark_consolidation_writes.py [--updates 10000] [--traces 50000] [--runs 3]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import uuid
+from datetime import datetime
+
+from psycopg.types.json import Json
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'api'))
+
+from consolidation_engine import ConsolidationEngine, Episode, MemoryTrace
+
+
+def synthetic_results(updates, traces, seed=42):
+    """Boosted episodes (with chain duplicates) and traces between them"""
+    rng = random.Random(seed)
+    episodes = [
+        Episode(
+            episode_id=str(uuid.UUID(int=rng.getrandbits(128))),
+            content=f"benchmark episode {i}",
+            embedding=[],
+            created_at=datetime(2025, 11, 3),
+            session_id=None,
+            tags=["benchmark"],
+            importance_score=rng.random(),
+            salience_score=rng.random(),
+            emotional_8d={},
+            somatic_7d={},
+            breakthrough_score=rng.random(),
+            consolidated_salience_score=rng.random()
+        )
+        for i in range(updates)
+    ]
+    boosted = episodes + rng.choices(episodes, k=updates // 4)  # Episodes in several chains
+    memory_traces = [
+        MemoryTrace(
+            source_episode_id=rng.choice(episodes).episode_id,
+            target_episode_id=rng.choice(episodes).episode_id,
+            trace_type=rng.choice(['initiator', 'progression', 'conclusion']),
+            strength=rng.random(),
+            narrative_id=f"chain_benchmark_{i // 8}"
+        )
+        for i in range(traces)
+    ]
+    return episodes, boosted, memory_traces
+
+
+def seed_episodes(engine, episodes):
+    with engine.cursor.copy("""
+        COPY nexus_memory.zep_episodic_memory (episode_id, content, importance_score, tags, metadata)
+        FROM STDIN
+    """) as copy:
+        for episode in episodes:
+            copy.write_row((episode.episode_id, episode.content, episode.importance_score,
+                            episode.tags, Json({"source": "benchmark"})))
+
+
+def legacy_write(engine, boosted, traces):
+    """Previous update_consolidated_scores + store_memory_traces, without the commits"""
+    for episode in boosted:
+        engine.cursor.execute("""
+            UPDATE nexus_memory.zep_episodic_memory
+            SET
+                metadata = metadata || jsonb_build_object(
+                    'consolidated_salience_score', %s,
+                    'breakthrough_score', %s,
+                    'last_consolidated_at', %s::text
+                ),
+                importance_score = %s
+            WHERE episode_id = %s
+        """, (
+            float(episode.consolidated_salience_score),
+            float(episode.breakthrough_score),
+            datetime.now().isoformat(),
+            float(episode.importance_score),
+            episode.episode_id
+        ))
+
+    engine.cursor.execute("""
+        SELECT EXISTS (
+            SELECT FROM information_schema.tables
+            WHERE table_schema = 'nexus_memory'
+              AND table_name = 'memory_traces'
+        )
+    """)
+    engine.cursor.fetchone()
+
+    for trace in traces:
+        engine.cursor.execute("""
+            INSERT INTO nexus_memory.memory_traces
+                (source_episode_id, target_episode_id, trace_type,
+                 strength, narrative_id, created_at)
+            VALUES (%s, %s, %s, %s, %s, %s)
+        """, (
+            trace.source_episode_id,
+            trace.target_episode_id,
+            trace.trace_type,
+            trace.strength,
+            trace.narrative_id,
+            trace.created_at
+        ))
+
+
+def bulk_write(engine, boosted, traces):
+    engine.update_consolidated_scores(boosted)
+    engine.store_memory_traces(traces)
+
+
+def timed_run(engine, write, episodes, boosted, traces):
+    """Seed, time the write-back (including the final flush), roll back"""
+    try:
+        seed_episodes(engine, episodes)
+        start = time.perf_counter()
+        write(engine, boosted, traces)
+        engine.cursor.execute("SELECT 1")  # Round trip after the last statement
+        return time.perf_counter() - start
+    finally:
+        engine.conn.rollback()
+
+
+def run_all_benchmarks(updates, traces, runs):
+    print(f"\n{'='*60}")
+    print(f"BENCHMARK: Consolidation write-back ({updates:,} episodes, {traces:,} traces)")
+    print(f"{'='*60}")
+
+    episodes, boosted, memory_traces = synthetic_results(updates, traces)
+
+    with ConsolidationEngine(
+        db_host=os.getenv('POSTGRES_HOST', 'localhost'),
+        db_port=int(os.getenv('POSTGRES_PORT', '5437')),
+        db_name=os.getenv('POSTGRES_DB', 'nexus_memory'),
+        db_user=os.getenv('POSTGRES_USER', 'nexus_superuser'),
+        db_password=os.getenv('POSTGRES_PASSWORD', '')
+    ) as engine:
+        legacy = [timed_run(engine, legacy_write, episodes, boosted, memory_traces) for _ in range(runs)]
+        bulk = [timed_run(engine, bulk_write, episodes, boosted, memory_traces) for _ in range(runs)]
+
+    legacy_s = min(legacy)
+    bulk_s = min(bulk)
+    print(f"  Boosted rows (with duplicates): {len(boosted):,}")
+    print(f"  Legacy: {legacy_s:.2f}s  ({len(boosted) + len(memory_traces) + 1:,} statements)")
+    print(f"  Bulk:   {bulk_s:.2f}s  ({legacy_s / bulk_s:.0f}x)")
+
+    results = {
+        "timestamp": datetime.now().isoformat(),
+        "episodes": updates,
+        "boosted_rows": len(boosted),
+        "traces": traces,
+        "runs": runs,
+        "legacy_s": legacy,
+        "bulk_s": bulk,
+        "speedup": legacy_s / bulk_s
+    }
+
+    filename = f"benchmark_consolidation_writes_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(filename, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResults saved to: {filename}")
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="LAB_003 consolidation write-back benchmark")
+    parser.add_argument("--updates", type=int, default=10_000)
+    parser.add_argument("--traces", type=int, default=50_000)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    run_all_benchmarks(args.updates, args.traces, args.runs)
@@ -0,0 +1,122 @@
+"""
+Embedding backend benchmark for NEXUS Cerebro V2.0.0
+Encode throughput and memory (RSS) of sentence-transformers vs ONNX vs ONNX int8
+
+Each backend runs in its own subprocess so RSS and load time are not
+polluted by the other backends' weights or runtime libraries.
+
+Usage:
+    python tests/benchmark_embedding_backends.py [--backends sentence-transformers onnx onnx-int8]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'api'))
+
+# Configuration
+NUM_TEXTS = 2000
+BATCH_SIZE = 32
+WARMUP_TEXTS = 64
+
+
+def rss_mb():
+    """Current and peak resident set size of this process (Linux)"""
+    values = {}
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith(("VmRSS:", "VmHWM:")):
+                key, value = line.split(":", 1)
+                values[key] = int(value.split()[0]) / 1024
+    return values.get("VmRSS", 0.0), values.get("VmHWM", 0.0)
+
+
+def synthetic_texts(count):
+    """Episode-like texts with a realistic length spread (short notes to paragraphs)"""
+    words = ("memory consolidation episode breakthrough api database embedding search "
+             "activation priming emotional somatic marker decay session context").split()
+    texts = []
+    for i in range(count):
+        length = 8 + (i * 37) % 180
+        texts.append(" ".join(words[(i + j) % len(words)] for j in range(length)))
+    return texts
+
+
+def run_backend(name):
+    """Child process: load one backend, measure, print JSON"""
+    from embedding_backends import load_embedding_backend
+
+    rss_before, _ = rss_mb()
+    start = time.perf_counter()
+    backend = load_embedding_backend(name)
+    texts = synthetic_texts(NUM_TEXTS)
+    backend.encode(texts[:WARMUP_TEXTS], batch_size=BATCH_SIZE)  # Session/graph init
+    load_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    backend.encode(texts, batch_size=BATCH_SIZE)
+    encode_seconds = time.perf_counter() - start
+    rss_after, rss_peak = rss_mb()
+
+    print(json.dumps({
+        "backend": name,
+        "load_seconds": load_seconds,
+        "texts": NUM_TEXTS,
+        "encode_seconds": encode_seconds,
+        "texts_per_second": NUM_TEXTS / encode_seconds,
+        "rss_baseline_mb": rss_before,
+        "rss_mb": rss_after,
+        "rss_peak_mb": rss_peak
+    }))
+
+
+def run_all_benchmarks(backends):
+    print(f"\n{'='*60}")
+    print(f"BENCHMARK: Embedding backends ({NUM_TEXTS} texts, batch {BATCH_SIZE})")
+    print(f"{'='*60}")
+
+    results = {"timestamp": datetime.now().isoformat(), "backends": []}
+    for name in backends:
+        proc = subprocess.run(
+            [sys.executable, __file__, "--child", name],
+            capture_output=True, text=True
+        )
+        if proc.returncode != 0:
+            print(f"  {name}: FAILED\n{proc.stderr.strip()[-2000:]}")
+            continue
+        result = json.loads(proc.stdout.strip().splitlines()[-1])
+        results["backends"].append(result)
+        print(f"  {name:<22} {result['texts_per_second']:>8.1f} texts/s   "
+              f"RSS {result['rss_mb']:>7.1f} MB (peak {result['rss_peak_mb']:.1f})   "
+              f"load {result['load_seconds']:.1f}s")
+
+    reference = next((r for r in results["backends"] if r["backend"] == "sentence-transformers"), None)
+    if reference:
+        print("\nRelative to sentence-transformers:")
+        for result in results["backends"]:
+            print(f"  {result['backend']:<22} {result['texts_per_second'] / reference['texts_per_second']:.2f}x throughput, "
+                  f"{result['rss_mb'] - reference['rss_mb']:+.1f} MB RSS")
+
+    filename = f"benchmark_embedding_backends_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(filename, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResults saved to: {filename}")
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Embedding backend throughput/RSS benchmark")
+    parser.add_argument("--backends", nargs="+", default=["sentence-transformers", "onnx", "onnx-int8"])
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_backend(args.child)
+    else:
+        run_all_benchmarks(args.backends)
@@ -0,0 +1,111 @@
+"""
+Graph snapshot benchmark for NEXUS Cerebro (LAB_005)
+Snapshot size, write time and restore time vs rebuilding the graph
+
+- Rebuild: SimilarityGraph.add_episodes over the corpus (what a restart
+  costs without a snapshot, before any database transfer)
+- Write: capture under the engine lock + atomic write (fsync + rename)
+- Restore: np.memmap open + uuid index + neighbour lists, then the first
+  get_related calls (page faults on the mapped matrix)
+
+Usage:
+    python tests/benchmark_graph_snapshot.py [--sizes 10000 50000] [--dir /tmp]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'api'))
+
+from graph_snapshot import load_engine_snapshot, save_engine_snapshot
+from spreading_activation import SpreadingActivationEngine
+
+from helpers import synthetic_embeddings
+
+# Configuration
+DIMENSION = 384
+NUM_CLUSTERS = 256
+SIMILARITY_THRESHOLD = 0.7
+ACTIVE_FRACTION = 0.05
+NUM_LOOKUPS = 1000
+VERSION = "miniLM-384-chunked@v2"
+
+
+def benchmark_size(n, directory):
+    print(f"\n{'='*60}")
+    print(f"BENCHMARK: Graph snapshot ({n:,} episodes, dim={DIMENSION})")
+    print(f"{'='*60}")
+
+    vectors = synthetic_embeddings(n, DIMENSION, NUM_CLUSTERS)
+    uuids = [f"{i:08x}-0000-4000-8000-000000000000" for i in range(n)]
+
+    engine = SpreadingActivationEngine(similarity_threshold=SIMILARITY_THRESHOLD)
+    start = time.perf_counter()
+    engine.add_episodes(uuids, vectors)
+    rebuild_seconds = time.perf_counter() - start
+    print(f"  Rebuild (add_episodes): {rebuild_seconds:.2f}s")
+
+    for i in range(0, n, int(1 / ACTIVE_FRACTION)):
+        engine.access_episode(uuids[i], "", vectors[i])
+    print(f"  Activation states: {len(engine.activation_manager.activations):,}")
+
+    path = os.path.join(directory, f"lab005_benchmark_{n}.snap")
+    written = save_engine_snapshot(engine, path, VERSION)
+    print(f"  Write: {written['seconds'] * 1000:.0f}ms, {written['bytes'] / 1e6:.1f} MB "
+          f"({written['bytes'] / n:.0f} bytes/episode)")
+
+    restored = SpreadingActivationEngine(similarity_threshold=SIMILARITY_THRESHOLD)
+    start = time.perf_counter()
+    load_engine_snapshot(restored, path, VERSION)
+    restore_seconds = time.perf_counter() - start
+    print(f"  Restore: {restore_seconds * 1000:.1f}ms")
+
+    rng = np.random.default_rng(7)
+    start = time.perf_counter()
+    for row in rng.integers(0, n, NUM_LOOKUPS):
+        restored.similarity_graph.get_related(uuids[row], top_k=5)
+    first_lookups_ms = (time.perf_counter() - start) * 1000 / NUM_LOOKUPS
+    print(f"  First {NUM_LOOKUPS} get_related after restore: {first_lookups_ms:.3f}ms avg")
+
+    os.unlink(path)
+    return {
+        "episodes": n,
+        "rebuild_seconds": rebuild_seconds,
+        "write_seconds": written["seconds"],
+        "snapshot_bytes": written["bytes"],
+        "restore_seconds": restore_seconds,
+        "first_lookup_ms": first_lookups_ms,
+        "restore_speedup": rebuild_seconds / restore_seconds
+    }
+
+
+def run_all_benchmarks(sizes, directory):
+    results = {
+        "timestamp": datetime.now().isoformat(),
+        "dimension": DIMENSION,
+        "similarity_threshold": SIMILARITY_THRESHOLD,
+        "sizes": [benchmark_size(n, directory) for n in sizes]
+    }
+
+    filename = f"benchmark_graph_snapshot_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(filename, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResults saved to: {filename}")
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="LAB_005 graph snapshot size/load benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 50_000])
+    parser.add_argument("--dir", default=tempfile.gettempdir(), help="Where snapshot files are written")
+    args = parser.parse_args()
+
+    run_all_benchmarks(args.sizes, args.dir)
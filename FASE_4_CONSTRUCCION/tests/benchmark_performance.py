@@ -3,6 +3,7 @@ Performance benchmarks for NEXUS Cerebro V2.0.0
 Measures throughput and latency for critical operations
 """
 
+import os
 import requests
 import time
 import statistics
@@ -210,64 +211,157 @@ def benchmark_semantic_search(num_queries=50):
     }
 
 
-def benchmark_embeddings_processing():
-    """Benchmark embeddings worker processing time"""
+def benchmark_embeddings_processing(num_episodes=200, max_wait=300):
+    """
+    Benchmark embeddings worker throughput (episodes embedded per second)
+
+    A/B: run once with the worker started with BATCH_ENCODE=false (legacy
+    per-item encode + UPDATE + commit) and once with BATCH_ENCODE=true
+    (one encode() per claimed batch, bulk UPDATE, one queue UPDATE).
+    The worker mode is reported as WORKER_MODE in the results.
+
+    Supervisor scaling: repeat with WORKER_PROCESSES=1, 2, 4, ... on the
+    worker and WORKER_MODE=procs-<n> here to check throughput per core.
+    """
+    worker_mode = os.getenv("WORKER_MODE", "batch")
+
     print(f"\n{'='*60}")
-    print(f"BENCHMARK: Embeddings Worker Processing")
+    print(f"BENCHMARK: Embeddings Worker Processing ({num_episodes} episodes, mode={worker_mode})")
     print(f"{'='*60}")
 
-    # Create test episode
-    payload = {
-        "action_type": "benchmark_embeddings",
-        "action_details": {
-            "message": "Benchmark embeddings worker processing time end-to-end",
-            "importance_score": 0.9
-        },
-        "context_state": {"benchmark": "embeddings"},
-        "tags": ["benchmark", "embeddings"]
-    }
+    def done_count():
+        stats_response = requests.get(f"{API_BASE_URL}/stats", timeout=TIMEOUT)
+        if stats_response.status_code != 200:
+            return None
+        return stats_response.json()["stats"].get("embeddings_queue", {}).get("done", 0)
+
+    baseline_done = done_count()
+    if baseline_done is None:
+        print("  ERROR: /stats unavailable")
+        return None
+
+    # Create test episodes in one bulk call so ingest time does not dominate
+    body = "\n".join(
+        json.dumps({
+            "action_type": "benchmark_embeddings",
+            "action_details": {
+                "message": f"Benchmark embeddings worker throughput episode {i} ({worker_mode})",
+                "importance_score": 0.9
+            },
+            "context_state": {"benchmark": "embeddings", "mode": worker_mode},
+            "tags": ["benchmark", "embeddings"]
+        })
+        for i in range(num_episodes)
+    )
 
     create_start = time.time()
     response = requests.post(
-        f"{API_BASE_URL}/memory/action",
-        json=payload,
-        timeout=TIMEOUT
+        f"{API_BASE_URL}/memory/actions/bulk",
+        data=body.encode("utf-8"),
+        headers={"Content-Type": "application/x-ndjson"},
+        timeout=max(TIMEOUT, 120)
     )
     create_end = time.time()
 
     if response.status_code != 200:
-        print("  ERROR: Failed to create episode")
+        print("  ERROR: Failed to create episodes")
         return None
 
-    episode_id = response.json()["episode_id"]
-    print(f"  Episode created: {episode_id}")
+    print(f"  {num_episodes} episodes created in {(create_end - create_start)*1000:.2f}ms")
 
-    # Poll for embedding completion
-    max_wait = 30  # seconds
-    poll_interval = 1
-    start_wait = time.time()
+    # Poll until the worker has embedded all of them
+    poll_interval = 0.5
+    processed = 0
 
-    while time.time() - start_wait < max_wait:
-        stats_response = requests.get(f"{API_BASE_URL}/stats", timeout=TIMEOUT)
-        if stats_response.status_code == 200:
-            stats = stats_response.json()["stats"]
-            queue = stats.get("embeddings_queue", {})
+    while time.time() - create_end < max_wait:
+        current_done = done_count()
+        if current_done is not None:
+            processed = current_done - baseline_done
+            if processed >= num_episodes:
+                break
+        time.sleep(poll_interval)
 
-            if queue.get("done", 0) > 0:
-                processing_time = time.time() - create_start
-                print(f"\n  Embedding processed!")
-                print(f"  Total time (create + process): {processing_time:.2f}s")
-                print(f"  Episode creation time: {(create_end - create_start)*1000:.2f}ms")
+    processing_time = time.time() - create_end
+    throughput = processed / processing_time if processing_time > 0 else 0
 
-                return {
-                    "total_time": processing_time,
-                    "creation_time": (create_end - create_start) * 1000
-                }
+    if processed < num_episodes:
+        print(f"  WARNING: only {processed}/{num_episodes} embedded within {max_wait}s")
 
-        time.sleep(poll_interval)
+    print(f"\nResults ({worker_mode}):")
+    print(f"  Embedded: {processed}/{num_episodes}")
+    print(f"  Processing time: {processing_time:.2f}s")
+    print(f"  Throughput: {throughput:.2f} embeddings/sec")
+
+    return {
+        "worker_mode": worker_mode,
+        "num_episodes": num_episodes,
+        "processed": processed,
+        "total_time": processing_time,
+        "throughput": throughput,
+        "creation_time": (create_end - create_start) * 1000
+    }
 
-    print(f"  WARNING: Embedding not processed within {max_wait}s")
-    return None
+
+def benchmark_bulk_ingest(total_rows=10000, batch_size=5000):
+    """Benchmark /memory/actions/bulk throughput (NDJSON, COPY per batch)"""
+    print(f"\n{'='*60}")
+    print(f"BENCHMARK: Bulk Ingest ({total_rows} episodes, batches of {batch_size})")
+    print(f"{'='*60}")
+
+    batch_latencies = []
+    created = 0
+    start_time = time.time()
+
+    for batch_start in range(0, total_rows, batch_size):
+        rows = min(batch_size, total_rows - batch_start)
+        body = "\n".join(
+            json.dumps({
+                "action_type": f"benchmark_bulk_{batch_start + i}",
+                "action_details": {
+                    "message": f"Bulk benchmark episode {batch_start + i} - measuring ingest throughput",
+                    "importance_score": 0.5 + ((batch_start + i) % 50) / 100
+                },
+                "context_state": {"benchmark": True, "iteration": batch_start + i},
+                "tags": ["benchmark", "bulk", f"batch_{batch_start // batch_size}"]
+            })
+            for i in range(rows)
+        )
+
+        req_start = time.time()
+        response = requests.post(
+            f"{API_BASE_URL}/memory/actions/bulk",
+            data=body.encode("utf-8"),
+            headers={"Content-Type": "application/x-ndjson"},
+            timeout=max(TIMEOUT, 120)
+        )
+        req_end = time.time()
+
+        if response.status_code == 200:
+            created += response.json()["count"]
+            batch_latencies.append((req_end - req_start) * 1000)
+        else:
+            print(f"  ERROR: Batch at {batch_start} failed with status {response.status_code}")
+
+        print(f"  Progress: {min(batch_start + rows, total_rows)}/{total_rows} episodes submitted")
+
+    total_time = time.time() - start_time
+    throughput = created / total_time if total_time > 0 else 0
+
+    print(f"\nResults:")
+    print(f"  Episodes created: {created}/{total_rows}")
+    print(f"  Total time: {total_time:.2f}s")
+    print(f"  Throughput: {throughput:.2f} episodes/sec")
+    if batch_latencies:
+        print(f"  Avg batch latency: {statistics.mean(batch_latencies):.2f}ms")
+
+    return {
+        "total_rows": total_rows,
+        "batch_size": batch_size,
+        "created": created,
+        "total_time": total_time,
+        "throughput": throughput,
+        "avg_batch_latency": statistics.mean(batch_latencies) if batch_latencies else None
+    }
 
 
 def run_all_benchmarks():
@@ -295,6 +389,8 @@ def run_all_benchmarks():
     results["recent_episodes"] = benchmark_recent_episodes(num_requests=100)
     results["semantic_search"] = benchmark_semantic_search(num_queries=50)
     results["embeddings_processing"] = benchmark_embeddings_processing()
+    results["bulk_ingest_10k"] = benchmark_bulk_ingest(total_rows=10000)
+    results["bulk_ingest_100k"] = benchmark_bulk_ingest(total_rows=100000)
 
     # Summary
     print(f"\n{'#'*60}")
@@ -313,8 +409,16 @@ def run_all_benchmarks():
     print(f"  Avg Results: {results['semantic_search']['avg_results']:.1f}")
 
     if results["embeddings_processing"]:
-        print(f"\nEmbeddings Processing:")
+        print(f"\nEmbeddings Processing ({results['embeddings_processing']['worker_mode']}):")
         print(f"  Total Time: {results['embeddings_processing']['total_time']:.2f}s")
+        print(f"  Throughput: {results['embeddings_processing']['throughput']:.2f} embeddings/sec")
+
+    print(f"\nBulk Ingest:")
+    for key in ("bulk_ingest_10k", "bulk_ingest_100k"):
+        bulk = results[key]
+        baseline = results['episode_creation']['throughput']
+        speedup = f"{bulk['throughput'] / baseline:.1f}x" if baseline > 0 else "n/a"
+        print(f"  {bulk['total_rows']} rows: {bulk['throughput']:.2f} eps/sec ({speedup} vs /memory/action)")
 
     # Save results to file
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -0,0 +1,163 @@
+"""
+SimilarityGraph benchmark for NEXUS Cerebro (LAB_005)
+Build time and per-insert latency of the matrix-backed graph at 10k / 100k episodes
+
+- Bulk build: add_episodes() over the whole corpus (block matrix products)
+- Per-insert: add_episode() of fresh episodes into the built graph
+  (one matrix-vector product + neighbour merge), p50/p99
+- get_related() latency on the built graph
+- Legacy baseline: the previous Dict[str, np.ndarray] graph (Python cosine
+  loop per pair) on a small corpus, since it is O(N^2) Python calls
+
+Usage:
+    python tests/benchmark_similarity_graph.py [--sizes 10000 100000] [--legacy-size 2000]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'api'))
+
+from spreading_activation import SimilarityGraph
+
+from helpers import synthetic_embeddings
+
+# Configuration
+DIMENSION = 384
+NUM_CLUSTERS = 256
+SIMILARITY_THRESHOLD = 0.7
+NUM_INSERTS = 200
+NUM_LOOKUPS = 1000
+
+
+class LegacySimilarityGraph:
+    """Previous implementation: dict of vectors, Python cosine loop per insert"""
+
+    def __init__(self, similarity_threshold):
+        self.similarity_threshold = similarity_threshold
+        self.graph = {}
+        self.embeddings = {}
+
+    def add_episode(self, uuid, embedding):
+        self.embeddings[uuid] = embedding
+        self.graph[uuid] = []
+        for other_uuid, other_embedding in self.embeddings.items():
+            if other_uuid == uuid:
+                continue
+            similarity = float(np.dot(embedding, other_embedding) /
+                               (np.linalg.norm(embedding) * np.linalg.norm(other_embedding)))
+            if similarity >= self.similarity_threshold:
+                self.graph[uuid].append((other_uuid, similarity))
+                self.graph[other_uuid].append((uuid, similarity))
+
+
+def percentiles(samples_ms):
+    samples_ms = sorted(samples_ms)
+    return {
+        "p50_ms": statistics.median(samples_ms),
+        "p99_ms": samples_ms[max(0, int(len(samples_ms) * 0.99) - 1)],
+        "mean_ms": statistics.mean(samples_ms)
+    }
+
+
+def benchmark_matrix_graph(n):
+    print(f"\n{'='*60}")
+    print(f"BENCHMARK: Matrix SimilarityGraph ({n:,} episodes, dim={DIMENSION})")
+    print(f"{'='*60}")
+
+    vectors = synthetic_embeddings(n + NUM_INSERTS, DIMENSION, NUM_CLUSTERS)
+    uuids = [f"ep-{i}" for i in range(n + NUM_INSERTS)]
+
+    graph = SimilarityGraph(SIMILARITY_THRESHOLD)
+    start = time.perf_counter()
+    graph.add_episodes(uuids[:n], vectors[:n])
+    build_seconds = time.perf_counter() - start
+    print(f"  Bulk build: {build_seconds:.2f}s ({n / build_seconds:,.0f} episodes/s)")
+
+    insert_ms = []
+    for i in range(n, n + NUM_INSERTS):
+        start = time.perf_counter()
+        graph.add_episode(uuids[i], vectors[i])
+        insert_ms.append((time.perf_counter() - start) * 1000)
+    insert = percentiles(insert_ms)
+    print(f"  Per-insert: p50 {insert['p50_ms']:.2f}ms  p99 {insert['p99_ms']:.2f}ms")
+
+    rng = np.random.default_rng(7)
+    lookup_ms = []
+    for row in rng.integers(0, n, NUM_LOOKUPS):
+        start = time.perf_counter()
+        graph.get_related(uuids[row], top_k=5)
+        lookup_ms.append((time.perf_counter() - start) * 1000)
+    lookup = percentiles(lookup_ms)
+    print(f"  get_related: p50 {lookup['p50_ms']:.3f}ms  p99 {lookup['p99_ms']:.3f}ms")
+
+    matrix_mb = graph._matrix.nbytes / 1e6
+    neighbours_mb = (graph._nbr_idx.nbytes + graph._nbr_sim.nbytes) / 1e6
+    print(f"  Memory: matrix {matrix_mb:.0f} MB, neighbour lists {neighbours_mb:.0f} MB (capacity {graph._capacity:,})")
+
+    return {
+        "episodes": n,
+        "build_seconds": build_seconds,
+        "insert": insert,
+        "get_related": lookup,
+        "matrix_mb": matrix_mb,
+        "neighbours_mb": neighbours_mb
+    }
+
+
+def benchmark_legacy_graph(n):
+    print(f"\n{'='*60}")
+    print(f"BASELINE: Legacy dict SimilarityGraph ({n:,} episodes)")
+    print(f"{'='*60}")
+
+    vectors = synthetic_embeddings(n + NUM_INSERTS // 10, DIMENSION, NUM_CLUSTERS)
+    graph = LegacySimilarityGraph(SIMILARITY_THRESHOLD)
+
+    start = time.perf_counter()
+    for i in range(n):
+        graph.add_episode(f"ep-{i}", vectors[i])
+    build_seconds = time.perf_counter() - start
+    print(f"  Build (add_episode loop): {build_seconds:.2f}s")
+
+    insert_ms = []
+    for i in range(n, n + NUM_INSERTS // 10):
+        start = time.perf_counter()
+        graph.add_episode(f"ep-{i}", vectors[i])
+        insert_ms.append((time.perf_counter() - start) * 1000)
+    insert = percentiles(insert_ms)
+    print(f"  Per-insert: p50 {insert['p50_ms']:.2f}ms  p99 {insert['p99_ms']:.2f}ms")
+
+    return {"episodes": n, "build_seconds": build_seconds, "insert": insert}
+
+
+def run_all_benchmarks(sizes, legacy_size):
+    results = {
+        "timestamp": datetime.now().isoformat(),
+        "dimension": DIMENSION,
+        "similarity_threshold": SIMILARITY_THRESHOLD,
+        "matrix": [benchmark_matrix_graph(n) for n in sizes],
+        "legacy": benchmark_legacy_graph(legacy_size) if legacy_size else None
+    }
+
+    filename = f"benchmark_similarity_graph_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(filename, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResults saved to: {filename}")
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SimilarityGraph build/insert benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--legacy-size", type=int, default=2000, help="0 to skip the legacy baseline")
+    args = parser.parse_args()
+
+    run_all_benchmarks(args.sizes, args.legacy_size)
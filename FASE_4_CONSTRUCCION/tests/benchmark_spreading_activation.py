@@ -0,0 +1,159 @@
+"""
+Spreading activation benchmark for NEXUS Cerebro (LAB_005)
+Vectorized SimilarityGraph.spread vs the previous hop-by-hop Python walk
+
+- Graphs of 10k-200k nodes with synthetic neighbour lists (32 per node,
+  clustered, similarity 0.7-0.95) loaded through SimilarityGraph.load_arrays,
+  so graph construction does not dominate the run
+- Legacy: the previous ActivationManager.spread_activation loop (deque-free
+  BFS over get_related), without the activation bookkeeping
+- Vectorized: one spread() call; sessions pass all sources at once, the
+  legacy walk loops over them
+- Both sides measure propagation only; activate() costs the same for both
+
+Usage:
+    python tests/benchmark_spreading_activation.py [--sizes 10000 50000 200000]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'api'))
+
+from spreading_activation import SimilarityGraph
+
+# Configuration
+MAX_NEIGHBORS = 32
+CLUSTER_SIZE = 400
+NUM_QUERIES = 200
+SESSION_SOURCES = 20
+CONFIGS = [
+    {"name": "engine default", "top_k": 5, "max_hops": 2},
+    {"name": "wide", "top_k": 10, "max_hops": 3},
+]
+
+
+def synthetic_graph(n, seed=42):
+    """Graph with clustered neighbour lists, loaded without computing similarities"""
+    rng = np.random.default_rng(seed)
+    cluster_start = (np.arange(n) // CLUSTER_SIZE) * CLUSTER_SIZE
+    offsets = rng.integers(0, CLUSTER_SIZE, (n, MAX_NEIGHBORS))
+    indices = np.minimum(cluster_start[:, None] + offsets, n - 1)
+    weights = np.sort(rng.uniform(0.7, 0.95, (n, MAX_NEIGHBORS)).astype(np.float32), axis=1)[:, ::-1]
+
+    graph = SimilarityGraph(0.7, max_neighbors=MAX_NEIGHBORS)
+    graph.load_arrays(
+        matrix=np.zeros((n, 8), dtype=np.float32),  # Propagation never reads embeddings
+        indptr=np.arange(n + 1, dtype=np.int64) * MAX_NEIGHBORS,
+        indices=indices.reshape(-1).astype(np.int32),
+        weights=np.ascontiguousarray(weights).reshape(-1),
+        uuids=np.array([f"ep-{i}".encode() for i in range(n)])
+    )
+    return graph
+
+
+def legacy_spread(graph, source_uuid, top_k, max_hops):
+    """Previous ActivationManager.spread_activation traversal"""
+    activated = []
+    visited = {source_uuid}
+    queue = [(source_uuid, 1.0, 0)]
+
+    while queue:
+        current_uuid, current_activation, hops = queue.pop(0)
+        if hops >= max_hops:
+            continue
+        for related_uuid, similarity in graph.get_related(current_uuid, top_k=top_k):
+            if related_uuid in visited:
+                continue
+            visited.add(related_uuid)
+            new_activation = current_activation * similarity * 0.7
+            if new_activation >= 0.2:
+                activated.append((related_uuid, new_activation))
+                queue.append((related_uuid, new_activation, hops + 1))
+
+    return activated
+
+
+def timed(fn, repeats):
+    samples = []
+    result = None
+    for i in range(repeats):
+        start = time.perf_counter()
+        result = fn(i)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), result
+
+
+def benchmark_size(n):
+    print(f"\n{'='*60}")
+    print(f"BENCHMARK: Spreading activation ({n:,} nodes, {MAX_NEIGHBORS} neighbours each)")
+    print(f"{'='*60}")
+
+    graph = synthetic_graph(n)
+    rng = np.random.default_rng(7)
+    sources = rng.integers(0, n, NUM_QUERIES)
+    sessions = rng.integers(0, n, (NUM_QUERIES // 10, SESSION_SOURCES))
+
+    results = []
+    for config in CONFIGS:
+        top_k, max_hops = config["top_k"], config["max_hops"]
+
+        legacy_ms, legacy = timed(
+            lambda i: legacy_spread(graph, graph.uuids[sources[i]], top_k, max_hops), NUM_QUERIES)
+        vector_ms, vector = timed(
+            lambda i: graph.spread(sources[i:i + 1], top_k=top_k, max_hops=max_hops), NUM_QUERIES)
+
+        legacy_session_ms, _ = timed(
+            lambda i: [legacy_spread(graph, graph.uuids[s], top_k, max_hops) for s in sessions[i]],
+            len(sessions))
+        vector_session_ms, session = timed(
+            lambda i: graph.spread(sessions[i], top_k=top_k, max_hops=max_hops), len(sessions))
+
+        print(f"  {config['name']} (top_k={top_k}, hops={max_hops}):")
+        print(f"    single source: legacy {legacy_ms:.3f}ms ({len(legacy)} activated)  "
+              f"vectorized {vector_ms:.3f}ms ({len(vector[0])} activated)  "
+              f"{legacy_ms / vector_ms:.1f}x")
+        print(f"    {SESSION_SOURCES}-source session: legacy {legacy_session_ms:.2f}ms  "
+              f"vectorized {vector_session_ms:.2f}ms ({len(session[0])} activated)  "
+              f"{legacy_session_ms / vector_session_ms:.1f}x")
+
+        results.append({
+            **config,
+            "single_legacy_ms": legacy_ms,
+            "single_vectorized_ms": vector_ms,
+            "session_legacy_ms": legacy_session_ms,
+            "session_vectorized_ms": vector_session_ms
+        })
+
+    return {"nodes": n, "configs": results}
+
+
+def run_all_benchmarks(sizes):
+    results = {
+        "timestamp": datetime.now().isoformat(),
+        "max_neighbors": MAX_NEIGHBORS,
+        "session_sources": SESSION_SOURCES,
+        "sizes": [benchmark_size(n) for n in sizes]
+    }
+
+    filename = f"benchmark_spreading_activation_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(filename, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResults saved to: {filename}")
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="LAB_005 spreading activation benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 50_000, 200_000])
+    args = parser.parse_args()
+
+    run_all_benchmarks(args.sizes)
@@ -0,0 +1,215 @@
+"""
+ANN index benchmark for NEXUS Cerebro V2.0.0
+Recall@k vs latency of pgvector HNSW over synthetic 10k / 100k / 1M corpora
+
+Each corpus is loaded into a scratch table (nexus_bench.ann_corpus_<n>),
+indexed with the same DDL as idx_episodic_embedding_hnsw, and queried with
+the same "ORDER BY distance LIMIT k" shape as /memory/search for a sweep of
+hnsw.ef_search values. Ground truth is exact cosine k-NN computed in NumPy
+while the corpus is streamed in, so 1M x 384 never has to fit in memory.
+
+Usage:
+    python tests/benchmark_vector_index.py --dsn postgresql://... [--sizes 10000 100000 1000000]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+import psycopg
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'api'))
+
+from vector_index import index_ddl, HNSW_DEFAULT_M, HNSW_DEFAULT_EF_CONSTRUCTION
+
+# Configuration
+DIMENSION = 384
+NUM_CLUSTERS = 256        # Sentence embeddings are strongly clustered by topic
+NUM_QUERIES = 200
+K = 10
+EF_SEARCH_SWEEP = [10, 20, 40, 80, 160, 320]
+CHUNK_ROWS = 20000
+BENCH_SCHEMA = "nexus_bench"
+
+
+def to_pgvector(vector):
+    return "[" + ",".join(f"{x:.6f}" for x in vector) + "]"
+
+
+def synthetic_chunks(num_rows, seed=42):
+    """Yield (start_id, unit-norm float32 chunk) from a Gaussian mixture"""
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((NUM_CLUSTERS, DIMENSION)).astype(np.float32)
+
+    for start in range(0, num_rows, CHUNK_ROWS):
+        rows = min(CHUNK_ROWS, num_rows - start)
+        labels = rng.integers(0, NUM_CLUSTERS, rows)
+        chunk = centers[labels] + 0.6 * rng.standard_normal((rows, DIMENSION)).astype(np.float32)
+        chunk /= np.linalg.norm(chunk, axis=1, keepdims=True)
+        yield start, chunk
+
+
+def synthetic_queries(seed=7):
+    rng = np.random.default_rng(seed)
+    centers = np.random.default_rng(42).standard_normal((NUM_CLUSTERS, DIMENSION)).astype(np.float32)
+    labels = rng.integers(0, NUM_CLUSTERS, NUM_QUERIES)
+    queries = centers[labels] + 0.6 * rng.standard_normal((NUM_QUERIES, DIMENSION)).astype(np.float32)
+    return queries / np.linalg.norm(queries, axis=1, keepdims=True)
+
+
+def load_corpus(conn, table, num_rows, queries):
+    """COPY the corpus into `table` and return exact top-K ids per query"""
+    best_sims = np.full((len(queries), K), -np.inf, dtype=np.float32)
+    best_ids = np.full((len(queries), K), -1, dtype=np.int64)
+
+    with conn.cursor() as cur:
+        cur.execute(f"DROP TABLE IF EXISTS {table}")
+        cur.execute(f"CREATE TABLE {table} (id bigint PRIMARY KEY, embedding vector({DIMENSION}))")
+
+        with cur.copy(f"COPY {table} (id, embedding) FROM STDIN") as copy:
+            for start, chunk in synthetic_chunks(num_rows):
+                for offset, vector in enumerate(chunk):
+                    copy.write_row((start + offset, to_pgvector(vector)))
+
+                # Streaming exact k-NN: merge chunk top-K into running top-K
+                sims = queries @ chunk.T
+                ids = np.arange(start, start + len(chunk))
+                merged_sims = np.concatenate([best_sims, sims], axis=1)
+                merged_ids = np.concatenate([best_ids, np.broadcast_to(ids, sims.shape)], axis=1)
+                top = np.argpartition(-merged_sims, K - 1, axis=1)[:, :K]
+                best_sims = np.take_along_axis(merged_sims, top, axis=1)
+                best_ids = np.take_along_axis(merged_ids, top, axis=1)
+
+        cur.execute(f"ANALYZE {table}")
+    conn.commit()
+
+    return [set(row.tolist()) for row in best_ids]
+
+
+def build_index(conn, table, m, ef_construction):
+    """Same DDL as idx_episodic_embedding_hnsw, pointed at the scratch table"""
+    ddl = index_ddl(f"{table.split('.')[-1]}_hnsw", "hnsw", m, ef_construction,
+                    concurrently=False, table=table)
+
+    start = time.time()
+    with conn.cursor() as cur:
+        cur.execute("SET maintenance_work_mem = '1GB'")
+        cur.execute(ddl)
+    conn.commit()
+    return time.time() - start
+
+
+def measure(conn, table, queries, exact, ef_search):
+    """Run all queries at one ef_search; return recall@K and latency stats"""
+    latencies = []
+    recalls = []
+
+    with conn.cursor() as cur:
+        cur.execute("SELECT set_config('hnsw.ef_search', %s, false)", (str(ef_search),))
+        for query, truth in zip(queries, exact):
+            q = to_pgvector(query)
+            start = time.perf_counter()
+            cur.execute(f"""
+                SELECT id FROM (
+                    SELECT id, embedding <=> %s::vector AS distance
+                    FROM {table}
+                    ORDER BY embedding <=> %s::vector
+                    LIMIT %s
+                ) nearest
+                ORDER BY distance
+            """, (q, q, K))
+            found = {row[0] for row in cur.fetchall()}
+            latencies.append((time.perf_counter() - start) * 1000)
+            recalls.append(len(found & truth) / K)
+    conn.rollback()
+
+    latencies.sort()
+    return {
+        "ef_search": ef_search,
+        f"recall_at_{K}": statistics.mean(recalls),
+        "p50_ms": statistics.median(latencies),
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1],
+        "mean_ms": statistics.mean(latencies)
+    }
+
+
+def benchmark_corpus(conn, num_rows, m, ef_construction, keep):
+    print(f"\n{'='*60}")
+    print(f"BENCHMARK: HNSW recall@{K} vs latency ({num_rows:,} rows, m={m}, ef_construction={ef_construction})")
+    print(f"{'='*60}")
+
+    table = f"{BENCH_SCHEMA}.ann_corpus_{num_rows}"
+    queries = synthetic_queries()
+
+    start = time.time()
+    exact = load_corpus(conn, table, num_rows, queries)
+    print(f"  Loaded corpus + exact ground truth in {time.time() - start:.1f}s")
+
+    build_seconds = build_index(conn, table, m, ef_construction)
+    print(f"  Built HNSW index in {build_seconds:.1f}s")
+
+    rows = []
+    print(f"\n  {'ef_search':>9}  {'recall@'+str(K):>10}  {'p50 (ms)':>9}  {'p99 (ms)':>9}")
+    for ef_search in EF_SEARCH_SWEEP:
+        result = measure(conn, table, queries, exact, ef_search)
+        rows.append(result)
+        print(f"  {ef_search:>9}  {result[f'recall_at_{K}']:>10.3f}  {result['p50_ms']:>9.2f}  {result['p99_ms']:>9.2f}")
+
+    if not keep:
+        with conn.cursor() as cur:
+            cur.execute(f"DROP TABLE IF EXISTS {table}")
+        conn.commit()
+
+    return {
+        "rows": num_rows,
+        "m": m,
+        "ef_construction": ef_construction,
+        "index_build_seconds": build_seconds,
+        "sweep": rows
+    }
+
+
+def run_all_benchmarks(dsn, sizes, m, ef_construction, keep):
+    results = {
+        "timestamp": datetime.now().isoformat(),
+        "dimension": DIMENSION,
+        "k": K,
+        "num_queries": NUM_QUERIES,
+        "corpora": []
+    }
+
+    with psycopg.connect(dsn) as conn:
+        with conn.cursor() as cur:
+            cur.execute("CREATE EXTENSION IF NOT EXISTS vector")
+            cur.execute(f"CREATE SCHEMA IF NOT EXISTS {BENCH_SCHEMA}")
+        conn.commit()
+
+        for num_rows in sizes:
+            results["corpora"].append(benchmark_corpus(conn, num_rows, m, ef_construction, keep))
+
+    filename = f"benchmark_vector_index_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(filename, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResults saved to: {filename}")
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="HNSW recall/latency benchmark")
+    parser.add_argument("--dsn", default=os.getenv("NEXUS_DB_DSN"), help="PostgreSQL DSN (scratch schema nexus_bench is used)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--m", type=int, default=HNSW_DEFAULT_M)
+    parser.add_argument("--ef-construction", type=int, default=HNSW_DEFAULT_EF_CONSTRUCTION)
+    parser.add_argument("--keep", action="store_true", help="Keep scratch tables after the run")
+    args = parser.parse_args()
+
+    if not args.dsn:
+        parser.error("--dsn or NEXUS_DB_DSN is required")
+
+    run_all_benchmarks(args.dsn, args.sizes, args.m, args.ef_construction, args.keep)
@@ -0,0 +1,164 @@
+"""
+Shared test helpers: synthetic embeddings and recording database stand-ins
+
+Imported by the unit tests and benchmarks in this directory (pytest and
+`python tests/benchmark_*.py` both put it on sys.path).
+"""
+
+from contextlib import asynccontextmanager
+
+import numpy as np
+
+
+# ============================================
+# Synthetic embeddings
+# ============================================
+def clustered(n, dim=32, clusters=4, spread=0.3, seed=0):
+    """Gaussian clusters around random centers (not normalized), float32 (n, dim)"""
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((clusters, dim))
+    return (centers[rng.integers(0, clusters, n)] + spread * rng.standard_normal((n, dim))).astype(np.float32)
+
+
+def synthetic_embeddings(n, dim=384, clusters=256, seed=42):
+    """Clustered unit vectors (sentence embeddings group by topic)"""
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((clusters, dim)).astype(np.float32)
+    vectors = centers[rng.integers(0, clusters, n)] + 0.6 * rng.standard_normal((n, dim)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+# ============================================
+# Async (psycopg AsyncConnection / pool) stand-ins
+# ============================================
+class RecordingCursor:
+    """Records (sql, params) on its connection; fetchall() serves connection.rows"""
+
+    def __init__(self, conn=None):
+        self.conn = conn if conn is not None else RecordingConnection()
+
+    @property
+    def statements(self):
+        return self.conn.statements
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, sql, params=None):
+        if self.conn.fail:
+            raise RuntimeError("database down")
+        self.conn.statements.append((sql, params))
+
+    async def fetchall(self):
+        return self.conn.rows
+
+
+class RecordingConnection:
+    """
+    Args:
+        rows: Result of every fetchall()
+
+    Set fail = True to make every statement raise.
+    """
+
+    def __init__(self, rows=()):
+        self.rows = list(rows)
+        self.statements = []
+        self.fail = False
+
+    def cursor(self, *args, **kwargs):
+        return RecordingCursor(self)
+
+
+class RecordingPool(RecordingConnection):
+    """Pool whose connection() is itself, so statements are recorded in one place"""
+
+    @asynccontextmanager
+    async def connection(self):
+        yield self
+
+
+# ============================================
+# Sync (psycopg Connection) stand-ins
+# ============================================
+class RecordingCopy:
+
+    def __init__(self, cursor, statement):
+        self.rows = cursor.copied.setdefault(" ".join(statement.split()), [])
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def write_row(self, row):
+        self.rows.append(row)
+
+
+class SyncRecordingCursor:
+    """
+    Records executed statements (whitespace-collapsed) and COPY rows; fails on a chosen statement
+
+    Args:
+        fail_on: Substring of the statement that raises
+        results: Served in order, one per fetchall() / fetchone()
+    """
+
+    def __init__(self, fail_on=None, results=()):
+        self.statements = []
+        self.copied = {}
+        self.fail_on = fail_on
+        self.results = list(results)
+        self.rowcount = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, statement, params=None):
+        statement = " ".join(statement.split())
+        if self.fail_on and self.fail_on in statement:
+            raise RuntimeError("statement failed")
+        self.statements.append((statement, params))
+
+    def fetchall(self):
+        return self.results.pop(0)
+
+    def fetchone(self):
+        rows = self.results.pop(0)
+        return rows[0] if rows else None
+
+    def copy(self, statement):
+        return RecordingCopy(self, statement)
+
+
+class SyncRecordingConnection:
+    """
+    Args:
+        cursor: SyncRecordingCursor returned by cursor(); commits and
+            rollbacks are recorded in its statements as "COMMIT" / "ROLLBACK"
+    """
+
+    def __init__(self, cursor=None):
+        self.recording_cursor = cursor
+        self.commits = 0
+        self.rollbacks = 0
+
+    def cursor(self):
+        return self.recording_cursor
+
+    def commit(self):
+        self.commits += 1
+        if self.recording_cursor is not None:
+            self.recording_cursor.statements.append(("COMMIT", None))
+
+    def rollback(self):
+        self.rollbacks += 1
+        if self.recording_cursor is not None:
+            self.recording_cursor.statements.append(("ROLLBACK", None))
@@ -0,0 +1,74 @@
+"""
+Unit tests for write-behind access tracking
+Runs offline against a recording stand-in for the connection pool
+"""
+
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'api'))
+
+from access_tracking import AccessTrackingBuffer
+
+from helpers import RecordingPool
+
+
+class TestAccessTrackingBuffer:
+
+    def test_hits_coalesced_into_one_statement(self):
+        pool = RecordingPool()
+        buffer = AccessTrackingBuffer(pool, flush_size=100, flush_interval=60)
+
+        buffer.record(["a", "b", "a"])
+        buffer.record(["a"])
+        asyncio.run(buffer.flush())
+
+        assert len(pool.statements) == 1
+        episode_ids, hits, _ = pool.statements[0][1]
+        assert dict(zip(episode_ids, hits)) == {"a": 3, "b": 1}
+
+    def test_size_trigger_flushes_without_waiting_for_interval(self):
+        pool = RecordingPool()
+
+        async def scenario():
+            buffer = AccessTrackingBuffer(pool, flush_size=3, flush_interval=60)
+            await buffer.start()
+            buffer.record(["a", "b", "c"])
+            for _ in range(50):
+                if pool.statements:
+                    break
+                await asyncio.sleep(0.01)
+            await buffer.stop()
+
+        asyncio.run(scenario())
+
+        assert len(pool.statements) == 1
+
+    def test_stop_drains_pending_hits(self):
+        pool = RecordingPool()
+
+        async def scenario():
+            buffer = AccessTrackingBuffer(pool, flush_size=100, flush_interval=60)
+            await buffer.start()
+            buffer.record(["a"])
+            await buffer.stop()
+
+        asyncio.run(scenario())
+
+        assert pool.statements and pool.statements[0][1][0] == ["a"]
+
+    def test_failed_flush_requeues_hits(self):
+        pool = RecordingPool()
+        buffer = AccessTrackingBuffer(pool, flush_size=100, flush_interval=60)
+
+        pool.fail = True
+        buffer.record(["a", "a"])
+        assert asyncio.run(buffer.flush()) == 0
+
+        pool.fail = False
+        buffer.record(["a"])
+        asyncio.run(buffer.flush())
+
+        episode_ids, hits, _ = pool.statements[0][1]
+        assert episode_ids == ["a"] and hits == [3]
@@ -0,0 +1,120 @@
+"""
+Cold start tests and startup-time benchmark for the API
+
+Each probe runs in a fresh interpreter (module caches would hide import
+cost) with PostgreSQL/Redis pointed at closed local ports, so it runs
+offline. The model loader is replaced by a stand-in that blocks until the
+probe releases it: if startup waited for the model, /health would never
+answer.
+
+Timings are printed; run with -s to see them. Offline, "lifespan start ->
+/health" is dominated by the Redis client retrying the refused port and by
+DB_POOL_TIMEOUT - neither depends on the model.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+API_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'api')
+
+# Generous budgets: these guard against regressions (e.g. the model load
+# moving back into startup), not against slow CI machines
+IMPORT_BUDGET_SECONDS = float(os.getenv("STARTUP_IMPORT_BUDGET_SECONDS", "5.0"))
+
+# Must not be imported by `import main`
+DEFERRED_MODULES = (
+    "numpy", "torch", "sentence_transformers", "onnxruntime",
+    "emotional_salience_scorer", "decay_modulator", "spreading_activation",
+    "ab_testing", "embedding_backends", "embedding_service", "query_embedding_cache",
+    "predictive_preloading", "consolidation_engine", "consolidation_scheduler",
+)
+
+OFFLINE_ENV = {
+    "POSTGRES_HOST": "127.0.0.1",
+    "POSTGRES_PORT": "1",
+    "DB_POOL_TIMEOUT": "0.5",
+    "REDIS_HOST": "127.0.0.1",
+    "REDIS_PORT": "1",
+}
+
+
+def run_probe(code):
+    """Run code in a fresh interpreter inside src/api; return its last JSON line"""
+    pytest.importorskip("fastapi")
+    proc = subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(code)],
+        cwd=API_DIR,
+        env={**os.environ, **OFFLINE_ENV, "PYTHONPATH": API_DIR},
+        capture_output=True,
+        text=True,
+        timeout=120
+    )
+    assert proc.returncode == 0, proc.stderr[-3000:]
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+class TestColdStart:
+
+    def test_import_defers_heavy_modules(self):
+        result = run_probe(f"""
+            import json, sys, time
+            start = time.perf_counter()
+            import main
+            elapsed = time.perf_counter() - start
+            print(json.dumps({{
+                "import_seconds": elapsed,
+                "loaded": [m for m in {DEFERRED_MODULES!r} if m in sys.modules]
+            }}))
+        """)
+
+        print(f"\n  import main: {result['import_seconds'] * 1000:.0f}ms")
+        assert result["loaded"] == []
+        assert result["import_seconds"] < IMPORT_BUDGET_SECONDS
+
+    def test_health_answers_while_model_warms(self):
+        pytest.importorskip("httpx")
+        result = run_probe(f"""
+            import asyncio, json, threading, time
+            import httpx
+            import main
+
+            model_released = threading.Event()
+
+            def blocked_model_load():
+                model_released.wait(timeout=60)
+                raise RuntimeError("stand-in model")
+
+            main.load_embeddings_backend = blocked_model_load
+
+            async def scenario():
+                transport = httpx.ASGITransport(app=main.app)
+                start = time.perf_counter()
+                async with main.lifespan(main.app):
+                    async with httpx.AsyncClient(transport=transport, base_url="http://nexus") as client:
+                        health = await client.get("/health")
+                        startup_seconds = time.perf_counter() - start
+                        search = await client.post("/memory/search", json={{"query": "cold start"}})
+                    model_released.set()
+                return startup_seconds, health, search
+
+            startup_seconds, health, search = asyncio.run(scenario())
+
+            print(json.dumps({{
+                "startup_seconds": startup_seconds,
+                "health_code": health.status_code,
+                "embeddings_model": health.json().get("embeddings_model"),
+                "search_code": search.status_code,
+                "search_retry_after": search.headers.get("retry-after")
+            }}))
+        """)
+
+        print(f"\n  lifespan start -> /health answered: {result['startup_seconds'] * 1000:.0f}ms")
+        assert result["health_code"] == 200
+        assert result["embeddings_model"] == "warming"
+        assert result["search_code"] == 503
+        assert result["search_retry_after"] is not None
@@ -0,0 +1,113 @@
+"""
+Unit tests for the streamed /memory/actions/bulk body parser
+Bodies are fed in small chunks so rows and UTF-8 characters straddle them
+"""
+
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'api'))
+
+import bulk_body
+from bulk_body import BulkBodyParser
+
+ROWS = [
+    {"action_type": f"action_{i}", "action_details": {"message": f"episodio {i} ✓", "importance_score": 0.5 + i / 100},
+     "tags": ["bulk", f"batch_{i // 3}"]}
+    for i in range(10)
+]
+
+
+def parse_in_chunks(body, content_type, size):
+    parser = BulkBodyParser(content_type)
+    rows, fed = [], []
+    for start in range(0, len(body), size):
+        batch = parser.feed(body[start:start + size])
+        rows += batch
+        fed.append(len(batch))
+    rows += parser.feed(b"", final=True)
+    return rows, fed
+
+
+class TestNdjson:
+
+    @pytest.mark.parametrize("size", [1, 7, 64, 1 << 20])
+    def test_rows_across_chunk_boundaries(self, size):
+        body = "\n".join(json.dumps(r, ensure_ascii=False) for r in ROWS).encode("utf-8")
+
+        rows, _ = parse_in_chunks(body, "application/x-ndjson", size)
+
+        assert rows == ROWS
+
+    def test_rows_returned_as_their_lines_complete(self):
+        body = "".join(json.dumps(r) + "\n" for r in ROWS).encode("utf-8")
+
+        _, fed = parse_in_chunks(body, "application/x-ndjson", 32)
+
+        assert sum(fed) == len(ROWS) and fed.count(0) < len(fed) - 1
+
+    def test_blank_lines_and_crlf_ignored(self):
+        body = b'{"a": 1}\r\n\r\n  \n{"a": 2}'
+
+        assert parse_in_chunks(body, "application/jsonlines", 3)[0] == [{"a": 1}, {"a": 2}]
+
+    def test_malformed_line_rejected(self):
+        with pytest.raises(ValueError):
+            parse_in_chunks(b'{"a": 1}\n{"a": \n', "application/x-ndjson", 4)
+
+    def test_content_type_is_case_insensitive(self):
+        assert BulkBodyParser("Application/X-NDJSON; charset=utf-8").ndjson
+
+
+class TestJsonArray:
+
+    @pytest.mark.parametrize("size", [1, 5, 64, 1 << 20])
+    def test_elements_across_chunk_boundaries(self, size):
+        body = json.dumps(ROWS, ensure_ascii=False, indent=1).encode("utf-8")
+
+        rows, _ = parse_in_chunks(body, "application/json", size)
+
+        assert rows == ROWS
+
+    def test_numbers_cut_by_a_chunk_are_not_split(self):
+        assert parse_in_chunks(b"[12345, 678]", "application/json", 3)[0] == [12345, 678]
+
+    def test_empty_array(self):
+        assert parse_in_chunks(b" [ ] ", "application/json", 2)[0] == []
+
+    @pytest.mark.parametrize("body", [
+        b"", b'{"a": 1}', b'[{"a": 1}', b'[{"a": 1},]', b'[{"a": 1} {"a": 2}]', b'[{"a": 1}] []', b'["\xff"]'
+    ])
+    def test_malformed_bodies_rejected(self, body):
+        with pytest.raises(ValueError):
+            parse_in_chunks(body, "application/json", 4)
+
+    def test_escapes_and_literals_cut_by_a_chunk(self):
+        body = json.dumps([{"s": "café \\ \"x\"", "t": True, "f": False, "n": None, "x": -1.5e+30}]).encode("utf-8")
+
+        assert parse_in_chunks(body, "application/json", 1)[0] == json.loads(body)
+
+    def test_large_element_decoded_a_logarithmic_number_of_times(self, monkeypatch):
+        calls = []
+
+        class CountingDecoder(json.JSONDecoder):
+            def raw_decode(self, s, idx=0):
+                calls.append(idx)
+                return super().raw_decode(s, idx)
+
+        monkeypatch.setattr(bulk_body.BulkBodyParser, "_decoder", CountingDecoder())
+        body = json.dumps([{"text": "x" * 200_000}, 1]).encode("utf-8")
+
+        rows, _ = parse_in_chunks(body, "application/json", 256)
+
+        assert rows == [{"text": "x" * 200_000}, 1]
+        assert len(calls) < 20  # Not one attempt per chunk (~780)
+
+    def test_malformed_element_rejected_before_the_body_ends(self):
+        parser = BulkBodyParser("application/json")
+
+        with pytest.raises(ValueError):
+            parser.feed(b'[{"a": 1}, {"a": bogus}, {"a": 2}')
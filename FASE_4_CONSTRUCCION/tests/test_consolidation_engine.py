@@ -0,0 +1,496 @@
+"""
+Unit tests for the LAB_003 consolidation engine: columnar scoring,
+indexed backward chain tracing, bulk write-back and the parallel
+date-range batch mode
+Runs offline - synthetic days of episodes, checked against the
+object-by-object / pairwise implementations the engine used before;
+the database is a cursor stand-in recording statements and COPY rows
+(batch workers are real processes running SyntheticEngine)
+"""
+
+import copy
+import os
+import random
+import sys
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'api'))
+
+import consolidation_engine
+from consolidation_engine import ConsolidationEngine, Episode, EpisodeColumns, MemoryTrace, base_importance
+
+from helpers import SyncRecordingConnection, SyncRecordingCursor
+
+
+def synthetic_day(n, seed=0, novelty=False, embedding_dim=0):
+    """n episodes over one day, random LAB_001 scores, some sessions and tags"""
+    rng = random.Random(seed)
+    start = datetime(2025, 11, 3)
+    episodes = []
+    for i, offset in enumerate(sorted(rng.uniform(0, 86_400) for _ in range(n))):
+        emotional = {d: rng.random() for d in ('joy', 'trust', 'fear', 'surprise', 'sadness', 'anticipation')}
+        somatic = {'valence': rng.uniform(-1, 1), 'arousal': rng.random()}
+        episode = Episode(
+            episode_id=f"ep-{i}",
+            content=f"episode {i}",
+            embedding=[rng.gauss(0, 1) for _ in range(embedding_dim)],
+            created_at=start + timedelta(seconds=round(offset, 3)),
+            session_id=f"s-{rng.randrange(n // 20 + 1)}" if rng.random() < 0.5 else None,
+            tags=rng.sample(["lab003", "lab004", "api", "db", "cache", "graph"], rng.randrange(4)),
+            importance_score=rng.random(),
+            salience_score=rng.random(),
+            emotional_8d=emotional,
+            somatic_7d=somatic
+        )
+        if novelty:
+            episode.novelty_score = rng.random()
+        episodes.append(episode)
+    return episodes
+
+
+def legacy_breakthroughs(episodes, threshold_percentile=80):
+    """Per-episode scoring loop the engine used before the columnar path"""
+    has_novelty = any(ep.novelty_score > 0 for ep in episodes)
+    for episode in episodes:
+        emotion_sum = sum(episode.emotional_8d.get(e, 0) for e in ['joy', 'trust', 'anticipation', 'surprise'])
+        valence = episode.somatic_7d.get('valence', 0)
+        score = 0.0
+        if has_novelty:
+            score += episode.salience_score * 0.35
+            score += (emotion_sum / 4) * 0.20
+            score += max(0, valence) * 0.15
+            score += episode.importance_score * 0.15
+            score += episode.novelty_score * 0.15
+        else:
+            score += episode.salience_score * 0.4
+            score += (emotion_sum / 4) * 0.25
+            score += max(0, valence) * 0.15
+            score += episode.importance_score * 0.20
+        episode.breakthrough_score = score
+    threshold = np.percentile([e.breakthrough_score for e in episodes], threshold_percentile)
+    breakthroughs = [e for e in episodes if e.breakthrough_score >= threshold]
+    breakthroughs.sort(key=lambda x: x.breakthrough_score, reverse=True)
+    return breakthroughs
+
+
+def legacy_trace(engine, breakthroughs, all_episodes):
+    """Previous trace_breakthrough_chains: scan the day per breakthrough, pairwise cosine"""
+    chains = []
+    for breakthrough in breakthroughs:
+        chain = [breakthrough]
+        current_time = breakthrough.created_at
+        window_start = current_time - timedelta(hours=12)
+        candidates = [e for e in all_episodes if window_start <= e.created_at < current_time]
+        candidates.sort(key=lambda x: x.created_at, reverse=True)
+        for candidate in candidates:
+            is_related = False
+            if candidate.session_id and breakthrough.session_id and candidate.session_id == breakthrough.session_id:
+                is_related = True
+            if candidate.embedding and breakthrough.embedding:
+                if engine.cosine_similarity(candidate.embedding, breakthrough.embedding) > 0.65:
+                    is_related = True
+            if len(set(candidate.tags) & set(breakthrough.tags)) >= 2:
+                is_related = True
+            if (current_time - candidate.created_at).total_seconds() < 3600:
+                is_related = True
+            if is_related:
+                chain.insert(0, candidate)
+                current_time = candidate.created_at
+        if len(chain) >= 2:
+            chains.append(chain)
+    return chains
+
+
+def sparse_day(n, seed=0, embedding_dim=6):
+    """Bursty day: sessions separated by gaps over an hour, duplicate timestamps"""
+    episodes = synthetic_day(n, seed=seed, embedding_dim=embedding_dim)
+    rng = random.Random(seed + 100)
+    start = datetime(2025, 11, 3)
+    offsets = sorted(rng.uniform(0, 86_400) if rng.random() < 0.03 else rng.randrange(0, 86_400, 5400) + rng.choice([0, 0, 60, 600])
+                     for _ in range(n))
+    for episode, offset in zip(episodes, offsets):
+        episode.created_at = start + timedelta(seconds=offset)
+        if rng.random() < 0.2:
+            episode.embedding = []
+    return episodes
+
+
+def overlapping_chains(episodes, breakthroughs, rng):
+    """Chains of preceding episodes; many episodes land in several chains"""
+    position = {ep.episode_id: i for i, ep in enumerate(episodes)}
+    chains = []
+    for breakthrough in breakthroughs:
+        end = position[breakthrough.episode_id]
+        members = sorted(rng.sample(range(max(0, end - 30), end), min(end, rng.randrange(0, 6))))
+        chains.append([episodes[i] for i in members] + [breakthrough])
+    return chains
+
+
+class SyntheticEngine(ConsolidationEngine):
+    """ConsolidationEngine over generated days: no connection, writes only counted"""
+
+    def connect(self):
+        self.worker_pid = os.getpid()
+
+    def close(self):
+        pass
+
+    def read_checkpoint_version(self, day):
+        return 0
+
+    def fetch_episodes_from_date(self, target_date):
+        if target_date.day == 13:
+            raise RuntimeError("connection lost")
+        episodes = synthetic_day(200 + target_date.day, seed=target_date.day, embedding_dim=4)
+        shift = target_date.replace(hour=0, minute=0, second=0, microsecond=0) - datetime(2025, 11, 3)
+        for episode in episodes:
+            episode.created_at += shift
+        return episodes
+
+    def fetch_old_important_memories(self, sample_size, days_back=7):
+        return []
+
+    def write_consolidation_results(self, episodes, traces, checkpoint=None, day=None):
+        return len({ep.episode_id for ep in episodes}), len(traces)
+
+    def consolidate_daily_memories(self, target_date, checkpoint=False):
+        report = super().consolidate_daily_memories(target_date, checkpoint=checkpoint)
+        report.top_breakthroughs.append({"baselines": self.baseline_models, "pid": self.worker_pid})
+        return report
+
+
+class TestColumnarScoring:
+
+    def test_breakthroughs_identical_to_object_path(self):
+        engine = ConsolidationEngine()
+        for novelty in (False, True):
+            episodes = synthetic_day(2000, seed=1, novelty=novelty)
+            # Ties: identical scores must keep chronological order
+            for episode in episodes[100:110]:
+                episode.__dict__.update(copy.deepcopy(episodes[100].__dict__), episode_id=episode.episode_id,
+                                        created_at=episode.created_at)
+            expected_episodes = copy.deepcopy(episodes)
+
+            breakthroughs = engine.identify_breakthroughs(episodes)
+            expected = legacy_breakthroughs(expected_episodes)
+
+            assert [b.episode_id for b in breakthroughs] == [b.episode_id for b in expected]
+            assert [e.breakthrough_score for e in episodes] == [e.breakthrough_score for e in expected_episodes]
+
+    def test_chain_boosts_identical_to_per_chain_loop(self):
+        engine = ConsolidationEngine()
+        episodes = synthetic_day(3000, seed=2, novelty=True)
+        columns = EpisodeColumns.from_episodes(episodes)
+        breakthroughs = engine.identify_breakthroughs(episodes, columns=columns)
+        chains = overlapping_chains(episodes, breakthroughs, random.Random(3))
+        expected_episodes = copy.deepcopy(episodes)
+        by_id = {ep.episode_id: ep for ep in expected_episodes}
+
+        engine.consolidate_chains(chains, columns)
+        for chain in chains:
+            engine.consolidate_chain([by_id[ep.episode_id] for ep in chain])
+
+        assert sum(len(chain) >= 2 for chain in chains) > 100
+        for episode in episodes:
+            expected = by_id[episode.episode_id]
+            assert episode.consolidated_salience_score == expected.consolidated_salience_score
+            assert episode.importance_score == expected.importance_score
+
+    def test_empty_day_and_single_episode_chains(self):
+        engine = ConsolidationEngine()
+        episodes = synthetic_day(5, seed=4)
+        columns = EpisodeColumns.from_episodes(episodes)
+        engine.identify_breakthroughs(episodes, columns=columns)
+
+        engine.consolidate_chains([[episodes[0]]], columns)
+
+        assert engine.identify_breakthroughs([]) == []
+        assert np.isnan(columns.consolidated).all()
+        assert all(ep.consolidated_salience_score is None for ep in episodes)
+
+
+class TestChainTracing:
+
+    def test_chains_identical_to_pairwise_scan(self):
+        engine = ConsolidationEngine()
+        for seed, n in ((5, 300), (6, 800), (7, 1500)):
+            episodes = sparse_day(n, seed=seed)
+            breakthroughs = engine.identify_breakthroughs(episodes)
+
+            chains = engine.trace_breakthrough_chains(breakthroughs, episodes)
+            expected = legacy_trace(engine, breakthroughs, episodes)
+
+            assert [[e.episode_id for e in chain] for chain in chains] == \
+                [[e.episode_id for e in chain] for chain in expected]
+            assert len({len(chain) for chain in expected}) > 10  # Partial chains, not whole windows
+
+    def test_each_criterion_alone(self):
+        engine = ConsolidationEngine()
+        start = datetime(2025, 11, 3, 20)
+
+        def episode(i, hours_before, **fields):
+            values = dict(episode_id=f"ep-{i}", content="", embedding=[], created_at=start - timedelta(hours=hours_before),
+                          session_id=None, tags=[], importance_score=0.5, salience_score=0.5,
+                          emotional_8d={}, somatic_7d={})
+            values.update(fields)
+            return Episode(**values)
+
+        breakthrough = episode(0, 0, session_id="s", tags=["a", "b", "c"], embedding=[1.0, 0.0])
+        episodes = [
+            episode(1, 13, session_id="s"),                  # Outside the 12h window
+            episode(2, 11, embedding=[0.9, 0.1]),            # Similar
+            episode(3, 9, tags=["a", "c"]),                  # Two shared tags
+            episode(4, 9.5),                                 # Within 1h of ep-3 (joined before it)
+            episode(5, 6, tags=["a"], embedding=[0.0, 1.0]),  # Unrelated
+            episode(6, 4, session_id="s"),                   # Same session
+            episode(7, 0.5),                                 # Within 1h of the breakthrough
+            episode(8, 0, session_id="s"),                   # Same time: not before the breakthrough
+            breakthrough
+        ]
+
+        chains = engine.trace_breakthrough_chains([breakthrough], episodes)
+
+        assert [e.episode_id for e in chains[0]] == ["ep-2", "ep-4", "ep-3", "ep-6", "ep-7", "ep-0"]
+        assert chains == legacy_trace(engine, [breakthrough], episodes)
+
+
+class TestResultWriteBack:
+
+    def engine_with(self, cursor):
+        engine = ConsolidationEngine()
+        engine.conn = SyncRecordingConnection()
+        engine.cursor = cursor
+        return engine
+
+    def test_one_update_and_one_insert_per_run(self):
+        engine = self.engine_with(SyncRecordingCursor())
+        episodes = synthetic_day(50, seed=8)
+        for episode in episodes:
+            episode.consolidated_salience_score = episode.salience_score * 1.1
+        episodes[3].consolidated_salience_score = None
+        traces = [MemoryTrace(episodes[i].episode_id, episodes[i + 1].episode_id, "progression", 0.5, "chain_0")
+                  for i in range(40)]
+
+        updated, inserted = engine.write_consolidation_results(episodes + episodes[:10], traces)
+
+        statements = [statement for statement, _ in engine.cursor.statements]
+        assert (updated, inserted) == (49, 40)
+        assert sum(s.startswith("UPDATE nexus_memory.zep_episodic_memory") for s in statements) == 1
+        assert sum(s.startswith("INSERT INTO nexus_memory.memory_traces") for s in statements) == 1
+        assert not any("information_schema" in s or "CREATE TABLE nexus_memory" in s for s in statements)
+        scores, staged_traces = engine.cursor.copied.values()
+        assert [row[0] for row in scores] == [ep.episode_id for ep in episodes if ep.consolidated_salience_score]
+        assert staged_traces[0][:5] == (episodes[0].episode_id, episodes[1].episode_id, "progression", 0.5, "chain_0")
+        assert engine.conn.commits == 1
+
+    def test_failed_insert_rolls_back_the_score_update(self):
+        engine = self.engine_with(SyncRecordingCursor(fail_on="INSERT INTO nexus_memory.memory_traces"))
+        episodes = synthetic_day(5, seed=9)
+        for episode in episodes:
+            episode.consolidated_salience_score = 0.9
+
+        try:
+            engine.write_consolidation_results(episodes, [MemoryTrace("a", "b", "initiator", 1.0, "chain_0")])
+            raised = False
+        except RuntimeError:
+            raised = True
+
+        assert raised
+        assert (engine.conn.commits, engine.conn.rollbacks) == (0, 1)
+
+    def test_checkpoint_recorded_in_the_same_transaction(self):
+        engine = self.engine_with(SyncRecordingCursor())
+        episodes = synthetic_day(5, seed=10)
+        for episode in episodes:
+            episode.consolidated_salience_score = 0.8
+
+        engine.write_consolidation_results(episodes, [], checkpoint=dict(
+            day=datetime(2025, 11, 3).date(), version=7, episodes_processed=5, breakthrough_count=1, trace_count=0))
+
+        statement, params = engine.cursor.statements[-1]
+        assert statement.startswith("INSERT INTO nexus_memory.consolidation_checkpoints")
+        assert params[1:3] == (7, 7)  # version read before the fetch = consolidated_version
+        assert engine.conn.commits == 1
+
+    def test_day_traces_replaced_on_reconsolidation(self):
+        engine = self.engine_with(SyncRecordingCursor())
+        day = date(2025, 11, 3)
+
+        engine.write_consolidation_results([], [MemoryTrace("a", "b", "initiator", 1.0, "chain_20251103_0")], day=day)
+
+        statements = engine.cursor.statements
+        delete = statements.index(("DELETE FROM nexus_memory.memory_traces WHERE consolidation_day = %s", (day,)))
+        assert statements[-1][0].startswith("INSERT INTO nexus_memory.memory_traces") and statements[-1][1] == (day,)
+        assert delete < len(statements) - 1
+
+    def test_reconsolidation_boosts_from_base_importance(self):
+        engine = ConsolidationEngine()
+        first = synthetic_day(1500, seed=12, novelty=True)
+        for episode in first:
+            episode.importance_score = min(episode.importance_score * 1.5, 0.95)
+        base = {ep.episode_id: ep.importance_score for ep in first}
+
+        def run(episodes):
+            columns = EpisodeColumns.from_episodes(episodes)
+            breakthroughs = engine.identify_breakthroughs(episodes, columns=columns)
+            engine.consolidate_chains(engine.trace_breakthrough_chains(breakthroughs, episodes), columns)
+            return {ep.episode_id: ep.importance_score for ep in episodes}
+
+        boosted = run(first)
+        # Second run: rows as the first run left them (boosted column, base kept in metadata)
+        rows = [{'importance_score': boosted[ep.episode_id],
+                 'metadata': {'pre_consolidation_importance': base[ep.episode_id]}} for ep in first]
+        second = copy.deepcopy(first)
+        for episode, row in zip(second, rows):
+            episode.importance_score = base_importance(row)
+            episode.consolidated_salience_score = None
+
+        assert any(boosted[k] > base[k] for k in base)
+        assert run(second) == boosted
+        assert max(boosted.values()) <= 1.0
+
+    def test_episodes_no_longer_boosted_get_their_base_back(self):
+        engine = self.engine_with(SyncRecordingCursor())
+
+        engine.write_consolidation_results([], [], day=date(2025, 11, 3))
+
+        reset = [statement for statement, _ in engine.cursor.statements if "pre_consolidation_importance')::float8" in statement]
+        assert len(reset) == 1 and "NOT EXISTS" in reset[0]
+
+    def test_nothing_to_write_issues_no_statements(self):
+        engine = self.engine_with(SyncRecordingCursor())
+
+        assert engine.write_consolidation_results([], []) == (0, 0)
+        assert engine.cursor.statements == [] and engine.conn.commits == 1
+
+
+class BaselineRecordingEngine(SyntheticEngine):
+    """Novelty baselines stubbed out: records the history window of each build"""
+
+    def __init__(self):
+        super().__init__()
+        self.novelty_detector = object()
+        self.baseline_windows = []
+
+    def build_novelty_baselines(self, lookback_days=60, end=None):
+        self.baseline_windows.append(end)
+        self.baseline_models = {"end": end}
+        self.baseline_end = end.date()
+        return True
+
+    def calculate_novelty_for_episodes(self, episodes):
+        pass
+
+
+def history_store(first_day, days, per_day):
+    """Episodes of consecutive days, ordered by created_at; ids carry their day"""
+    store = []
+    for offset in range(days):
+        day = first_day + timedelta(days=offset)
+        for episode in synthetic_day(per_day, seed=offset):
+            episode.created_at += datetime.combine(day, datetime.min.time()) - datetime(2025, 11, 3)
+            episode.episode_id = f"{day}-{episode.episode_id}"
+            store.append(episode)
+    return store
+
+
+class RecordingDetector:
+    """Baseline 'models' are the ids of the history they were built from"""
+
+    def build_baseline_models(self, episodes):
+        return [ep.episode_id for ep in episodes]
+
+
+class HistoryEngine(SyntheticEngine):
+    """Real baseline windows over a fixed episode store; range reads recorded"""
+
+    def __init__(self, store):
+        super().__init__()
+        self.store = store
+        self.novelty_detector = RecordingDetector()
+        self.fetched = []
+
+    def fetch_episodes_from_date_range(self, start_date, end_date):
+        self.fetched.append((start_date, end_date))
+        return [ep for ep in self.store if start_date <= ep.created_at < end_date]
+
+    def calculate_novelty_for_episodes(self, episodes):
+        pass
+
+
+class TestNoveltyBaselines:
+
+    def test_long_lived_engine_rebuilds_baselines_per_consolidated_day(self, monkeypatch):
+        monkeypatch.setattr(consolidation_engine, "LAB_004_AVAILABLE", True)
+        engine = BaselineRecordingEngine()
+        engine.connect()
+
+        for day in (10, 11, 11, 12):
+            report = engine.consolidate_daily_memories(datetime(2025, 10, day, 3, 0))
+
+        assert engine.baseline_windows == [datetime(2025, 10, d) for d in (10, 11, 12)]
+        assert report.top_breakthroughs[-1]["baselines"] == {"end": datetime(2025, 10, 12)}
+
+    def test_batch_history_gives_each_day_its_own_window(self, monkeypatch):
+        monkeypatch.setattr(consolidation_engine, "LAB_004_AVAILABLE", True)
+        monkeypatch.setattr(consolidation_engine, "NoveltyEpisode", SimpleNamespace, raising=False)
+        store = history_store(date(2025, 8, 1), days=80, per_day=6)
+        parent = HistoryEngine(store)
+
+        history = parent.prepare_baseline_history(date(2025, 10, 10), date(2025, 10, 13))
+
+        # One read: the union of every day's 60-day window
+        assert parent.fetched == [(datetime(2025, 8, 11), datetime(2025, 10, 12))]
+        batch, single = HistoryEngine(store), HistoryEngine(store)
+        batch.set_baseline_history(history)
+        batch.connect()
+        single.connect()
+        for day in (10, 11, 12):
+            batch.consolidate_daily_memories(datetime(2025, 10, day, 3, 0))
+            single.consolidate_daily_memories(datetime(2025, 10, day, 3, 0))
+            # Same baseline as a day consolidated on its own (scheduler path)
+            assert batch.baseline_models == single.baseline_models
+            assert batch.baseline_models[0].startswith(f"{date(2025, 10, day) - timedelta(days=60)}")
+            assert len(batch.baseline_models) == 60 * 6
+        assert batch.fetched == [] and len(single.fetched) == 3
+
+
+class TestBatchMode:
+
+    def test_days_fanned_out_over_worker_processes(self):
+        engine = SyntheticEngine()
+
+        batch = engine.consolidate_date_range(date(2025, 10, 10), date(2025, 10, 16), workers=2)
+
+        assert [report.date.date() for report in batch.reports] == \
+            [date(2025, 10, d) for d in (10, 11, 12, 14, 15)]
+        assert list(batch.days_failed) == ["2025-10-13"] and "connection lost" in batch.days_failed["2025-10-13"]
+        assert batch.workers == 2 and batch.days_processed == 5
+        assert batch.episodes_processed == sum(200 + d for d in (10, 11, 12, 14, 15))
+        assert batch.trace_count == sum(report.trace_count for report in batch.reports) > 0
+        assert batch.days_per_minute > 0 and batch.episodes_per_second > 0
+        workers = [report.top_breakthroughs[-1] for report in batch.reports]
+        assert os.getpid() not in {worker["pid"] for worker in workers}
+
+    def test_day_matches_sequential_run(self):
+        engine = SyntheticEngine()
+        engine.connect()
+
+        batch = engine.consolidate_date_range(date(2025, 10, 20), date(2025, 10, 21), workers=4)
+        expected = engine.consolidate_daily_memories(datetime(2025, 10, 20))
+
+        report = batch.reports[0]
+        assert batch.workers == 1  # Never more workers than days
+        assert (report.breakthrough_count, report.chain_count, report.trace_count, report.boosted_episode_ids) == \
+            (expected.breakthrough_count, expected.chain_count, expected.trace_count, expected.boosted_episode_ids)
+
+    def test_narrative_ids_keyed_by_consolidated_day(self):
+        engine = ConsolidationEngine()
+        episodes = synthetic_day(4, seed=11)
+
+        traces = engine.create_memory_traces([episodes], day=date(2025, 10, 20))
+
+        assert {trace.narrative_id for trace in traces} == {"chain_20251020_0"}
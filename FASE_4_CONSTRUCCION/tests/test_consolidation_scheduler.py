@@ -0,0 +1,212 @@
+"""
+Unit tests for the LAB_003 consolidation scheduler: catch-up over pending
+days in order, concurrent days, explicit-date jobs, progress, failures and
+deduplication
+Runs offline - a thread pool with in-memory stand-ins for the worker
+functions (pending_days / consolidate_day) instead of processes + PostgreSQL
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'api'))
+
+from consolidation_scheduler import ConsolidationScheduler
+
+
+class FakeCheckpoints:
+    """Checkpoint table: day -> (version, consolidated_version)"""
+
+    def __init__(self, days, fail_on=None, gate=None, delays=None):
+        self.days = {day: [1, None] for day in days}
+        self.consolidated = []
+        self.fail_on = fail_on
+        self.gate = gate
+        self.delays = delays or {}
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.peak = 0
+
+    def pending_days(self, db_params, until):
+        return sorted(day for day, (version, done) in self.days.items() if day < until and done != version)
+
+    def consolidate_day(self, db_params, day):
+        with self.lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        try:
+            if self.gate is not None:
+                self.gate.wait(timeout=5)
+            time.sleep(self.delays.get(day, 0))
+            if day == self.fail_on:
+                raise RuntimeError("connection lost")
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+        with self.lock:
+            self.days.setdefault(day, [0, None])[1] = self.days[day][0]
+            self.consolidated.append(day)
+        return {"date": day, "episodes_processed": 10, "trace_count": 3, "episodes_boosted": 2,
+                "boosted_episode_ids": [f"{day}-a", f"{day}-b"]}
+
+
+def scheduler_for(checkpoints, invalidated=None, workers=1):
+    return ConsolidationScheduler(
+        {"db_host": "unused"},
+        on_day_done=invalidated.extend if invalidated is not None else None,
+        workers=workers,
+        catchup_interval=0,
+        executor=ThreadPoolExecutor(max_workers=workers),
+        pending_fn=checkpoints.pending_days,
+        consolidate_fn=checkpoints.consolidate_day
+    )
+
+
+async def wait_for(job):
+    for _ in range(500):
+        if not job.active:
+            return
+        await asyncio.sleep(0.01)
+
+
+class TestCatchUp:
+
+    def test_pending_days_consolidated_oldest_first_and_skipped_once_done(self):
+        checkpoints = FakeCheckpoints(["2025-11-03", "2025-10-30", "2025-11-01", "2999-01-01"])
+        checkpoints.days["2025-11-01"][1] = 1  # Already consolidated, unchanged
+        invalidated = []
+
+        async def scenario():
+            scheduler = scheduler_for(checkpoints, invalidated)
+            await scheduler.start()
+            first = scheduler.submit()
+            await wait_for(first)
+            checkpoints.days["2025-11-03"][0] += 1  # An episode changed
+            second = scheduler.submit()
+            await wait_for(second)
+            await scheduler.stop()
+            return first, second
+
+        first, second = asyncio.run(scenario())
+
+        assert checkpoints.consolidated == ["2025-10-30", "2025-11-03", "2025-11-03"]
+        assert first.status == "done" and (first.days_done, first.days_total) == (2, 2)
+        assert first.episodes_processed == 20 and first.traces_stored == 6
+        assert second.days_total == 1
+        assert invalidated[:2] == ["2025-10-30-a", "2025-10-30-b"]
+        progress = first.to_dict()
+        assert progress["progress"] == 1.0 and "boosted_episode_ids" not in progress["days"][0]
+
+    def test_failed_day_stops_the_job_and_stays_pending(self):
+        checkpoints = FakeCheckpoints(["2025-10-01", "2025-10-02", "2025-10-03"], fail_on="2025-10-02")
+
+        async def scenario():
+            scheduler = scheduler_for(checkpoints)
+            await scheduler.start()
+            job = scheduler.submit()
+            await wait_for(job)
+            await scheduler.stop()
+            return scheduler, job
+
+        scheduler, job = asyncio.run(scenario())
+
+        assert job.status == "failed" and "2025-10-02" in job.error and job.days_done == 1
+        assert checkpoints.consolidated == ["2025-10-01"]
+        assert checkpoints.pending_days(None, "2025-11-01") == ["2025-10-02", "2025-10-03"]
+        assert scheduler.get_stats()["days_failed"] == 1
+
+
+class TestConcurrentDays:
+
+    def test_days_run_concurrently_up_to_workers_and_report_in_day_order(self):
+        days = [f"2025-10-0{d}" for d in range(1, 7)]
+        checkpoints = FakeCheckpoints(days, delays={"2025-10-01": 0.1, "2025-10-02": 0.01})
+        invalidated = []
+
+        async def scenario():
+            scheduler = scheduler_for(checkpoints, invalidated, workers=3)
+            await scheduler.start()
+            job = scheduler.submit()
+            await wait_for(job)
+            await scheduler.stop()
+            return job
+
+        job = asyncio.run(scenario())
+
+        assert job.status == "done" and job.days_done == 6
+        assert checkpoints.peak == 3
+        assert checkpoints.consolidated[-1] == "2025-10-01"  # Slowest day finished last...
+        assert [report["date"] for report in job.reports] == days  # ...but results are in day order
+        assert invalidated[:2] == ["2025-10-01-a", "2025-10-01-b"]
+
+    def test_failure_stops_new_days_and_running_days_finish(self):
+        days = [f"2025-10-0{d}" for d in range(1, 6)]
+        checkpoints = FakeCheckpoints(days, fail_on="2025-10-02", delays={"2025-10-01": 0.05})
+
+        async def scenario():
+            scheduler = scheduler_for(checkpoints, workers=2)
+            await scheduler.start()
+            job = scheduler.submit()
+            await wait_for(job)
+            await scheduler.stop()
+            return job
+
+        job = asyncio.run(scenario())
+
+        assert job.status == "failed" and job.error.startswith("2025-10-02")
+        # 10-01 was running next to the failing day and finished; nothing started after the failure
+        assert checkpoints.consolidated == ["2025-10-01"]
+        assert [report["date"] for report in job.reports] == ["2025-10-01"]
+        assert checkpoints.pending_days(None, "2025-11-01") == ["2025-10-02", "2025-10-03", "2025-10-04", "2025-10-05"]
+
+
+class TestJobs:
+
+    def test_progress_while_running_and_catch_up_deduplicated(self):
+        gate = threading.Event()
+        checkpoints = FakeCheckpoints(["2025-10-01", "2025-10-02"], gate=gate)
+
+        async def scenario():
+            scheduler = scheduler_for(checkpoints)
+            await scheduler.start()
+            job = scheduler.submit()
+            again = scheduler.submit()
+            for _ in range(100):
+                if job.current_day:
+                    break
+                await asyncio.sleep(0.01)
+            running = job.to_dict()
+            gate.set()
+            await wait_for(job)
+            await scheduler.stop()
+            return job, again, running
+
+        job, again, running = asyncio.run(scenario())
+
+        assert again is job
+        assert running["status"] == "running" and running["current_day"] == "2025-10-01"
+        assert running["days_total"] == 2 and running["progress"] == 0.0
+        assert job.status == "done" and job.current_day is None
+
+    def test_explicit_date_reconsolidated_even_if_checkpointed(self):
+        checkpoints = FakeCheckpoints(["2025-10-01"])
+        checkpoints.days["2025-10-01"][1] = 1
+
+        async def scenario():
+            scheduler = scheduler_for(checkpoints)
+            await scheduler.start()
+            job = scheduler.submit([date(2025, 10, 1)])
+            await wait_for(job)
+            await scheduler.stop()
+            return scheduler, job
+
+        scheduler, job = asyncio.run(scenario())
+
+        assert job.to_dict()["kind"] == "dates" and job.status == "done"
+        assert checkpoints.consolidated == ["2025-10-01"]
+        assert scheduler.get_job(job.job_id) is job and scheduler.get_job("missing") is None
@@ -0,0 +1,79 @@
+"""
+Unit and parity tests for embedding backends
+
+Offline tests cover pooling and backend selection. Parity tests load the
+reference sentence-transformers model and compare every ONNX backend against
+it; they are skipped when sentence-transformers / onnxruntime are missing.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'api'))
+
+from embedding_backends import embedding_version, load_embedding_backend, mean_pool
+
+PARITY_TEXTS = [
+    "NEXUS consolidated yesterday's episodes during the sleep cycle",
+    "Ricardo fixed the API connection pool timeout",
+    "breakthrough",
+    "Spreading activation primes related memories before they are requested. " * 20,
+    "Memoria episódica con embeddings de 384 dimensiones",
+]
+
+# Minimum cosine(reference, backend) per text
+PARITY_THRESHOLDS = {"onnx": 0.999, "onnx-int8": 0.98}
+
+
+class TestMeanPool:
+
+    def test_padding_tokens_ignored(self):
+        hidden = np.array([[[1.0, 0.0], [0.0, 1.0], [100.0, 100.0]]], dtype=np.float32)
+        mask = np.array([[1, 1, 0]])
+
+        pooled = mean_pool(hidden, mask)
+
+        assert np.allclose(pooled, [[np.sqrt(0.5), np.sqrt(0.5)]], atol=1e-6)
+
+    def test_rows_are_unit_length(self):
+        hidden = np.random.default_rng(0).standard_normal((4, 7, 16)).astype(np.float32)
+        pooled = mean_pool(hidden, np.ones((4, 7)))
+        assert np.allclose(np.linalg.norm(pooled, axis=1), 1.0, atol=1e-5)
+
+
+class TestBackendSelection:
+
+    def test_unknown_backend_rejected(self):
+        with pytest.raises(ValueError):
+            load_embedding_backend("tensorflow-lite")
+
+    def test_version_tags_runtime_and_precision(self):
+        assert embedding_version("sentence-transformers") == "miniLM-384-chunked@v2"
+        assert embedding_version("onnx") == "miniLM-384-chunked@v2+onnx-fp32"
+        assert embedding_version("onnx-int8") == "miniLM-384-chunked@v2+onnx-int8"
+        with pytest.raises(ValueError):
+            embedding_version("tensorflow-lite")
+
+
+@pytest.fixture(scope="module")
+def reference_vectors():
+    pytest.importorskip("sentence_transformers")
+    backend = load_embedding_backend("sentence-transformers")
+    return backend.encode(PARITY_TEXTS)
+
+
+class TestParity:
+
+    @pytest.mark.parametrize("backend_name", sorted(PARITY_THRESHOLDS))
+    def test_cosine_agreement_with_reference(self, reference_vectors, backend_name):
+        pytest.importorskip("onnxruntime")
+        backend = load_embedding_backend(backend_name)
+
+        vectors = backend.encode(PARITY_TEXTS, batch_size=2)
+
+        assert vectors.shape == reference_vectors.shape
+        cosines = np.sum(vectors * reference_vectors, axis=1)
+        assert cosines.min() >= PARITY_THRESHOLDS[backend_name], cosines
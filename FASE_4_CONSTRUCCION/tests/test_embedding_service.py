@@ -0,0 +1,150 @@
+"""
+Unit tests for the API embedding service (micro-batching)
+Runs offline with a stand-in model - no API or database required
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'api'))
+
+from embedding_service import EmbeddingService
+
+
+class RecordingModel:
+    """Encodes text as [len(text), batch index]; records every encode() call"""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.calls = []
+        self.threads = set()
+
+    def encode(self, texts, batch_size=32):
+        self.calls.append(list(texts))
+        self.threads.add(threading.current_thread().name)
+        if self.delay:
+            time.sleep(self.delay)
+        return np.array([[float(len(t)), float(i)] for i, t in enumerate(texts)], dtype=np.float32)
+
+
+class FailingModel:
+    def encode(self, texts, batch_size=32):
+        raise ValueError("model exploded")
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+class TestEmbeddingService:
+
+    def test_concurrent_requests_share_one_batch(self):
+        """Concurrent callers are grouped and each gets its own vector"""
+        model = RecordingModel()
+
+        async def scenario():
+            service = EmbeddingService(model, max_batch_size=16, max_wait_ms=50)
+            await service.start()
+            try:
+                texts = ["a" * n for n in range(1, 9)]
+                return texts, await asyncio.gather(*(service.encode(t) for t in texts))
+            finally:
+                await service.stop()
+
+        texts, vectors = run(scenario())
+
+        assert len(model.calls) == 1
+        assert model.calls[0] == texts
+        assert [v[0] for v in vectors] == [float(len(t)) for t in texts]
+
+    def test_batch_size_bound(self):
+        """No encode() call exceeds max_batch_size"""
+        model = RecordingModel()
+
+        async def scenario():
+            service = EmbeddingService(model, max_batch_size=4, max_wait_ms=50)
+            await service.start()
+            try:
+                await asyncio.gather(*(service.encode(f"q{i}") for i in range(10)))
+            finally:
+                await service.stop()
+
+        run(scenario())
+
+        assert max(len(c) for c in model.calls) <= 4
+        assert sum(len(c) for c in model.calls) == 10
+
+    def test_encode_runs_off_event_loop(self):
+        """Model runs on the dedicated executor thread, loop stays responsive"""
+        model = RecordingModel(delay=0.2)
+
+        async def scenario():
+            service = EmbeddingService(model, max_batch_size=8, max_wait_ms=1)
+            await service.start()
+            try:
+                ticks = 0
+
+                async def ticker():
+                    nonlocal ticks
+                    while True:
+                        await asyncio.sleep(0.01)
+                        ticks += 1
+
+                tick_task = asyncio.create_task(ticker())
+                await service.encode("slow query")
+                tick_task.cancel()
+                return ticks
+            finally:
+                await service.stop()
+
+        ticks = run(scenario())
+
+        assert ticks >= 5
+        assert all(name.startswith("nexus-embed") for name in model.threads)
+
+    def test_model_error_propagates_to_callers(self):
+        async def scenario():
+            service = EmbeddingService(FailingModel(), max_batch_size=8, max_wait_ms=1)
+            await service.start()
+            try:
+                await service.encode("boom")
+            finally:
+                await service.stop()
+
+        with pytest.raises(ValueError):
+            run(scenario())
+
+    def test_encode_requires_running_service(self):
+        service = EmbeddingService(RecordingModel())
+
+        with pytest.raises(RuntimeError):
+            run(service.encode("not started"))
+
+    def test_long_text_chunked_into_the_same_batch(self):
+        """Long texts are split into windows and pooled, not truncated"""
+        model = RecordingModel()
+
+        async def scenario():
+            service = EmbeddingService(model, max_batch_size=2, max_wait_ms=50)
+            await service.start()
+            try:
+                return await asyncio.gather(
+                    service.encode(" ".join(["word"] * 1000)),
+                    service.encode("short")
+                )
+            finally:
+                await service.stop()
+
+        long_vector, short_vector = run(scenario())
+
+        assert len(model.calls) == 1
+        assert len(model.calls[0]) > 2
+        assert model.calls[0][-1] == "short"
+        assert abs(np.linalg.norm(long_vector) - 1.0) < 1e-5
+        assert short_vector[0] == 5.0
@@ -0,0 +1,92 @@
+"""
+Unit tests for the embeddings worker's queue transactions and supervisor restarts
+Runs offline against a recording stand-in for the psycopg connection; no process is forked
+"""
+
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'workers'))
+
+import embeddings_worker
+from embeddings_worker import EmbeddingsWorker, WorkerSupervisor
+
+from helpers import SyncRecordingConnection, SyncRecordingCursor
+
+
+def worker_with(cursor):
+    worker = EmbeddingsWorker(worker_id="test", model=object(), serve_metrics=False)
+    worker.conn = SyncRecordingConnection(cursor)
+    return worker
+
+
+def verbs(cursor):
+    return [statement.split()[0] for statement, _ in cursor.statements]
+
+
+class TestQueueTransactions:
+
+    def test_claim_and_content_read_commit_before_encoding(self):
+        cur = SyncRecordingCursor(results=[[("ep-1",), ("ep-2",)], [("ep-1", "uno"), ("ep-2", "dos")]])
+        worker = worker_with(cur)
+
+        items = worker.get_pending_items()
+
+        assert items == [("ep-1", "uno"), ("ep-2", "dos")]
+        # No transaction left open across encode(): NOW() in it would date the write-back
+        assert verbs(cur) == ["UPDATE", "COMMIT", "SELECT", "COMMIT"]
+
+    def test_processed_at_is_write_time(self):
+        cur = SyncRecordingCursor(results=[[(0.5,)]])
+        worker = worker_with(cur)
+
+        worker.write_embeddings([("ep-1", [0.1, 0.2])])
+
+        done = [statement for statement, _ in cur.statements if "SET state = 'done'" in statement]
+        assert done and "processed_at = clock_timestamp()" in done[0]
+        assert verbs(cur)[-1] == "COMMIT"
+
+
+class RecordingSupervisor(WorkerSupervisor):
+    """Records spawns instead of forking"""
+
+    def __init__(self, num_workers):
+        super().__init__(num_workers)
+        self.spawned = []
+
+    def spawn(self, index):
+        self.spawned.append(index)
+
+
+class TestSupervisorRestarts:
+
+    def test_reap_schedules_restart_without_blocking(self, monkeypatch):
+        monkeypatch.setattr(embeddings_worker, "multiprocess", SimpleNamespace(mark_process_dead=lambda pid: None))
+        monkeypatch.setattr(embeddings_worker.time, "sleep", lambda s: pytest.fail("reap slept through the backoff"))
+        supervisor = RecordingSupervisor(2)
+        supervisor.children = {101: 0, 102: 1}
+        supervisor.started_at = {0: embeddings_worker.time.time(), 1: embeddings_worker.time.time()}
+
+        # Both crash right after starting: the second is reaped while the first backs off
+        supervisor.reap(101, 1 << 8)
+        supervisor.reap(102, 1 << 8)
+
+        assert supervisor.children == {} and supervisor.spawned == []
+        assert set(supervisor.restart_at) == {0, 1}
+
+        supervisor.restart_at[0] = 0  # Worker 0's backoff has elapsed
+        supervisor.spawn_due()
+
+        assert supervisor.spawned == [0] and list(supervisor.restart_at) == [1]
+
+    def test_pending_restarts_dropped_when_stopping(self):
+        supervisor = RecordingSupervisor(1)
+        supervisor.restart_at = {0: 0}
+        supervisor.stopping = True
+
+        supervisor.spawn_due()
+
+        assert supervisor.spawned == [] and supervisor.restart_at == {}
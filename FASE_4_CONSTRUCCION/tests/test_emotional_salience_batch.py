@@ -0,0 +1,94 @@
+"""
+Unit tests for batched emotional salience (LAB_001)
+Runs offline - a stand-in async connection returns BATCH_CONTEXT_SQL rows
+"""
+
+import asyncio
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'api'))
+
+from emotional_salience_scorer import (
+    EmotionalSalienceScorer, EmotionalState, SomaticMarker, BATCH_CONTEXT_SQL
+)
+
+from helpers import RecordingConnection
+
+T0 = datetime(2025, 10, 27, 12, 0, tzinfo=timezone.utc)
+
+
+def context_row(idx, with_emotion=True, with_somatic=True, situation="coding"):
+    row = {'idx': idx}
+    row.update({
+        'joy': 0.7, 'trust': 0.6, 'fear': 0.1, 'surprise': 0.4, 'sadness': 0.05,
+        'disgust': 0.0, 'anger': 0.0, 'anticipation': 0.9, 'complexity': 0.5,
+        'es_created_at': T0,
+    } if with_emotion else {
+        'joy': None, 'trust': None, 'fear': None, 'surprise': None, 'sadness': None,
+        'disgust': None, 'anger': None, 'anticipation': None, 'complexity': None,
+        'es_created_at': None,
+    })
+    row.update({
+        'situation': situation, 'valence': 0.8, 'arousal': 0.6, 'strength': 0.9,
+        'sm_created_at': T0,
+    } if with_somatic else {
+        'situation': None, 'valence': None, 'arousal': None, 'strength': None,
+        'sm_created_at': None,
+    })
+    return row
+
+
+class TestBatchSalience:
+
+    def test_single_round_trip_for_whole_batch(self):
+        scorer = EmotionalSalienceScorer()
+        episodes = [
+            {'episode_id': f'ep-{i}', 'timestamp': T0 + timedelta(minutes=i)}
+            for i in range(50)
+        ]
+        conn = RecordingConnection([context_row(i + 1) for i in range(50)])
+
+        scores = asyncio.run(scorer.batch_calculate_salience_async(conn, episodes))
+
+        assert len(conn.statements) == 1
+        assert conn.statements[0][0] == BATCH_CONTEXT_SQL
+        assert len(conn.statements[0][1][0]) == 50
+        assert set(scores) == {e['episode_id'] for e in episodes}
+
+    def test_batch_matches_per_episode_scoring(self):
+        scorer = EmotionalSalienceScorer()
+        emotional_state, somatic_marker = scorer._context_from_row(context_row(1, situation="breakthrough"))
+        expected = scorer.score_context(emotional_state, somatic_marker)
+
+        conn = RecordingConnection([context_row(1, situation="breakthrough")])
+        scores = asyncio.run(scorer.batch_calculate_salience_async(
+            conn, [{'episode_id': 'ep', 'timestamp': T0}]
+        ))
+
+        assert scores['ep'] == expected
+        assert scores['ep'].breakthrough_bonus == 0.3
+
+    def test_missing_context_is_neutral(self):
+        scorer = EmotionalSalienceScorer()
+        conn = RecordingConnection([
+            context_row(1, with_emotion=False),
+            context_row(2, with_somatic=False),
+        ])
+
+        scores = asyncio.run(scorer.batch_calculate_salience_async(conn, [
+            {'episode_id': 'a', 'timestamp': T0},
+            {'episode_id': 'b', 'timestamp': T0},
+        ]))
+
+        assert scores['a'].total_score == 0.5 and not scores['a'].has_emotional_context
+        assert scores['b'].total_score == 0.5 and not scores['b'].has_somatic_context
+
+    def test_row_parsing(self):
+        emotional_state, somatic_marker = EmotionalSalienceScorer._context_from_row(context_row(1))
+
+        assert isinstance(emotional_state, EmotionalState)
+        assert isinstance(somatic_marker, SomaticMarker)
+        assert emotional_state.anticipation == 0.9
+        assert somatic_marker.valence == 0.8
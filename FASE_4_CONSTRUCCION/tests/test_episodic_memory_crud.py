@@ -20,7 +20,7 @@ class TestEpisodicMemoryCRUD:
         response = requests.get(f"{API_BASE_URL}/health", timeout=TIMEOUT)
         assert response.status_code == 200
         data = response.json()
-        assert data["status"] in ["healthy", "degraded"]
+        assert data["status"] in ["healthy", "degraded", "warming"]  # warming = model still loading
         assert data["database"] == "connected"
 
     def test_create_episode_minimal(self):
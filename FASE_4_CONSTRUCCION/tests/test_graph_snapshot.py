@@ -0,0 +1,152 @@
+"""
+Unit tests for LAB_005 graph snapshots (format, atomic write, engine restore)
+"""
+
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'api'))
+
+import graph_snapshot
+from graph_snapshot import (
+    GraphSnapshotter, load_engine_snapshot, read_snapshot, save_engine_snapshot, write_snapshot
+)
+from spreading_activation import SpreadingActivationEngine
+
+from helpers import clustered
+
+VERSION = "miniLM-384-chunked@v2"
+
+
+def build_engine(n=400, seed=0):
+    engine = SpreadingActivationEngine(similarity_threshold=0.5)
+    vectors = clustered(n, clusters=6, spread=0.4, seed=seed)
+    engine.add_episodes([f"ep-{i}" for i in range(n)], vectors)
+    for i in range(0, n, 40):
+        engine.access_episode(f"ep-{i}", "", vectors[i])
+    return engine, vectors
+
+
+class TestFileFormat:
+
+    def test_sections_round_trip_as_memmaps(self, tmp_path):
+        path = str(tmp_path / "graph.snap")
+        sections = {
+            "a": np.arange(12, dtype=np.float32).reshape(3, 4),
+            "b": np.array([b"x", b"yz"]),
+            "empty": np.zeros((0, 4), dtype=np.int32),
+        }
+
+        write_snapshot(path, sections, {"k": 1})
+        loaded, meta = read_snapshot(path)
+
+        assert meta == {"k": 1}
+        assert isinstance(loaded["a"], np.memmap)
+        assert loaded["a"].ctypes.data % graph_snapshot.SECTION_ALIGNMENT == 0
+        for name, array in sections.items():
+            assert np.array_equal(loaded[name], array) and loaded[name].dtype == array.dtype
+
+    def test_failed_write_keeps_previous_snapshot(self, tmp_path):
+        path = str(tmp_path / "graph.snap")
+        write_snapshot(path, {"a": np.ones(3, dtype=np.float32)}, {"generation": 1})
+
+        with pytest.raises(TypeError):
+            write_snapshot(path, {"a": np.ones(3, dtype=np.float32)}, {"generation": object()})
+
+        _, meta = read_snapshot(path)
+        assert meta == {"generation": 1}
+        assert os.listdir(tmp_path) == ["graph.snap"]
+
+
+class TestEngineSnapshot:
+
+    def test_restore_matches_original_engine(self, tmp_path):
+        path = str(tmp_path / "graph.snap")
+        engine, vectors = build_engine()
+        save_engine_snapshot(engine, path, VERSION)
+
+        restored = SpreadingActivationEngine(similarity_threshold=0.5)
+        meta = load_engine_snapshot(restored, path, VERSION)
+
+        assert meta["episodes"] == 400
+        assert restored.similarity_graph.uuids == engine.similarity_graph.uuids
+        for i in range(0, 400, 7):
+            assert restored.similarity_graph.get_related(f"ep-{i}", top_k=10) == \
+                engine.similarity_graph.get_related(f"ep-{i}", top_k=10)
+        original = engine.activation_manager.activations
+        assert set(restored.activation_manager.activations) == set(original)
+        for uuid, state in restored.activation_manager.activations.items():
+            assert state.source_episodes == original[uuid].source_episodes
+            assert state.access_count == original[uuid].access_count
+
+    def test_restored_graph_accepts_inserts(self, tmp_path):
+        path = str(tmp_path / "graph.snap")
+        engine, vectors = build_engine(200)
+        save_engine_snapshot(engine, path, VERSION)
+        restored = SpreadingActivationEngine(similarity_threshold=0.5)
+        load_engine_snapshot(restored, path, VERSION)
+
+        restored.add_episode("ep-3", "", vectors[4])   # Replace a memory-mapped row
+        engine.add_episode("ep-3", "", vectors[4])
+        extra = clustered(50, clusters=6, spread=0.4, seed=9)   # Grows past the mapped rows
+        engine.add_episodes([f"new-{i}" for i in range(50)], extra)
+        restored.add_episodes([f"new-{i}" for i in range(50)], extra)
+
+        for uuid in ["ep-0", "ep-3", "new-0", "new-49"]:
+            assert restored.similarity_graph.get_related(uuid, top_k=8) == \
+                engine.similarity_graph.get_related(uuid, top_k=8)
+        # Copy-on-write: the snapshot file is unchanged
+        sections, _ = read_snapshot(path)
+        assert np.allclose(sections["graph.matrix"][3], vectors[3] / np.linalg.norm(vectors[3]), atol=1e-6)
+
+    def test_decayed_activations_dropped_on_restore(self, tmp_path):
+        path = str(tmp_path / "graph.snap")
+        engine, _ = build_engine(100)
+        for state in engine.activation_manager.activations.values():
+            state.last_accessed = time.time() - 3600  # 120 half-lives ago
+        save_engine_snapshot(engine, path, VERSION)
+
+        restored = SpreadingActivationEngine(similarity_threshold=0.5)
+        load_engine_snapshot(restored, path, VERSION)
+
+        assert restored.activation_manager.activations == {}
+
+    def test_incompatible_snapshot_ignored(self, tmp_path):
+        path = str(tmp_path / "graph.snap")
+        engine, _ = build_engine(50)
+        save_engine_snapshot(engine, path, VERSION)
+
+        other_threshold = SpreadingActivationEngine(similarity_threshold=0.7)
+        assert load_engine_snapshot(other_threshold, path, VERSION) is None
+        assert len(other_threshold.similarity_graph) == 0
+        assert load_engine_snapshot(SpreadingActivationEngine(similarity_threshold=0.5), path, "other@v1") is None
+        assert load_engine_snapshot(engine, str(tmp_path / "missing.snap"), VERSION) is None
+
+
+class TestGraphSnapshotter:
+
+    def test_stop_writes_final_snapshot_with_loader_watermark(self, tmp_path):
+        path = str(tmp_path / "graph.snap")
+        engine, _ = build_engine(60)
+
+        class SyncingLoader:
+            state = "syncing"
+            watermark = datetime(2025, 11, 4, 12, 0)
+
+        async def scenario():
+            snapshotter = GraphSnapshotter(engine, path, VERSION, interval=3600, loader=SyncingLoader())
+            await snapshotter.start()
+            await snapshotter.stop()
+            restored = SpreadingActivationEngine(similarity_threshold=0.5)
+            return await GraphSnapshotter(restored, path, VERSION).restore()
+
+        meta = asyncio.run(scenario())
+
+        assert meta["episodes"] == 60
+        assert meta["watermark"] == "2025-11-04T12:00:00"
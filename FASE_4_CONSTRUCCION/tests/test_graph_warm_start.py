@@ -0,0 +1,283 @@
+"""
+Unit tests for the LAB_005 similarity graph warm start
+Runs offline against a stand-in pool serving rows in pgvector binary form
+"""
+
+import asyncio
+import os
+import struct
+import sys
+import uuid as uuid_module
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'api'))
+
+from graph_warm_start import (
+    COUNT_EPISODES_SQL, SCAN_EPISODES_SQL, SYNC_EPISODES_SQL,
+    GraphWarmStartLoader, decode_vectors, graph_bytes_per_episode
+)
+from embedding_backends import embedding_version
+from spreading_activation import SimilarityGraph, SpreadingActivationEngine
+
+from helpers import clustered
+
+VERSION = "miniLM-384-chunked@v2"
+SNAPSHOT = datetime(2025, 11, 4, 12, 0, tzinfo=timezone.utc)
+
+
+def vector_send(vector):
+    """pgvector binary output: int16 dim, int16 unused, big-endian float4"""
+    return struct.pack(f">hh{len(vector)}f", len(vector), 0, *vector)
+
+
+class FakeDatabase:
+    """
+    episodes: newest first (scan order); queue: (episode_id, processed_at)
+    versions: embedding_version per episode (default VERSION)
+    """
+
+    def __init__(self, episodes):
+        self.episodes = dict(episodes)
+        self.versions = {}
+        self.queue = []
+        self.fetch_sizes = []
+
+    def version_of(self, episode_id):
+        return self.versions.get(episode_id, VERSION)
+
+    def embedded(self, version):
+        return {e: v for e, v in self.episodes.items() if self.version_of(e) == version}
+
+    def sync_rows(self, after_time, after_id, version, limit):
+        done = sorted((t, str(e)) for e, t in self.queue)
+        rows = [(e, vector_send(self.episodes[e]), t) for t, e in done
+                if (t, e) > (after_time, after_id) and self.version_of(e) == version]
+        return rows[:limit]
+
+
+class FakeCursor:
+    def __init__(self, db, name=None):
+        self.db = db
+        self.name = name
+        self.rows = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, sql, params):
+        if sql == COUNT_EPISODES_SQL:
+            self.rows = [(len(self.db.embedded(params[0])), SNAPSHOT)]
+        elif sql == SCAN_EPISODES_SQL:
+            assert self.name, "initial load must use a server-side cursor"
+            self.rows = [(uuid_module.UUID(e), vector_send(v)) for e, v in self.db.embedded(params[0]).items()]
+        elif sql == SYNC_EPISODES_SQL:
+            self.rows = self.db.sync_rows(*params)
+        else:
+            raise AssertionError(sql)
+
+    async def fetchone(self):
+        return self.rows.pop(0)
+
+    async def fetchmany(self, size):
+        self.db.fetch_sizes.append(size)
+        batch, self.rows = self.rows[:size], self.rows[size:]
+        return batch
+
+    async def fetchall(self):
+        batch, self.rows = self.rows, []
+        return batch
+
+
+class FakeConnection:
+    def __init__(self, db):
+        self.db = db
+
+    def cursor(self, name=None, binary=False):
+        return FakeCursor(self.db, name)
+
+    @asynccontextmanager
+    async def transaction(self):
+        yield
+
+
+class FakePool:
+    def __init__(self, db):
+        self.db = db
+
+    @asynccontextmanager
+    async def connection(self):
+        yield FakeConnection(self.db)
+
+
+def make_episodes(n, seed=0):
+    vectors = clustered(n, dim=16, seed=seed)
+    return [(str(uuid_module.UUID(int=i + 1)), vectors[i]) for i in range(n)]
+
+
+class TestDecodeVectors:
+
+    def test_round_trips_pgvector_binary_form(self):
+        vectors = np.array([[1.5, -2.0, 0.25], [0.0, 3.0, -1.0]], dtype=np.float32)
+
+        decoded = decode_vectors([vector_send(v) for v in vectors])
+
+        assert decoded.dtype == np.float32
+        assert np.array_equal(decoded, vectors)
+
+
+class TestInitialLoad:
+
+    def test_streams_whole_corpus_in_batches(self):
+        episodes = make_episodes(250)
+        db = FakeDatabase(episodes)
+        engine = SpreadingActivationEngine(similarity_threshold=0.5)
+        loader = GraphWarmStartLoader(engine, FakePool(db), VERSION, batch_size=64, insert_chunk=20)
+
+        asyncio.run(loader.load())
+
+        graph = engine.similarity_graph
+        assert len(graph) == 250
+        assert db.fetch_sizes == [64] * 5
+        assert loader.state == "syncing" and loader.get_stats()["progress"] == 1.0
+        assert loader.watermark == SNAPSHOT
+        # Allocated once for the corpus (plus sync headroom), never doubled
+        assert graph.capacity == int(250 * 1.1)
+        assert graph.get_related(episodes[0][0], top_k=3)
+
+    def test_memory_budget_keeps_newest_episodes(self):
+        episodes = make_episodes(300)
+        db = FakeDatabase(episodes)
+        engine = SpreadingActivationEngine(similarity_threshold=0.5)
+        budget = 120 * graph_bytes_per_episode(16, engine.similarity_graph.max_neighbors)
+        loader = GraphWarmStartLoader(engine, FakePool(db), VERSION, batch_size=50,
+                                      memory_mb=budget / (1024 * 1024))
+
+        asyncio.run(loader.load())
+
+        graph = engine.similarity_graph
+        assert len(graph) == 120
+        assert graph.capacity <= 120
+        assert set(graph.uuids) == {e for e, _ in episodes[:120]}
+        assert loader.get_stats()["target"] == 120
+
+
+class TestIncrementalSync:
+
+    def test_backend_switch_loads_re_embedded_episodes_only(self):
+        """Another backend's vectors are another space: the graph fills as the worker re-embeds"""
+        episodes = make_episodes(60)
+        db = FakeDatabase(episodes)
+        engine = SpreadingActivationEngine(similarity_threshold=0.5)
+        onnx_version = embedding_version("onnx-int8")
+        loader = GraphWarmStartLoader(engine, FakePool(db), onnx_version, batch_size=16)
+
+        async def scenario():
+            await loader.load()
+            loaded = len(engine.similarity_graph)
+            # Worker re-embeds the corpus with the new backend, oldest queue rows first
+            for i, (episode_id, vector) in enumerate(episodes[:40]):
+                db.episodes[episode_id] = -vector
+                db.versions[episode_id] = onnx_version
+                db.queue.append((episode_id, SNAPSHOT + timedelta(seconds=i + 1)))
+            return loaded, await loader.sync()
+
+        loaded, applied = asyncio.run(scenario())
+
+        graph = engine.similarity_graph
+        assert loaded == 0 and applied == 40
+        assert set(graph.uuids) == {e for e, _ in episodes[:40]}
+        assert np.allclose(graph.embeddings[episodes[0][0]], SimilarityGraph._normalize(-episodes[0][1]))
+
+    def test_new_and_re_embedded_episodes_applied_once(self):
+        episodes = make_episodes(100)
+        db = FakeDatabase(episodes)
+        engine = SpreadingActivationEngine(similarity_threshold=0.5)
+        loader = GraphWarmStartLoader(engine, FakePool(db), VERSION, batch_size=8, sync_lag=30)
+
+        async def scenario():
+            await loader.load()
+
+            # Embedded during the scan (inside the lag window) -> already loaded, skipped
+            db.queue.append((episodes[5][0], SNAPSHOT - timedelta(seconds=10)))
+            # New episodes, more than one sync page
+            new = make_episodes(120, seed=1)[100:]
+            for i, (episode_id, vector) in enumerate(new):
+                db.episodes[episode_id] = vector
+                db.queue.append((episode_id, SNAPSHOT + timedelta(seconds=i + 1)))
+            # Re-embedded episode
+            db.episodes[episodes[0][0]] = -episodes[0][1]
+            db.queue.append((episodes[0][0], SNAPSHOT + timedelta(seconds=60)))
+
+            first = await loader.sync()
+            second = await loader.sync()
+            return new, first, second
+
+        new, first, second = asyncio.run(scenario())
+
+        graph = engine.similarity_graph
+        assert first == 21 and second == 0
+        assert len(graph) == 120 and all(e in graph for e, _ in new)
+        assert np.allclose(graph.embeddings[episodes[0][0]], SimilarityGraph._normalize(-episodes[0][1]))
+        assert loader.watermark == SNAPSHOT + timedelta(seconds=60)
+
+    def test_late_commit_behind_watermark_is_synced(self):
+        """A batch that commits after a sync passed its processed_at, within the lag window"""
+        episodes = make_episodes(40)
+        db = FakeDatabase(episodes)
+        engine = SpreadingActivationEngine(similarity_threshold=0.5)
+        loader = GraphWarmStartLoader(engine, FakePool(db), VERSION, batch_size=8, sync_lag=30)
+
+        async def scenario():
+            await loader.load()
+            new = make_episodes(50, seed=1)[40:]
+            for episode_id, vector in new:
+                db.episodes[episode_id] = vector
+            # A fast batch commits first and moves the watermark
+            db.queue.append((new[0][0], SNAPSHOT + timedelta(seconds=20)))
+            first = await loader.sync()
+            # A slow batch written 15s earlier commits only now
+            for episode_id, _ in new[1:]:
+                db.queue.append((episode_id, SNAPSHOT + timedelta(seconds=5)))
+            second = await loader.sync()
+            return new, first, second
+
+        new, first, second = asyncio.run(scenario())
+
+        assert first == 1 and second == 9
+        assert all(e in engine.similarity_graph for e, _ in new)
+        assert loader.watermark == SNAPSHOT + timedelta(seconds=20)
+
+    def test_full_graph_evicts_oldest_for_synced_and_primed_episodes(self):
+        episodes = make_episodes(150)
+        db = FakeDatabase(episodes)
+        engine = SpreadingActivationEngine(similarity_threshold=0.5)
+        budget = 100 * graph_bytes_per_episode(16, engine.similarity_graph.max_neighbors)
+        loader = GraphWarmStartLoader(engine, FakePool(db), VERSION, batch_size=40,
+                                      memory_mb=budget / (1024 * 1024))
+
+        async def scenario():
+            await loader.load()
+            new = make_episodes(170, seed=1)[150:]
+            for i, (episode_id, vector) in enumerate(new):
+                db.episodes[episode_id] = vector
+                db.queue.append((episode_id, SNAPSHOT + timedelta(seconds=i + 1)))
+            applied = await loader.sync()
+            # /memory/prime inserts go through the same cap
+            engine.add_episode(episodes[149][0], "", episodes[149][1])
+            return new, applied
+
+        new, applied = asyncio.run(scenario())
+
+        graph = engine.similarity_graph
+        assert applied == 20
+        assert len(graph) == 100 and graph.capacity <= 100
+        assert all(e in graph for e, _ in new) and episodes[149][0] in graph
+        # Loaded newest first: the oldest loaded episodes made room
+        assert set(graph.uuids) == ({e for e, _ in episodes[:79]} | {e for e, _ in new} | {episodes[149][0]})
+        assert loader.get_stats()["evicted"] == 21
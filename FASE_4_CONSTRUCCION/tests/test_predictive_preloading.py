@@ -0,0 +1,218 @@
+"""
+Unit tests for LAB_007 predictive preloading in the API: indexed and
+bounded pattern learning, queued batched prefetch, cache bounds and TTL,
+prefetch concurrency and per-endpoint hit accounting
+Runs offline - the payload query is an in-memory fetch_many stand-in
+"""
+
+import asyncio
+import os
+import sys
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'api'))
+
+from predictive_preloading import Prediction, PredictivePreloadingEngine, PreloadingScheduler, TemporalPatternLearner
+
+
+def payload(episode_id, size=10):
+    return {"content": f"{episode_id} " + "x" * size, "importance_score": 0.5, "tags": ["lab007"],
+            "created_at": None, "has_embedding": True}
+
+
+class FakeStore:
+    """fetch_many_fn recording each batch and the peak number of concurrent calls"""
+
+    def __init__(self, delay=0.0, size=10):
+        self.batches = []
+        self.delay = delay
+        self.size = size
+        self.in_flight = 0
+        self.peak = 0
+
+    async def fetch_many(self, episode_ids):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        self.batches.append(list(episode_ids))
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        return {e: payload(e, self.size) for e in episode_ids if not e.startswith("deleted")}
+
+
+async def drain(scheduler):
+    for _ in range(200):
+        if not scheduler._pending and scheduler._queue.empty():
+            return
+        await asyncio.sleep(0.005)
+
+
+class TestPatternLearner:
+
+    def test_indexed_successors_match_counts(self):
+        learner = TemporalPatternLearner()
+        now = datetime.now()
+        for episode_id in ["a", "b", "a", "c", "a", "b"]:
+            learner.learn_from_access(episode_id, now)
+
+        successors = {target: prob for target, prob, _ in learner.get_bigram_successors("a")}
+        trigram = learner.get_trigram_successors("b", "a")
+
+        assert successors == {"b": 2 / 3, "c": 1 / 3}
+        assert [(target, prob) for target, prob, _ in trigram] == [("c", 1.0)]
+        assert learner.get_bigram_successors("zzz") == []
+
+    def test_decay_drops_patterns_from_index(self):
+        learner = TemporalPatternLearner()
+        old = datetime.now() - timedelta(days=60)
+        for episode_id in ["a", "b", "c"]:
+            learner.learn_from_access(episode_id, old)
+
+        removed = learner.decay_patterns()
+
+        assert removed == 3  # a->b, b->c, (a, b)->c
+        assert learner.get_bigram_successors("a") == []
+        assert "a" not in learner.bigram_successors and ("a", "b") not in learner.trigram_successors
+
+    def test_sources_and_successors_bounded_across_every_index(self):
+        learner = TemporalPatternLearner(max_sources=3, max_successors=2)
+        start = datetime.now()
+        for i, episode_id in enumerate(["a", "b", "a", "c", "a", "d", "e", "f", "g"]):
+            learner.learn_from_access(episode_id, start + timedelta(seconds=i))
+
+        # a's least recently seen successor (b) made room for d, then a itself aged out
+        assert list(learner.bigram_successors) == ["d", "e", "f"]
+        assert len(learner.trigram_successors) == 3
+        for model in ("bigram", "trigram"):
+            counts, last_seen, successors, totals = learner._model(model)
+            keys = {learner._key(source, target) for source, targets in successors.items() for target in targets}
+            assert set(counts) == set(last_seen) == keys
+            assert set(totals) == set(successors)
+            assert all(totals[source] == sum(counts[learner._key(source, t)] for t in targets)
+                       for source, targets in successors.items())
+        assert learner.get_bigram_successors("a") == []
+
+
+class TestPrefetch:
+
+    def test_predicted_episodes_prefetched_in_one_batch_and_served(self):
+        store = FakeStore()
+
+        async def scenario():
+            engine = PredictivePreloadingEngine(store.fetch_many, prediction_k=5, min_confidence=0.5)
+            await engine.start()
+            for _ in range(3):  # Learn: a is followed by b, c and d
+                for nxt in ["b", "c", "d"]:
+                    engine.on_episode_access("a", ["x"])
+                    engine.on_episode_access(nxt, ["x"])
+            await drain(engine.preload_scheduler)
+            store.batches.clear()
+            engine.preload_scheduler.cache.clear()
+            engine.preload_scheduler.cache_bytes = 0
+
+            predictions = engine.on_episode_access("a", ["x"])
+            await drain(engine.preload_scheduler)
+            found = engine.get_many(["b", "c", "d", "zzz"])
+            engine.observe_fetch(0.004)
+            engine.record_lookup("search", len(found), 1, avoided_query=False)
+            engine.record_lookup("temporal_related", 2, 0, avoided_query=True)
+            await engine.stop()
+            return engine, predictions, found
+
+        engine, predictions, found = asyncio.run(scenario())
+
+        assert {p.episode_id for p in predictions} >= {"b", "c", "d"}
+        assert len(store.batches) == 1 and set(store.batches[0]) >= {"b", "c", "d"}
+        assert set(found) == {"b", "c", "d"}
+        endpoints = engine.get_stats()["endpoints"]
+        assert endpoints["search"]["hits"] == 3 and endpoints["search"]["saved_ms"] == 0
+        assert endpoints["temporal_related"]["hit_rate"] == 1.0
+        assert endpoints["temporal_related"]["saved_ms"] == 4.0
+
+    def test_invalidated_while_in_flight_is_not_cached(self):
+        store = FakeStore(delay=0.05)
+
+        async def scenario():
+            scheduler = PreloadingScheduler(store.fetch_many, max_concurrency=1)
+            await scheduler.start()
+            scheduler.schedule([Prediction("a", 0.9, ["pattern"]), Prediction("b", 0.9, ["pattern"])])
+            await asyncio.sleep(0.01)
+            scheduler.invalidate(["a"])
+            await drain(scheduler)
+            await scheduler.stop()
+            return scheduler
+
+        scheduler = asyncio.run(scenario())
+
+        assert list(scheduler.cache) == ["b"]
+
+    def test_response_rank_order_is_not_learned(self):
+        engine = PredictivePreloadingEngine(FakeStore().fetch_many)
+
+        engine.observe_results([("r1", ["x"]), ("r2", ["y"]), ("r3", None)])
+
+        assert engine.pattern_learner.bigram_counts == {} and not engine.recent_events
+        assert engine.context_analyzer.episode_metadata == {"r1": {"x"}, "r2": {"y"}}
+
+
+class TestBounds:
+
+    def test_entry_and_byte_bounds_with_waste_accounting(self):
+        store = FakeStore(size=2000)
+
+        async def scenario():
+            scheduler = PreloadingScheduler(store.fetch_many, max_cache_size=50, max_bytes=20_000, batch_size=16)
+            for i in range(40):
+                scheduler._pending[f"ep-{i}"] = 0.5 + i / 100
+            scheduler.get_many(["ep-0"])
+            await scheduler.prefetch([f"ep-{i}" for i in range(40)])
+            return scheduler
+
+        scheduler = asyncio.run(scenario())
+
+        stats = scheduler.get_cache_stats()
+        assert stats["cache_bytes"] <= 20_000
+        assert 0 < stats["cache_size"] < 40
+        assert stats["cache_bytes"] == sum(e.nbytes for e in scheduler.cache.values())
+        # Lowest confidence evicted first; all evicted entries were never read
+        assert "ep-39" in scheduler.cache and "ep-0" not in scheduler.cache
+        assert stats["preload_wasted"] == 40 - stats["cache_size"]
+
+    def test_concurrency_limit_and_queue_overflow(self):
+        store = FakeStore(delay=0.02)
+
+        async def scenario():
+            scheduler = PreloadingScheduler(store.fetch_many, max_concurrency=2, batch_size=4, queue_size=20)
+            queued = scheduler.schedule([Prediction(f"ep-{i}", 0.8, ["pattern"]) for i in range(30)])
+            requeued = scheduler.schedule([Prediction("ep-0", 0.9, ["pattern"])])
+            await scheduler.start()
+            await drain(scheduler)
+            await scheduler.stop()
+            return scheduler, queued, requeued
+
+        scheduler, queued, requeued = asyncio.run(scenario())
+
+        assert queued == 20 and requeued == 0
+        assert scheduler.metrics["prefetch_dropped"] == 10
+        assert store.peak == 2
+        assert all(len(batch) <= 4 for batch in store.batches) and len(store.batches) == 5
+        assert len(scheduler.cache) == 20
+
+    def test_expired_entries_not_served_and_refetched(self):
+        store = FakeStore()
+
+        async def scenario():
+            scheduler = PreloadingScheduler(store.fetch_many, ttl=60)
+            scheduler._pending.update({"a": 0.9, "b": 0.9})
+            await scheduler.prefetch(["a", "b"])
+            scheduler._pending.clear()  # Done by the worker after a prefetch
+            scheduler.cache["a"].preloaded_at -= 120
+            found = scheduler.get_many(["a", "b"])
+            scheduler.cache["b"].preloaded_at -= 120
+            queued = scheduler.schedule([Prediction("b", 0.9, ["pattern"])])
+            return scheduler, found, queued
+
+        scheduler, found, queued = asyncio.run(scenario())
+
+        assert set(found) == {"b"} and queued == 1
+        assert not scheduler.cache and scheduler.cache_bytes == 0
+        assert scheduler.metrics["preload_expired"] == 2 and scheduler.metrics["preload_wasted"] == 1
@@ -0,0 +1,142 @@
+"""
+Unit tests for the LAB_005 priming cache (shards, byte/entry bounds,
+activation-decay TTL) and the engine's two-phase priming
+"""
+
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'api'))
+
+from spreading_activation import PrimedEpisode, PrimingCache, SpreadingActivationEngine
+
+from helpers import clustered
+
+
+def primed(uuid, content="x", activation=1.0, primed_at=None):
+    return PrimedEpisode(
+        uuid=uuid, content=content, embedding=None, activation=activation,
+        primed_at=time.time() if primed_at is None else primed_at, source_uuid="src"
+    )
+
+
+class TestBounds:
+
+    def test_entry_bound_evicts_least_recently_used(self):
+        cache = PrimingCache(max_size=4, num_shards=1)
+        for i in range(4):
+            cache.add(primed(f"ep-{i}"))
+        cache.get("ep-0")                     # ep-1 is now the LRU entry
+
+        cache.add(primed("ep-4"))
+
+        assert len(cache) == 4
+        assert set(cache.get_many(["ep-0", "ep-2", "ep-3", "ep-4"])) == {"ep-0", "ep-2", "ep-3", "ep-4"}
+        assert cache.get("ep-1") is None
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_byte_bound_counts_payload_size(self):
+        cache = PrimingCache(max_size=1000, max_bytes=100_000, num_shards=4)
+        for i in range(200):
+            cache.add(primed(f"ep-{i}", content="y" * 2000))
+
+        stats = cache.get_stats()
+        assert stats["bytes"] <= 100_000
+        assert 0 < stats["size"] < 50
+        assert stats["bytes"] == sum(e.nbytes for s in cache._shards for e in s.entries.values())
+
+    def test_oversized_payload_rejected(self):
+        cache = PrimingCache(max_size=10, max_bytes=8000, num_shards=2)
+        cache.add(primed("small"))
+
+        assert cache.add(primed("huge", content="z" * 10_000)) is False
+        assert len(cache) == 1
+
+
+class TestActivationTTL:
+
+    def test_entry_expires_when_activation_decays_below_threshold(self):
+        cache = PrimingCache(max_size=10, decay_half_life=30.0, min_activation=0.1)
+        now = time.time()
+        assert cache.add(primed("strong", activation=0.8, primed_at=now - 60))   # 0.8 -> 0.2 after 2 half-lives
+        assert not cache.add(primed("decayed", activation=0.3, primed_at=now - 60))  # 0.3 -> 0.075
+        cache.add(primed("weak", activation=0.3, primed_at=now - 40))            # 0.3 -> 0.119
+        cache._shard("weak").entries["weak"].expires_at = now                    # ... 8s later
+
+        assert cache.ttl(0.4) == 60.0
+        assert set(cache.get_many(["strong", "weak", "decayed"])) == {"strong"}
+        assert cache.get_stats()["expirations"] == 1
+
+    def test_refresh_extends_cached_entries_and_reports_missing(self):
+        cache = PrimingCache(max_size=10, decay_half_life=30.0, min_activation=0.1)
+        cache.add(primed("cached", activation=0.3, primed_at=time.time() - 45))
+
+        missing = cache.refresh([("cached", 0.9, "new-src"), ("other", 0.9, "new-src")])
+
+        assert missing == ["other"]
+        entry = cache.get("cached")
+        assert entry.activation == 0.9 and entry.source_uuid == "new-src"
+        assert entry.expires_at > time.time() + 90
+
+
+class TestConcurrency:
+
+    def test_concurrent_writers_and_readers_keep_shards_consistent(self):
+        cache = PrimingCache(max_size=300, max_bytes=200_000, num_shards=8)
+        errors = []
+
+        def worker(seed):
+            rng = np.random.default_rng(seed)
+            try:
+                for i in rng.integers(0, 1000, 3000).tolist():
+                    if i % 3:
+                        cache.add(primed(f"ep-{i}", content="c" * (i % 500)))
+                    else:
+                        cache.get_many([f"ep-{i}", f"ep-{i + 1}"])
+                    if i % 97 == 0:
+                        cache.invalidate([f"ep-{i}"])
+            except Exception as e:  # pragma: no cover - surfaced below
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(seed,)) for seed in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert len(cache) <= 300
+        for shard in cache._shards:
+            assert shard.nbytes == sum(e.nbytes for e in shard.entries.values())
+            assert shard.nbytes <= cache._shard_bytes
+
+
+class TestTwoPhasePriming:
+
+    def test_payloads_fetched_once_then_served_from_cache(self):
+        vectors = clustered(80)
+        engine = SpreadingActivationEngine(similarity_threshold=0.5, cache_size=500)
+        engine.add_episodes([f"ep-{i}" for i in range(80)], vectors)
+        created_at = datetime(2025, 11, 4, 12, 0)
+
+        first = engine.access_episodes(["ep-0", "ep-1"])
+        assert first["missing_payloads"] == first["primed_episodes"]
+        payloads = {
+            uuid: {"content": f"text of {uuid}", "importance_score": 0.7, "tags": ["lab005"],
+                   "created_at": created_at, "has_embedding": True}
+            for uuid in first["missing_payloads"]
+        }
+        cached = engine.prime_payloads(first["activated"], payloads)
+
+        second = engine.access_episodes(["ep-0", "ep-1"])
+        primed_episode = engine.try_primed_access(first["primed_episodes"][0])
+
+        assert cached == len(first["primed_episodes"]) > 0
+        assert second["missing_payloads"] == []
+        assert primed_episode.content == f"text of {primed_episode.uuid}"
+        assert primed_episode.tags == ["lab005"] and primed_episode.created_at == created_at
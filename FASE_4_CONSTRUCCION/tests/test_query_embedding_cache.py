@@ -0,0 +1,90 @@
+"""
+Unit tests for the query embedding cache
+Runs offline - the Redis tier is exercised with an in-memory dict client
+"""
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'api'))
+
+from query_embedding_cache import QueryEmbeddingCache, normalize_query, tokenizer_lowercases
+
+
+class DictRedis:
+    """Minimal bytes-valued get/setex store"""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def setex(self, key, ttl, value):
+        self.data[key] = value
+
+
+class TestQueryEmbeddingCache:
+
+    def test_normalization_collapses_whitespace_and_case(self):
+        assert normalize_query("  Memory   Storage\n", lowercase=True) == normalize_query("memory storage", lowercase=True)
+
+    def test_case_kept_unless_the_tokenizer_is_uncased(self):
+        class Uncased:
+            do_lower_case = True
+
+        assert tokenizer_lowercases(Uncased()) and not tokenizer_lowercases(None)
+        cased = QueryEmbeddingCache("model|v1", max_entries=4)
+        cased.put(cased.normalize("Apple  stock"), [0.5])
+
+        assert cased.get(cased.normalize("apple stock")) is None
+        assert cased.get(cased.normalize(" Apple stock ")) == [0.5]
+
+    def test_hit_after_put(self):
+        cache = QueryEmbeddingCache("model|v1", max_entries=4)
+        assert cache.get("q") is None
+
+        cache.put("q", [0.5, 0.25])
+
+        assert cache.get("q") == [0.5, 0.25]
+        stats = cache.get_stats()
+        assert stats["hits"] == 1 and stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_lru_eviction_and_memory_accounting(self):
+        cache = QueryEmbeddingCache("model|v1", max_entries=2)
+        cache.put("a", [1.0] * 384)
+        cache.put("b", [2.0] * 384)
+        cache.get("a")  # a becomes most recent
+        cache.put("c", [3.0] * 384)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        stats = cache.get_stats()
+        assert stats["entries"] == 2
+        assert stats["memory_bytes"] >= 2 * 384 * 4
+
+    def test_model_version_isolates_keys(self):
+        redis_client = DictRedis()
+        old = QueryEmbeddingCache("model|v1", redis_client=redis_client)
+        old.put("q", [1.0, 2.0])
+
+        new = QueryEmbeddingCache("model|v2", redis_client=redis_client)
+
+        assert new.get("q") is None
+
+    def test_redis_tier_stores_float32_bytes(self):
+        redis_client = DictRedis()
+        writer = QueryEmbeddingCache("model|v1", redis_client=redis_client)
+        writer.put("q", [0.1, 0.2, 0.3])
+
+        raw = next(iter(redis_client.data.values()))
+        assert isinstance(raw, bytes) and len(raw) == 3 * 4
+
+        reader = QueryEmbeddingCache("model|v1", redis_client=redis_client)
+        vector = reader.get("q")
+
+        assert np.allclose(vector, [0.1, 0.2, 0.3])
+        assert reader.get_stats()["entries"] == 1  # promoted to L1
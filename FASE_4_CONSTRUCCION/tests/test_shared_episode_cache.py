@@ -0,0 +1,192 @@
+"""
+Unit tests for the shared (Redis) episode cache
+Runs offline - two "replicas" share an in-memory Redis stand-in with
+MGET, pipelined SET/DELETE and a pub/sub channel
+"""
+
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'api'))
+
+from shared_episode_cache import EPISODE_INVALIDATION_CHANNEL, SharedEpisodeCache, decode_episode, encode_episode
+from spreading_activation import PrimedEpisode, PrimingCache
+
+PAYLOAD = {
+    "content": "Breakthrough: the priming cache now holds real payloads. " * 40,
+    "importance_score": 0.7300000000000001,  # Not representable in float32
+    "tags": ["lab005", "cache", "ñandú"],
+    "created_at": datetime(2025, 11, 4, 12, 30, tzinfo=timezone.utc),
+    "has_embedding": True
+}
+
+
+class FakeRedis:
+    """bytes store with millisecond TTLs and an in-process pub/sub channel"""
+
+    def __init__(self):
+        self.data = {}
+        self.ttls = {}
+        self.subscribers = []
+
+    def mget(self, keys):
+        return [self.data.get(key) for key in keys]
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def pubsub(self, ignore_subscribe_messages=False):
+        subscriber = FakePubSub()
+        self.subscribers.append(subscriber)
+        return subscriber
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.ops = []
+
+    def set(self, key, value, px):
+        self.ops.append(("set", key, value, px))
+
+    def delete(self, *keys):
+        self.ops.append(("delete", keys))
+
+    def publish(self, channel, message):
+        self.ops.append(("publish", channel, message))
+
+    def execute(self):
+        for op in self.ops:
+            if op[0] == "set":
+                self.redis.data[op[1]] = op[2]
+                self.redis.ttls[op[1]] = op[3]
+            elif op[0] == "delete":
+                for key in op[1]:
+                    self.redis.data.pop(key, None)
+            else:
+                for subscriber in self.redis.subscribers:
+                    if op[1] in subscriber.channels:
+                        subscriber.messages.append({"type": "message", "data": op[2]})
+
+
+class FakePubSub:
+    def __init__(self):
+        self.channels = set()
+        self.messages = []
+
+    def subscribe(self, channel):
+        self.channels.add(channel)
+
+    def get_message(self, timeout=0.0):
+        if self.messages:
+            return self.messages.pop(0)
+        time.sleep(min(timeout, 0.01))
+        return None
+
+    def close(self):
+        pass
+
+
+class TestEncoding:
+
+    def test_round_trip_is_compact(self):
+        raw = encode_episode(PAYLOAD, 0.6, 1762259400.5, "source-episode")
+
+        payload, weight, cached_at, source = decode_episode(raw)
+
+        assert payload == PAYLOAD
+        assert weight == 0.6 and cached_at == 1762259400.5 and source == "source-episode"
+        # Repetitive content is compressed; far below the JSON form
+        assert len(raw) < len(PAYLOAD["content"]) // 4
+
+    def test_missing_created_at_and_embedding_flag(self):
+        payload = {"content": "short", "importance_score": 0.5, "tags": [],
+                   "created_at": None, "has_embedding": False}
+
+        decoded, _, _, _ = decode_episode(encode_episode(payload, 1.0, 0.0))
+
+        assert decoded == payload
+
+
+class TestSharedTier:
+
+    def test_entry_written_by_one_replica_served_to_another(self):
+        redis = FakeRedis()
+        writer, reader = SharedEpisodeCache(redis), SharedEpisodeCache(redis)
+
+        writer.put_many("priming", [("ep-1", PAYLOAD, 0.9, time.time(), "src", 60.0)])
+        found = reader.get_many("priming", ["ep-1", "ep-2"])
+
+        assert list(found) == ["ep-1"] and found["ep-1"][0] == PAYLOAD
+        assert reader.get_stats()["hits"] == 1 and reader.get_stats()["misses"] == 1
+        assert reader.get_many("preload", ["ep-1"]) == {}   # Caches are namespaced
+
+    def test_ttl_weighted_by_activation(self):
+        redis = FakeRedis()
+        cache = SharedEpisodeCache(redis, min_ttl=5, max_ttl=605)
+        priming = PrimingCache(decay_half_life=30.0, min_activation=0.1)
+
+        cache.put_many("preload", [("strong", PAYLOAD, 0.9, 0.0, "", cache.weighted_ttl(0.9)),
+                                   ("weak", PAYLOAD, 0.1, 0.0, "", cache.weighted_ttl(0.1))])
+        cache.put_many("priming", [("decayed", PAYLOAD, 0.1, 0.0, "", priming.ttl(0.1))])
+
+        assert redis.ttls[cache.make_key("preload", "strong")] == 545_000
+        assert redis.ttls[cache.make_key("preload", "weak")] == 65_000
+        assert cache.make_key("priming", "decayed") not in redis.data
+
+    def test_invalidation_reaches_other_replicas(self):
+        redis = FakeRedis()
+        local_a, local_b = PrimingCache(max_size=10), PrimingCache(max_size=10)
+        for local in (local_a, local_b):
+            local.add(PrimedEpisode("ep-1", "old", None, 1.0, time.time(), "src"))
+        replica_a, replica_b = SharedEpisodeCache(redis), SharedEpisodeCache(redis)
+        replica_a.add_invalidation_handler(local_a.invalidate)
+        replica_b.add_invalidation_handler(local_b.invalidate)
+        replica_a.put_many("priming", [("ep-1", PAYLOAD, 1.0, time.time(), "src", 60.0)])
+
+        async def scenario():
+            await replica_b.start()
+            replica_a.invalidate(["ep-1"])
+            for _ in range(100):
+                if local_b.get("ep-1") is None:
+                    break
+                await asyncio.sleep(0.01)
+            await replica_b.stop()
+
+        asyncio.run(scenario())
+
+        assert local_a.get("ep-1") is None and local_b.get("ep-1") is None
+        assert replica_b.get_many("priming", ["ep-1"]) == {}
+        assert EPISODE_INVALIDATION_CHANNEL in redis.subscribers[0].channels
+
+    def test_unencodable_entry_skipped_without_losing_the_batch(self):
+        redis = FakeRedis()
+        cache = SharedEpisodeCache(redis)
+        too_many_tags = {**PAYLOAD, "tags": ["t"] * 70_000}
+        long_tag = {**PAYLOAD, "tags": ["x" * 70_000]}
+
+        cache.put_many("preload", [("ep-1", PAYLOAD, 0.5, 0.0, "", 60.0),
+                                   ("ep-2", too_many_tags, 0.5, 0.0, "", 60.0),
+                                   ("ep-3", long_tag, 0.5, 0.0, "", 60.0),
+                                   ("ep-4", PAYLOAD, 0.5, 0.0, "", 60.0)])
+
+        assert set(cache.get_many("preload", ["ep-1", "ep-2", "ep-3", "ep-4"])) == {"ep-1", "ep-4"}
+        stats = cache.get_stats()
+        assert (stats["writes"], stats["skipped"], stats["errors"]) == (2, 2, 0)
+
+    def test_redis_errors_degrade_to_misses(self):
+        class DownRedis:
+            def mget(self, keys):
+                raise ConnectionError("refused")
+
+            def pipeline(self, transaction=True):
+                raise ConnectionError("refused")
+
+        cache = SharedEpisodeCache(DownRedis())
+
+        assert cache.get_many("priming", ["ep-1"]) == {}
+        cache.put_many("priming", [("ep-1", PAYLOAD, 1.0, 0.0, "", 60.0)])
+        assert cache.get_stats()["errors"] == 2
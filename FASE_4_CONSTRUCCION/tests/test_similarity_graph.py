@@ -0,0 +1,224 @@
+"""
+Unit tests for the matrix-backed LAB_005 SimilarityGraph
+Neighbour lists are checked against brute-force cosine over all pairs
+"""
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'api'))
+
+from spreading_activation import ActivationManager, SimilarityGraph, SpreadingActivationEngine
+
+from helpers import clustered
+
+THRESHOLD = 0.5
+
+
+def brute_force_related(vectors, row, top_k, threshold=THRESHOLD):
+    unit = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    sims = unit @ unit[row]
+    ranked = [(i, s) for i, s in enumerate(sims) if i != row and s >= threshold]
+    ranked.sort(key=lambda x: -x[1])
+    return ranked[:top_k]
+
+
+def assert_matches_brute_force(graph, vectors, top_k):
+    for row in range(len(vectors)):
+        expected = brute_force_related(vectors, row, top_k)
+        related = graph.get_related(f"ep-{row}", top_k=top_k)
+        assert [u for u, _ in related] == [f"ep-{i}" for i, _ in expected]
+        assert np.allclose([s for _, s in related], [s for _, s in expected], atol=1e-5)
+
+
+class TestSimilarityGraph:
+
+    def test_incremental_inserts_match_brute_force(self):
+        vectors = clustered(300, clusters=8, spread=0.5)
+        graph = SimilarityGraph(THRESHOLD, max_neighbors=8, initial_capacity=16)
+        for i, vector in enumerate(vectors):
+            graph.add_episode(f"ep-{i}", vector)
+
+        assert len(graph) == 300 and graph.matrix.shape == (300, 32)
+        assert_matches_brute_force(graph, vectors, top_k=5)
+
+    def test_bulk_insert_matches_brute_force_across_blocks(self):
+        vectors = clustered(1200, clusters=8, spread=0.5, seed=1)
+        graph = SimilarityGraph(THRESHOLD, max_neighbors=8)
+        graph.BLOCK_COLUMNS, graph.BLOCK_ROWS = 128, 300   # Force many blocks
+
+        graph.add_episodes([f"ep-{i}" for i in range(600)], vectors[:600])
+        graph.add_episodes([f"ep-{i}" for i in range(600, 1200)], vectors[600:])
+
+        assert_matches_brute_force(graph, vectors, top_k=8)
+
+    def test_wider_than_stored_lists_uses_full_scan(self):
+        vectors = clustered(200, clusters=8, spread=0.5, seed=2)
+        graph = SimilarityGraph(THRESHOLD, max_neighbors=4)
+        graph.add_episodes([f"ep-{i}" for i in range(200)], vectors)
+
+        assert_matches_brute_force(graph, vectors, top_k=20)
+
+    def test_rows_are_normalized_and_similarity_is_cosine(self):
+        graph = SimilarityGraph(THRESHOLD)
+        graph.add_episode("a", np.array([3.0, 4.0]))
+        graph.add_episode("b", np.array([4.0, 3.0]))
+
+        assert np.allclose(np.linalg.norm(graph.embeddings["a"]), 1.0)
+        assert abs(graph.get_similarity("a", "b") - 0.96) < 1e-6
+        assert graph.get_related("a") == [("b", graph.get_similarity("a", "b"))]
+
+    def test_zero_vector_and_unknown_ids(self):
+        graph = SimilarityGraph(THRESHOLD)
+        graph.add_episode("zero", np.zeros(4))
+        graph.add_episode("x", np.ones(4))
+
+        assert graph.get_related("zero") == []
+        assert graph.get_related("missing") == []
+        assert graph.get_similarity("zero", "missing") == 0.0
+
+    def test_re_adding_replaces_embedding(self):
+        graph = SimilarityGraph(THRESHOLD)
+        graph.add_episode("a", np.array([1.0, 0.0]))
+        graph.add_episode("b", np.array([1.0, 0.1]))
+        graph.add_episode("c", np.array([0.0, 1.0]))
+
+        graph.add_episode("b", np.array([0.1, 1.0]))
+
+        assert len(graph) == 3
+        assert [u for u, _ in graph.get_related("b")] == ["c"]
+        assert [u for u, _ in graph.get_related("c")] == ["b"]
+        assert graph.get_related("a") == []
+
+    def test_max_episodes_evicts_oldest_rows(self):
+        vectors = clustered(160, clusters=8, spread=0.5, seed=3)
+        # Lists wide enough to hold every neighbour: eviction leaves them exact
+        graph = SimilarityGraph(THRESHOLD, max_neighbors=128, initial_capacity=16, max_episodes=100)
+        # Bulk insert past the cap: its oldest rows are not admitted at all
+        assert graph.add_episodes([f"ep-{i}" for i in range(120)], vectors[:120]) == []
+        assert "ep-19" not in graph and "ep-20" in graph
+        evicted = []
+        for i in range(120, 160):
+            evicted += graph.add_episode(f"ep-{i}", vectors[i])
+
+        assert len(graph) == 100 and graph.capacity == 100
+        assert sorted(evicted, key=lambda u: int(u[3:])) == [f"ep-{i}" for i in range(20, 60)]
+        assert graph.evicted == 40 and "ep-59" not in graph and "ep-60" in graph
+        kept = vectors[60:]
+        for row in range(100):
+            expected = brute_force_related(kept, row, top_k=10)
+            related = graph.get_related(f"ep-{row + 60}", top_k=10)
+            assert [u for u, _ in related] == [f"ep-{i + 60}" for i, _ in expected]
+
+    def test_recency_keys_decide_what_is_kept(self):
+        vectors = clustered(30, clusters=8, spread=0.5, seed=4)
+        graph = SimilarityGraph(THRESHOLD, max_episodes=10)
+
+        # Newest first with descending keys (warm start scan order)
+        graph.add_episodes([f"ep-{i}" for i in range(20)], vectors[:20], recency=[-(i + 1) for i in range(20)])
+        assert set(graph.uuids) == {f"ep-{i}" for i in range(10)}
+
+        graph.add_episodes([f"ep-{i}" for i in range(20, 25)], vectors[20:25])
+        assert set(graph.uuids) == {f"ep-{i}" for i in list(range(5)) + list(range(20, 25))}
+
+
+def reference_spread(graph, sources, top_k, max_hops, decays, min_activation, max_frontier=None):
+    """Hop-by-hop Python propagation: strongest incoming activation per episode"""
+    visited = set(sources)
+    frontier = {uuid: 1.0 for uuid in sources}
+    activated = {}
+    for hop in range(max_hops):
+        best = {}
+        for uuid, activation in frontier.items():
+            for related, similarity in graph.get_related(uuid, top_k=top_k):
+                value = activation * similarity * decays[hop]
+                if related not in visited and value >= min_activation and value > best.get(related, (0.0,))[0]:
+                    best[related] = (value, uuid)
+        ranked = sorted(best.items(), key=lambda item: -item[1][0])[:max_frontier]
+        frontier = {uuid: value for uuid, (value, _) in ranked}
+        visited.update(frontier)
+        activated.update({uuid: entry for uuid, entry in ranked})
+    return activated
+
+
+class TestSpread:
+
+    def build(self, n=600, seed=4):
+        vectors = clustered(n, clusters=8, spread=0.5, seed=seed)
+        graph = SimilarityGraph(THRESHOLD, max_neighbors=12)
+        graph.add_episodes([f"ep-{i}" for i in range(n)], vectors)
+        return graph
+
+    def assert_matches_reference(self, graph, sources, **kwargs):
+        decays = kwargs.get("hop_decay", 0.7)
+        decays = list(decays) if isinstance(decays, (list, tuple)) else [decays] * kwargs["max_hops"]
+        expected = reference_spread(graph, sources, kwargs["top_k"], kwargs["max_hops"], decays,
+                                    kwargs["min_activation"], kwargs.get("max_frontier"))
+
+        rows, levels, parents = graph.spread(np.array([graph.index[u] for u in sources]), **kwargs)
+
+        got = {graph.uuids[r]: (l, graph.uuids[p]) for r, l, p in zip(rows, levels, parents)}
+        assert len(got) == len(rows)
+        assert set(got) == set(expected)
+        for uuid, (level, parent) in got.items():
+            assert abs(level - expected[uuid][0]) < 1e-5 and parent == expected[uuid][1]
+
+    def test_single_source_multi_hop(self):
+        graph = self.build()
+        self.assert_matches_reference(graph, ["ep-0"], top_k=5, max_hops=3, min_activation=0.2)
+
+    def test_many_sources_in_one_call(self):
+        graph = self.build()
+        sources = [f"ep-{i}" for i in range(0, 600, 37)]
+        self.assert_matches_reference(graph, sources, top_k=8, max_hops=2, min_activation=0.15)
+
+    def test_per_hop_decay_and_frontier_pruning(self):
+        graph = self.build()
+        sources = [f"ep-{i}" for i in range(0, 600, 50)]
+        self.assert_matches_reference(graph, sources, top_k=12, max_hops=3, hop_decay=[0.9, 0.8, 0.6],
+                                      min_activation=0.1, max_frontier=25)
+        rows, _, _ = graph.spread(np.array([graph.index[u] for u in sources]), top_k=12, max_hops=3,
+                                  min_activation=0.1, max_frontier=25)
+        assert len(rows) <= 75
+
+    def test_activation_manager_records_sources(self):
+        graph = self.build(200)
+        manager = ActivationManager()
+
+        activated = manager.spread_activation_many(["ep-0", "ep-1"], graph, top_k=5, max_hops=2)
+
+        assert activated and all(level >= 0.2 for _, level in activated)
+        for uuid, level in activated:
+            state = manager.activations[uuid]
+            assert state.activation_level == level and state.source_episodes
+
+
+class TestEngineIntegration:
+
+    def test_engine_primes_neighbours_from_matrix_graph(self):
+        vectors = clustered(100, clusters=8, spread=0.5, seed=3)
+        engine = SpreadingActivationEngine(similarity_threshold=THRESHOLD)
+        for i, vector in enumerate(vectors):
+            engine.add_episode(f"ep-{i}", "", vector)
+
+        result = engine.access_episode("ep-0", "", vectors[0])
+
+        assert "ep-0" in engine.similarity_graph.embeddings
+        assert result["activation_count"] > 0
+        assert engine.get_statistics()["similarity_graph_size"] == 100
+
+    def test_session_context_primed_in_one_call(self):
+        vectors = clustered(100, clusters=8, spread=0.5, seed=3)
+        engine = SpreadingActivationEngine(similarity_threshold=THRESHOLD, max_frontier=10)
+        engine.add_episodes([f"ep-{i}" for i in range(100)], vectors)
+
+        result = engine.access_episodes(["ep-0", "ep-1", "ep-2"])
+
+        assert result["uuids"] == ["ep-0", "ep-1", "ep-2"]
+        assert 0 < result["activation_count"] <= 20
+        engine.prime_payloads(result["activated"], {uuid: {"content": uuid} for uuid in result["missing_payloads"]})
+        primed = engine.try_primed_access(result["primed_episodes"][0])
+        assert primed.content == primed.uuid
+        assert primed.source_uuid in engine.similarity_graph
@@ -0,0 +1,93 @@
+"""
+Unit tests for token-aware chunking and pooled embeddings
+Runs offline with a stand-in tokenizer and model
+"""
+
+import os
+import re
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'api'))
+
+from text_chunking import chunk_texts, encode_chunked, pool_vectors
+
+
+class WordTokenizer:
+    """Fast-tokenizer stand-in: one token per word, with character offsets"""
+
+    def __call__(self, texts, **kwargs):
+        return {"offset_mapping": [[m.span() for m in re.finditer(r"\S+", t)] for t in texts]}
+
+
+class BagOfWordsModel:
+    """Deterministic 8-d embedding; records encode() calls"""
+
+    max_seq_length = 12
+    tokenizer = WordTokenizer()
+
+    def __init__(self):
+        self.calls = []
+
+    def encode(self, texts, batch_size=32):
+        self.calls.append(list(texts))
+        vectors = np.zeros((len(texts), 8), dtype=np.float32)
+        for i, text in enumerate(texts):
+            for word in text.split():
+                vectors[i, hash(word) % 8] += 1.0
+        return vectors / np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12)
+
+
+def words(n, prefix="w"):
+    return " ".join(f"{prefix}{i}" for i in range(n))
+
+
+class TestChunking:
+
+    def test_short_text_is_single_unchanged_chunk(self):
+        assert chunk_texts(["hello world"], WordTokenizer(), chunk_tokens=10) == [["hello world"]]
+
+    def test_windows_overlap_and_cover_the_text(self):
+        text = words(24)
+        (chunks,) = chunk_texts([text], WordTokenizer(), chunk_tokens=10, overlap_tokens=3)
+
+        assert [len(c.split()) for c in chunks] == [10, 10, 10]
+        assert chunks[0].split()[-3:] == chunks[1].split()[:3]
+        assert chunks[0].startswith("w0 ") and chunks[-1].endswith("w23")
+
+    def test_max_chunks_bounds_work(self):
+        (chunks,) = chunk_texts([words(1000)], WordTokenizer(), chunk_tokens=10, overlap_tokens=0, max_chunks=4)
+        assert len(chunks) == 4
+
+    def test_whitespace_fallback_without_tokenizer(self):
+        (chunks,) = chunk_texts([words(100)], None, chunk_tokens=40, overlap_tokens=0)
+        assert len(chunks) == 4 and all(len(c.split()) == 30 for c in chunks[:3])
+
+
+class TestEncodeChunked:
+
+    def test_all_chunks_of_all_texts_in_one_encode(self):
+        model = BagOfWordsModel()
+        vectors, counts = encode_chunked(model, [words(40), "short text", words(30, "x")],
+                                         chunk_tokens=256, overlap_tokens=2)
+
+        assert len(model.calls) == 1
+        assert counts[1] == 1 and counts[0] > 1 and counts[2] > 1
+        assert sum(counts) == len(model.calls[0])
+        assert vectors.shape == (3, 8) and vectors.dtype == np.float32
+
+    def test_window_capped_by_model_max_seq_length(self):
+        model = BagOfWordsModel()
+        encode_chunked(model, [words(50)], chunk_tokens=256, overlap_tokens=0)
+        assert all(len(chunk.split()) <= model.max_seq_length - 2 for chunk in model.calls[0])
+
+    def test_single_window_text_matches_direct_encode(self):
+        model = BagOfWordsModel()
+        vectors, _ = encode_chunked(model, ["alpha beta gamma"])
+        assert np.allclose(vectors[0], model.encode(["alpha beta gamma"])[0])
+
+    def test_pooled_vector_is_unit_mean_direction(self):
+        chunk_vectors = np.array([[2.0, 0.0], [0.0, 1.0]], dtype=np.float32)
+        pooled = pool_vectors(chunk_vectors)
+        assert np.allclose(pooled, [np.sqrt(0.5), np.sqrt(0.5)], atol=1e-6)
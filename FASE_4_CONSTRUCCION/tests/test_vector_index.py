@@ -0,0 +1,52 @@
+"""
+Unit tests for vector index management helpers
+Runs offline - DDL generation and per-request search knobs only
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'api'))
+
+from vector_index import index_ddl, apply_search_params
+
+from helpers import RecordingCursor
+
+
+class TestVectorIndex:
+
+    def test_hnsw_ddl_matches_init_script_shape(self):
+        ddl = index_ddl("idx_episodic_embedding_hnsw", "hnsw", m=24, ef_construction=128)
+
+        assert ddl.startswith("CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_episodic_embedding_hnsw")
+        assert "ON nexus_memory.zep_episodic_memory" in ddl
+        assert "USING hnsw (embedding vector_cosine_ops)" in ddl
+        assert "WITH (m = 24, ef_construction = 128)" in ddl
+
+    def test_ivfflat_ddl(self):
+        ddl = index_ddl("idx_episodic_embedding_ivf", "ivfflat", lists=200, concurrently=False)
+
+        assert "CONCURRENTLY" not in ddl
+        assert "USING ivfflat" in ddl and "lists = 200" in ddl
+
+    def test_rejects_unsafe_index_names(self):
+        with pytest.raises(ValueError):
+            index_ddl("idx; DROP TABLE x")
+
+    def test_search_params_are_transaction_local(self):
+        cur = RecordingCursor()
+        asyncio.run(apply_search_params(cur, ef_search=120, probes=8))
+
+        assert cur.statements == [
+            ("SELECT set_config('hnsw.ef_search', %s, true)", ("120",)),
+            ("SELECT set_config('ivfflat.probes', %s, true)", ("8",)),
+        ]
+
+    def test_search_params_noop_when_unset(self):
+        cur = RecordingCursor()
+        asyncio.run(apply_search_params(cur))
+
+        assert cur.statements == []